@@ -1,34 +1,87 @@
 
 import asyncio
-from typing import List
+from typing import List, Tuple, Union
 from loguru import logger
-from openai import AsyncOpenAI
 from ..core.config import settings
+from ..core.llm_cache import llm_cache
+from ..core.tracing import trace_methods
+from ..utils.http_cassette import httpx_async_client
+from ..utils.token_batching import split_by_token_budget, map_chunks, merge_keyword_lists
+from ..trend.records import NewsRecord, VideoRecord
 
+@trace_methods("openai")
 class AIKeywordExtractor:
     """GenAI를 활용한 마케팅 키워드 추출"""
     
+    MODEL = "gpt-4o-mini"
+    PROMPT_VERSION = "v1"  # 프롬프트 수정 시 올려야 캐시가 갱신됨
+    
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
+        self._client = None
+
+    @property
+    def client(self):
+        """AsyncOpenAI 클라이언트 (openai SDK는 첫 호출 시 로딩)"""
+        if self._client is None:
+            from openai import AsyncOpenAI
+            self._client = AsyncOpenAI(
+                api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL, http_client=httpx_async_client("openai")
+            )
+        return self._client
     
-    async def extract_marketing_keywords(self, contents: List[dict]) -> List[str]:
+    async def extract_marketing_keywords(self, contents: List[Union[VideoRecord, NewsRecord]]) -> List[str]:
         """
         수집된 콘텐츠(YouTube, News)를 분석하여 마케팅 활용 가능한 키워드 추출
         
-        :param contents: [{'title': '...', 'type': 'video/news'}, ...]
+        :param contents: 수집 레코드 (제목만 사용)
         :return: ['키워드1', '키워드2', ...]
         """
         if not contents:
             return []
         
-        # 콘텐츠 제목만 추출
-        titles = [item.get('title', '') for item in contents[:30]]  # 최대 30개
-        combined_text = "\n".join(titles)
+        # 콘텐츠 제목만 추출 (중복 제거, 순서 유지)
+        titles = list(dict.fromkeys(item.title for item in contents if item.title))
+        if not titles:
+            return []
         
         try:
-            logger.info("🤖 GenAI 마케팅 키워드 추출 시작...")
+            # 토큰 예산 단위 청크로 나눠 병렬 추출 후 가중 병합
+            chunks = split_by_token_budget(titles, settings.LLM_BATCH_TOKEN_BUDGET)
+            if len(chunks) == 1:
+                keywords = await self._extract_chunk(chunks[0])
+                return keywords[:15]
+            
+            logger.info(f"🧩 GenAI 분할 추출: 제목 {len(titles)}개 -> {len(chunks)}개 청크")
+            results = await map_chunks(
+                chunks,
+                self._weighted_chunk,
+                concurrency=settings.LLM_BATCH_CONCURRENCY,
+                timeout=settings.LLM_BATCH_TIMEOUT_SECONDS
+            )
+            return merge_keyword_lists(results, top_n=15)
             
-            prompt = f"""다음은 최근 인기 있는 콘텐츠들의 제목입니다.
+        except Exception as e:
+            logger.error(f"❌ GenAI 키워드 추출 실패: {e}")
+            return []
+
+    async def _extract_chunk(self, titles: List[str]) -> List[str]:
+        """청크 단위 추출 (LLM 결과 캐시 경유)"""
+        return await llm_cache.get_or_compute(
+            "openai", self.MODEL, self.PROMPT_VERSION, titles, "",
+            lambda: self._request_keywords(titles)
+        )
+
+    async def _weighted_chunk(self, titles: List[str]) -> Tuple[List[str], float]:
+        """병합용 (키워드, 청크 크기 가중치)"""
+        return await self._extract_chunk(titles), float(len(titles))
+
+    async def _request_keywords(self, titles: List[str]) -> Tuple[List[str], int]:
+        """OpenAI 호출 -> (키워드 리스트, 사용 토큰 수)"""
+        combined_text = "\n".join(titles)
+        
+        logger.info("🤖 GenAI 마케팅 키워드 추출 시작...")
+        
+        prompt = f"""다음은 최근 인기 있는 콘텐츠들의 제목입니다.
                         이 콘텐츠들을 분석하여 마케팅 및 콘텐츠 제작에 활용할 수 있는 핵심 키워드를 추출해주세요.
 
                         요구사항:
@@ -44,24 +97,21 @@ class AIKeywordExtractor:
 
                         마케팅 키워드:"""
 
-            response = await self.client.chat.completions.create(
-                model="gpt-4o-mini",
-                messages=[
-                    {"role": "system", "content": "당신은 트렌드 분석 및 마케팅 전문가입니다."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=200
-            )
-            
-            result = response.choices[0].message.content.strip()
-            
-            # 쉼표로 분리하여 리스트로 변환
-            keywords = [k.strip() for k in result.split(',') if k.strip()]
-            
-            logger.info(f"✅ GenAI 키워드 추출 완료: {len(keywords)}개 - {keywords[:5]}...")
-            return keywords[:15]
-            
-        except Exception as e:
-            logger.error(f"❌ GenAI 키워드 추출 실패: {e}")
-            return []
+        response = await self.client.chat.completions.create(
+            model=self.MODEL,
+            messages=[
+                {"role": "system", "content": "당신은 트렌드 분석 및 마케팅 전문가입니다."},
+                {"role": "user", "content": prompt}
+            ],
+            temperature=0.3,
+            max_tokens=200
+        )
+        
+        result = response.choices[0].message.content.strip()
+        
+        # 쉼표로 분리하여 리스트로 변환
+        keywords = [k.strip() for k in result.split(',') if k.strip()]
+        tokens = response.usage.total_tokens if response.usage else 0
+        
+        logger.info(f"✅ GenAI 키워드 추출 완료: {len(keywords)}개 - {keywords[:5]}...")
+        return keywords[:15], tokens
@@ -2,15 +2,21 @@
 Google Gemini API 클라이언트
 - 트렌드 키워드 추출 및 분석용
 """
-import google.generativeai as genai
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Tuple
 from loguru import logger
 import json
 
 from ..core.config import settings
+from ..core.llm_cache import llm_cache
+from ..core.tracing import trace_methods
 from ..utils.execution_utils import handle_exception
+from ..utils.token_batching import split_by_token_budget, map_chunks, merge_keyword_dicts
 
+@trace_methods("gemini")
 class GeminiClient:
+    MODEL = "gemini-2.0-flash-exp"
+    PROMPT_VERSION = "v2"  # 프롬프트 수정 시 올려야 캐시가 갱신됨
+
     def __init__(self):
         try:
             if not settings.GEMINI_API_KEY:
@@ -18,8 +24,9 @@ class GeminiClient:
                 self.model = None
                 return
 
+            import google.generativeai as genai  # SDK는 클라이언트 생성 시점에 로딩
             genai.configure(api_key=settings.GEMINI_API_KEY)
-            self.model = genai.GenerativeModel('gemini-2.0-flash-exp')
+            self.model = genai.GenerativeModel(self.MODEL)
         except Exception as e:
             logger.error(f"⚠️ Gemini Client 초기화 실패: {e}")
             self.model = None
@@ -28,10 +35,35 @@ class GeminiClient:
     async def analyze_keywords(self, titles: List[str], country: str = "KR") -> List[Dict[str, Any]]:
         """
         제목 리스트를 받아 핵심 트렌드 키워드와 이유를 추출
+        - 토큰 예산 단위 청크로 나눠 병렬 분석(Map) 후 count 가중 병합(Reduce)
         """
         if not self.model or not titles:
             return []
 
+        # 중복 제목 제거 (순서 유지) 후 토큰 예산 단위로 분할
+        unique_titles = list(dict.fromkeys(t for t in titles if t))
+        chunks = split_by_token_budget(unique_titles, settings.LLM_BATCH_TOKEN_BUDGET)
+        if len(chunks) == 1:
+            return await self._analyze_chunk(chunks[0], country)
+
+        logger.info(f"🧩 Gemini 분할 분석: 제목 {len(unique_titles)}개 -> {len(chunks)}개 청크")
+        results = await map_chunks(
+            chunks,
+            lambda chunk: self._analyze_chunk(chunk, country),
+            concurrency=settings.LLM_BATCH_CONCURRENCY,
+            timeout=settings.LLM_BATCH_TIMEOUT_SECONDS
+        )
+        return merge_keyword_dicts(results)
+
+    async def _analyze_chunk(self, titles: List[str], country: str) -> List[Dict[str, Any]]:
+        """청크 단위 분석 (LLM 결과 캐시 경유)"""
+        return await llm_cache.get_or_compute(
+            "gemini", self.MODEL, self.PROMPT_VERSION, titles, country,
+            lambda: self._request_analysis(titles, country)
+        )
+
+    async def _request_analysis(self, titles: List[str], country: str) -> Tuple[List[Dict[str, Any]], int]:
+        """Gemini 호출 -> (키워드 분석 결과, 사용 토큰 수)"""
         # 프롬프트 구성
         prompt = f"""
         당신은 실시간 트렌드 분석 전문가입니다.
@@ -41,8 +73,7 @@ class GeminiClient:
         [분석 대상 국가]: {country}
 
         [제목 목록]:
-        {chr(10).join(titles[:100])} 
-        (너무 많으면 상위 100개만 전송)
+        {chr(10).join(titles)}
 
         [요구사항]:
         1. 단순한 단어가 아니라 '주제' 중심으로 키워드를 잡을 것 (예: '삼성' (X) -> '삼성전자 실적 발표' (O))
@@ -76,6 +107,8 @@ class GeminiClient:
         json_str = text_response.replace("```json", "").replace("```", "").strip()
         
         keywords = json.loads(json_str)
+        usage = getattr(response, "usage_metadata", None)
+        tokens = getattr(usage, "total_token_count", 0) if usage else 0
         
         logger.info(f"✅ Gemini 분석 완료: {len(keywords)}개 키워드")
-        return keywords
+        return keywords, tokens
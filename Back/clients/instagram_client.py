@@ -0,0 +1,221 @@
+"""
+Instagram 해시태그 게시물 수집
+- InstagramClient: 공통 인터페이스 (페이지 단위 비동기 순회 + 키워드 전체 동시 수집)
+- ApifyInstagramClient: Apify 해시태그 스크레이퍼 Actor 실행 -> 데이터셋 offset/limit 페이지 조회 (httpx, 호출 메트릭/record-replay)
+- FakeInstagramClient: 해시태그별 결정적 가짜 게시물 (오프라인 개발/벤치마크, 페이지당 지연 주입)
+- INSTAGRAM_BACKEND: apify / fake / off
+"""
+import asyncio
+import hashlib
+import re
+from typing import Any, AsyncIterator, Dict, List, Optional
+
+from loguru import logger
+
+from ..core.config import settings
+from ..core.tracing import trace_methods
+from ..utils.execution_utils import handle_exception
+from ..utils.http_cassette import httpx_async_client
+from ..trend.records import InstagramPost
+
+_NON_WORD = re.compile(r"[^\w]+", re.UNICODE)
+
+
+def hashtag_for(keyword: str) -> str:
+    """트렌드 키워드 -> 해시태그 (공백/구두점 제거, 소문자)"""
+    return _NON_WORD.sub("", keyword).lower()
+
+
+def _to_int(value: Any) -> int:
+    try:
+        return int(value or 0)
+    except (TypeError, ValueError):
+        return 0
+
+
+@trace_methods("instagram")
+class InstagramClient:
+    """해시태그 게시물 수집 인터페이스"""
+
+    def iter_hashtag_posts(self, hashtag: str, limit: int) -> AsyncIterator[List[InstagramPost]]:
+        """게시물 페이지 단위 비동기 순회"""
+        raise NotImplementedError
+
+    @handle_exception(error_msg="Instagram 해시태그 수집 실패", default=[])
+    async def fetch_hashtag_posts(self, hashtag: str, limit: int) -> List[InstagramPost]:
+        posts: List[InstagramPost] = []
+        async for page in self.iter_hashtag_posts(hashtag, limit):
+            posts.extend(page)
+            if len(posts) >= limit:
+                break
+        return posts[:limit]
+
+    async def fetch_for_keywords(
+        self,
+        keywords: List[str],
+        per_keyword: Optional[int] = None,
+        concurrency: Optional[int] = None,
+        timeout: Optional[float] = None
+    ) -> List[InstagramPost]:
+        """
+        키워드 전체 동시 수집 (동시 실행 수 제한)
+        - timeout 초과 시 끝난 키워드 결과만 사용하고 나머지는 취소 (수집 전체 소요 시간 상한)
+        """
+        per_keyword = per_keyword or settings.INSTAGRAM_POSTS_PER_KEYWORD
+        semaphore = asyncio.Semaphore(concurrency or settings.INSTAGRAM_CONCURRENCY)
+
+        async def fetch(hashtag: str):
+            async with semaphore:
+                return await self.fetch_hashtag_posts(hashtag, per_keyword)
+
+        hashtags = list(dict.fromkeys(tag for tag in map(hashtag_for, keywords) if tag))
+        if not hashtags:
+            return []
+        tasks = [asyncio.create_task(fetch(tag)) for tag in hashtags]
+        done, pending = await asyncio.wait(tasks, timeout=timeout or settings.INSTAGRAM_TIMEOUT_SECONDS)
+        for task in pending:
+            task.cancel()
+        if pending:
+            # 취소된 작업의 정리(Apify 실행 중단 요청)까지 끝난 뒤 반환
+            await asyncio.gather(*pending, return_exceptions=True)
+            logger.warning(f"⏱️ Instagram 수집 시간 초과: {len(pending)}/{len(tasks)}개 해시태그 취소")
+
+        posts = [post for task in done if not task.cancelled() and task.exception() is None for post in task.result()]
+        logger.info(f"✅ Instagram 수집 완료: 해시태그 {len(done)}개, 게시물 {len(posts)}개")
+        return posts
+
+
+class ApifyInstagramClient(InstagramClient):
+    """Apify Instagram Hashtag Scraper (Actor 실행 -> 완료 대기 -> 데이터셋 페이지 조회)"""
+
+    def __init__(self):
+        self._client = None
+
+    @property
+    def client(self):
+        if self._client is None:
+            self._client = httpx_async_client("apify")
+        return self._client
+
+    def _url(self, path: str) -> str:
+        return f"{settings.APIFY_BASE_URL.rstrip('/')}/v2/{path}"
+
+    @property
+    def _headers(self) -> Dict[str, str]:
+        # 토큰은 쿼리 대신 헤더로 전달 (카세트/로그에 남지 않음)
+        return {"Authorization": f"Bearer {settings.APIFY_TOKEN}"}
+
+    @staticmethod
+    def _normalize(item: Dict[str, Any]) -> Optional[InstagramPost]:
+        post_id = item.get("id") or item.get("shortCode")
+        if not post_id:
+            return None
+        short_code = item.get("shortCode")
+        # InstagramPost(post_id, username, caption, likes, comments, timestamp, url)
+        return InstagramPost(
+            str(post_id)[:100],
+            (item.get("ownerUsername") or "")[:100],
+            item.get("caption") or "",
+            _to_int(item.get("likesCount")),
+            _to_int(item.get("commentsCount")),
+            (item.get("timestamp") or "")[:50],
+            (item.get("url") or (f"https://www.instagram.com/p/{short_code}/" if short_code else ""))[:300],
+        )
+
+    async def _run(self, hashtag: str, limit: int) -> Optional[Dict[str, Any]]:
+        """
+        Actor 실행 시작 -> 완료 대기
+        - 시작 요청은 대기 없이 바로 반환 (실행 id를 먼저 확보해야 취소 시 중단 가능)
+        - 대기 중 취소(fetch_for_keywords 시간 초과 등)되면 Apify 실행도 중단 (계속 돌며 과금되지 않도록)
+        """
+        response = await self.client.post(
+            self._url(f"acts/{settings.APIFY_INSTAGRAM_ACTOR}/runs"),
+            json={"hashtags": [hashtag], "resultsLimit": limit},
+            headers=self._headers,
+        )
+        response.raise_for_status()
+        run = response.json()["data"]
+
+        # 최대 60초씩 서버 측 대기 (폴링 간격 없이 완료 즉시 반환)
+        try:
+            while run.get("status") in ("READY", "RUNNING"):
+                response = await self.client.get(
+                    self._url(f"actor-runs/{run['id']}"), params={"waitForFinish": 60}, headers=self._headers
+                )
+                response.raise_for_status()
+                run = response.json()["data"]
+        except asyncio.CancelledError:
+            await self._abort(run["id"], hashtag)
+            raise
+
+        if run.get("status") != "SUCCEEDED":
+            logger.warning(f"⚠️ Apify 실행 실패 (#{hashtag}): {run.get('status')}")
+            return None
+        return run
+
+    async def _abort(self, run_id: str, hashtag: str):
+        """진행 중인 Actor 실행 중단 (취소 처리 중이므로 실패해도 로그만)"""
+        try:
+            response = await self.client.post(self._url(f"actor-runs/{run_id}/abort"), headers=self._headers)
+            response.raise_for_status()
+            logger.info(f"🛑 Apify 실행 중단 (#{hashtag}): {run_id}")
+        except Exception as e:
+            logger.warning(f"⚠️ Apify 실행 중단 실패 (#{hashtag}): {e}")
+
+    async def iter_hashtag_posts(self, hashtag: str, limit: int) -> AsyncIterator[List[InstagramPost]]:
+        run = await self._run(hashtag, limit)
+        if run is None:
+            return
+
+        page_size = settings.INSTAGRAM_PAGE_SIZE
+        offset = 0
+        while offset < limit:
+            response = await self.client.get(
+                self._url(f"datasets/{run['defaultDatasetId']}/items"),
+                params={"offset": offset, "limit": min(page_size, limit - offset), "clean": "true"},
+                headers=self._headers,
+            )
+            response.raise_for_status()
+            items = response.json()
+            page = [post for post in map(self._normalize, items) if post]
+            if page:
+                yield page
+            if len(items) < min(page_size, limit - offset):
+                break
+            offset += len(items)
+
+
+class FakeInstagramClient(InstagramClient):
+    """해시태그 해시 기반 결정적 게시물 (페이지마다 INSTAGRAM_FAKE_LATENCY_MS 지연)"""
+
+    def __init__(self, latency_ms: Optional[float] = None):
+        self.latency = (settings.INSTAGRAM_FAKE_LATENCY_MS if latency_ms is None else latency_ms) / 1000
+
+    async def iter_hashtag_posts(self, hashtag: str, limit: int) -> AsyncIterator[List[InstagramPost]]:
+        seed = int(hashlib.md5(hashtag.encode("utf-8")).hexdigest()[:8], 16)
+        page_size = settings.INSTAGRAM_PAGE_SIZE
+        for offset in range(0, limit, page_size):
+            if self.latency:
+                await asyncio.sleep(self.latency)
+            yield [
+                InstagramPost(
+                    f"fake_{seed:08x}_{i}",
+                    f"user_{(seed + i) % 997}",
+                    f"#{hashtag} 게시물 {i}",
+                    (seed >> (i % 16)) % 50_000,
+                    (seed + i * 7) % 900,
+                    f"2025-01-{1 + i % 28:02d}T12:00:00.000Z",
+                    f"https://www.instagram.com/p/fake{seed:08x}{i}/",
+                )
+                for i in range(offset, min(offset + page_size, limit))
+            ]
+
+
+def create_instagram_client() -> Optional[InstagramClient]:
+    """INSTAGRAM_BACKEND 기준 클라이언트 (off면 None)"""
+    backend = settings.INSTAGRAM_BACKEND
+    if backend == "apify":
+        return ApifyInstagramClient()
+    if backend == "fake":
+        return FakeInstagramClient()
+    return None
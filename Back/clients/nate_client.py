@@ -1,10 +1,11 @@
-
-import requests
-from bs4 import BeautifulSoup
 from typing import List
 from loguru import logger
+from ..core.config import settings
+from ..core.tracing import trace_methods
 from ..utils.execution_utils import handle_exception
+from ..utils.http_cassette import http_session
 
+@trace_methods("nate")
 class NateClient:
     """Nate 실시간 이슈 키워드 수집 클라이언트"""
     
@@ -12,6 +13,7 @@ class NateClient:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        self.session = http_session("nate")
 
     @handle_exception(error_msg="Nate 트렌드 수집 실패", default=[])
     async def get_realtime_trends(self) -> List[str]:
@@ -23,14 +25,15 @@ class NateClient:
         # 모바일 페이지(m.nate.com)가 구조가 단순하여 크롤링에 유리할 수 있음.
         # PC: www.nate.com -> .isKeyword
         
-        url = "https://www.nate.com/"
+        url = settings.NATE_URL
         logger.info(f"Nate 트렌드 수집 시도: {url}")
         
-        response = requests.get(url, headers=self.headers, timeout=5)
+        response = self.session.get(url, headers=self.headers, timeout=5)
         if response.status_code != 200:
             logger.warning(f"Nate 접속 실패: {response.status_code}")
             return []
             
+        from bs4 import BeautifulSoup  # 파싱 시점 로딩 (cold start 단축)
         soup = BeautifulSoup(response.text, 'html.parser')
         keywords = []
         
@@ -66,7 +69,11 @@ class NateClient:
             # 네이트의 경우 HTML 구조상 텍스트가 분리되어 있을 수 있음.
             # 예시 출력: ['단식 장동혁'] -> 깔끔함.
             
+            # 순위 숫자만 있는 줄(<span class="num">1</span>)은 키워드가 아님
+            lines = [line for line in lines if not line.isdigit()]
             word = lines[0] if lines else raw_text
+            if txt_span and txt_span.get_text(strip=True):
+                word = txt_span.get_text(strip=True)
             
             # 2글자 이상만
             if len(word) >= 2 and word not in keywords:
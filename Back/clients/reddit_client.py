@@ -1,9 +1,12 @@
 
-import requests
 from typing import List
 from loguru import logger
+from ..core.config import settings
+from ..core.tracing import trace_methods
 from ..utils.execution_utils import handle_exception
+from ..utils.http_cassette import http_session
 
+@trace_methods("reddit")
 class RedditClient:
     """Reddit Popular 트렌드 수집 클라이언트"""
     
@@ -11,6 +14,7 @@ class RedditClient:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        self.session = http_session("reddit")
 
     @handle_exception(error_msg="Reddit 트렌드 수집 실패", default=[])
     async def get_global_trends(self) -> List[str]:
@@ -19,10 +23,10 @@ class RedditClient:
         :return: ['Topic 1', 'Topic 2', ...]
         """
         # API 없이 JSON 엔드포인트 사용
-        url = "https://www.reddit.com/r/popular/top.json?limit=25&t=day"
+        url = settings.REDDIT_POPULAR_URL
         logger.info(f"Reddit 트렌드 수집 시도: {url}")
         
-        response = requests.get(url, headers=self.headers, timeout=10)
+        response = self.session.get(url, headers=self.headers, timeout=10)
         if response.status_code != 200:
             logger.warning(f"Reddit 접속 실패: {response.status_code}")
             return []
@@ -1,15 +1,22 @@
-
-import feedparser
-from typing import List, Dict, Any
+from datetime import datetime
+from typing import List
 from loguru import logger
+from ..core.config import settings
+from ..core.tracing import trace_methods
 from ..utils.execution_utils import handle_exception
+from ..utils.http_cassette import http_session
+from ..trend.records import NewsRecord
 
+@trace_methods("rss")
 class RSSClient:
     """RSS 피드 수집 클라이언트"""
     
+    def __init__(self):
+        self.session = http_session("google_news_rss")
+    
     @handle_exception(error_msg="Google News RSS 수집 실패", default=[])
-    def fetch_google_news(self, country: str) -> List[Dict[str, Any]]:
-        """Google News RSS 헤드라인 파싱"""
+    def fetch_google_news(self, country: str) -> List[NewsRecord]:
+        """Google News RSS 헤드라인 파싱 (발행 시각이 없으면 수집 시각)"""
         # 국가별 RSS URL 설정
         configs = {
             "KR": {"hl": "ko", "gl": "KR", "ceid": "KR:ko"},
@@ -20,28 +27,30 @@ class RSSClient:
         }
         
         config = configs.get(country, configs["US"])
-        url = f"https://news.google.com/rss?hl={config['hl']}&gl={config['gl']}&ceid={config['ceid']}"
+        url = f"{settings.GOOGLE_NEWS_RSS_URL}?hl={config['hl']}&gl={config['gl']}&ceid={config['ceid']}"
         
-        feed = feedparser.parse(url)
+        # 다운로드는 공용 세션(기록/재생 지원), 파싱만 feedparser
+        response = self.session.get(url, timeout=10)
+        import feedparser  # 파싱 시점 로딩 (cold start 단축)
+        feed = feedparser.parse(response.content)
         
-        keywords = []
-        for i, entry in enumerate(feed.entries[:20]):
+        headlines = []
+        for entry in feed.entries[:20]:
             # 제목에서 매체명 제거 (예: "제목 - 조선일보" -> "제목")
             title = entry.title
             if ' - ' in title:
                 title = title.rsplit(' - ', 1)[0]
             
-            keywords.append({
-                "keyword": title, # 뉴스 제목 자체가 이슈 키워드
-                "country": country,
-                "trend_volume": 0,
-                "rank": i + 1,
-                "url": entry.link,
-                "published_at": entry.get("published", "")
-            })
+            # NewsRecord(title, source, url, published_at)
+            headlines.append(NewsRecord(
+                title,
+                "Google News",
+                entry.get("link", ""),
+                entry.get("published") or datetime.now().isoformat()
+            ))
             
-        if keywords:
-            logger.info(f"✅ Google News RSS 수집 성공 ({country}): {len(keywords)}개")
-            return keywords
+        if headlines:
+            logger.info(f"✅ Google News RSS 수집 성공 ({country}): {len(headlines)}개")
+            return headlines
             
         return []
@@ -0,0 +1,195 @@
+"""
+표 형식 싱크 (sheet_sync 대상)
+- GoogleSheetsSink: Sheets API v4 (googleapiclient + 서비스 계정, 호출 메트릭/record-replay는 googleapi_http)
+- LocalFileSink: 탭 1개 = CSV 파일 1개 (테스트/오프라인 대체용, Sheets와 같은 행 번호 체계)
+
+공통 규칙
+- 1행은 헤더, 데이터는 2행부터 / 행 번호는 1부터
+- prepare(): 탭/헤더 보장 + 키 컬럼 전체를 1회 읽어 {키: 행 번호}
+- append_rows(): 표 끝에 추가하고 첫 행 번호 반환 / update_rows(): 여러 행을 호출 1회로 덮어쓰기
+"""
+import asyncio
+import csv
+import os
+import re
+from typing import Dict, List, Sequence, Tuple
+
+from loguru import logger
+
+from ..core.config import settings
+from ..core.tracing import trace_methods
+from ..utils.http_cassette import googleapi_http
+
+_SCOPES = ["https://www.googleapis.com/auth/spreadsheets"]
+_RANGE_START_ROW = re.compile(r"![A-Z]+(\d+)")
+
+
+def _column_letter(index: int) -> str:
+    """0 -> A, 25 -> Z, 26 -> AA"""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(65 + rem) + letters
+    return letters
+
+
+class TabularSink:
+    """싱크 인터페이스 (모든 메서드는 호출 1회 = 외부 요청 1회 기준으로 설계)"""
+
+    name = "sink"
+
+    async def prepare(self, tab: str, header: Sequence[str], key_index: int) -> Dict[str, int]:
+        raise NotImplementedError
+
+    async def append_rows(self, tab: str, rows: List[List[str]]) -> int:
+        raise NotImplementedError
+
+    async def update_rows(self, tab: str, updates: List[Tuple[int, List[str]]]):
+        raise NotImplementedError
+
+    def is_retryable(self, error: Exception) -> bool:
+        """속도 제한/일시 오류 여부 (sheet_sync가 백오프 후 같은 청크 재시도)"""
+        return False
+
+
+@trace_methods("gsheets")
+class GoogleSheetsSink(TabularSink):
+    """Google Sheets (GOOGLE_SHEET_ID + GOOGLE_SERVICE_ACCOUNT_FILE)"""
+
+    def __init__(self, spreadsheet_id: str = None, credentials_file: str = None):
+        self.spreadsheet_id = spreadsheet_id or settings.GOOGLE_SHEET_ID
+        self.credentials_file = credentials_file or settings.GOOGLE_SERVICE_ACCOUNT_FILE
+        if not self.spreadsheet_id or not self.credentials_file:
+            raise ValueError("GOOGLE_SHEET_ID / GOOGLE_SERVICE_ACCOUNT_FILE 설정이 필요합니다.")
+        self.name = f"gsheets:{self.spreadsheet_id}"
+        self._service = None
+
+    @property
+    def service(self):
+        """Sheets API 리소스 (googleapiclient/google-auth 로딩은 첫 호출 시 1회)"""
+        if self._service is None:
+            from google.oauth2 import service_account
+            from google_auth_httplib2 import AuthorizedHttp
+            from googleapiclient.discovery import build
+
+            credentials = service_account.Credentials.from_service_account_file(self.credentials_file, scopes=_SCOPES)
+            self._service = build(
+                "sheets", "v4", http=AuthorizedHttp(credentials, http=googleapi_http("sheets")), cache_discovery=False
+            )
+        return self._service
+
+    def is_retryable(self, error: Exception) -> bool:
+        status = getattr(getattr(error, "resp", None), "status", None)
+        return status in (429, 500, 502, 503, 504)
+
+    def _prepare(self, tab: str, header: Sequence[str], key_index: int) -> Dict[str, int]:
+        values = self.service.spreadsheets().values()
+        key_column = _column_letter(key_index)
+        try:
+            response = values.get(
+                spreadsheetId=self.spreadsheet_id, range=f"'{tab}'!{key_column}:{key_column}",
+                majorDimension="COLUMNS"
+            ).execute()
+        except Exception as e:
+            # 탭이 없으면 범위 파싱 오류(400) -> 탭 생성
+            if getattr(getattr(e, "resp", None), "status", None) != 400:
+                raise
+            self.service.spreadsheets().batchUpdate(
+                spreadsheetId=self.spreadsheet_id,
+                body={"requests": [{"addSheet": {"properties": {"title": tab}}}]}
+            ).execute()
+            logger.info(f"📄 시트 탭 생성: {tab}")
+            response = {}
+
+        column = (response.get("values") or [[]])[0]
+        if not column:
+            values.update(
+                spreadsheetId=self.spreadsheet_id, range=f"'{tab}'!A1",
+                valueInputOption="RAW", body={"values": [list(header)]}
+            ).execute()
+            return {}
+        return {key: row for row, key in enumerate(column[1:], start=2) if key}
+
+    def _append(self, tab: str, rows: List[List[str]]) -> int:
+        response = self.service.spreadsheets().values().append(
+            spreadsheetId=self.spreadsheet_id, range=f"'{tab}'!A1",
+            valueInputOption="RAW", insertDataOption="INSERT_ROWS", body={"values": rows}
+        ).execute()
+        match = _RANGE_START_ROW.search(response.get("updates", {}).get("updatedRange", ""))
+        return int(match.group(1)) if match else 0
+
+    def _update(self, tab: str, updates: List[Tuple[int, List[str]]]):
+        self.service.spreadsheets().values().batchUpdate(
+            spreadsheetId=self.spreadsheet_id,
+            body={
+                "valueInputOption": "RAW",
+                "data": [{"range": f"'{tab}'!A{row}", "values": [values]} for row, values in updates],
+            }
+        ).execute()
+
+    # googleapiclient는 동기 호출 -> 스레드에서 실행 (한 싱크에서 동시에 1개씩만 호출)
+    async def prepare(self, tab: str, header: Sequence[str], key_index: int) -> Dict[str, int]:
+        return await asyncio.to_thread(self._prepare, tab, header, key_index)
+
+    async def append_rows(self, tab: str, rows: List[List[str]]) -> int:
+        return await asyncio.to_thread(self._append, tab, rows)
+
+    async def update_rows(self, tab: str, updates: List[Tuple[int, List[str]]]):
+        await asyncio.to_thread(self._update, tab, updates)
+
+
+class LocalFileSink(TabularSink):
+    """<디렉터리>/<탭>.csv (Sheets 대체: 같은 행 번호/호출 단위, calls에 호출 수 기록)"""
+
+    def __init__(self, directory: str = None):
+        self.directory = directory or settings.SYNC_FILE_DIR
+        os.makedirs(self.directory, exist_ok=True)
+        self.name = f"file:{os.path.abspath(self.directory)}"
+        self.calls: Dict[str, int] = {}
+
+    def _path(self, tab: str) -> str:
+        return os.path.join(self.directory, f"{tab}.csv")
+
+    def _count(self, call: str):
+        self.calls[call] = self.calls.get(call, 0) + 1
+
+    def _read(self, tab: str) -> List[List[str]]:
+        with open(self._path(tab), encoding="utf-8", newline="") as f:
+            return list(csv.reader(f))
+
+    async def prepare(self, tab: str, header: Sequence[str], key_index: int) -> Dict[str, int]:
+        self._count("prepare")
+        if not os.path.exists(self._path(tab)):
+            with open(self._path(tab), "w", encoding="utf-8", newline="") as f:
+                csv.writer(f).writerow(header)
+            return {}
+        rows = self._read(tab)
+        return {row[key_index]: n for n, row in enumerate(rows[1:], start=2) if len(row) > key_index and row[key_index]}
+
+    async def append_rows(self, tab: str, rows: List[List[str]]) -> int:
+        self._count("append")
+        start = len(self._read(tab)) + 1
+        with open(self._path(tab), "a", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows(rows)
+        return start
+
+    async def update_rows(self, tab: str, updates: List[Tuple[int, List[str]]]):
+        self._count("update")
+        rows = self._read(tab)
+        for row, values in updates:
+            rows[row - 1] = values
+        tmp = self._path(tab) + ".tmp"
+        with open(tmp, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows(rows)
+        os.replace(tmp, self._path(tab))
+
+
+def create_sink(kind: str = None, directory: str = None) -> TabularSink:
+    """SYNC_SINK(gsheets / file) 기준 싱크 생성"""
+    kind = kind or settings.SYNC_SINK
+    if kind == "file":
+        return LocalFileSink(directory)
+    if kind == "gsheets":
+        return GoogleSheetsSink()
+    raise ValueError(f"지원하지 않는 싱크: {kind}")
@@ -1,10 +1,11 @@
-
-import requests
-from bs4 import BeautifulSoup
 from typing import List
 from loguru import logger
+from ..core.config import settings
+from ..core.tracing import trace_methods
 from ..utils.execution_utils import handle_exception
+from ..utils.http_cassette import http_session
 
+@trace_methods("yahoo_japan")
 class YahooJapanClient:
     """Yahoo! Japan 실시간 검색어 수집 클라이언트"""
     
@@ -12,6 +13,7 @@ class YahooJapanClient:
         self.headers = {
             'User-Agent': 'Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36'
         }
+        self.session = http_session("yahoo_japan")
 
     @handle_exception(error_msg="Yahoo Japan 트렌드 수집 실패", default=[])
     async def get_realtime_trends(self) -> List[str]:
@@ -19,14 +21,15 @@ class YahooJapanClient:
         Yahoo! Japan 실시간 급상승 검색어 수집
         :return: ['キーワード1', 'キーワード2', ...]
         """
-        url = "https://search.yahoo.co.jp/realtime/search"
+        url = settings.YAHOO_JAPAN_REALTIME_URL
         logger.info(f"Yahoo Japan 트렌드 수집 시도: {url}")
         
-        response = requests.get(url, headers=self.headers, timeout=10)
+        response = self.session.get(url, headers=self.headers, timeout=10)
         if response.status_code != 200:
             logger.warning(f"Yahoo Japan 접속 실패: {response.status_code}")
             return []
             
+        from bs4 import BeautifulSoup  # 파싱 시점 로딩 (cold start 단축)
         soup = BeautifulSoup(response.text, 'html.parser')
         keywords = []
         
@@ -1,22 +1,40 @@
-from googleapiclient.discovery import build
 import asyncio
-from typing import List, Dict, Any
+from typing import List
 from loguru import logger
+from ..core import metrics
 from ..core.config import settings
+from ..core.tracing import trace_methods
 from ..utils.execution_utils import handle_exception
+from ..utils.http_cassette import googleapi_http
+from ..trend.records import VideoRecord
 
+@trace_methods("youtube")
 class YouTubeClient:
     """YouTube Data API v3 클라이언트"""
     
     def __init__(self):
-        try:
-            self.youtube = build("youtube", "v3", developerKey=settings.YOUTUBE_API_KEY)
-        except Exception as e:
-            logger.error(f"⚠️ YouTube API 초기화 실패: {e}")
-            self.youtube = None
+        self._youtube = None
+        self._initialized = False
+
+    @property
+    def youtube(self):
+        """YouTube API 리소스 (googleapiclient 로딩/Discovery 파싱은 첫 호출 시 1회)"""
+        if not self._initialized:
+            self._initialized = True
+            try:
+                from googleapiclient.discovery import build
+                client_options = {"api_endpoint": settings.YOUTUBE_API_ENDPOINT} if settings.YOUTUBE_API_ENDPOINT else None
+                self._youtube = build(
+                    "youtube", "v3", developerKey=settings.YOUTUBE_API_KEY,
+                    client_options=client_options, http=googleapi_http("youtube")
+                )
+            except Exception as e:
+                logger.error(f"⚠️ YouTube API 초기화 실패: {e}")
+                self._youtube = None
+        return self._youtube
     
     @handle_exception(error_msg="YouTube 검색 실패", default=[])
-    async def search_videos(self, keyword: str, max_results: int = 10) -> List[Dict[str, Any]]:
+    async def search_videos(self, keyword: str, max_results: int = 10) -> List[VideoRecord]:
         """비디오 검색 (비동기 래퍼)"""
         if not self.youtube:
             logger.warning(f"YouTube Client 미작동 (Skip: {keyword})")
@@ -25,6 +43,7 @@ class YouTubeClient:
         loop = asyncio.get_event_loop()
         
         def _execute():
+            metrics.youtube_quota_units.inc("search.list", amount=100)
             return self.youtube.search().list(
                 q=keyword,
                 part="snippet",
@@ -39,19 +58,20 @@ class YouTubeClient:
             snippet = item.get("snippet", {})
             video_id = item.get("id", {}).get("videoId", "")
             
-            videos.append({
-                "video_id": video_id,
-                "title": snippet.get("title", ""),
-                "channel": snippet.get("channelTitle", ""),
-                "published_at": snippet.get("publishedAt", ""),
-                "url": f"https://youtube.com/watch?v={video_id}"
-            })
+            # VideoRecord(video_id, title, channel, published_at, url)
+            videos.append(VideoRecord(
+                video_id,
+                snippet.get("title", ""),
+                snippet.get("channelTitle", ""),
+                snippet.get("publishedAt", ""),
+                f"https://youtube.com/watch?v={video_id}"
+            ))
         
         logger.info(f"✅ YouTube 수집 완료: {keyword} ({len(videos)}개)")
         return videos
     
     @handle_exception(error_msg="YouTube Trending 수집 실패", default=[])
-    async def get_trending_videos(self, country: str = "KR", max_results: int = 20) -> List[Dict[str, Any]]:
+    async def get_trending_videos(self, country: str = "KR", max_results: int = 20) -> List[VideoRecord]:
         """
         YouTube 실시간 인기 영상 수집 (Trending)
         """
@@ -65,6 +85,7 @@ class YouTubeClient:
         def _fetch():
             if not self.youtube:
                  raise Exception("YouTube Client is None")
+            metrics.youtube_quota_units.inc("videos.list", amount=1)
             request = self.youtube.videos().list(
                 part="snippet,statistics",
                 chart="mostPopular",
@@ -82,15 +103,16 @@ class YouTubeClient:
             snippet = item['snippet']
             stats = item.get('statistics', {})
             
-            videos.append({
-                'video_id': item['id'],
-                'title': snippet['title'],
-                'channel': snippet['channelTitle'],
-                'url': f"https://youtube.com/watch?v={item['id']}",
-                'views': int(stats.get('viewCount', 0)),
-                'likes': int(stats.get('likeCount', 0)),
-                'published_at': snippet['publishedAt']
-            })
+            # VideoRecord(video_id, title, channel, published_at, url, views, likes)
+            videos.append(VideoRecord(
+                item['id'],
+                snippet['title'],
+                snippet['channelTitle'],
+                snippet['publishedAt'],
+                f"https://youtube.com/watch?v={item['id']}",
+                int(stats.get('viewCount', 0)),
+                int(stats.get('likeCount', 0))
+            ))
         
         logger.info(f"✅ YouTube Trending 수집 성공 ({country}): {len(videos)}개")
         return videos
@@ -0,0 +1,7 @@
+"""
+ORM 선언 Base (모델 등록 전용)
+- 엔진/커넥션 풀과 분리: Alembic / 모델 import 시 asyncpg 엔진을 만들지 않음
+"""
+from sqlalchemy.orm import declarative_base
+
+Base = declarative_base()
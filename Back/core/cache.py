@@ -0,0 +1,189 @@
+"""
+응답 캐시 (In-Memory LRU + 국가별 데이터 세대(Generation) 카운터)
+- 키: (endpoint, country, params, 세대)
+- 수집이 끝나면 bump_generation(country)로 해당 국가 캐시 즉시 무효화
+- 세대는 Postgres(cache_generations)에 저장: 다른 워커는 RESPONSE_CACHE_GENERATION_SYNC_SECONDS마다 다시 읽어 무효화
+- DB 조회 실패 등으로 세대 동기화가 늦어져도 항목은 RESPONSE_CACHE_TTL_SECONDS 후 만료
+- 강한 ETag 생성 및 If-None-Match 비교 지원
+"""
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
+
+from loguru import logger
+
+from .config import settings
+from .database import execute_return, fetch_all
+from .responses import dumps
+
+
+class CachedResponse:
+    """캐시된 직렬화 결과 (본문 bytes + 강한 ETag)"""
+    __slots__ = ("body", "etag", "expires_at")
+
+    def __init__(self, body: bytes, etag: str, expires_at: float = 0.0):
+        self.body = body
+        self.etag = etag
+        self.expires_at = expires_at
+
+
+def make_etag(body: bytes) -> str:
+    """본문 바이트 기반 강한(Strong) ETag"""
+    return '"' + hashlib.blake2b(body, digest_size=16).hexdigest() + '"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """If-None-Match 헤더와 ETag 비교 (목록/와일드카드 지원)"""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return etag in candidates
+
+
+def serialize(payload: Any) -> bytes:
+    """JSON 직렬화 (orjson, datetime 등은 네이티브 처리)"""
+    return dumps(payload)
+
+
+class ResponseCache:
+    """
+    크기 제한이 있는 LRU 응답 캐시
+    - max_entries: 최대 항목 수
+    - max_bytes: 본문 총 바이트 상한
+    - ttl_seconds: 항목 만료 (세대 동기화가 실패해도 다른 워커의 오래된 응답이 남지 않도록)
+    - sync_seconds: 공유 세대(DB) 재조회 간격
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 256,
+        max_bytes: int = 32 * 1024 * 1024,
+        ttl_seconds: float = 600.0,
+        sync_seconds: float = 2.0
+    ):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.ttl_seconds = ttl_seconds
+        self.sync_seconds = sync_seconds
+        self._entries: "OrderedDict[Tuple, CachedResponse]" = OrderedDict()
+        self._generations: Dict[str, int] = {}
+        self._synced_at = float("-inf")
+        self._size = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def generation(self, country: str) -> int:
+        """국가별 현재 데이터 세대 (이 프로세스가 마지막으로 확인한 값)"""
+        return self._generations.get(country, 0)
+
+    def _apply_generation(self, country: str, gen: int):
+        """세대 갱신 + 해당 국가 캐시 제거"""
+        with self._lock:
+            if self._generations.get(country, 0) == gen:
+                return
+            self._generations[country] = gen
+            for key in [k for k in self._entries if k[1] == country]:
+                self._size -= len(self._entries.pop(key).body)
+
+    async def bump_generation(self, country: str) -> int:
+        """수집 완료 시 호출 -> 공유 세대 증가 + 이 프로세스의 해당 국가 캐시 즉시 제거"""
+        try:
+            row = await execute_return(
+                """
+                INSERT INTO cache_generations (country, generation, updated_at) VALUES (:country, 1, NOW())
+                ON CONFLICT (country) DO UPDATE
+                SET generation = cache_generations.generation + 1, updated_at = NOW()
+                RETURNING generation
+                """,
+                {"country": country}
+            )
+            gen = row["generation"]
+        except Exception as e:
+            # 다른 워커는 TTL 만료 전까지 이전 응답을 줄 수 있음
+            logger.warning(f"⚠️ 캐시 세대 저장 실패, 로컬만 무효화 ({country}): {e}")
+            gen = self.generation(country) + 1
+        self._apply_generation(country, gen)
+        return gen
+
+    async def refresh_generations(self):
+        """다른 워커가 올린 세대 반영 (sync_seconds 간격, 실패 시 다음 간격에 재시도)"""
+        now = time.monotonic()
+        if now - self._synced_at < self.sync_seconds:
+            return
+        self._synced_at = now
+        try:
+            rows = await fetch_all("SELECT country, generation FROM cache_generations")
+        except Exception as e:
+            logger.warning(f"⚠️ 캐시 세대 조회 실패: {e}")
+            return
+        for row in rows:
+            self._apply_generation(row["country"], row["generation"])
+
+    def make_key(self, endpoint: str, country: str, params: Dict[str, Any]) -> Tuple:
+        return (endpoint, country, tuple(sorted(params.items())), self.generation(country))
+
+    def get(self, key: Tuple) -> Optional[CachedResponse]:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None and entry.expires_at <= time.monotonic():
+                self._size -= len(self._entries.pop(key).body)
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return entry
+
+    def put(self, key: Tuple, payload: Any, store: bool = True) -> CachedResponse:
+        """payload를 직렬화하여 저장 후 반환 (세대가 바뀌었거나 store=False면 저장 생략)"""
+        body = serialize(payload)
+        entry = CachedResponse(body, make_etag(body), time.monotonic() + self.ttl_seconds)
+        if not store:
+            return entry
+
+        with self._lock:
+            # 빌드 도중 수집이 끝나 세대가 바뀐 경우, 오래된 결과는 저장하지 않음
+            if key[-1] != self._generations.get(key[1], 0):
+                return entry
+            if len(body) > self.max_bytes:
+                return entry
+
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self._size -= len(old.body)
+            self._entries[key] = entry
+            self._size += len(body)
+
+            # LRU 제거 (항목 수 / 바이트 상한)
+            while self._entries and (len(self._entries) > self.max_entries or self._size > self.max_bytes):
+                _, evicted = self._entries.popitem(last=False)
+                self._size -= len(evicted.body)
+        return entry
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self._size = 0
+
+    def stats(self) -> Dict[str, int]:
+        return {
+            "entries": len(self._entries),
+            "bytes": self._size,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# 프로세스 전역 캐시 인스턴스
+response_cache = ResponseCache(
+    max_entries=settings.RESPONSE_CACHE_MAX_ENTRIES,
+    max_bytes=settings.RESPONSE_CACHE_MAX_BYTES,
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    sync_seconds=settings.RESPONSE_CACHE_GENERATION_SYNC_SECONDS,
+)
@@ -22,13 +22,114 @@ class Settings(BaseSettings):
     OPENAI_API_KEY: str
     GEMINI_API_KEY: str
     
+    # Upstream Endpoints (오프라인 벤치마크/테스트 시 로컬 가짜 서버로 교체)
+    NATE_URL: str = "https://www.nate.com/"
+    REDDIT_POPULAR_URL: str = "https://www.reddit.com/r/popular/top.json?limit=25&t=day"
+    YAHOO_JAPAN_REALTIME_URL: str = "https://search.yahoo.co.jp/realtime/search"
+    GOOGLE_NEWS_RSS_URL: str = "https://news.google.com/rss"
+    YOUTUBE_API_ENDPOINT: Optional[str] = None  # 예: http://127.0.0.1:8765/
+    OPENAI_BASE_URL: Optional[str] = None  # 예: http://127.0.0.1:8765/v1
+
+    # Instagram (Back/clients/instagram_client.py)
+    INSTAGRAM_BACKEND: str = "off"  # apify / fake (오프라인 가짜 게시물) / off
+    APIFY_BASE_URL: str = "https://api.apify.com"
+    APIFY_INSTAGRAM_ACTOR: str = "apify~instagram-hashtag-scraper"
+    INSTAGRAM_POSTS_PER_KEYWORD: int = 20
+    INSTAGRAM_PAGE_SIZE: int = 100  # 데이터셋 페이지 크기
+    INSTAGRAM_CONCURRENCY: int = 5  # 동시 실행 해시태그 수 (Apify 동시 실행 한도 이하)
+    INSTAGRAM_TIMEOUT_SECONDS: float = 90.0  # 초과 시 끝난 해시태그 결과만 저장
+    INSTAGRAM_FAKE_LATENCY_MS: float = 0.0
+
+    # HTTP Record/Replay (Back/utils/http_cassette.py)
+    HTTP_MODE: str = "live"  # live / record / replay
+    HTTP_CASSETTE: str = "default"  # 카세트 이름 -> <HTTP_CASSETTE_DIR>/<이름>.jsonl.gz
+    HTTP_CASSETTE_DIR: str = "cassettes"
+    HTTP_REPLAY_SPEED: float = 0.0  # 0: 지연 없음, 1: 기록된 응답 시간 그대로, 2: 2배속
+    HTTP_REPLAY_CONCURRENCY: int = 0  # 재생 동시 응답 수 제한 (0: 무제한)
+    HTTP_MATCH_ON: str = "method,host,path,query,body"  # 요청 매칭 규칙 (host를 빼면 다른 주소로 기록한 카세트도 재생)
+    HTTP_IGNORE_PARAMS: str = "key,api_key,access_token"  # URL 매칭/저장 시 제외할 쿼리 파라미터
+
+    # Tracing (Back/core/tracing.py)
+    TRACE_SAMPLE_RATE: float = 0.0  # 요청 샘플링 비율 (0: 끔)
+    TRACE_TRUST_PARENT: bool = False  # traceparent sampled 플래그를 따름 (신뢰하는 게이트웨이 뒤에서만 켤 것)
+    TRACE_EXPORTER: str = "none"  # none / stdout / file (OTLP/JSON 한 줄씩)
+    TRACE_EXPORT_PATH: str = "traces.jsonl"
+    TRACE_SERVER_TIMING: bool = True  # 서버가 직접 샘플링한 요청 응답에 Server-Timing 헤더 추가
+    TRACE_SERVER_TIMING_LIMIT: int = 15  # 헤더에 넣을 Span 이름 수 (소요 시간 큰 순)
+    TRACE_SERVICE_NAME: str = "keyword-trend-collector"
+
+    # Export (Back/trend/export.py)
+    EXPORT_CHUNK_ROWS: int = 10000  # 서버 사이드 커서 1회 fetch 행 수 = CSV/JSONL 청크 = Parquet row group
+
     # Google Sheets (Optional - 호환성 유지)
     GOOGLE_SHEET_ID: Optional[str] = None
+    GOOGLE_SERVICE_ACCOUNT_FILE: Optional[str] = None  # 시트 편집 권한을 받은 서비스 계정 키(JSON)
+
+    # Sheet Sync (Back/trend/sheet_sync.py)
+    SYNC_SINK: str = "gsheets"  # gsheets / file (로컬 CSV 대체 싱크)
+    SYNC_FILE_DIR: str = "sheet_sync"
+    SYNC_SCAN_ROWS: int = 10000  # DB 변경분 페이지 크기
+    SYNC_CHUNK_ROWS: int = 5000  # 쓰기 호출 1회 최대 행 수
+    SYNC_CHUNK_BYTES: int = 2_000_000  # 쓰기 호출 1회 대략적 요청 크기 상한 (Sheets 권장 2MB)
+    SYNC_WRITE_CALLS_PER_MINUTE: int = 50  # Sheets 쓰기 한도(분당 60회/사용자) 이하로 유지
+    SYNC_LAG_SECONDS: int = 10  # 이 시간 이내 수집분은 다음 실행으로 미룸 (커밋 지연 행 누락 방지)
     
     # Application
     DEBUG: bool = False
     LOG_LEVEL: str = "INFO"
     
+    # Collection Lock (워커/호스트 간 수집 상호 배제)
+    COLLECT_LOCK_POLL_SECONDS: float = 1.0  # 대기 중 잠금 해제 확인 간격 (커넥션 미점유)
+    COLLECT_LOCK_WAIT_SECONDS: float = 600.0  # 다른 프로세스 수집 완료 대기 상한
+    
+    # Response Cache (In-Memory LRU)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 256
+    RESPONSE_CACHE_MAX_BYTES: int = 32 * 1024 * 1024
+    RESPONSE_CACHE_TTL_SECONDS: int = 600  # 세대 동기화 실패 시 상한
+    RESPONSE_CACHE_GENERATION_SYNC_SECONDS: float = 2.0  # 다른 워커의 세대 증가 반영 지연 상한
+    PLATFORM_KEYWORDS_TTL_SECONDS: float = 300.0  # 대시보드 플랫폼 검색어(Nate/Yahoo) 백그라운드 갱신 주기
+    
+    # LLM Result Cache (Memory + Postgres)
+    LLM_CACHE_TTL_SECONDS: int = 24 * 60 * 60
+    LLM_CACHE_MEMORY_ENTRIES: int = 512
+    LLM_CACHE_MAX_ROWS: int = 10000
+    
+    # LLM Batching (Token Budget Map-Reduce)
+    LLM_BATCH_TOKEN_BUDGET: int = 3000
+    LLM_BATCH_CONCURRENCY: int = 4
+    LLM_BATCH_TIMEOUT_SECONDS: float = 20.0
+    LLM_ENRICH_TIMEOUT_SECONDS: float = 25.0
+    
+    # Title Search (tsvector + pg_trgm)
+    # - 오타/유사 검색어 허용 기준: 검색어와 제목 내 가장 비슷한 구간의 word_similarity (pg_trgm 기본 0.6)
+    SEARCH_FUZZY_THRESHOLD: float = 0.5
+    
+    # Near-Duplicate Detection (MinHash/LSH)
+    DEDUPE_JACCARD_THRESHOLD: float = 0.5
+    DEDUPE_HISTORY_DAYS: int = 7
+    
+    # Embeddings (pgvector)
+    # - EMBEDDING_BACKEND: hashing(오프라인 기본), sentence-transformers, openai
+    # - EMBEDDING_DIM 변경 시 content_embeddings.embedding 컬럼 마이그레이션 필요
+    EMBEDDING_BACKEND: str = "hashing"
+    EMBEDDING_MODEL: Optional[str] = None
+    EMBEDDING_DIM: int = 384
+    EMBEDDING_BATCH_SIZE: int = 64
+    # - HNSW 검색 후보 수 / 필터(kind/country/model)로 걸러져 limit보다 적게 나오면 이어서 탐색 (pgvector 0.8+)
+    EMBEDDING_HNSW_EF_SEARCH: int = 100
+    EMBEDDING_HNSW_ITERATIVE_SCAN: bool = True
+    
+    # Heavy-Hitter Term Sketches (Count-Min + Space-Saving)
+    # - 크기 변경 시 기존 버킷과 병합 불가 (새 버킷부터 적용)
+    SKETCH_WIDTH: int = 2048
+    SKETCH_DEPTH: int = 4
+    SKETCH_CAPACITY: int = 500
+    
+    # Keyword Spike Detection (EWMA)
+    SPIKE_EWMA_ALPHA: float = 0.3
+    SPIKE_Z_THRESHOLD: float = 2.5
+    SPIKE_MIN_OBSERVATIONS: int = 3
+    
     class Config:
         env_file = ".env"
         case_sensitive = True
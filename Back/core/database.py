@@ -1,11 +1,19 @@
 """
 데이터베이스 설정 (SQLAlchemy Async Engine + asyncpg)
+- 엔진은 첫 사용 시 생성 (import만으로 asyncpg 드라이버/커넥션 풀을 만들지 않음)
+- ORM 모델 등록은 core/base.py + trend/models (Alembic 전용), 여기서는 import하지 않음
 """
+import asyncio
 import os
-from sqlalchemy.ext.asyncio import create_async_engine, AsyncSession
-from sqlalchemy import text
-from sqlalchemy.orm import sessionmaker, declarative_base
+import re
+import time
+from contextlib import asynccontextmanager
+from functools import lru_cache
+from sqlalchemy import event, text
+from sqlalchemy.exc import TimeoutError as PoolTimeoutError
+from .base import Base  # noqa: F401 (기존 import 경로 호환)
 from .config import settings
+from . import metrics
 
 # 1. 비동기 엔진 생성
 # config.py의 설정을 사용 (postgresql+asyncpg://...)
@@ -17,55 +25,191 @@ from .config import settings
 # DATABASE_URL 재조립 (asyncpg 드라이버 강제)
 ASYNC_DB_URL = f"postgresql+asyncpg://{settings.DB_USER}:{settings.DB_PASSWORD}@{settings.DB_HOST}:{settings.DB_PORT}/{settings.DB_NAME}"
 
-engine = create_async_engine(
-    ASYNC_DB_URL,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    echo=settings.DEBUG  # 디버그 모드일 때 쿼리 로그 출력
-)
+_engine = None
 
-# 2. Base 선언 (Alembic용)
-Base = declarative_base()
 
-# 중요: Alembic 모델 인식용 import
-from ..trend.models import *  # noqa: F401
+def get_engine():
+    """프로세스 전역 비동기 엔진 (지연 생성)"""
+    global _engine
+    if _engine is None:
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        _engine = create_async_engine(
+            ASYNC_DB_URL,
+            pool_size=10,
+            max_overflow=20,
+            pool_pre_ping=True,
+            echo=settings.DEBUG  # 디버그 모드일 때 쿼리 로그 출력
+        )
+        _instrument_pool(_engine)
+    return _engine
+
+
+def _instrument_pool(engine):
+    """커넥션 풀 메트릭 (/metrics)"""
+    pool = engine.sync_engine.pool
+    metrics.db_pool_connections.set_function(lambda: {
+        ("size",): pool.size(),
+        ("checked_in",): pool.checkedin(),
+        ("checked_out",): pool.checkedout(),
+        ("overflow",): max(pool.overflow(), 0),
+    })
+
+    @event.listens_for(engine.sync_engine, "checkout")
+    def _on_checkout(dbapi_connection, connection_record, connection_proxy):
+        metrics.db_pool_checkouts.inc("yes" if pool.overflow() > 0 else "no")
+
+
+def __getattr__(name):
+    # `from .database import engine` 호환 (접근 시점에 생성)
+    if name == "engine":
+        return get_engine()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 # 3. Raw SQL 헬퍼 함수 (SQLAlchemy Core 사용)
 
+_WRITE_TARGET = re.compile(r"\b(INSERT\s+INTO|UPDATE)\s+([A-Za-z_][A-Za-z0-9_]*)", re.IGNORECASE)
+
+
+@lru_cache(maxsize=512)
+def _write_target(query: str):
+    """쓰기 쿼리의 (대상 테이블, 종류). 첫 INSERT INTO/UPDATE 기준 (ON CONFLICT DO UPDATE는 upsert)"""
+    match = _WRITE_TARGET.search(query)
+    if not match or match.group(2).lower() == "set":
+        return None
+    if match.group(1).upper().startswith("INSERT"):
+        return match.group(2), "upsert" if "ON CONFLICT" in query.upper() else "insert"
+    return match.group(2), "update"
+
+
+def _count_written(query: str, params, result):
+    target = _write_target(query)
+    if target is None:
+        return
+    rowcount = result.rowcount
+    if rowcount is None or rowcount < 0:
+        # executemany 등 드라이버가 행 수를 주지 않는 경우 파라미터 건수로 대체
+        rowcount = len(params) if isinstance(params, list) else 1
+    metrics.db_rows_written.inc(*target, amount=rowcount)
+
+
+@asynccontextmanager
+async def _acquire(begin: bool = False):
+    """커넥션 획득 (대기 시간/타임아웃 메트릭 기록)"""
+    engine = get_engine()
+    started = time.perf_counter()
+    try:
+        async with (engine.begin() if begin else engine.connect()) as conn:
+            metrics.db_pool_acquire_seconds.observe(time.perf_counter() - started)
+            yield conn
+    except PoolTimeoutError:
+        metrics.db_pool_timeouts.inc()
+        raise
+
 async def fetch_one(query: str, params: dict = None) -> dict | None:
     """SELECT 단건 조회 (결과를 dict로 반환)"""
-    async with engine.connect() as conn:
+    async with _acquire() as conn:
         # text()로 감싸서 실행
         result = await conn.execute(text(query), params or {})
         row = result.mappings().first()
         return dict(row) if row else None
 
-async def fetch_all(query: str, params: dict = None) -> list[dict]:
-    """SELECT 다건 조회"""
-    async with engine.connect() as conn:
+async def fetch_all(query: str, params: dict = None, local_settings: dict = None) -> list[dict]:
+    """
+    SELECT 다건 조회
+    :param local_settings: 이 조회의 트랜잭션에만 적용할 설정 (SET LOCAL, 커넥션 반납 시 원복)
+    """
+    async with _acquire() as conn:
+        for name, value in (local_settings or {}).items():
+            await conn.execute(text("SELECT set_config(:name, :value, true)"), {"name": name, "value": str(value)})
         result = await conn.execute(text(query), params or {})
         rows = result.mappings().all()
         return [dict(row) for row in rows]
 
+async def stream_all(query: str, params: dict = None):
+    """SELECT 다건 조회 (서버 사이드 커서로 1행씩 yield, 결과 전체를 메모리에 올리지 않음)"""
+    async with _acquire() as conn:
+        result = await conn.stream(text(query), params or {})
+        async for row in result.mappings():
+            yield dict(row)
+
+async def stream_batches(query: str, params: dict = None, batch_size: int = 1000):
+    """
+    SELECT 대량 조회 (서버 사이드 커서로 batch_size행씩 가져와 (컬럼명 목록, 행 튜플 목록) yield)
+    - 행마다 dict를 만들지 않음: 내보내기처럼 결과 전체를 흘려보내는 용도
+    """
+    async with _acquire() as conn:
+        result = await conn.stream(text(query), params or {}, execution_options={"yield_per": batch_size})
+        columns = list(result.keys())
+        async for rows in result.partitions(batch_size):
+            yield columns, rows
+
 async def execute(query: str, params: dict = None):
     """INSERT, UPDATE, DELETE (자동 커밋)"""
-    async with engine.begin() as conn:
-         await conn.execute(text(query), params or {})
+    async with _acquire(begin=True) as conn:
+         result = await conn.execute(text(query), params or {})
+         _count_written(query, params, result)
 
 async def execute_return(query: str, params: dict = None) -> dict | None:
     """INSERT/UPDATE 후 결과 반환 (RETURNING)"""
-    async with engine.begin() as conn:
+    async with _acquire(begin=True) as conn:
         result = await conn.execute(text(query), params or {})
         row = result.mappings().first()
+        _count_written(query, params, result)
         return dict(row) if row else None
 
+@asynccontextmanager
+async def raw_connection():
+    """
+    asyncpg 원본 커넥션 (binary COPY 등 드라이버 전용 기능용, 풀에서 대여)
+    - SQLAlchemy 트랜잭션을 시작하지 않음: 트랜잭션은 호출 측에서 conn.transaction()으로 관리
+    """
+    async with _acquire() as conn:
+        raw = await conn.get_raw_connection()
+        yield raw.driver_connection
+
+async def _try_advisory_lock(conn, name: str) -> bool:
+    return bool((await conn.execute(text("SELECT pg_try_advisory_lock(hashtext(:name))"), {"name": name})).scalar())
+
+async def _advisory_unlock(conn, name: str):
+    await conn.execute(text("SELECT pg_advisory_unlock(hashtext(:name))"), {"name": name})
+    await conn.commit()
+
+@asynccontextmanager
+async def advisory_lock(name: str, poll_seconds: float = 1.0, timeout: float = 600.0, hold_after_wait: bool = False):
+    """
+    Postgres 세션 Advisory Lock (프로세스/호스트 간 상호 배제)
+    - 즉시 획득: 전용 커넥션에서 블록 동안 보유 후 해제, yield True
+    - 다른 프로세스가 보유 중: 커넥션을 풀에 반납한 채 poll_seconds 간격으로 해제 여부만 확인 (대기 중 커넥션 점유 없음)
+      해제되면 잠금 없이 yield False (hold_after_wait=True면 잠금을 획득한 채 yield True), timeout 초과 시 TimeoutError
+    """
+    deadline = time.monotonic() + timeout
+    waited = False
+    while True:
+        async with _acquire() as conn:
+            if await _try_advisory_lock(conn, name):
+                if waited and not hold_after_wait:
+                    await _advisory_unlock(conn, name)
+                    break
+                try:
+                    yield True
+                finally:
+                    await _advisory_unlock(conn, name)
+                return
+            await conn.commit()
+        if time.monotonic() >= deadline:
+            raise TimeoutError(f"advisory lock 대기 시간 초과: {name}")
+        waited = True
+        await asyncio.sleep(poll_seconds)
+    yield False
+
 # 4. Pool Lifecycle (main.py에서 사용)
 async def init_pool():
     # SQLAlchemy Engine은 Lazy Connect라 명시적 init 불필요하지만
     # 연결 테스트를 위해 핑을 한번 날려봄
     try:
-        async with engine.connect() as conn:
+        async with get_engine().connect() as conn:
             await conn.execute(text("SELECT 1"))
         print(f"🔥 Async DB Engine initialized - Connected to {settings.DB_HOST}:{settings.DB_PORT}")
     except Exception as e:
@@ -73,5 +217,6 @@ async def init_pool():
         # raise e  # 필요 시 주석 해제
 
 async def close_pool():
-    await engine.dispose()
+    if _engine is not None:
+        await _engine.dispose()
     print("🧹 Async DB Engine disposed")
@@ -0,0 +1,226 @@
+"""
+LLM 결과 캐시 (콘텐츠 해시 기반)
+- 키: sha256(provider, model, prompt_version, 정규화된 제목 집합, country)
+- 1차: In-Memory LRU (TTL), 2차: Postgres llm_cache 테이블
+- 같은 키로 진행 중인 LLM 호출은 SingleFlight로 1회만 실행
+- 적중률 / 절약된 지연시간 / 절약된 토큰 집계
+"""
+import hashlib
+import json
+import time
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Iterable, Optional, Tuple
+from loguru import logger
+
+from .config import settings
+from .database import execute, execute_return
+from . import metrics
+from .tracing import current_span
+from ..utils.singleflight import SingleFlight
+
+
+def normalize_titles(titles: Iterable[str]) -> list:
+    """공백/대소문자 정규화 후 중복 제거 + 정렬 (순서가 달라도 같은 키)"""
+    return sorted({" ".join(t.split()).lower() for t in titles if t and t.strip()})
+
+
+def make_cache_key(provider: str, model: str, prompt_version: str, titles: Iterable[str], country: str = "") -> str:
+    raw = json.dumps(
+        [provider, model, prompt_version, country or "", normalize_titles(titles)],
+        ensure_ascii=False, separators=(",", ":")
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class _Entry:
+    __slots__ = ("result", "tokens", "latency_ms", "expires_at")
+
+    def __init__(self, result: Any, tokens: int, latency_ms: float, expires_at: float):
+        self.result = result
+        self.tokens = tokens
+        self.latency_ms = latency_ms
+        self.expires_at = expires_at
+
+
+class LLMCache:
+    """메모리 + Postgres 2계층 LLM 결과 캐시"""
+
+    def __init__(self, ttl_seconds: int, memory_entries: int, max_rows: int):
+        self.ttl_seconds = ttl_seconds
+        self.memory_entries = memory_entries
+        self.max_rows = max_rows
+        self._memory: "OrderedDict[str, _Entry]" = OrderedDict()
+        self._flight = SingleFlight()
+        self._writes_since_prune = 0
+
+        self.memory_hits = 0
+        self.db_hits = 0
+        self.misses = 0
+        self.saved_latency_ms = 0.0
+        self.saved_tokens = 0
+
+    async def get_or_compute(
+        self,
+        provider: str,
+        model: str,
+        prompt_version: str,
+        titles: Iterable[str],
+        country: str,
+        compute: Callable[[], Awaitable[Tuple[Any, int]]]
+    ) -> Any:
+        """
+        캐시 조회 -> 없으면 compute() 실행 후 저장
+        :param compute: (결과, 사용 토큰 수)를 반환하는 코루틴 함수. 예외 발생 시 캐싱하지 않음
+        """
+        key = make_cache_key(provider, model, prompt_version, titles, country)
+
+        entry = self._memory_get(key)
+        if entry is not None:
+            self.memory_hits += 1
+            self._record_saving(entry)
+            metrics.llm_cache_lookups.inc("memory")
+            current_span().set(**{"cache.hit": "memory"})
+            return entry.result
+
+        return await self._flight.do(key, self._load_or_compute, key, provider, model, prompt_version, country, compute)
+
+    async def _load_or_compute(self, key, provider, model, prompt_version, country, compute) -> Any:
+        entry = await self._db_get(key)
+        if entry is not None:
+            self.db_hits += 1
+            self._record_saving(entry)
+            self._memory_put(key, entry)
+            metrics.llm_cache_lookups.inc("db")
+            current_span().set(**{"cache.hit": "db"})
+            return entry.result
+
+        self.misses += 1
+        metrics.llm_cache_lookups.inc("miss")
+        current_span().set(**{"cache.hit": "miss"})
+        started = time.perf_counter()
+        try:
+            result, tokens = await compute()
+        except Exception:
+            metrics.llm_errors.inc(provider, model)
+            raise
+        latency_ms = (time.perf_counter() - started) * 1000
+        metrics.llm_request_seconds.observe(latency_ms / 1000, provider, model)
+        metrics.llm_tokens.inc(provider, model, amount=tokens or 0)
+
+        entry = _Entry(result, tokens or 0, latency_ms, time.time() + self.ttl_seconds)
+        self._memory_put(key, entry)
+        await self._db_put(key, provider, model, prompt_version, country, entry)
+        return result
+
+    # ----- 메모리 계층 -----
+    def _memory_get(self, key: str) -> Optional[_Entry]:
+        entry = self._memory.get(key)
+        if entry is None:
+            return None
+        if entry.expires_at <= time.time():
+            del self._memory[key]
+            return None
+        self._memory.move_to_end(key)
+        return entry
+
+    def _memory_put(self, key: str, entry: _Entry):
+        self._memory[key] = entry
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    # ----- Postgres 계층 (실패해도 LLM 경로는 계속 진행) -----
+    async def _db_get(self, key: str) -> Optional[_Entry]:
+        # 적중 기록(hit_count/last_hit_at) UPDATE -> 커밋 경로로 실행해야 prune()이 LRU 순서로 동작
+        try:
+            row = await execute_return(
+                """
+                UPDATE llm_cache
+                SET hit_count = hit_count + 1, last_hit_at = NOW()
+                WHERE cache_key = :key AND expires_at > NOW()
+                RETURNING result, tokens, latency_ms, EXTRACT(EPOCH FROM expires_at) AS expires_at
+                """,
+                {"key": key}
+            )
+        except Exception as e:
+            logger.warning(f"⚠️ LLM 캐시 조회 실패 (DB): {e}")
+            return None
+
+        if not row:
+            return None
+        result = row["result"]
+        if isinstance(result, str):
+            result = json.loads(result)
+        return _Entry(result, row["tokens"] or 0, row["latency_ms"] or 0.0, float(row["expires_at"]))
+
+    async def _db_put(self, key, provider, model, prompt_version, country, entry: _Entry):
+        try:
+            await execute(
+                """
+                INSERT INTO llm_cache
+                (cache_key, provider, model, prompt_version, country, result, tokens, latency_ms, hit_count, expires_at)
+                VALUES (:key, :provider, :model, :prompt_version, :country, CAST(:result AS JSONB),
+                        :tokens, :latency_ms, 0, NOW() + make_interval(secs => :ttl))
+                ON CONFLICT (cache_key) DO UPDATE
+                SET result = EXCLUDED.result, tokens = EXCLUDED.tokens, latency_ms = EXCLUDED.latency_ms,
+                    expires_at = EXCLUDED.expires_at, last_hit_at = NOW()
+                """,
+                {
+                    "key": key,
+                    "provider": provider,
+                    "model": model,
+                    "prompt_version": prompt_version,
+                    "country": country,
+                    "result": json.dumps(entry.result, ensure_ascii=False),
+                    "tokens": entry.tokens,
+                    "latency_ms": entry.latency_ms,
+                    "ttl": self.ttl_seconds
+                }
+            )
+            self._writes_since_prune += 1
+            if self._writes_since_prune >= 100:
+                self._writes_since_prune = 0
+                await self.prune()
+        except Exception as e:
+            logger.warning(f"⚠️ LLM 캐시 저장 실패 (DB): {e}")
+
+    async def prune(self):
+        """만료 행 삭제 + 최대 행 수 초과분을 오래 안 쓰인 순으로 삭제 (LRU)"""
+        await execute("DELETE FROM llm_cache WHERE expires_at <= NOW()")
+        await execute(
+            """
+            DELETE FROM llm_cache
+            WHERE cache_key IN (
+                SELECT cache_key FROM llm_cache
+                ORDER BY last_hit_at DESC
+                OFFSET :max_rows
+            )
+            """,
+            {"max_rows": self.max_rows}
+        )
+
+    # ----- 통계 -----
+    def _record_saving(self, entry: _Entry):
+        self.saved_latency_ms += entry.latency_ms
+        self.saved_tokens += entry.tokens
+
+    def stats(self) -> Dict[str, Any]:
+        hits = self.memory_hits + self.db_hits
+        total = hits + self.misses
+        return {
+            "memory_entries": len(self._memory),
+            "memory_hits": self.memory_hits,
+            "db_hits": self.db_hits,
+            "misses": self.misses,
+            "hit_rate": round(hits / total, 4) if total else 0.0,
+            "saved_latency_ms": round(self.saved_latency_ms, 1),
+            "saved_tokens": self.saved_tokens,
+        }
+
+
+# 프로세스 전역 LLM 캐시 인스턴스
+llm_cache = LLMCache(
+    ttl_seconds=settings.LLM_CACHE_TTL_SECONDS,
+    memory_entries=settings.LLM_CACHE_MEMORY_ENTRIES,
+    max_rows=settings.LLM_CACHE_MAX_ROWS,
+)
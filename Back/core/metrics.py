@@ -0,0 +1,255 @@
+"""
+Prometheus 텍스트 포맷 메트릭 (외부 의존성 없음)
+- Counter / Histogram: 스레드별 샤드에만 쓰고 수집(/metrics) 시 합산 -> 기록 경로에 잠금 없음
+  (이벤트 루프 + to_thread/run_in_executor 스레드가 동시에 기록해도 서로 다른 dict를 갱신)
+- CallbackGauge: 수집 시점에 함수 호출로 값 계산 (DB 커넥션 풀 상태 등)
+- MetricsMiddleware: 라우트(경로 템플릿)별 요청 지연 히스토그램
+- 노출: GET /metrics (text/plain; version=0.0.4)
+"""
+import math
+import threading
+import time
+from bisect import bisect_left
+from typing import Callable, Dict, List, Sequence, Tuple
+
+# 초 단위 기본 버킷 (외부 API ~ 수 초, DB ~ ms)
+DEFAULT_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0)
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(names: Sequence[str], values: Sequence[str], extra: str = "") -> str:
+    pairs = [f'{n}="{_escape(v)}"' for n, v in zip(names, values)]
+    if extra:
+        pairs.append(extra)
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+def _format_value(value: float) -> str:
+    if value == math.inf:
+        return "+Inf"
+    return repr(float(value)) if not float(value).is_integer() else str(int(value))
+
+
+class _Metric:
+    TYPE = ""
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        self.name = name
+        self.documentation = documentation
+        self.labelnames = tuple(labelnames)
+        self._shards: Dict[int, dict] = {}
+
+    def _shard(self) -> dict:
+        # dict.get / setdefault는 GIL 하에서 원자적 -> 스레드별 dict 생성에도 잠금 불필요
+        ident = threading.get_ident()
+        shard = self._shards.get(ident)
+        if shard is None:
+            shard = self._shards.setdefault(ident, {})
+        return shard
+
+    def _iter_shards(self) -> List[List[tuple]]:
+        return [list(shard.items()) for shard in list(self._shards.values())]
+
+    def render(self) -> List[str]:
+        return [f"# HELP {self.name} {self.documentation}", f"# TYPE {self.name} {self.TYPE}"] + self._samples()
+
+    def _samples(self) -> List[str]:
+        raise NotImplementedError
+
+
+class Counter(_Metric):
+    TYPE = "counter"
+
+    def inc(self, *labels: str, amount: float = 1.0):
+        shard = self._shard()
+        shard[labels] = shard.get(labels, 0.0) + amount
+
+    def values(self) -> Dict[Tuple[str, ...], float]:
+        totals: Dict[Tuple[str, ...], float] = {}
+        for items in self._iter_shards():
+            for labels, value in items:
+                totals[labels] = totals.get(labels, 0.0) + value
+        return totals
+
+    def _samples(self) -> List[str]:
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(self.values().items())
+        ]
+
+
+class Histogram(_Metric):
+    TYPE = "histogram"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS):
+        super().__init__(name, documentation, labelnames)
+        self.buckets = tuple(sorted(buckets))
+
+    def observe(self, value: float, *labels: str):
+        shard = self._shard()
+        state = shard.get(labels)
+        if state is None:
+            # [버킷별 개수..., +Inf 개수, 합계]
+            state = shard[labels] = [0] * (len(self.buckets) + 1) + [0.0]
+        state[bisect_left(self.buckets, value)] += 1
+        state[-1] += value
+
+    def time(self, *labels: str):
+        return _Timer(self, labels)
+
+    def _samples(self) -> List[str]:
+        merged: Dict[Tuple[str, ...], List[float]] = {}
+        for items in self._iter_shards():
+            for labels, state in items:
+                total = merged.setdefault(labels, [0] * len(state))
+                for i, v in enumerate(list(state)):
+                    total[i] += v
+
+        lines = []
+        for labels, state in sorted(merged.items()):
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), state[:-1]):
+                cumulative += count
+                le = f'le="{_format_value(bound)}"'
+                lines.append(f"{self.name}_bucket{_format_labels(self.labelnames, labels, le)} {cumulative}")
+            label_str = _format_labels(self.labelnames, labels)
+            lines.append(f"{self.name}_sum{label_str} {_format_value(state[-1])}")
+            lines.append(f"{self.name}_count{label_str} {cumulative}")
+        return lines
+
+
+class _Timer:
+    __slots__ = ("histogram", "labels", "started")
+
+    def __init__(self, histogram: Histogram, labels: Tuple[str, ...]):
+        self.histogram = histogram
+        self.labels = labels
+
+    def __enter__(self):
+        self.started = time.perf_counter()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.histogram.observe(time.perf_counter() - self.started, *self.labels)
+        return False
+
+
+class CallbackGauge(_Metric):
+    """수집 시점에 callback() -> {라벨 튜플: 값}으로 계산되는 게이지"""
+
+    TYPE = "gauge"
+
+    def __init__(self, name: str, documentation: str, labelnames: Sequence[str] = ()):
+        super().__init__(name, documentation, labelnames)
+        self._callback: Callable[[], Dict[Tuple[str, ...], float]] = dict
+
+    def set_function(self, callback: Callable[[], Dict[Tuple[str, ...], float]]):
+        self._callback = callback
+
+    def _samples(self) -> List[str]:
+        try:
+            values = self._callback()
+        except Exception:
+            return []
+        return [
+            f"{self.name}{_format_labels(self.labelnames, labels)} {_format_value(value)}"
+            for labels, value in sorted(values.items())
+        ]
+
+
+class Registry:
+    def __init__(self):
+        self._metrics: List[_Metric] = []
+
+    def register(self, metric: _Metric) -> _Metric:
+        self._metrics.append(metric)
+        return metric
+
+    def counter(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> Counter:
+        return self.register(Counter(name, documentation, labelnames))
+
+    def histogram(self, name: str, documentation: str, labelnames: Sequence[str] = (), buckets: Sequence[float] = DEFAULT_BUCKETS) -> Histogram:
+        return self.register(Histogram(name, documentation, labelnames, buckets))
+
+    def callback_gauge(self, name: str, documentation: str, labelnames: Sequence[str] = ()) -> CallbackGauge:
+        return self.register(CallbackGauge(name, documentation, labelnames))
+
+    def render(self) -> str:
+        lines: List[str] = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+# ===== HTTP 요청 =====
+http_request_seconds = registry.histogram(
+    "http_request_duration_seconds", "API 요청 처리 시간 (라우트 경로 템플릿별)", ("method", "route", "status")
+)
+
+# ===== 외부 호출 =====
+outbound_request_seconds = registry.histogram(
+    "outbound_request_duration_seconds", "외부 소스 HTTP 호출 시간", ("source", "status")
+)
+outbound_errors = registry.counter(
+    "outbound_request_errors_total", "외부 소스 HTTP 호출 실패 (HTTP 오류 코드 또는 예외 종류)", ("source", "reason")
+)
+youtube_quota_units = registry.counter(
+    "youtube_quota_units_total", "YouTube Data API 할당량 소모 단위 (search.list=100, videos.list=1)", ("method",)
+)
+
+# ===== DB =====
+db_pool_connections = registry.callback_gauge(
+    "db_pool_connections", "DB 커넥션 풀 상태 (size/checked_in/checked_out/overflow)", ("state",)
+)
+db_pool_checkouts = registry.counter(
+    "db_pool_checkouts_total", "DB 커넥션 풀 체크아웃 수 (overflow=yes: pool_size 초과분 사용 중)", ("overflow",)
+)
+db_pool_acquire_seconds = registry.histogram(
+    "db_pool_acquire_seconds", "DB 커넥션 획득 대기 시간",
+    buckets=(0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 1.0, 5.0, 30.0)
+)
+db_pool_timeouts = registry.counter("db_pool_timeouts_total", "DB 커넥션 풀 획득 타임아웃 수")
+db_rows_written = registry.counter(
+    "db_rows_written_total", "테이블별 INSERT/UPSERT/UPDATE 행 수", ("table", "op")
+)
+
+# ===== LLM =====
+llm_request_seconds = registry.histogram(
+    "llm_request_duration_seconds", "LLM 호출 시간 (캐시 미적중분)", ("provider", "model")
+)
+llm_tokens = registry.counter("llm_tokens_total", "LLM 사용 토큰 수", ("provider", "model"))
+llm_errors = registry.counter("llm_errors_total", "LLM 호출 실패 수", ("provider", "model"))
+llm_cache_lookups = registry.counter("llm_cache_lookups_total", "LLM 결과 캐시 조회 (memory/db/miss)", ("result",))
+
+
+class MetricsMiddleware:
+    """ASGI 미들웨어: 라우트별 요청 지연 기록 (매칭되지 않은 경로는 하나로 묶어 라벨 폭증 방지)"""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        status = {"code": 500}
+
+        async def send_with_status(message):
+            if message["type"] == "http.response.start":
+                status["code"] = message["status"]
+            await send(message)
+
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            route = scope.get("route")
+            http_request_seconds.observe(
+                time.perf_counter() - started,
+                scope["method"], getattr(route, "path", "unmatched"), str(status["code"])
+            )
@@ -0,0 +1,33 @@
+"""
+고속 JSON 직렬화 (orjson)
+- datetime/date/UUID/numpy를 C 레벨에서 직접 직렬화 (json.dumps 대체)
+- 기본 응답 클래스로 지정해도 핸들러가 dict를 반환하면 FastAPI가 jsonable_encoder를 먼저 실행함
+  -> 응답이 큰 핸들러는 FastJSONResponse(payload)를 직접 반환해야 jsonable_encoder 단계까지 생략
+  (100+100건 콘텐츠 기준 TestClient 왕복 p50 약 6~8ms -> 1.7ms, benchmarks/bench_json_response.py --asgi)
+- orjson 미설치 환경에서는 표준 json으로 동작
+"""
+import json
+from typing import Any
+
+from fastapi.responses import JSONResponse
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - 선택 의존성
+    orjson = None
+
+_ORJSON_OPTIONS = (orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY) if orjson else 0
+
+
+def dumps(payload: Any) -> bytes:
+    """JSON bytes 직렬화 (지원하지 않는 타입은 str 처리)"""
+    if orjson is not None:
+        return orjson.dumps(payload, default=str, option=_ORJSON_OPTIONS)
+    return json.dumps(payload, ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+
+
+class FastJSONResponse(JSONResponse):
+    """기본 응답 클래스 (orjson 렌더링, 직접 반환 시 jsonable_encoder 생략)"""
+
+    def render(self, content: Any) -> bytes:
+        return dumps(content)
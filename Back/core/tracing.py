@@ -0,0 +1,384 @@
+"""
+경량 트레이싱 (컨텍스트 전파 Span + Server-Timing + OTLP JSON 내보내기)
+- 요청 단위 Trace는 TracingMiddleware가 샘플링 여부를 결정해 ContextVar에 설정
+  (TRACE_SAMPLE_RATE 확률, TRACE_TRUST_PARENT=true면 W3C traceparent 헤더의 sampled 플래그도 따름)
+- span("이름", 속성=값) / @traced / @trace_methods("접두어")로 클라이언트/Repository/서비스 단계 계측
+  asyncio.gather / to_thread 하위 작업에도 ContextVar로 부모 Span이 전파됨
+- 샘플링되지 않은 요청에서는 ContextVar 조회 1회 후 공용 No-op Span 반환 (속성 계산/시간 측정 없음)
+- 샘플링된 요청: TRACE_EXPORTER=stdout|file 이면 OTLP/JSON(resourceSpans) 형식으로 한 줄씩 내보냄
+  Server-Timing 헤더(이름별 합산 시간)는 서버가 직접 샘플링한 요청에만 추가
+  (클라이언트가 보낸 traceparent만으로 내부 단계 시간이 노출되지 않도록)
+"""
+import functools
+import inspect
+import json
+import os
+import random
+import re
+import sys
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any, Dict, List, Optional
+
+from loguru import logger
+
+from .config import settings
+
+# 함수 인자 중 Span 속성으로 기록할 이름
+ATTR_PARAMS = ("country", "keyword", "source", "kind", "limit", "days", "max_results")
+
+_TRACEPARENT = re.compile(r"^[0-9a-f]{2}-([0-9a-f]{32})-([0-9a-f]{16})-([0-9a-f]{2})$")
+_TIMING_TOKEN = re.compile(r"[^A-Za-z0-9!#$%&'*+\-.^_`|~]")
+
+SPAN_KIND_INTERNAL = 1
+SPAN_KIND_SERVER = 2
+
+
+def _new_id(nbytes: int) -> str:
+    return os.urandom(nbytes).hex()
+
+
+class Trace:
+    """요청 하나에서 완료된 Span 모음"""
+
+    __slots__ = ("trace_id", "parent_id", "spans", "local")
+
+    def __init__(self, trace_id: Optional[str] = None, parent_id: Optional[str] = None, local: bool = True):
+        self.trace_id = trace_id or _new_id(16)
+        self.parent_id = parent_id
+        self.spans: List["Span"] = []
+        self.local = local  # 서버 자체 샘플링 여부 (False: 상위 traceparent sampled 플래그로 기록)
+
+    def server_timing(self, root: Optional["Span"] = None, limit: Optional[int] = None) -> str:
+        """Span 이름별 합산 시간 -> Server-Timing 헤더 값 (큰 순서로 limit개)"""
+        totals: Dict[str, List[float]] = {}
+        for span in self.spans:
+            if span is root:
+                continue
+            item = totals.setdefault(span.name, [0.0, 0])
+            item[0] += span.duration_ms
+            item[1] += 1
+
+        limit = limit or settings.TRACE_SERVER_TIMING_LIMIT
+        metrics = []
+        for name, (duration, count) in sorted(totals.items(), key=lambda kv: kv[1][0], reverse=True)[:limit]:
+            metric = f"{_TIMING_TOKEN.sub('_', name)};dur={duration:.1f}"
+            if count > 1:
+                metric += f';desc="x{count}"'
+            metrics.append(metric)
+        if root is not None:
+            metrics.append(f"total;dur={(time.time_ns() - root.start_ns) / 1e6:.1f}")
+        return ", ".join(metrics)
+
+
+class Span:
+    """시작/종료 시각과 속성을 가진 작업 구간 (with / async with 모두 지원)"""
+
+    __slots__ = ("trace", "name", "kind", "span_id", "parent_id", "start_ns", "end_ns", "attributes", "error", "_token")
+
+    def __init__(self, trace: Trace, name: str, attributes: Dict[str, Any], kind: int = SPAN_KIND_INTERNAL):
+        self.trace = trace
+        self.name = name
+        self.kind = kind
+        self.span_id = _new_id(8)
+        self.parent_id: Optional[str] = None
+        self.start_ns = 0
+        self.end_ns = 0
+        self.attributes = attributes
+        self.error: Optional[str] = None
+        self._token = None
+
+    @property
+    def duration_ms(self) -> float:
+        return (self.end_ns - self.start_ns) / 1e6
+
+    def set(self, **attributes):
+        self.attributes.update(attributes)
+
+    def __enter__(self) -> "Span":
+        parent = _current.get()
+        self.parent_id = parent.span_id if parent is not None else self.trace.parent_id
+        self._token = _current.set(self)
+        self.start_ns = time.time_ns()
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        self.end_ns = time.time_ns()
+        if exc is not None:
+            self.error = f"{exc_type.__name__}: {exc}"
+        _current.reset(self._token)
+        self.trace.spans.append(self)
+        return False
+
+    async def __aenter__(self) -> "Span":
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+class _NoopSpan:
+    """샘플링되지 않은 경우 사용하는 공용 Span (아무 것도 기록하지 않음)"""
+
+    __slots__ = ()
+
+    def set(self, **attributes):
+        pass
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc, tb):
+        return False
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+
+NOOP_SPAN = _NoopSpan()
+
+_trace: ContextVar[Optional[Trace]] = ContextVar("trace", default=None)
+_current: ContextVar[Optional[Span]] = ContextVar("current_span", default=None)
+
+
+def span(name: str, **attributes):
+    """현재 Trace 아래 자식 Span 생성 (Trace가 없으면 No-op)"""
+    trace = _trace.get()
+    if trace is None:
+        return NOOP_SPAN
+    return Span(trace, name, attributes)
+
+
+def current_span():
+    """진행 중인 Span (속성 추가용). 없으면 No-op"""
+    return _current.get() or NOOP_SPAN
+
+
+def start_trace(traceparent: Optional[str] = None) -> Optional[Trace]:
+    """
+    샘플링 결정 후 Trace 생성 (미샘플링 시 None)
+    - 샘플링은 TRACE_SAMPLE_RATE로 서버가 결정, traceparent 헤더가 있으면 그 trace-id/부모 span-id를 이어받음
+    - TRACE_TRUST_PARENT=true일 때만 sampled 플래그가 켜진 요청을 비율과 무관하게 기록
+    """
+    trace_id = parent_id = None
+    if traceparent:
+        match = _TRACEPARENT.match(traceparent.strip().lower())
+        if match:
+            trace_id, parent_id, flags = match.groups()
+            if settings.TRACE_TRUST_PARENT and int(flags, 16) & 1:
+                return Trace(trace_id, parent_id, local=False)
+    rate = settings.TRACE_SAMPLE_RATE
+    if rate <= 0 or (rate < 1 and random.random() >= rate):
+        return None
+    return Trace(trace_id, parent_id)
+
+
+class trace_context:
+    """HTTP 요청 외부(CLI/배치)에서 Trace + 루트 Span 시작, 종료 시 내보내기"""
+
+    def __init__(self, name: str, force: bool = False, **attributes):
+        self.name = name
+        self.force = force
+        self.attributes = attributes
+        self.trace: Optional[Trace] = None
+        self._root = None
+        self._token = None
+
+    def __enter__(self):
+        self.trace = Trace() if self.force else start_trace()
+        if self.trace is None:
+            return NOOP_SPAN
+        self._token = _trace.set(self.trace)
+        self._root = Span(self.trace, self.name, self.attributes).__enter__()
+        return self._root
+
+    def __exit__(self, exc_type, exc, tb):
+        if self.trace is None:
+            return False
+        self._root.__exit__(exc_type, exc, tb)
+        _trace.reset(self._token)
+        exporter.export(self.trace)
+        return False
+
+    async def __aenter__(self):
+        return self.__enter__()
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return self.__exit__(exc_type, exc, tb)
+
+
+def _argument_positions(func) -> Dict[str, int]:
+    try:
+        params = list(inspect.signature(func).parameters)
+    except (TypeError, ValueError):
+        return {}
+    return {name: index for index, name in enumerate(params) if name in ATTR_PARAMS}
+
+
+def _call_attributes(positions: Dict[str, int], args: tuple, kwargs: dict) -> Dict[str, Any]:
+    attributes = {}
+    for name, index in positions.items():
+        value = kwargs[name] if name in kwargs else (args[index] if index < len(args) else None)
+        if isinstance(value, (str, int, float, bool)):
+            attributes[name] = value
+    return attributes
+
+
+def _result_attributes(span: Span, result: Any):
+    if isinstance(result, (list, tuple, dict, set)):
+        span.attributes["rows"] = len(result)
+
+
+def traced(name: Optional[str] = None):
+    """
+    [데코레이터] 함수 호출을 Span으로 기록
+    - ATTR_PARAMS에 해당하는 인자와 결과 건수(rows)를 속성으로 남김
+    """
+    def decorator(func):
+        if inspect.isasyncgenfunction(func):
+            # 스트리밍 제너레이터는 호출 시점이 아닌 소비 시점에 실행되므로 계측 대상에서 제외
+            return func
+        span_name = name or func.__qualname__
+        positions = _argument_positions(func)
+
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                trace = _trace.get()
+                if trace is None:
+                    return await func(*args, **kwargs)
+                with Span(trace, span_name, _call_attributes(positions, args, kwargs)) as s:
+                    result = await func(*args, **kwargs)
+                    _result_attributes(s, result)
+                    return result
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            trace = _trace.get()
+            if trace is None:
+                return func(*args, **kwargs)
+            with Span(trace, span_name, _call_attributes(positions, args, kwargs)) as s:
+                result = func(*args, **kwargs)
+                _result_attributes(s, result)
+                return result
+        return sync_wrapper
+    return decorator
+
+
+def trace_methods(prefix: str):
+    """[클래스 데코레이터] 클래스에 정의된 공개 메서드 전체를 '<prefix>.<메서드>' Span으로 기록"""
+    def decorator(cls):
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not inspect.isfunction(value):
+                continue
+            setattr(cls, attr, traced(f"{prefix}.{attr}")(value))
+        return cls
+    return decorator
+
+
+class OTLPJsonExporter:
+    """완료된 Trace를 OTLP/JSON(ExportTraceServiceRequest) 한 줄로 stdout 또는 파일에 기록"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def _value(value: Any) -> Dict[str, Any]:
+        if isinstance(value, bool):
+            return {"boolValue": value}
+        if isinstance(value, int):
+            return {"intValue": str(value)}
+        if isinstance(value, float):
+            return {"doubleValue": value}
+        return {"stringValue": str(value)}
+
+    def to_otlp(self, trace: Trace) -> Dict[str, Any]:
+        spans = []
+        for s in trace.spans:
+            item = {
+                "traceId": trace.trace_id,
+                "spanId": s.span_id,
+                "name": s.name,
+                "kind": s.kind,
+                "startTimeUnixNano": str(s.start_ns),
+                "endTimeUnixNano": str(s.end_ns),
+                "attributes": [{"key": k, "value": self._value(v)} for k, v in s.attributes.items()],
+                "status": {"code": 2, "message": s.error} if s.error else {"code": 1},
+            }
+            if s.parent_id:
+                item["parentSpanId"] = s.parent_id
+            spans.append(item)
+        return {
+            "resourceSpans": [{
+                "resource": {"attributes": [
+                    {"key": "service.name", "value": {"stringValue": settings.TRACE_SERVICE_NAME}},
+                ]},
+                "scopeSpans": [{"scope": {"name": __name__}, "spans": spans}],
+            }]
+        }
+
+    def export(self, trace: Trace):
+        target = settings.TRACE_EXPORTER
+        if target == "none" or not trace.spans:
+            return
+        line = json.dumps(self.to_otlp(trace), ensure_ascii=False, separators=(",", ":"))
+        try:
+            with self._lock:
+                if target == "stdout":
+                    sys.stdout.write(line + "\n")
+                    sys.stdout.flush()
+                elif target == "file":
+                    with open(settings.TRACE_EXPORT_PATH, "a", encoding="utf-8") as f:
+                        f.write(line + "\n")
+        except Exception as e:
+            logger.warning(f"⚠️ 트레이스 내보내기 실패: {e}")
+
+
+exporter = OTLPJsonExporter()
+
+
+class TracingMiddleware:
+    """
+    ASGI 미들웨어: 요청별 Trace 시작 -> 응답 시작 시 Server-Timing 헤더 추가 -> 종료 후 내보내기
+    """
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            return await self.app(scope, receive, send)
+
+        traceparent = None
+        for key, value in scope.get("headers", []):
+            if key == b"traceparent":
+                traceparent = value.decode("latin-1")
+                break
+        trace = start_trace(traceparent)
+        if trace is None:
+            return await self.app(scope, receive, send)
+
+        root = Span(trace, f"{scope['method']} {scope['path']}", {"http.method": scope["method"]}, SPAN_KIND_SERVER)
+
+        async def send_with_timing(message):
+            if message["type"] == "http.response.start":
+                root.set(**{"http.status_code": message["status"]})
+                if settings.TRACE_SERVER_TIMING and trace.local:
+                    headers = list(message.get("headers", []))
+                    headers.append((b"server-timing", trace.server_timing(root).encode("latin-1")))
+                    headers.append((b"timing-allow-origin", b"*"))
+                    message = {**message, "headers": headers}
+            await send(message)
+
+        token = _trace.set(trace)
+        try:
+            with root:
+                await self.app(scope, receive, send_with_timing)
+        finally:
+            _trace.reset(token)
+            exporter.export(trace)
@@ -1,12 +1,15 @@
 """
 FastAPI 메인 애플리케이션
 """
-from fastapi import FastAPI
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
 from loguru import logger
 import sys
 
 from .core.config import settings
+from .core.responses import FastJSONResponse
+from .core.metrics import MetricsMiddleware, registry as metrics_registry
+from .core.tracing import TracingMiddleware
 from .trend.router import router as trend_router
 
 # 로거 설정
@@ -37,7 +40,8 @@ app = FastAPI(
     description="글로벌 트렌드 키워드 수집 및 분석 시스템",
     version="1.0.0",
     debug=settings.DEBUG,
-    lifespan=lifespan
+    lifespan=lifespan,
+    default_response_class=FastJSONResponse
 )
 
 # CORS 설정
@@ -47,8 +51,15 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["Server-Timing"],
 )
 
+# 요청 트레이싱 (샘플링된 요청만 Span 기록 + Server-Timing 헤더)
+app.add_middleware(TracingMiddleware)
+
+# 라우트별 요청 지연 메트릭 (/metrics)
+app.add_middleware(MetricsMiddleware)
+
 # 라우터 등록
 app.include_router(trend_router)
 
@@ -61,3 +72,9 @@ async def root():
         "service": "Keyword Trend Collector",
         "version": "1.0.0"
     }
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics():
+    """Prometheus 텍스트 포맷 메트릭 (요청 지연, 외부 호출, DB 풀, 저장 행 수, LLM, YouTube 할당량)"""
+    return Response(content=metrics_registry.render(), media_type="text/plain; version=0.0.4; charset=utf-8")
@@ -1,39 +1,74 @@
 """
 트렌드 키워드 분석 모듈
-AI(Gemini)를 활용하여 수집된 콘텐츠에서 핵심 트렌드 주제를 도출
+로컬 TF-IDF 엔진으로 즉시 키워드를 산출하고,
+AI(Gemini) 보강 결과(이유/번역 포함)는 요청 경로 밖에서 따로 산출
 """
-from typing import List, Dict, Any
+import asyncio
+from typing import List, Dict, Any, Optional
 from loguru import logger
+from ..core.config import settings
 from ..clients.gemini_client import GeminiClient
+from .keyword_engine import keyword_engine
 
 class KeywordAnalyzer:
-    """핵심 키워드 추출 및 분석 (AI Powered)"""
+    """핵심 키워드 추출 및 분석 (Local Fast Path + AI Enrichment)"""
     
     def __init__(self):
-        self.ai_client = GeminiClient()
+        self._ai_client: Optional[GeminiClient] = None
+
+    @property
+    def ai_client(self) -> GeminiClient:
+        """AI 보강 시에만 생성 (로컬 추출 경로에서는 SDK 초기화 없음)"""
+        if self._ai_client is None:
+            self._ai_client = GeminiClient()
+        return self._ai_client
     
-    async def extract_keywords(self, contents: Dict[str, List[Dict]], country: str = "KR", top_n: int = 10) -> List[Dict[str, Any]]:
+    async def extract_keywords(
+        self,
+        contents: Dict[str, List[Dict]],
+        country: str = "KR",
+        top_n: int = 10
+    ) -> List[Dict[str, Any]]:
+        """수집된 콘텐츠에서 핵심 트렌드 키워드 추출 (로컬, 수 ms)"""
+        titles = _titles(contents)
+        if not titles:
+            return []
+        return await keyword_engine.extract(titles, country=country, top_n=top_n)
+
+    async def enrich_keywords(
+        self,
+        contents: Dict[str, List[Dict]],
+        country: str = "KR",
+        top_n: int = 10
+    ) -> Optional[List[Dict[str, Any]]]:
         """
-        수집된 콘텐츠에서 AI를 통해 핵심 트렌드 키워드 추출
+        AI 분석 키워드 (이유/한국어 번역 포함)
+        - 제한 시간 초과/실패/빈 결과면 None (호출자는 로컬 결과 유지)
         """
-        # 1. 제목 데이터 집계
-        titles = []
-        for video in contents.get('youtube', []):
-            titles.append(video.get('title', ''))
-        
-        for news in contents.get('news', []):
-            titles.append(news.get('title', ''))
-            
+        titles = _titles(contents)
         if not titles:
-            return []
-            
-        # 2. AI 분석 요청
+            return None
         try:
-            keywords = await self.ai_client.analyze_keywords(titles, country)
-            
-            # top_n 개수 맞추기
-            return keywords[:top_n]
-            
+            keywords = await asyncio.wait_for(
+                self.ai_client.analyze_keywords(titles, country),
+                timeout=settings.LLM_ENRICH_TIMEOUT_SECONDS
+            )
+        except asyncio.TimeoutError:
+            logger.warning(f"⏱️ AI 키워드 분석 지연 -> 로컬 결과 유지 ({country})")
+            return None
         except Exception as e:
             logger.error(f"KeywordAnalyzer 에러: {e}")
-            return []
+            return None
+        
+        if not keywords:
+            return None
+        
+        # top_n 개수 맞추기
+        return [{**k, "source": "ai"} for k in keywords[:top_n]]
+
+
+def _titles(contents: Dict[str, List[Dict]]) -> List[str]:
+    """제목 데이터 집계 (YouTube + 뉴스)"""
+    titles = [video.get('title', '') for video in contents.get('youtube', [])]
+    titles.extend(news.get('title', '') for news in contents.get('news', []))
+    return titles
@@ -0,0 +1,288 @@
+"""
+대량 적재 / 백필 (Postgres binary COPY)
+- 입력: n8n 시절 Google Sheets 내보내기(Sheet Keywords / Sheet YouTube / Sheet News) CSV 또는 덤프 JSONL(.gz 가능)
+- 파일을 batch_rows 단위로 스트리밍 -> UNLOGGED 스테이징 테이블에 COPY -> 집합 연산으로 keywords / youtube_contents / news_contents 병합
+- 배치 병합과 체크포인트 갱신이 한 트랜잭션 -> 중단 후 같은 명령을 다시 실행하면 마지막 완료 배치 다음부터 재개
+- 메모리: 병합 중인 배치 + 다음 배치(스레드에서 미리 파싱) 2개분만 유지
+- 콘텐츠는 (keyword, keyword_country, keyword_collected_at)으로 키워드에 연결, 없는 키워드는 새로 생성
+- 점수/임베딩/집계는 계산하지 않음: 적재 후 python -m Back.trend.rollups --days N 으로 집계 백필
+
+실행 (저장소 루트):
+  python -m Back.trend.bulk_ingest keywords "Sheet Keywords.csv"
+  python -m Back.trend.bulk_ingest youtube "Sheet YouTube.csv" dump_youtube.jsonl.gz [--batch-rows 50000] [--restart]
+"""
+import argparse
+import asyncio
+import csv
+import gzip
+import json
+import os
+import time
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from operator import itemgetter
+from typing import Callable, Dict, Iterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..core.tracing import span
+from .repositories.ingest_repo import STAGES, IngestRepository
+
+try:
+    import orjson
+    _loads = orjson.loads
+except ImportError:  # pragma: no cover - 선택 의존성
+    _loads = json.loads
+
+DEFAULT_BATCH_ROWS = 50_000
+NO_DATA = "NO_DATA"  # n8n 워크플로가 결과 없는 키워드에 남긴 자리 표시 행
+
+# 포맷된 트렌드 검색량 ("200K+", "2M+", "1,000+", "5만+")
+_VOLUME_SUFFIX = {"K": 1_000, "M": 1_000_000, "B": 1_000_000_000, "천": 1_000, "만": 10_000, "억": 100_000_000}
+
+
+def _to_int(value: str) -> Optional[int]:
+    if value.isdigit():
+        return int(value)
+    text = value.strip().replace(",", "").rstrip("+").strip()
+    if not text:
+        return None
+    multiplier = 1
+    if text[-1].upper() in _VOLUME_SUFFIX:
+        multiplier = _VOLUME_SUFFIX[text[-1].upper()]
+        text = text[:-1]
+    try:
+        return int(float(text) * multiplier)
+    except ValueError:
+        return None
+
+
+@lru_cache(maxsize=8192)
+def _to_datetime(value: str) -> Optional[datetime]:
+    # 같은 회차 행들은 collected_at/keyword_collected_at 문자열이 같으므로 캐시 적중률이 높음
+    text = value.strip()
+    if not text:
+        return None
+    if text.endswith("Z"):
+        text = text[:-1] + "+00:00"
+    try:
+        parsed = datetime.fromisoformat(text)
+    except ValueError:
+        return None
+    return parsed if parsed.tzinfo else parsed.replace(tzinfo=timezone.utc)
+
+
+# ===== 원본 행 -> COPY 레코드 =====
+# - 입력 행은 STAGES 컬럼 순서로 정렬된 문자열 튜플 (없는 컬럼/NULL은 "")
+# - country 자리는 콘텐츠 시트의 keyword_country, 없으면 country
+# - 반환: 같은 순서의 COPY 레코드, 적재 대상이 아니면 None
+
+def keyword_record(row: Sequence[str], now: datetime) -> Optional[tuple]:
+    keyword, country, trend_volume, rank, keyword_collected_at = row
+    keyword, country = keyword.strip(), country.strip()
+    if not keyword or not country:
+        return None
+    return (
+        keyword[:200], country[:10], _to_int(trend_volume), _to_int(rank),
+        _to_datetime(keyword_collected_at) or now,
+    )
+
+
+def youtube_record(row: Sequence[str], now: datetime) -> Optional[tuple]:
+    keyword, country, keyword_collected_at, video_id, title, channel, views, likes, published_at, url, collected_at = row
+    keyword, country, video_id = keyword.strip(), country.strip(), video_id.strip()
+    if not video_id or video_id == NO_DATA or not keyword or not country:
+        return None
+    collected = _to_datetime(collected_at) or now
+    return (
+        keyword[:200], country[:10], _to_datetime(keyword_collected_at) or collected,
+        video_id[:50], title[:300] or None, channel[:200] or None,
+        int(views) if views.isdigit() else _to_int(views), int(likes) if likes.isdigit() else _to_int(likes),
+        published_at[:50] or None, url[:300] or None, collected,
+    )
+
+
+def news_record(row: Sequence[str], now: datetime) -> Optional[tuple]:
+    keyword, country, keyword_collected_at, title, source, description, published_at, url, collected_at = row
+    keyword, country, url = keyword.strip(), country.strip(), url.strip()
+    if not url or title == NO_DATA or not keyword or not country:
+        return None
+    collected = _to_datetime(collected_at) or now
+    return (
+        keyword[:200], country[:10], _to_datetime(keyword_collected_at) or collected,
+        title[:300] or None, source[:100] or None, description or None,
+        published_at[:50] or None, url, collected,
+    )
+
+
+RECORD_BUILDERS: Dict[str, Callable[[Sequence[str], datetime], Optional[tuple]]] = {
+    "keywords": keyword_record,
+    "youtube": youtube_record,
+    "news": news_record,
+}
+
+
+# ===== 파일 스트리밍 =====
+
+def detect_format(path: str) -> str:
+    name = path[:-3] if path.endswith(".gz") else path
+    return "jsonl" if name.endswith((".jsonl", ".ndjson", ".json")) else "csv"
+
+
+def _source_columns(kind: str, available: Sequence[str]) -> List[str]:
+    """STAGES 컬럼 -> 원본 컬럼 이름 (country는 keyword_country 우선)"""
+    columns = list(STAGES[kind][1])
+    if "keyword_country" in available or "country" not in available:
+        columns[columns.index("country")] = "keyword_country"
+    return columns
+
+
+def _as_text(value) -> str:
+    if value is None:
+        return ""
+    return value if isinstance(value, str) else str(value)
+
+
+def iter_rows(path: str, fmt: str, kind: str) -> Iterator[Sequence[str]]:
+    """
+    CSV(헤더 행 필수) / JSONL 파일을 한 행씩 STAGES 컬럼 순서 튜플로 (파일 전체를 읽지 않음)
+    - CSV는 DictReader 대신 헤더 위치 기반 itemgetter (행당 dict 생성 없음)
+    """
+    opener = gzip.open if path.endswith(".gz") else open
+    with opener(path, "rt", encoding="utf-8-sig", newline="") as f:
+        if fmt == "csv":
+            reader = csv.reader(f)
+            header = [name.strip() for name in next(reader, [])]
+            width = len(header)
+            # 없는 컬럼은 행 끝에 덧붙인 "" 위치를 가리킴
+            pick = itemgetter(*[
+                header.index(name) if name in header else width for name in _source_columns(kind, header)
+            ])
+            padding = [""] * (width + 1)
+            for row in reader:
+                size = len(row)
+                if size == width:
+                    row.append("")
+                elif size == 0:
+                    continue
+                elif size < width:
+                    row.extend(padding[size:])
+                else:
+                    row = row[:width] + [""]
+                yield pick(row)
+        else:
+            columns = None
+            for line in f:
+                if not line.strip():
+                    continue
+                data = _loads(line)
+                if columns is None:
+                    columns = _source_columns(kind, list(data))
+                yield tuple(_as_text(data.get(name)) for name in columns)
+
+
+class _BatchReader:
+    """원본 행을 batch_rows개씩 읽어 COPY 레코드 목록으로 (한 번에 한 스레드에서만 호출)"""
+
+    def __init__(self, kind: str, path: str, fmt: str, skip: int, batch_rows: int):
+        self.rows = islice(iter_rows(path, fmt, kind), skip, None)
+        self.build = RECORD_BUILDERS[kind]
+        self.batch_rows = batch_rows
+        self.now = datetime.now(timezone.utc)
+
+    def next_batch(self) -> Tuple[List[tuple], int]:
+        """(레코드 목록, 소비한 원본 행 수). 원본 행 수 0이면 파일 끝"""
+        build, now = self.build, self.now
+        records = []
+        consumed = 0
+        for row in islice(self.rows, self.batch_rows):
+            consumed += 1
+            record = build(row, now)
+            if record is not None:
+                records.append(record)
+        return records, consumed
+
+
+class BulkIngestService:
+    """CSV/JSONL -> 스테이징 COPY -> 집합 병합 (파일별 체크포인트)"""
+
+    def __init__(self, batch_rows: int = DEFAULT_BATCH_ROWS):
+        self.repo = IngestRepository()
+        self.batch_rows = batch_rows
+
+    async def ingest_file(self, kind: str, path: str, fmt: Optional[str] = None, restart: bool = False) -> Dict[str, int]:
+        if kind not in STAGES:
+            raise ValueError(f"지원하지 않는 적재 종류: {kind} ({', '.join(STAGES)})")
+
+        source_key = f"{kind}:{os.path.abspath(path)}"
+        if restart:
+            await self.repo.reset_checkpoint(source_key)
+        checkpoint = await self.repo.get_checkpoint(source_key)
+        if checkpoint and checkpoint["finished"]:
+            logger.info(f"⏭️ 이미 적재 완료된 파일: {path} ({checkpoint['rows_done']}행, 다시 적재하려면 --restart)")
+            return {"rows": 0, "records": 0, "contents": 0, "keywords": 0}
+
+        rows_done = checkpoint["rows_done"] if checkpoint else 0
+        if rows_done:
+            logger.info(f"↩️ 체크포인트에서 재개: {path} ({rows_done}행 이후)")
+
+        reader = _BatchReader(kind, path, fmt or detect_format(path), rows_done, self.batch_rows)
+        totals = {"rows": 0, "records": 0, "contents": 0, "keywords": 0}
+        started = time.perf_counter()
+
+        # 현재 배치를 병합하는 동안 다음 배치를 스레드에서 파싱 (CSV 파싱과 DB 작업 겹치기)
+        pending = asyncio.create_task(asyncio.to_thread(reader.next_batch))
+        while True:
+            records, consumed = await pending
+            if consumed == 0:
+                break
+            pending = asyncio.create_task(asyncio.to_thread(reader.next_batch))
+
+            rows_done += consumed
+            try:
+                with span("ingest.batch", kind=kind, rows=consumed, records=len(records)):
+                    counts = await self.repo.merge_batch(kind, records, source_key, rows_done)
+            except BaseException:
+                pending.cancel()
+                raise
+
+            totals["rows"] += consumed
+            totals["records"] += len(records)
+            totals["contents"] += counts["contents"]
+            totals["keywords"] += counts["keywords_updated"] + counts["keywords_inserted"]
+            elapsed = time.perf_counter() - started
+            logger.info(
+                f"📥 {kind} {rows_done}행 적재 (배치 {len(records)}건, 누적 {totals['rows'] / elapsed:,.0f}행/s)"
+            )
+
+        await self.repo.finish_checkpoint(source_key, kind, rows_done)
+        elapsed = time.perf_counter() - started
+        logger.info(
+            f"✅ {kind} 적재 완료: {path} - 원본 {totals['rows']}행, 레코드 {totals['records']}건, "
+            f"콘텐츠 {totals['contents']}건, 키워드 {totals['keywords']}건 ({elapsed:.1f}s)"
+        )
+        return totals
+
+
+async def _main():
+    parser = argparse.ArgumentParser(description="CSV/JSONL 대량 적재 (COPY + 집합 병합, 체크포인트 재개)")
+    parser.add_argument("kind", choices=sorted(STAGES))
+    parser.add_argument("paths", nargs="+", help="CSV(헤더 포함) / JSONL 파일 (.gz 가능)")
+    parser.add_argument("--format", choices=["csv", "jsonl"], default=None, help="기본: 확장자로 판단")
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS)
+    parser.add_argument("--restart", action="store_true", help="체크포인트를 지우고 처음부터 다시 적재")
+    args = parser.parse_args()
+
+    from ..core.database import close_pool
+    service = BulkIngestService(args.batch_rows)
+    try:
+        for path in args.paths:
+            await service.ingest_file(args.kind, path, args.format, args.restart)
+    finally:
+        await close_pool()
+    logger.info("ℹ️ 일자별 집계는 python -m Back.trend.rollups --days N 으로 갱신")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
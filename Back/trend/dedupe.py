@@ -0,0 +1,208 @@
+"""
+유사 중복(Near-Duplicate) 탐지 (MinHash + LSH Banding)
+- 문자 Shingle 집합의 MinHash 시그니처로 Jaccard 유사도 근사
+- LSH 밴드 버킷으로 후보만 비교 -> 전체 쌍 비교 없이 준선형 시간 클러스터링
+- 시그니처/밴드 키를 DB에 저장하여 새 항목을 과거 이력과 증분 비교
+"""
+import hashlib
+import re
+import zlib
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..core.config import settings
+from .records import NewsRecord
+from .repositories.signature_repo import SignatureRepository
+
+NUM_PERM = 128
+BANDS = 32
+ROWS = NUM_PERM // BANDS
+
+_MERSENNE_PRIME = np.uint64((1 << 61) - 1)
+_MAX_HASH = np.uint64(0xFFFFFFFF)
+_rng = np.random.RandomState(1)  # 고정 시드: 저장된 시그니처와 호환 유지
+_PERM_A = _rng.randint(1, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+_PERM_B = _rng.randint(0, (1 << 61) - 1, size=NUM_PERM, dtype=np.uint64)
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize(text: str) -> str:
+    """소문자 + 공백/구두점 제거 (매체명·띄어쓰기 차이 무시)"""
+    return _NON_WORD.sub("", (text or "").lower())
+
+
+def shingle_hashes(text: str, k: int = 3) -> np.ndarray:
+    norm = normalize(text)
+    if len(norm) <= k:
+        grams = {norm} if norm else set()
+    else:
+        grams = {norm[i:i + k] for i in range(len(norm) - k + 1)}
+    return np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+
+
+def minhash(text: str, k: int = 3) -> np.ndarray:
+    """MinHash 시그니처 (uint32 x NUM_PERM)"""
+    hashes = shingle_hashes(text, k)
+    if hashes.size == 0:
+        return np.full(NUM_PERM, 0xFFFFFFFF, dtype=np.uint32)
+    with np.errstate(over="ignore"):
+        permuted = (np.outer(_PERM_A, hashes) + _PERM_B[:, None]) % _MERSENNE_PRIME
+    return np.bitwise_and(permuted, _MAX_HASH).min(axis=1).astype(np.uint32)
+
+
+def band_keys(signature: np.ndarray) -> List[int]:
+    """밴드별 버킷 키 (밴드 번호 포함 64bit signed 정수 -> Postgres BIGINT 호환)"""
+    keys = []
+    for band in range(BANDS):
+        chunk = signature[band * ROWS:(band + 1) * ROWS].tobytes()
+        digest = hashlib.blake2b(bytes([band]) + chunk, digest_size=8).digest()
+        keys.append(int.from_bytes(digest, "big", signed=True))
+    return keys
+
+
+def similarity(sig_a: np.ndarray, sig_b: np.ndarray) -> float:
+    """추정 Jaccard 유사도"""
+    return float(np.mean(sig_a == sig_b))
+
+
+def cluster(signatures: Sequence[np.ndarray], threshold: float) -> List[List[int]]:
+    """
+    LSH 후보 쌍만 검증하여 Union-Find로 클러스터링
+    :return: 입력 순서 기준 인덱스 클러스터 리스트 (각 클러스터 첫 원소가 대표)
+    """
+    parent = list(range(len(signatures)))
+
+    def find(i: int) -> int:
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+
+    # 버킷에는 서로 유사하지 않은 대표만 보관 -> 유사 항목이 몰려도 버킷 크기가 커지지 않음
+    buckets: Dict[int, List[int]] = {}
+    for idx, sig in enumerate(signatures):
+        for key in band_keys(sig):
+            bucket = buckets.setdefault(key, [])
+            matched = False
+            for other in bucket:
+                ra, rb = find(idx), find(other)
+                if ra == rb or similarity(sig, signatures[other]) >= threshold:
+                    # 먼저 등장한 항목(상위 순위)이 대표가 되도록 작은 인덱스를 루트로
+                    parent[max(ra, rb)] = min(ra, rb)
+                    matched = True
+            if not matched:
+                bucket.append(idx)
+
+    groups: Dict[int, List[int]] = {}
+    for idx in range(len(signatures)):
+        groups.setdefault(find(idx), []).append(idx)
+    return sorted(groups.values(), key=lambda g: g[0])
+
+
+class NearDuplicateDetector:
+    """헤드라인/트렌드 키워드 유사 중복 제거 + 이력 대비 증분 검사"""
+
+    def __init__(self, threshold: Optional[float] = None):
+        self.threshold = threshold or settings.DEDUPE_JACCARD_THRESHOLD
+        self.signature_repo = SignatureRepository()
+
+    def dedupe_keywords(self, keywords: List[str]) -> List[str]:
+        """같은 사건을 다르게 표현한 키워드 제거 (순위가 높은 표현 유지)"""
+        if len(keywords) < 2:
+            return keywords
+        signatures = [minhash(k, k=2) for k in keywords]
+        clusters = cluster(signatures, self.threshold)
+        if len(clusters) < len(keywords):
+            logger.info(f"🧬 유사 키워드 병합: {len(keywords)}개 -> {len(clusters)}개")
+        return [keywords[group[0]] for group in clusters]
+
+    def dedupe_items(self, items: List[NewsRecord]) -> List[NewsRecord]:
+        """수집분 내부 클러스터링 -> 대표 레코드만 남기고 duplicate_urls/signature 기록 (제자리 갱신)"""
+        if not items:
+            return items
+        signatures = [minhash(item.title) for item in items]
+        canonical = []
+        for group in cluster(signatures, self.threshold):
+            item = items[group[0]]
+            item.duplicate_urls = [*item.duplicate_urls, *(items[i].url for i in group[1:] if items[i].url)]
+            item.signature = signatures[group[0]]
+            canonical.append(item)
+        if len(canonical) < len(items):
+            logger.info(f"🧬 유사 헤드라인 병합: {len(items)}개 -> {len(canonical)}개")
+        return canonical
+
+    async def filter_against_history(
+        self,
+        country: str,
+        kind: str,
+        items: List[NewsRecord]
+    ) -> Tuple[List[NewsRecord], Dict[str, str]]:
+        """
+        저장된 과거 시그니처와 비교 (DB GIN 인덱스로 밴드 키 후보만 조회)
+        :return: (신규 항목, {병합된 url: 대표 content_key})
+            - 수집분 내부 병합분 포함, 이미 기록된 병합은 저장 시 무시되므로 재수집해도 중복 수가 늘지 않음
+        """
+        if not items:
+            return items, {}
+        for item in items:
+            if item.signature is None:
+                item.signature = minhash(item.title)
+
+        all_keys = sorted({key for item in items for key in band_keys(item.signature)})
+        candidates = await self.signature_repo.find_candidates(
+            country, kind, all_keys, settings.DEDUPE_HISTORY_DAYS
+        )
+        history = [
+            (row["content_key"], np.frombuffer(row["signature"], dtype=np.uint32))
+            for row in candidates
+        ]
+
+        history_keys = {key for key, _ in history}
+        fresh: List[NewsRecord] = []
+        duplicates: Dict[str, str] = {}
+        merged = 0
+        for item in items:
+            # 이미 대표로 저장된 항목의 재수집은 일반 Upsert 경로로 처리
+            if item.url in history_keys:
+                fresh.append(item)
+                duplicates.update(dict.fromkeys(item.duplicate_urls, item.url))
+                continue
+            match = next(
+                (
+                    key for key, sig in history
+                    if similarity(item.signature, sig) >= self.threshold
+                ),
+                None
+            )
+            if match is None:
+                fresh.append(item)
+                duplicates.update(dict.fromkeys(item.duplicate_urls, item.url))
+            else:
+                absorbed = [url for url in (item.url, *item.duplicate_urls) if url != match]
+                duplicates.update(dict.fromkeys(absorbed, match))
+                merged += len(absorbed)
+
+        if merged:
+            logger.info(f"🧬 과거 이력과 중복된 {kind} {merged}건 병합")
+        return fresh, duplicates
+
+    async def remember(self, country: str, kind: str, items: List[NewsRecord]):
+        """신규 대표 항목의 시그니처 저장 (content_key = url)"""
+        rows = []
+        for item in items:
+            if not item.url:
+                continue
+            signature = item.signature
+            if signature is None:
+                signature = minhash(item.title)
+            rows.append({
+                "country": country,
+                "kind": kind,
+                "content_key": item.url,
+                "signature": signature.tobytes(),
+                "bands": band_keys(signature),
+            })
+        await self.signature_repo.save_signatures(rows)
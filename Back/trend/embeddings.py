@@ -0,0 +1,261 @@
+"""
+제목/트렌드 키워드 임베딩 파이프라인 (pgvector)
+- 수집 시 신규 제목/키워드를 배치 단위로 한 번에 임베딩
+- 정규화 텍스트 해시로 캐싱 (프로세스 LRU -> DB 순), 이미 계산된 텍스트는 재계산하지 않음
+- 관련 콘텐츠 / 유사 트렌드 조회는 HNSW 근사 최근접 탐색으로 처리 (LLM 호출 불필요)
+
+백엔드 (settings.EMBEDDING_BACKEND)
+- hashing: 문자 n-gram Feature Hashing (외부 모델/네트워크 불필요, 기본값)
+- sentence-transformers: 로컬 다국어 모델 (설치 + 모델 파일이 있으면 오프라인 동작)
+- openai: text-embedding-3-small (dimensions=EMBEDDING_DIM)
+"""
+import asyncio
+import hashlib
+import re
+import zlib
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..core.config import settings
+from .repositories.embedding_repo import EmbeddingRepository
+
+_NON_WORD = re.compile(r"[\W_]+", re.UNICODE)
+
+
+def normalize_text(text: str) -> str:
+    """소문자 + 구두점/연속 공백 정리"""
+    return " ".join(_NON_WORD.sub(" ", (text or "").lower()).split())
+
+
+def text_hash(text: str) -> str:
+    return hashlib.sha256(normalize_text(text).encode("utf-8")).hexdigest()
+
+
+def to_pgvector(vector: np.ndarray) -> str:
+    """numpy 벡터 -> pgvector 텍스트 표현 '[x,y,...]'"""
+    return "[" + ",".join(f"{v:.6f}" for v in vector.tolist()) + "]"
+
+
+def from_pgvector(value: str) -> np.ndarray:
+    return np.fromstring(value.strip("[]"), sep=",", dtype=np.float32)
+
+
+class HashingEmbedder:
+    """
+    문자 n-gram + 단어 Feature Hashing 임베딩
+    - 의미 유사도보다는 표기 유사도에 가깝지만, 외부 의존성 없이 다국어(CJK 포함) 동작
+    """
+
+    def __init__(self, dim: int, ngram_range=(2, 3)):
+        self.dim = dim
+        self.ngram_range = ngram_range
+        self.name = f"hashing-char{ngram_range[0]}{ngram_range[1]}-{dim}"
+
+    def _features(self, text: str) -> List[str]:
+        norm = normalize_text(text)
+        features = [f"w:{w}" for w in norm.split()]
+        compact = norm.replace(" ", "")
+        for n in range(self.ngram_range[0], self.ngram_range[1] + 1):
+            features.extend(compact[i:i + n] for i in range(len(compact) - n + 1))
+        return features or ([compact] if compact else [])
+
+    def _embed_sync(self, texts: List[str]) -> np.ndarray:
+        rows: List[int] = []
+        cols: List[int] = []
+        signs: List[float] = []
+        for row, text in enumerate(texts):
+            for feature in self._features(text):
+                h = zlib.crc32(feature.encode("utf-8"))
+                rows.append(row)
+                cols.append(h % self.dim)
+                signs.append(1.0 if (h >> 31) & 1 else -1.0)
+
+        matrix = np.zeros((len(texts), self.dim), dtype=np.float32)
+        np.add.at(matrix, (np.asarray(rows, dtype=np.int64), np.asarray(cols, dtype=np.int64)), signs)
+        # 빈도 완화 후 L2 정규화 (코사인 거리 기준)
+        matrix = np.sign(matrix) * np.log1p(np.abs(matrix))
+        norms = np.linalg.norm(matrix, axis=1, keepdims=True)
+        return matrix / np.where(norms == 0, 1.0, norms)
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        return self._embed_sync(texts)
+
+
+class SentenceTransformerEmbedder:
+    """로컬 sentence-transformers 모델 (지연 로딩, 스레드에서 실행)"""
+
+    DEFAULT_MODEL = "paraphrase-multilingual-MiniLM-L12-v2"
+
+    def __init__(self, dim: int, model_name: Optional[str] = None):
+        self.dim = dim
+        self.model_name = model_name or self.DEFAULT_MODEL
+        self.name = f"st-{self.model_name}"
+        self._model = None
+
+    def _embed_sync(self, texts: List[str]) -> np.ndarray:
+        if self._model is None:
+            from sentence_transformers import SentenceTransformer
+            self._model = SentenceTransformer(self.model_name)
+        vectors = self._model.encode(texts, batch_size=len(texts), normalize_embeddings=True)
+        if vectors.shape[1] != self.dim:
+            raise ValueError(f"모델 차원({vectors.shape[1]})이 EMBEDDING_DIM({self.dim})과 다릅니다.")
+        return vectors.astype(np.float32)
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        return await asyncio.to_thread(self._embed_sync, texts)
+
+
+class OpenAIEmbedder:
+    """OpenAI Embeddings API (배치 1회 호출)"""
+
+    DEFAULT_MODEL = "text-embedding-3-small"
+
+    def __init__(self, dim: int, model_name: Optional[str] = None):
+        from openai import AsyncOpenAI
+        from ..utils.http_cassette import httpx_async_client
+        self.dim = dim
+        self.model_name = model_name or self.DEFAULT_MODEL
+        self.name = f"openai-{self.model_name}-{dim}"
+        self.client = AsyncOpenAI(
+            api_key=settings.OPENAI_API_KEY, base_url=settings.OPENAI_BASE_URL, http_client=httpx_async_client("openai")
+        )
+
+    async def embed(self, texts: List[str]) -> np.ndarray:
+        response = await self.client.embeddings.create(model=self.model_name, input=texts, dimensions=self.dim)
+        return np.asarray([item.embedding for item in response.data], dtype=np.float32)
+
+
+# 백엔드 등록부 (이름 -> 생성 함수). 새 모델은 register_embedder로 추가
+_BACKENDS: Dict[str, Callable[[int, Optional[str]], object]] = {
+    "hashing": lambda dim, model: HashingEmbedder(dim),
+    "sentence-transformers": SentenceTransformerEmbedder,
+    "openai": OpenAIEmbedder,
+}
+
+
+def register_embedder(name: str, factory: Callable[[int, Optional[str]], object]):
+    _BACKENDS[name] = factory
+
+
+def create_embedder(backend: Optional[str] = None):
+    backend = backend or settings.EMBEDDING_BACKEND
+    if backend not in _BACKENDS:
+        raise ValueError(f"지원하지 않는 임베딩 백엔드: {backend}")
+    return _BACKENDS[backend](settings.EMBEDDING_DIM, settings.EMBEDDING_MODEL)
+
+
+class EmbeddingIndex:
+    """임베딩 계산/캐시/저장 + 근사 최근접 조회"""
+
+    def __init__(self, embedder=None, memory_entries: int = 4096):
+        self._embedder = embedder
+        self.memory_entries = memory_entries
+        self._memory: "OrderedDict[str, np.ndarray]" = OrderedDict()
+        self.repo = EmbeddingRepository()
+
+    @property
+    def embedder(self):
+        if self._embedder is None:
+            self._embedder = create_embedder()
+        return self._embedder
+
+    def _memory_key(self, digest: str) -> str:
+        return f"{self.embedder.name}:{digest}"
+
+    def _remember(self, digest: str, vector: np.ndarray):
+        key = self._memory_key(digest)
+        self._memory[key] = vector
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.memory_entries:
+            self._memory.popitem(last=False)
+
+    async def embed_texts(self, texts: List[str]) -> Dict[str, np.ndarray]:
+        """
+        텍스트 -> 임베딩 (해시 캐시 경유, 미적중분만 배치 계산)
+        :return: {text_hash: vector}
+        """
+        digests = {text_hash(t): t for t in texts if t and t.strip()}
+        vectors: Dict[str, np.ndarray] = {}
+
+        for digest in digests:
+            cached = self._memory.get(self._memory_key(digest))
+            if cached is not None:
+                vectors[digest] = cached
+
+        missing = [d for d in digests if d not in vectors]
+        if missing:
+            stored = await self.repo.find_by_hashes(self.embedder.name, missing)
+            for digest, value in stored.items():
+                vectors[digest] = from_pgvector(value)
+                self._remember(digest, vectors[digest])
+            missing = [d for d in missing if d not in vectors]
+
+        batch_size = max(1, settings.EMBEDDING_BATCH_SIZE)
+        for start in range(0, len(missing), batch_size):
+            batch = missing[start:start + batch_size]
+            matrix = await self.embedder.embed([digests[d] for d in batch])
+            for digest, vector in zip(batch, matrix):
+                vectors[digest] = vector
+                self._remember(digest, vector)
+
+        if missing:
+            logger.info(f"🧠 임베딩 계산 {len(missing)}건 (캐시 적중 {len(digests) - len(missing)}건)")
+        return vectors
+
+    async def index(self, country: str, kind: str, items: Sequence[Any], key_field: str = "url", text_field: str = "title"):
+        """수집 레코드 임베딩 일괄 계산 + 저장 (key_field/text_field: 레코드 필드 이름)"""
+        await self._index_pairs(country, kind, [(getattr(item, key_field), getattr(item, text_field)) for item in items])
+
+    async def index_keywords(self, country: str, keywords: List[str]):
+        await self._index_pairs(country, "keyword", [(k, k) for k in keywords])
+
+    async def _index_pairs(self, country: str, kind: str, pairs: List[Tuple[str, str]]):
+        pairs = [(key, text) for key, text in pairs if key and text]
+        if not pairs:
+            return
+        vectors = await self.embed_texts([text for _, text in pairs])
+        rows = []
+        for key, text in pairs:
+            digest = text_hash(text)
+            if digest not in vectors:
+                continue
+            rows.append({
+                "country": country,
+                "kind": kind,
+                "content_key": key,
+                "title": text,
+                "text_hash": digest,
+                "model": self.embedder.name,
+                "embedding": to_pgvector(vectors[digest]),
+            })
+        await self.repo.save_embeddings(rows)
+
+    async def related_contents(self, content_key: str, limit: int = 10, country: Optional[str] = None) -> Optional[List[dict]]:
+        """저장된 콘텐츠(URL)와 의미상 가까운 YouTube/News 콘텐츠. 대상이 없으면 None"""
+        target = await self.repo.get_embedding(content_key)
+        if target is None or target["kind"] == "keyword":
+            return None
+        return await self.repo.nearest(
+            target["embedding"], target["model"], ["youtube", "news"],
+            country=country, exclude_key=content_key, limit=limit
+        )
+
+    async def similar_keywords(self, keyword: str, country: Optional[str] = None, limit: int = 10) -> List[dict]:
+        """입력 키워드와 가까운 과거 트렌드 키워드 (입력은 즉석 임베딩)"""
+        vectors = await self.embed_texts([keyword])
+        vector = vectors.get(text_hash(keyword))
+        if vector is None:
+            return []
+        rows = await self.repo.nearest(
+            to_pgvector(vector), self.embedder.name, ["keyword"],
+            country=country, limit=limit + 1
+        )
+        norm = normalize_text(keyword)
+        return [row for row in rows if normalize_text(row["title"]) != norm][:limit]
+
+
+# 프로세스 전역 인덱스 (임베딩 메모리 캐시 공유)
+embedding_index = EmbeddingIndex()
@@ -0,0 +1,224 @@
+"""
+수집 이력 내보내기 (CSV / JSONL / Parquet 스트리밍)
+- 서버 사이드 커서로 EXPORT_CHUNK_ROWS행씩 읽어 바로 인코딩 -> 결과 크기와 무관하게 메모리 일정
+- 1년치 전체도 한 요청으로 내보내기 가능 (GET /trend/export, 응답 본문을 청크 단위로 전송)
+- Parquet: Arrow RecordBatch를 청크마다 row group으로 기록 (pyarrow 필요, 미설치 시 CSV/JSONL만)
+- CLI: python -m Back.trend.export youtube --format parquet --country KR --from 2025-01-01 --to 2025-12-31 -o youtube.parquet
+"""
+import argparse
+import asyncio
+import csv
+import io
+import time
+from datetime import date, datetime, time as dt_time, timedelta, timezone
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..core.config import settings
+from ..core.responses import dumps
+from .repositories.export_repo import EXPORT_SOURCES, ExportRepository, export_columns
+
+# 형식 -> (Content-Type, 확장자)
+EXPORT_FORMATS = {
+    "csv": ("text/csv; charset=utf-8", "csv"),
+    "jsonl": ("application/x-ndjson", "jsonl"),
+    "parquet": ("application/vnd.apache.parquet", "parquet"),
+}
+
+
+def parquet_available() -> bool:
+    try:
+        import pyarrow.parquet  # noqa: F401
+    except ImportError:
+        return False
+    return True
+
+
+class _CsvEncoder:
+    """헤더 + 행 (UTF-8 BOM 포함: 엑셀에서 한글 깨짐 방지), 배열 컬럼은 '|'로 연결"""
+
+    def __init__(self, columns: List[Tuple[str, str]]):
+        self.columns = columns
+        self.array_positions = [i for i, (_, kind) in enumerate(columns) if kind == "text[]"]
+        self.buffer = io.StringIO()
+        self.writer = csv.writer(self.buffer)
+
+    def _take(self) -> bytes:
+        data = self.buffer.getvalue().encode("utf-8")
+        self.buffer.seek(0)
+        self.buffer.truncate()
+        return data
+
+    def begin(self) -> bytes:
+        self.writer.writerow([name for name, _ in self.columns])
+        return b"\xef\xbb\xbf" + self._take()
+
+    def encode(self, rows: Sequence[tuple]) -> bytes:
+        if self.array_positions:
+            rows = [list(row) for row in rows]
+            for row in rows:
+                for i in self.array_positions:
+                    row[i] = "|".join(row[i]) if row[i] else ""
+        self.writer.writerows(rows)
+        return self._take()
+
+    def end(self) -> bytes:
+        return b""
+
+
+class _JsonlEncoder:
+    """한 행 = JSON 객체 한 줄 (bulk_ingest 입력으로 재사용 가능)"""
+
+    def __init__(self, columns: List[Tuple[str, str]]):
+        self.names = [name for name, _ in columns]
+
+    def begin(self) -> bytes:
+        return b""
+
+    def encode(self, rows: Sequence[tuple]) -> bytes:
+        names = self.names
+        return b"".join(dumps(dict(zip(names, row))) + b"\n" for row in rows)
+
+    def end(self) -> bytes:
+        return b""
+
+
+class _ChunkSink(io.RawIOBase):
+    """ParquetWriter 출력 버퍼 (청크마다 비워서 전송)"""
+
+    def __init__(self):
+        super().__init__()
+        self.buffer = bytearray()
+        self.position = 0
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        self.buffer += data
+        self.position += len(data)
+        return len(data)
+
+    def tell(self) -> int:
+        return self.position
+
+    def take(self) -> bytes:
+        data = bytes(self.buffer)
+        self.buffer.clear()
+        return data
+
+
+class _ParquetEncoder:
+    """청크(RecordBatch) 1개 = row group 1개, 파일 메타데이터(footer)는 end()에서 기록"""
+
+    def __init__(self, columns: List[Tuple[str, str]]):
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+        types = {
+            "int": pa.int64(),
+            "float": pa.float64(),
+            "text": pa.string(),
+            "timestamp": pa.timestamp("us", tz="UTC"),
+            "text[]": pa.list_(pa.string()),
+        }
+        self.pa = pa
+        self.schema = pa.schema([(name, types[kind]) for name, kind in columns])
+        self.sink = _ChunkSink()
+        self.writer = pq.ParquetWriter(self.sink, self.schema, compression="zstd")
+
+    def begin(self) -> bytes:
+        return self.sink.take()
+
+    def encode(self, rows: Sequence[tuple]) -> bytes:
+        pa = self.pa
+        arrays = [
+            pa.array(values, type=field.type)
+            for values, field in zip(zip(*rows), self.schema)
+        ]
+        self.writer.write_batch(pa.RecordBatch.from_arrays(arrays, schema=self.schema))
+        return self.sink.take()
+
+    def end(self) -> bytes:
+        self.writer.close()
+        return self.sink.take()
+
+
+_ENCODERS = {"csv": _CsvEncoder, "jsonl": _JsonlEncoder, "parquet": _ParquetEncoder}
+
+
+def day_bounds(date_from: Optional[date], date_to: Optional[date]) -> Tuple[Optional[datetime], Optional[datetime]]:
+    """수집일 범위 (date_to 포함) -> UTC [시작, 끝)"""
+    start = datetime.combine(date_from, dt_time.min, tzinfo=timezone.utc) if date_from else None
+    end = datetime.combine(date_to + timedelta(days=1), dt_time.min, tzinfo=timezone.utc) if date_to else None
+    return start, end
+
+
+class ExportService:
+    """소스/국가/기간별 수집 이력 스트리밍 내보내기"""
+
+    def __init__(self):
+        self.repo = ExportRepository()
+
+    async def stream(
+        self,
+        source: str,
+        fmt: str,
+        countries: Optional[List[str]] = None,
+        date_from: Optional[date] = None,
+        date_to: Optional[date] = None,
+        chunk_rows: Optional[int] = None
+    ) -> AsyncIterator[bytes]:
+        """인코딩된 바이트 청크 (헤더 -> 행 청크 -> 푸터), 빈 청크는 건너뜀"""
+        if source not in EXPORT_SOURCES:
+            raise ValueError(f"지원하지 않는 내보내기 소스: {source}")
+        encoder = _ENCODERS[fmt](export_columns(source))
+        start, end = day_bounds(date_from, date_to)
+        started = time.perf_counter()
+        total = 0
+
+        head = encoder.begin()
+        if head:
+            yield head
+        async for rows in self.repo.stream_rows(source, countries, start, end, chunk_rows or settings.EXPORT_CHUNK_ROWS):
+            total += len(rows)
+            chunk = encoder.encode(rows)
+            if chunk:
+                yield chunk
+        tail = encoder.end()
+        if tail:
+            yield tail
+
+        logger.info(f"📤 내보내기 완료: {source}.{fmt} {total}행 ({time.perf_counter() - started:.1f}s)")
+
+
+def export_filename(source: str, fmt: str, date_from: Optional[date], date_to: Optional[date]) -> str:
+    return f"trend_{source}_{date_from or 'all'}_{date_to or 'all'}.{EXPORT_FORMATS[fmt][1]}"
+
+
+async def _main():
+    parser = argparse.ArgumentParser(description="수집 이력 내보내기 (CSV/JSONL/Parquet)")
+    parser.add_argument("source", choices=EXPORT_SOURCES)
+    parser.add_argument("--format", choices=sorted(EXPORT_FORMATS), default="csv")
+    parser.add_argument("--country", default=None, help="쉼표 구분 (미지정 시 전체)")
+    parser.add_argument("--from", dest="date_from", type=date.fromisoformat, default=None)
+    parser.add_argument("--to", dest="date_to", type=date.fromisoformat, default=None)
+    parser.add_argument("-o", "--output", default=None, help="기본: trend_<소스>_<시작>_<끝>.<확장자>")
+    args = parser.parse_args()
+
+    countries = [c.strip().upper() for c in args.country.split(",") if c.strip()] if args.country else None
+    output = args.output or export_filename(args.source, args.format, args.date_from, args.date_to)
+
+    from ..core.database import close_pool
+    try:
+        with open(output, "wb") as f:
+            async for chunk in ExportService().stream(args.source, args.format, countries, args.date_from, args.date_to):
+                f.write(chunk)
+    finally:
+        await close_pool()
+    logger.info(f"💾 {output}")
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -0,0 +1,254 @@
+"""
+로컬(오프라인) 키워드 추출 엔진
+- 외부 AI 호출 없이 프로세스 내에서 수 ms 내 키워드 산출
+- 오늘 제목들의 문서 빈도(TF)를 국가별 누적 배경 코퍼스(감쇠 DF) 대비 TF-IDF로 점수화
+  (배경은 전날까지의 수집분만 포함 -> 오늘 제목이 배경과 오늘 빈도에 이중 집계되지 않음)
+- 배경 코퍼스는 Postgres(keyword_corpora)에 저장: 재시작 후에도 유지, 모든 워커가 같은 배경 사용
+  (워커는 국가별로 하루 1회 로드 -> 배경은 날짜가 바뀔 때만 변하므로 하루 동안 재조회 불필요)
+- CJK 대응 토크나이저 (KR: 어절 + 조사 제거, JP: 가타카나/한자 단위, TW: 한자 bi-gram)
+"""
+import json
+import re
+import threading
+import zlib
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Set
+
+import numpy as np
+from loguru import logger
+
+from .repositories.corpus_repo import CorpusRepository
+
+_LATIN = re.compile(r"[a-z0-9][a-z0-9'+#&.-]*[a-z0-9+#]|[a-z0-9]")
+_HANGUL = re.compile(r"[가-힣]+")
+_KATAKANA = re.compile(r"[ァ-ヴー]{2,}")
+_HAN = re.compile(r"[㐀-䶿一-鿿]+")
+
+_EN_STOPWORDS = {
+    "the", "a", "an", "and", "or", "of", "to", "in", "on", "for", "with", "at", "by", "from",
+    "is", "are", "was", "were", "be", "been", "it", "its", "this", "that", "as", "after", "over",
+    "vs", "how", "what", "why", "who", "new", "you", "your", "my", "i", "we", "he", "she", "they",
+    "his", "her", "their", "will", "just", "not", "no", "can", "has", "have", "had", "do", "does",
+    "official", "video", "mv", "ft", "feat", "live", "full", "episode", "ep", "shorts", "amp",
+}
+_KO_STOPWORDS = {
+    "오늘", "이번", "관련", "위해", "대한", "통해", "있는", "없는", "하는", "했다", "한다", "된다",
+    "그리고", "하지만", "단독", "속보", "영상", "뉴스", "종합", "기자", "사진", "공식", "최신",
+}
+# 긴 것부터 매칭해야 '에서'가 '서'보다 먼저 제거됨
+_KO_SUFFIXES = sorted([
+    "으로부터", "에서는", "에게서", "으로서", "으로써", "이라고", "라고", "에서", "에게", "한테",
+    "까지", "부터", "으로", "처럼", "보다", "이나", "이며", "하고", "했다", "한다", "된다", "됐다",
+    "은", "는", "이", "가", "을", "를", "의", "에", "로", "와", "과", "도", "만", "나",
+], key=len, reverse=True)
+
+
+def _strip_korean_suffix(word: str) -> str:
+    for suffix in _KO_SUFFIXES:
+        if word.endswith(suffix) and len(word) - len(suffix) >= 2:
+            return word[: -len(suffix)]
+    return word
+
+
+def _han_terms(run: str, max_whole: int) -> List[str]:
+    """공백 없는 한자 구간: 짧으면 통째로, 길면 2글자 bi-gram"""
+    if len(run) < 2:
+        return []
+    if len(run) <= max_whole:
+        return [run]
+    return [run[i:i + 2] for i in range(len(run) - 1)]
+
+
+def tokenize(text: str, country: str = "KR") -> List[str]:
+    """
+    국가별 토큰 리스트 (순서 유지)
+    - 라틴 문자는 모든 국가 공통 처리
+    """
+    text = text.lower()
+    tokens: List[str] = [t for t in _LATIN.findall(text) if t not in _EN_STOPWORDS and not t.isdigit()]
+
+    if country == "KR":
+        for word in _HANGUL.findall(text):
+            word = _strip_korean_suffix(word)
+            if len(word) >= 2 and word not in _KO_STOPWORDS:
+                tokens.append(word)
+    elif country == "JP":
+        tokens.extend(_KATAKANA.findall(text))
+        for run in _HAN.findall(text):
+            tokens.extend(_han_terms(run, max_whole=4))
+    elif country == "TW":
+        for run in _HAN.findall(text):
+            tokens.extend(_han_terms(run, max_whole=3))
+    return tokens
+
+
+def title_terms(text: str, country: str = "KR") -> Set[str]:
+    """제목 1건의 term 집합 (unigram + 인접 bi-gram 구문)"""
+    tokens = tokenize(text, country)
+    terms = set(tokens)
+    # 구문(2-gram): 한국어/라틴 어절 단위일 때만 의미가 있음
+    if country not in ("JP", "TW"):
+        terms.update(f"{a} {b}" for a, b in zip(tokens, tokens[1:]) if a != b)
+    return terms
+
+
+class BackgroundCorpus:
+    """국가별 감쇠 문서 빈도 (Rolling Background, 일 단위)"""
+
+    def __init__(self, decay: float = 0.9, min_df: float = 0.05):
+        self.decay = decay
+        self.min_df = min_df
+        self.df: Dict[str, float] = {}
+        self.n_docs = 0.0
+        self.day: Optional[str] = None
+        self.pending: Dict[str, Set[str]] = {}  # 오늘 수집분 (제목 -> term 집합, 재수집 제목은 1건)
+
+    def observe(self, docs: Dict[str, Set[str]], day: str):
+        """수집분을 오늘 대기분에 추가 (배경 반영은 날짜가 바뀔 때)"""
+        self.roll(day)
+        self.pending.update(docs)
+
+    def roll(self, day: str):
+        """날짜가 바뀌면 전날 수집분 편입: 기존 빈도 감쇠 후 누적 (작은 값은 제거하여 크기 제한)"""
+        if self.day == day:
+            return
+        docs = list(self.pending.values())
+        self.day = day
+        self.pending = {}
+        if not docs:
+            return
+        self.n_docs = self.n_docs * self.decay + len(docs)
+        self.df = {t: v * self.decay for t, v in self.df.items() if v * self.decay >= self.min_df}
+        for terms in docs:
+            for term in terms:
+                self.df[term] = self.df.get(term, 0.0) + 1.0
+
+    def to_bytes(self) -> bytes:
+        """저장용 직렬화 (대기분은 제목만 저장 -> 로드 시 다시 토큰화)"""
+        raw = json.dumps({"df": self.df, "pending": list(self.pending)}, ensure_ascii=False, separators=(",", ":"))
+        return zlib.compress(raw.encode("utf-8"))
+
+    @classmethod
+    def from_row(cls, row: Optional[dict], country: str) -> "BackgroundCorpus":
+        """keyword_corpora 행 -> 코퍼스 (행이 없으면 빈 코퍼스)"""
+        corpus = cls()
+        if row:
+            data = json.loads(zlib.decompress(row["data"]).decode("utf-8"))
+            corpus.df = data["df"]
+            corpus.n_docs = row["n_docs"]
+            corpus.day = row["day"]
+            corpus.pending = {t: title_terms(t, country) for t in data["pending"]}
+        return corpus
+
+
+class LocalKeywordEngine:
+    """TF-IDF 기반 로컬 키워드 추출기"""
+
+    def __init__(self):
+        self._corpora: Dict[str, BackgroundCorpus] = {}  # 국가 -> 오늘 날짜로 굴린 배경 (읽기 전용 사본)
+        self._lock = threading.Lock()
+        self.repo = CorpusRepository()
+
+    async def _background(self, country: str) -> BackgroundCorpus:
+        """
+        오늘 기준 배경 코퍼스 (국가별 하루 1회 DB 로드)
+        - 저장 행이 전날 상태여도 같은 규칙으로 굴려 사용 -> 오늘 첫 수집 전후, 워커와 무관하게 같은 배경
+        - 로드 실패 시 이전 사본(없으면 빈 배경)을 쓰고 다음 호출에서 재시도
+        """
+        today = _today()
+        with self._lock:
+            corpus = self._corpora.get(country)
+        if corpus is not None and corpus.day == today:
+            return corpus
+        try:
+            row = await self.repo.get(country)
+        except Exception as e:
+            logger.warning(f"⚠️ 키워드 배경 코퍼스 조회 실패 ({country}): {e}")
+            return corpus or BackgroundCorpus()
+        corpus = BackgroundCorpus.from_row(row, country)
+        corpus.roll(today)
+        with self._lock:
+            self._corpora[country] = corpus
+        return corpus
+
+    async def observe(self, titles: Iterable[str], country: str):
+        """
+        수집 완료 시 호출 -> 배경 코퍼스 갱신 (오늘 수집분은 다음 날부터 배경에 반영)
+        - 같은 국가 수집은 advisory lock으로 직렬화되므로 행 read-modify-write가 안전
+        """
+        docs = {t: title_terms(t, country) for t in titles if t}
+        corpus = BackgroundCorpus.from_row(await self.repo.get(country), country)
+        corpus.observe(docs, _today())
+        await self.repo.save(country, corpus.day, corpus.n_docs, corpus.to_bytes())
+        with self._lock:
+            self._corpora[country] = corpus
+
+    async def extract(self, titles: List[str], country: str = "KR", top_n: int = 20) -> List[Dict]:
+        """
+        오늘 제목들에서 상위 키워드 추출
+        :return: [{'keyword', 'keyword_kr', 'count', 'reason', 'score', 'source'}, ...]
+        """
+        docs = [title_terms(t, country) for t in titles if t]
+        if not docs:
+            return []
+
+        # 1. 어휘 사전 + 오늘 문서 빈도 (벡터화 집계)
+        vocab: Dict[str, int] = {}
+        ids: List[int] = []
+        for terms in docs:
+            for term in terms:
+                ids.append(vocab.setdefault(term, len(vocab)))
+        if not vocab:
+            return []
+        df_today = np.bincount(np.asarray(ids, dtype=np.int64), minlength=len(vocab)).astype(np.float64)
+
+        # 2. 배경 코퍼스 대비 IDF
+        corpus = await self._background(country)
+        terms = list(vocab)
+        df_bg = np.fromiter((corpus.df.get(t, 0.0) for t in terms), dtype=np.float64, count=len(terms))
+        n_bg = corpus.n_docs
+        n_total = n_bg + len(docs)
+        idf = np.log((n_total + 1.0) / (df_bg + df_today + 1.0)) + 1.0
+
+        # 3. 점수: 오늘 빈도(log 완화) x IDF, 구문은 가산 / 1회 등장은 감점
+        is_phrase = np.fromiter((" " in t for t in terms), dtype=bool, count=len(terms))
+        scores = (1.0 + np.log(df_today)) * idf
+        scores[is_phrase] *= 1.2
+        if len(docs) >= 5:
+            scores[df_today < 2] *= 0.5
+
+        # 4. 상위 후보 선택 + 이미 선택된 구문에 포함된 단어/겹치는 구문 제거 (중복 억제)
+        order = np.argsort(-scores, kind="stable")
+        selected: List[int] = []
+        covered: Set[str] = set()
+        for idx in order[: max(top_n * 5, 50)]:
+            term = terms[idx]
+            parts = term.split(" ")
+            if any(part in covered for part in parts):
+                continue
+            if is_phrase[idx]:
+                covered.update(p for p in parts if p in vocab and df_today[vocab[p]] <= df_today[idx])
+            selected.append(int(idx))
+            covered.add(term)
+            if len(selected) >= top_n:
+                break
+
+        return [
+            {
+                "keyword": terms[i],
+                "keyword_kr": terms[i],
+                "count": int(df_today[i]),
+                "reason": f"오늘 수집된 제목 {int(df_today[i])}건에서 언급",
+                "score": round(float(scores[i]), 4),
+                "source": "local",
+            }
+            for i in selected
+        ]
+
+
+def _today() -> str:
+    return datetime.now().strftime("%Y%m%d")
+
+
+# 프로세스 전역 엔진 (배경 코퍼스 사본 캐시, 원본은 keyword_corpora)
+keyword_engine = LocalKeywordEngine()
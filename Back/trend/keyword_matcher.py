@@ -0,0 +1,139 @@
+"""
+뉴스 헤드라인 <-> 트렌드 키워드 매칭 (Aho-Corasick)
+- 수집 1회마다 정규화된 트렌드 키워드/별칭으로 오토마톤을 한 번 구성
+- 모든 헤드라인을 한 번의 선형 스캔으로 매칭 (키워드별 검색 API 호출 불필요)
+"""
+import re
+from collections import deque
+from typing import Dict, Iterable, List, Optional, Set
+
+from .records import NewsRecord
+
+_PUNCT = re.compile(r"[^\w\s]+", re.UNICODE)
+_SPACES = re.compile(r"\s+")
+_CJK = re.compile(r"[가-힣ぁ-ヿ㐀-䶿一-鿿]")
+
+
+def normalize(text: str) -> str:
+    """소문자 + 구두점 제거 + 공백 정리"""
+    return _SPACES.sub(" ", _PUNCT.sub(" ", (text or "").lower())).strip()
+
+
+def default_aliases(keyword: str) -> Set[str]:
+    """
+    기본 별칭: 정규화 원문 + (CJK 포함 시) 띄어쓰기 제거형
+    예: '손흥민 골' -> {'손흥민 골', '손흥민골'}
+    """
+    norm = normalize(keyword)
+    aliases = {norm} if norm else set()
+    if norm and " " in norm and _CJK.search(norm):
+        aliases.add(norm.replace(" ", ""))
+    return aliases
+
+
+def _is_ascii_word(ch: str) -> bool:
+    return ch.isascii() and ch.isalnum()
+
+
+class AhoCorasick:
+    """다중 패턴 문자열 매칭 오토마톤"""
+
+    def __init__(self, patterns: Dict[str, str]):
+        """:param patterns: {패턴 문자열: 원본 키워드}"""
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[int]] = [[]]
+        self._patterns: List[str] = []
+        self._owners: List[str] = []
+
+        for pattern, owner in patterns.items():
+            if pattern:
+                self._add(pattern, owner)
+        self._build()
+
+    def _add(self, pattern: str, owner: str):
+        state = 0
+        for ch in pattern:
+            nxt = self._goto[state].get(ch)
+            if nxt is None:
+                nxt = len(self._goto)
+                self._goto[state][ch] = nxt
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+            state = nxt
+        self._out[state].append(len(self._patterns))
+        self._patterns.append(pattern)
+        self._owners.append(owner)
+
+    def _build(self):
+        """BFS로 실패 링크 구성 + 출력 병합"""
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in self._goto[state].items():
+                queue.append(nxt)
+                fail = self._fail[state]
+                while fail and ch not in self._goto[fail]:
+                    fail = self._fail[fail]
+                candidate = self._goto[fail].get(ch, 0)
+                self._fail[nxt] = candidate if candidate != nxt else 0
+                self._out[nxt] = self._out[nxt] + self._out[self._fail[nxt]]
+
+    def find(self, text: str) -> Set[str]:
+        """text에 등장하는 원본 키워드 집합 (라틴 패턴은 단어 경계 확인)"""
+        found: Set[str] = set()
+        state = 0
+        for pos, ch in enumerate(text):
+            while state and ch not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(ch, 0)
+            for pid in self._out[state]:
+                owner = self._owners[pid]
+                if owner in found:
+                    continue
+                pattern = self._patterns[pid]
+                start, end = pos - len(pattern) + 1, pos + 1
+                if _is_ascii_word(pattern[0]) and start > 0 and _is_ascii_word(text[start - 1]):
+                    continue
+                if _is_ascii_word(pattern[-1]) and end < len(text) and _is_ascii_word(text[end]):
+                    continue
+                found.add(owner)
+        return found
+
+
+class KeywordMatcher:
+    """트렌드 키워드 기반 헤드라인 매처"""
+
+    def __init__(self, keywords: Iterable[str], aliases: Optional[Dict[str, Iterable[str]]] = None):
+        patterns: Dict[str, str] = {}
+        for keyword in keywords:
+            variants = default_aliases(keyword)
+            for alias in (aliases or {}).get(keyword, []):
+                variants |= default_aliases(alias)
+            for variant in variants:
+                # 2글자 미만 패턴은 오탐이 많아 제외
+                if len(variant) >= 2:
+                    patterns.setdefault(variant, keyword)
+        self.automaton = AhoCorasick(patterns)
+
+    def match(self, text: str) -> List[str]:
+        norm = normalize(text)
+        found = self.automaton.find(norm)
+        # 띄어쓰기 변형(CJK) 대응: 공백 제거본도 스캔
+        if " " in norm and _CJK.search(norm):
+            found |= self.automaton.find(norm.replace(" ", ""))
+        return sorted(found)
+
+    def annotate(self, items: List[NewsRecord]) -> Dict[str, int]:
+        """
+        각 기사 레코드의 matched_keywords 채움 (제목 기준)
+        :return: 키워드별 매칭 기사 수 (뉴스 커버리지)
+        """
+        coverage: Dict[str, int] = {}
+        for item in items:
+            matched = self.match(item.title)
+            item.matched_keywords = matched
+            for keyword in matched:
+                coverage[keyword] = coverage.get(keyword, 0) + 1
+        return coverage
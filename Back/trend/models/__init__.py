@@ -2,6 +2,16 @@ from .keyword import Keyword
 from .youtube import YouTubeContent
 from .news import NewsContent
 from .instagram import InstagramContent
+from .llm_cache import LLMCacheEntry
+from .signature import ContentSignature, ContentDuplicate
+from .embedding import ContentEmbedding
+from .sketch import TermSketchBucket
+from .keyword_stat import KeywordStat
+from .rollup import DailyRollup, DailyTopRollup
+from .ingest import IngestCheckpoint
+from .sync import SyncState
+from .cache_generation import CacheGeneration
+from .corpus import KeywordCorpus
 
 # Alembic이 찾을 수 있도록 __all__ 정의 (선택사항이나 좋음)
-__all__ = ["Keyword", "YouTubeContent", "NewsContent", "InstagramContent"]
+__all__ = ["Keyword", "YouTubeContent", "NewsContent", "InstagramContent", "LLMCacheEntry", "ContentSignature", "ContentDuplicate", "ContentEmbedding", "TermSketchBucket", "KeywordStat", "DailyRollup", "DailyTopRollup", "IngestCheckpoint", "SyncState", "CacheGeneration", "KeywordCorpus"]
@@ -0,0 +1,11 @@
+from sqlalchemy import Column, String, BigInteger, DateTime
+from sqlalchemy.sql import func
+from ...core.base import Base
+
+class CacheGeneration(Base):
+    """국가별 응답 캐시 데이터 세대 (워커 간 공유, core/cache.py)"""
+    __tablename__ = "cache_generations"
+
+    country = Column(String(10), primary_key=True)
+    generation = Column(BigInteger, nullable=False, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False, server_default=func.now())
@@ -0,0 +1,15 @@
+from sqlalchemy import Column, String, Float, DateTime, LargeBinary
+from sqlalchemy.sql import func
+from ...core.base import Base
+
+class KeywordCorpus(Base):
+    """국가별 로컬 키워드 엔진 배경 코퍼스 (감쇠 문서 빈도 + 오늘 대기분, keyword_engine.BackgroundCorpus)"""
+    __tablename__ = "keyword_corpora"
+
+    country = Column(String(10), primary_key=True)
+    day = Column(String(8), nullable=False)  # 대기분(pending)의 수집일 YYYYMMDD (다음 날 배경에 편입)
+    n_docs = Column(Float, nullable=False, default=0.0)  # 감쇠 누적 문서 수
+
+    data = Column(LargeBinary, nullable=False)  # zlib(JSON {"df": {term: 감쇠 빈도}, "pending": [제목, ...]})
+
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -0,0 +1,34 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from pgvector.sqlalchemy import Vector
+from ...core.config import settings
+from ...core.base import Base
+
+class ContentEmbedding(Base):
+    """제목/트렌드 키워드 임베딩 테이블 (pgvector)"""
+    __tablename__ = "content_embeddings"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    country = Column(String(10), nullable=False)
+    kind = Column(String(20), nullable=False)  # youtube, news, keyword
+    content_key = Column(Text, nullable=False)  # 콘텐츠 URL 또는 키워드 원문
+    title = Column(Text, nullable=False)
+    
+    # 임베딩 캐시 키: sha256(정규화 텍스트) + 모델명
+    text_hash = Column(String(64), nullable=False)
+    model = Column(String(100), nullable=False)
+    embedding = Column(Vector(settings.EMBEDDING_DIM), nullable=False)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint('kind', 'country', 'content_key', name='uq_content_embeddings_kind_key'),
+        Index('ix_content_embeddings_hash', 'text_hash', 'model'),
+        # 근사 최근접 탐색 (코사인 거리)
+        Index(
+            'ix_content_embeddings_hnsw', 'embedding',
+            postgresql_using='hnsw',
+            postgresql_with={'m': 16, 'ef_construction': 64},
+            postgresql_ops={'embedding': 'vector_cosine_ops'}
+        ),
+    )
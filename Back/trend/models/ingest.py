@@ -0,0 +1,57 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Boolean, DateTime, Text, Table
+from ...core.base import Base
+
+class IngestCheckpoint(Base):
+    """대량 적재(bulk_ingest) 진행 위치 (파일별, 배치 병합과 같은 트랜잭션에서 갱신)"""
+    __tablename__ = "ingest_checkpoints"
+    
+    source_key = Column(String(500), primary_key=True)  # <종류>:<파일 절대 경로>
+    kind = Column(String(20), nullable=False)  # keywords, youtube, news
+    rows_done = Column(BigInteger, nullable=False, default=0)  # 병합 완료된 원본 레코드 수 (재개 시 건너뜀)
+    merged_rows = Column(BigInteger, nullable=False, default=0)
+    finished = Column(Boolean, nullable=False, default=False)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+
+
+# ===== 적재용 스테이징 테이블 (UNLOGGED: WAL 미기록, 배치마다 TRUNCATE 후 COPY) =====
+# - 제약/인덱스 없음, 길이 제한은 병합 시 LEFT()로 적용
+
+ingest_stage_keywords = Table(
+    "ingest_stage_keywords", Base.metadata,
+    Column("keyword", Text),
+    Column("country", Text),
+    Column("trend_volume", BigInteger),
+    Column("rank", Integer),
+    Column("keyword_collected_at", DateTime(timezone=True)),
+    prefixes=["UNLOGGED"],
+)
+
+ingest_stage_youtube = Table(
+    "ingest_stage_youtube", Base.metadata,
+    Column("keyword", Text),
+    Column("country", Text),
+    Column("keyword_collected_at", DateTime(timezone=True)),
+    Column("video_id", Text),
+    Column("title", Text),
+    Column("channel", Text),
+    Column("views", BigInteger),
+    Column("likes", BigInteger),
+    Column("published_at", Text),
+    Column("url", Text),
+    Column("collected_at", DateTime(timezone=True)),
+    prefixes=["UNLOGGED"],
+)
+
+ingest_stage_news = Table(
+    "ingest_stage_news", Base.metadata,
+    Column("keyword", Text),
+    Column("country", Text),
+    Column("keyword_collected_at", DateTime(timezone=True)),
+    Column("title", Text),
+    Column("source", Text),
+    Column("description", Text),
+    Column("published_at", Text),
+    Column("url", Text),
+    Column("collected_at", DateTime(timezone=True)),
+    prefixes=["UNLOGGED"],
+)
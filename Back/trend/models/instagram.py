@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from ...core.database import Base
+from ...core.base import Base
 
 class InstagramContent(Base):
     """인스타그램 콘텐츠 테이블"""
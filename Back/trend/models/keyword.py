@@ -1,7 +1,7 @@
 from sqlalchemy import Column, String, Integer, DateTime, Float, Index
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from ...core.database import Base
+from ...core.base import Base
 
 class Keyword(Base):
     """트렌드 키워드 테이블"""
@@ -21,6 +21,7 @@ class Keyword(Base):
     youtube_videos = Column(Integer, default=0)
     news_count = Column(Integer, default=0)
     score = Column(Float, default=0.0)  # 종합 점수
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())  # 값/집계/점수 변경 시각 (싱크 diff 워터마크)
     
     # 관계 설정 (1:N)
     # 문자열로 클래스명을 참조하므로 순환 참조 문제 없음
@@ -28,7 +29,9 @@ class Keyword(Base):
     youtube_contents = relationship("YouTubeContent", back_populates="keyword_ref", cascade="all, delete-orphan")
     news_contents = relationship("NewsContent", back_populates="keyword_ref", cascade="all, delete-orphan")
     
-    # 복합 인덱스 (국가별 키워드 검색 최적화)
+    # 복합 인덱스 (국가별 키워드 검색 최적화 / 대량 적재 시 콘텐츠 -> 키워드 연결)
     __table_args__ = (
         Index('ix_keywords_country_collected', 'country', 'keyword_collected_at'),
+        Index('ix_keywords_lookup', 'keyword', 'country', 'keyword_collected_at'),
+        Index('ix_keywords_updated', 'updated_at', 'id'),
     )
@@ -0,0 +1,31 @@
+from sqlalchemy import Column, String, Integer, DateTime, REAL, Index, UniqueConstraint
+from sqlalchemy.sql import func
+from ...core.base import Base
+
+class KeywordStat(Base):
+    """키워드별 EWMA 통계 (급상승 탐지용, 키워드당 1행)"""
+    __tablename__ = "keyword_stats"
+    
+    id = Column(Integer, primary_key=True)
+    country = Column(String(10), nullable=False)
+    keyword = Column(String(200), nullable=False)  # 정규화된 키워드
+    
+    # 순위 / 언급 빈도의 지수가중 평균·분산 (4byte REAL로 행 크기 최소화)
+    rank_mean = Column(REAL, nullable=False)
+    rank_var = Column(REAL, nullable=False, default=0.0)
+    freq_mean = Column(REAL, nullable=False)
+    freq_var = Column(REAL, nullable=False, default=0.0)
+    observations = Column(Integer, nullable=False, default=1)
+    last_seen_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    # 마지막으로 감지된 이벤트 (new, rank_spike, freq_spike)
+    last_event = Column(String(20))
+    last_event_z = Column(REAL)
+    last_event_rank = Column(Integer)
+    last_event_freq = Column(Integer)
+    last_event_at = Column(DateTime(timezone=True))
+    
+    __table_args__ = (
+        UniqueConstraint('country', 'keyword', name='uq_keyword_stats_country_keyword'),
+        Index('ix_keyword_stats_country_event', 'country', 'last_event_at'),
+    )
@@ -0,0 +1,26 @@
+from sqlalchemy import Column, String, Integer, DateTime, Float
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.sql import func
+from ...core.base import Base
+
+class LLMCacheEntry(Base):
+    """LLM 분석 결과 캐시 테이블 (콘텐츠 해시 기반)"""
+    __tablename__ = "llm_cache"
+    
+    # sha256(provider, model, prompt_version, 정규화된 제목 집합, country)
+    cache_key = Column(String(64), primary_key=True)
+    provider = Column(String(30), nullable=False)
+    model = Column(String(100), nullable=False)
+    prompt_version = Column(String(20), nullable=False)
+    country = Column(String(10))
+    
+    # 결과 및 비용 메타
+    result = Column(JSONB, nullable=False)
+    tokens = Column(Integer, default=0)
+    latency_ms = Column(Float, default=0.0)
+    hit_count = Column(Integer, default=0)
+    
+    # TTL / LRU 관리
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    last_hit_at = Column(DateTime(timezone=True), server_default=func.now(), index=True)
+    expires_at = Column(DateTime(timezone=True), nullable=False, index=True)
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, Integer, DateTime, Text, ForeignKey
+from sqlalchemy import Computed, Column, String, Integer, DateTime, Float, Index, Text, ForeignKey
+from sqlalchemy.dialects.postgresql import ARRAY, TSVECTOR
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from ...core.database import Base
+from ...core.base import Base
+from .search import TITLE_TSV_EXPR
 
 class NewsContent(Base):
     """뉴스 콘텐츠 테이블"""
@@ -17,9 +19,32 @@ class NewsContent(Base):
     published_at = Column(String(50))
     url = Column(Text, unique=True)
     
+    # 핫이슈 점수 (HotIssueScorer)
+    score = Column(Float, default=0.0)
+    
+    # 유사 중복으로 병합된 다른 매체 기사 수 (NearDuplicateDetector)
+    duplicate_count = Column(Integer, default=0, server_default="0")
+    
+    # 헤드라인에 등장한 트렌드 키워드 (KeywordMatcher)
+    matched_keywords = Column(ARRAY(String(200)))
+    keyword_match_count = Column(Integer, default=0, server_default="0")
+    
     # 수집 메타
     collected_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())  # 재수집/점수/중복 수 변경 시각 (싱크 diff 워터마크)
     keyword_country = Column(String(10))
     
+    # 전문 검색용 생성 컬럼 (검색 API)
+    title_tsv = Column(TSVECTOR, Computed(TITLE_TSV_EXPR, persisted=True))
+    
     # 관계
     keyword_ref = relationship("Keyword", back_populates="news_contents")
+    
+    # 점수순 조회 / 국가별 점수 재계산 / 제목 검색(FTS + Trigram)용 인덱스
+    __table_args__ = (
+        Index('ix_news_contents_keyword_score', 'keyword_id', 'score'),
+        Index('ix_news_contents_country_collected', 'keyword_country', 'collected_at'),
+        Index('ix_news_contents_updated', 'updated_at', 'id'),
+        Index('ix_news_contents_title_tsv', 'title_tsv', postgresql_using='gin'),
+        Index('ix_news_contents_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
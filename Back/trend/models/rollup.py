@@ -0,0 +1,45 @@
+from sqlalchemy import Column, String, Integer, BigInteger, Date, DateTime, Float, Index, UniqueConstraint
+from ...core.base import Base
+
+class DailyRollup(Base):
+    """국가 x 일자(UTC) x 소스별 수집 요약 (대시보드 차트용)"""
+    __tablename__ = "daily_rollups"
+    
+    id = Column(Integer, primary_key=True)
+    country = Column(String(10), nullable=False)
+    day = Column(Date, nullable=False)
+    source = Column(String(20), nullable=False)  # youtube, news
+    
+    content_count = Column(Integer, default=0)
+    total_views = Column(BigInteger, default=0)
+    total_likes = Column(BigInteger, default=0)
+    duplicate_count = Column(Integer, default=0)  # 병합된 유사 중복 뉴스 수
+    avg_score = Column(Float)
+    
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('country', 'day', 'source', name='uq_daily_rollups_country_day_source'),
+    )
+
+
+class DailyTopRollup(Base):
+    """국가 x 일자 x 소스별 상위 채널/언론사/트렌드 키워드 (일자당 상위 N개만 보관)"""
+    __tablename__ = "daily_top_rollups"
+    
+    id = Column(Integer, primary_key=True)
+    country = Column(String(10), nullable=False)
+    day = Column(Date, nullable=False)
+    source = Column(String(20), nullable=False)
+    dimension = Column(String(20), nullable=False)  # channel, source, keyword
+    value = Column(String(200), nullable=False)
+    
+    content_count = Column(Integer, default=0)
+    total_views = Column(BigInteger, default=0)
+    
+    updated_at = Column(DateTime(timezone=True), nullable=False)
+    
+    __table_args__ = (
+        UniqueConstraint('country', 'day', 'source', 'dimension', 'value', name='uq_daily_top_rollups_key'),
+        Index('ix_daily_top_rollups_lookup', 'country', 'dimension', 'day'),
+    )
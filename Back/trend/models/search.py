@@ -0,0 +1,9 @@
+"""
+제목 검색용 공통 정의 (tsvector 생성 컬럼 표현식)
+- US: english 형태소(어간) 분석, 그 외(KR/JP/TW/ID): simple (CJK는 pg_trgm 인덱스로 보완)
+"""
+TITLE_TSV_EXPR = (
+    "to_tsvector("
+    "CASE WHEN keyword_country = 'US' THEN 'english'::regconfig ELSE 'simple'::regconfig END, "
+    "coalesce(title, ''))"
+)
@@ -0,0 +1,36 @@
+from sqlalchemy import Column, String, Integer, DateTime, Text, LargeBinary, BigInteger, Index, UniqueConstraint
+from sqlalchemy.dialects.postgresql import ARRAY
+from sqlalchemy.sql import func
+from ...core.base import Base
+
+class ContentSignature(Base):
+    """유사 중복 탐지용 MinHash 시그니처 테이블"""
+    __tablename__ = "content_signatures"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    country = Column(String(10), nullable=False)
+    kind = Column(String(20), nullable=False)  # news, keyword 등
+    content_key = Column(Text, nullable=False)  # 대표 항목 식별자 (뉴스 URL 등)
+    
+    # MinHash 시그니처 (uint32 x 128) / LSH 밴드 버킷 키
+    signature = Column(LargeBinary, nullable=False)
+    bands = Column(ARRAY(BigInteger), nullable=False)
+    
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint('kind', 'content_key', name='uq_content_signatures_kind_key'),
+        Index('ix_content_signatures_bands', 'bands', postgresql_using='gin'),
+        Index('ix_content_signatures_scope', 'country', 'kind', 'created_at'),
+    )
+
+
+class ContentDuplicate(Base):
+    """대표 항목으로 병합된 유사 중복 항목 (병합 1회만 중복 수에 가산)"""
+    __tablename__ = "content_duplicates"
+    
+    kind = Column(String(20), primary_key=True)
+    content_key = Column(Text, primary_key=True)  # 병합된 항목 식별자 (뉴스 URL 등)
+    canonical_key = Column(Text, nullable=False)  # 대표 항목 content_key
+    country = Column(String(10), nullable=False)
+    created_at = Column(DateTime(timezone=True), server_default=func.now())
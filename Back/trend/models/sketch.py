@@ -0,0 +1,20 @@
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime, LargeBinary, UniqueConstraint
+from sqlalchemy.sql import func
+from ...core.base import Base
+
+class TermSketchBucket(Base):
+    """국가 x 일자 버킷 용어 스케치 (Count-Min + Space-Saving 직렬화 바이트)"""
+    __tablename__ = "term_sketches"
+    
+    id = Column(Integer, primary_key=True, index=True)
+    country = Column(String(10), nullable=False)
+    bucket_start = Column(DateTime(timezone=True), nullable=False)  # UTC 일자 시작
+    
+    data = Column(LargeBinary, nullable=False)
+    total = Column(BigInteger, default=0)  # 버킷에 반영된 용어 수 합계
+    
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())
+    
+    __table_args__ = (
+        UniqueConstraint('country', 'bucket_start', name='uq_term_sketches_country_bucket'),
+    )
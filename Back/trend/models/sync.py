@@ -0,0 +1,17 @@
+from sqlalchemy import Column, String, Integer, BigInteger, DateTime
+from ...core.base import Base
+
+class SyncState(Base):
+    """표 형식 싱크(Google Sheets 등) 동기화 워터마크 (싱크 x 소스별, 청크 기록 성공 시마다 전진)"""
+    __tablename__ = "sync_states"
+    
+    sink = Column(String(200), primary_key=True)  # 예: gsheets:<시트 ID>, file:<디렉터리>
+    source = Column(String(20), primary_key=True)  # keywords, youtube, news
+    
+    # 마지막으로 반영한 행 (수집 시각, id) - 다음 실행은 이보다 뒤의 행만 조회
+    watermark_at = Column(DateTime(timezone=True))
+    watermark_id = Column(Integer, default=0)
+    
+    rows_appended = Column(BigInteger, default=0)
+    rows_updated = Column(BigInteger, default=0)
+    updated_at = Column(DateTime(timezone=True), nullable=False)
@@ -1,7 +1,9 @@
-from sqlalchemy import Column, String, Integer, DateTime, ForeignKey
+from sqlalchemy import BigInteger, Computed, Column, String, Integer, DateTime, Float, Index, ForeignKey
+from sqlalchemy.dialects.postgresql import TSVECTOR
 from sqlalchemy.sql import func
 from sqlalchemy.orm import relationship
-from ...core.database import Base
+from ...core.base import Base
+from .search import TITLE_TSV_EXPR
 
 class YouTubeContent(Base):
     """유튜브 콘텐츠 테이블"""
@@ -14,14 +16,30 @@ class YouTubeContent(Base):
     video_id = Column(String(50), unique=True, nullable=False)
     title = Column(String(300))
     channel = Column(String(200))
-    views = Column(Integer, default=0)
-    likes = Column(Integer, default=0)
+    views = Column(BigInteger, default=0)  # 인기 영상 조회수는 INTEGER 범위(2^31-1) 초과
+    likes = Column(BigInteger, default=0)
     published_at = Column(String(50))
     url = Column(String(300))
     
+    # 핫이슈 점수 (HotIssueScorer)
+    score = Column(Float, default=0.0)
+    
     # 수집 메타
     collected_at = Column(DateTime(timezone=True), server_default=func.now())
+    updated_at = Column(DateTime(timezone=True), server_default=func.now())  # 재수집/점수/중복 수 변경 시각 (싱크 diff 워터마크)
     keyword_country = Column(String(10))
     
+    # 전문 검색용 생성 컬럼 (검색 API)
+    title_tsv = Column(TSVECTOR, Computed(TITLE_TSV_EXPR, persisted=True))
+    
     # 관계
     keyword_ref = relationship("Keyword", back_populates="youtube_contents")
+    
+    # 점수순 조회 / 국가별 점수 재계산 / 제목 검색(FTS + Trigram)용 인덱스
+    __table_args__ = (
+        Index('ix_youtube_contents_keyword_score', 'keyword_id', 'score'),
+        Index('ix_youtube_contents_country_collected', 'keyword_country', 'collected_at'),
+        Index('ix_youtube_contents_updated', 'updated_at', 'id'),
+        Index('ix_youtube_contents_title_tsv', 'title_tsv', postgresql_using='gin'),
+        Index('ix_youtube_contents_title_trgm', 'title', postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}),
+    )
@@ -0,0 +1,24 @@
+from ...core.database import fetch_one, execute
+from ...core.tracing import trace_methods
+
+@trace_methods("db.corpus")
+class CorpusRepository:
+    def __init__(self):
+        pass
+
+    async def get(self, country: str) -> dict | None:
+        return await fetch_one(
+            "SELECT day, n_docs, data FROM keyword_corpora WHERE country = :country",
+            {"country": country}
+        )
+
+    async def save(self, country: str, day: str, n_docs: float, data: bytes):
+        await execute(
+            """
+            INSERT INTO keyword_corpora (country, day, n_docs, data, updated_at)
+            VALUES (:country, :day, :n_docs, :data, NOW())
+            ON CONFLICT (country) DO UPDATE
+            SET day = EXCLUDED.day, n_docs = EXCLUDED.n_docs, data = EXCLUDED.data, updated_at = NOW()
+            """,
+            {"country": country, "day": day, "n_docs": n_docs, "data": data}
+        )
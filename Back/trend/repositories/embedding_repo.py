@@ -0,0 +1,99 @@
+from typing import List, Dict, Any, Optional
+from ...core.config import settings
+from ...core.database import fetch_one, fetch_all, execute
+from ...core.tracing import trace_methods
+
+@trace_methods("db.embedding")
+class EmbeddingRepository:
+    def __init__(self):
+        pass
+
+    async def find_by_hashes(self, model: str, text_hashes: List[str]) -> Dict[str, str]:
+        """텍스트 해시로 기존 임베딩 조회 (재계산 방지) -> {text_hash: '[...]'}"""
+        if not text_hashes:
+            return {}
+        rows = await fetch_all(
+            """
+            SELECT DISTINCT ON (text_hash) text_hash, embedding::text AS embedding
+            FROM content_embeddings
+            WHERE model = :model AND text_hash = ANY(CAST(:hashes AS VARCHAR[]))
+            """,
+            {"model": model, "hashes": text_hashes}
+        )
+        return {row["text_hash"]: row["embedding"] for row in rows}
+
+    async def save_embeddings(self, rows: List[Dict[str, Any]]):
+        """임베딩 일괄 저장 (executemany, 같은 키는 갱신)"""
+        if not rows:
+            return
+        await execute(
+            """
+            INSERT INTO content_embeddings (country, kind, content_key, title, text_hash, model, embedding, created_at)
+            VALUES (:country, :kind, :content_key, :title, :text_hash, :model, CAST(:embedding AS vector), NOW())
+            ON CONFLICT (kind, country, content_key) DO UPDATE
+            SET title = EXCLUDED.title, text_hash = EXCLUDED.text_hash, model = EXCLUDED.model,
+                embedding = EXCLUDED.embedding, created_at = NOW()
+            WHERE content_embeddings.text_hash IS DISTINCT FROM EXCLUDED.text_hash
+               OR content_embeddings.model IS DISTINCT FROM EXCLUDED.model
+            """,
+            rows
+        )
+
+    async def get_embedding(self, content_key: str, kind: Optional[str] = None) -> dict | None:
+        """저장된 항목의 임베딩 조회"""
+        kind_filter = "AND kind = :kind" if kind else ""
+        return await fetch_one(
+            f"""
+            SELECT kind, country, content_key, title, model, embedding::text AS embedding
+            FROM content_embeddings
+            WHERE content_key = :content_key {kind_filter}
+            ORDER BY created_at DESC
+            LIMIT 1
+            """,
+            {"content_key": content_key, "kind": kind}
+        )
+
+    async def nearest(
+        self,
+        embedding: str,
+        model: str,
+        kinds: List[str],
+        country: Optional[str] = None,
+        exclude_key: Optional[str] = None,
+        limit: int = 10
+    ) -> List[dict]:
+        """
+        HNSW 인덱스 기반 근사 최근접 이웃 (코사인 거리)
+        - 필터는 인덱스 탐색 후 적용되므로 ef_search 후보 중 조건에 맞는 행만 남음
+          -> 조회 트랜잭션에서만 ef_search를 올리고, iterative scan으로 limit을 채울 때까지 이어서 탐색
+        - relaxed_order는 거리 순서가 약간 어긋날 수 있어 바깥에서 다시 정렬
+        """
+        filters = ["model = :model", "kind = ANY(CAST(:kinds AS VARCHAR[]))"]
+        params = {"embedding": embedding, "model": model, "kinds": kinds, "limit": limit}
+        if country:
+            filters.append("country = :country")
+            params["country"] = country
+        if exclude_key:
+            filters.append("content_key <> :exclude_key")
+            params["exclude_key"] = exclude_key
+
+        local_settings = {"hnsw.ef_search": max(settings.EMBEDDING_HNSW_EF_SEARCH, limit)}
+        if settings.EMBEDDING_HNSW_ITERATIVE_SCAN:
+            local_settings["hnsw.iterative_scan"] = "relaxed_order"
+
+        return await fetch_all(
+            f"""
+            WITH candidates AS MATERIALIZED (
+                SELECT kind, country, content_key, title, embedding <=> CAST(:embedding AS vector) AS distance
+                FROM content_embeddings
+                WHERE {" AND ".join(filters)}
+                ORDER BY embedding <=> CAST(:embedding AS vector)
+                LIMIT :limit
+            )
+            SELECT kind, country, content_key, title, 1 - distance AS similarity
+            FROM candidates
+            ORDER BY distance
+            """,
+            params,
+            local_settings=local_settings
+        )
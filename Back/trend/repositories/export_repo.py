@@ -0,0 +1,156 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional, Sequence, Tuple
+from ...core.database import fetch_all, stream_batches
+from ...core.tracing import trace_methods
+
+# 소스별 내보내기 컬럼 (이름, SQL 식, 값 종류: int / float / text / timestamp / text[])
+# - 콘텐츠 컬럼 이름은 bulk_ingest 입력 컬럼과 같음 -> JSONL/CSV 내보내기를 그대로 다시 적재 가능
+_SOURCES = {
+    "keywords": {
+        "from": "keywords k",
+        "time": "k.keyword_collected_at",
+        "changed": "k.updated_at",
+        "country": "k.country",
+        "id": "k.id",
+        "columns": [
+            ("id", "k.id", "int"),
+            ("keyword", "k.keyword", "text"),
+            ("country", "k.country", "text"),
+            ("trend_volume", "k.trend_volume", "int"),
+            ("rank", "k.rank", "int"),
+            ("keyword_collected_at", "k.keyword_collected_at", "timestamp"),
+            ("youtube_videos", "k.youtube_videos", "int"),
+            ("news_count", "k.news_count", "int"),
+            ("instagram_posts", "k.instagram_posts", "int"),
+            ("score", "k.score", "float"),
+        ],
+    },
+    "youtube": {
+        "from": "youtube_contents c LEFT JOIN keywords k ON k.id = c.keyword_id",
+        "time": "c.collected_at",
+        "changed": "c.updated_at",
+        "country": "c.keyword_country",
+        "id": "c.id",
+        "columns": [
+            ("id", "c.id", "int"),
+            ("keyword", "k.keyword", "text"),
+            ("keyword_country", "c.keyword_country", "text"),
+            ("keyword_collected_at", "k.keyword_collected_at", "timestamp"),
+            ("video_id", "c.video_id", "text"),
+            ("title", "c.title", "text"),
+            ("channel", "c.channel", "text"),
+            ("views", "c.views", "int"),
+            ("likes", "c.likes", "int"),
+            ("published_at", "c.published_at", "text"),
+            ("url", "c.url", "text"),
+            ("score", "c.score", "float"),
+            ("collected_at", "c.collected_at", "timestamp"),
+        ],
+    },
+    "news": {
+        "from": "news_contents c LEFT JOIN keywords k ON k.id = c.keyword_id",
+        "time": "c.collected_at",
+        "changed": "c.updated_at",
+        "country": "c.keyword_country",
+        "id": "c.id",
+        "columns": [
+            ("id", "c.id", "int"),
+            ("keyword", "k.keyword", "text"),
+            ("keyword_country", "c.keyword_country", "text"),
+            ("keyword_collected_at", "k.keyword_collected_at", "timestamp"),
+            ("title", "c.title", "text"),
+            ("source", "c.source", "text"),
+            ("description", "c.description", "text"),
+            ("published_at", "c.published_at", "text"),
+            ("url", "c.url", "text"),
+            ("score", "c.score", "float"),
+            ("duplicate_count", "c.duplicate_count", "int"),
+            ("matched_keywords", "c.matched_keywords", "text[]"),
+            ("keyword_match_count", "c.keyword_match_count", "int"),
+            ("collected_at", "c.collected_at", "timestamp"),
+        ],
+    },
+}
+
+EXPORT_SOURCES = tuple(_SOURCES)
+
+
+def export_columns(source: str) -> List[Tuple[str, str]]:
+    """(컬럼 이름, 값 종류) 목록"""
+    return [(name, kind) for name, _, kind in _SOURCES[source]["columns"]]
+
+
+@trace_methods("db.export")
+class ExportRepository:
+    def __init__(self):
+        pass
+
+    async def stream_rows(
+        self,
+        source: str,
+        countries: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        batch_size: int = 10000
+    ) -> AsyncIterator[Sequence[tuple]]:
+        """
+        수집 시각순 행 튜플 배치 (export_columns 순서, 서버 사이드 커서)
+        - 국가 필터는 (keyword_country, collected_at) 인덱스 사용
+        """
+        spec = _SOURCES[source]
+        filters = []
+        params = {}
+        if countries:
+            filters.append(f"{spec['country']} = ANY(CAST(:countries AS VARCHAR[]))")
+            params["countries"] = countries
+        if date_from:
+            filters.append(f"{spec['time']} >= :date_from")
+            params["date_from"] = date_from
+        if date_to:
+            filters.append(f"{spec['time']} < :date_to")
+            params["date_to"] = date_to
+        where = f"WHERE {' AND '.join(filters)}" if filters else ""
+        select = ", ".join(f"{expr} AS {name}" for name, expr, _ in spec["columns"])
+
+        async for _, rows in stream_batches(
+            f"SELECT {select} FROM {spec['from']} {where} ORDER BY {spec['time']}, {spec['id']}",
+            params,
+            batch_size=batch_size
+        ):
+            yield rows
+
+    async def fetch_changed(
+        self,
+        source: str,
+        after_at: Optional[datetime],
+        after_id: int,
+        until: datetime,
+        countries: Optional[List[str]] = None,
+        limit: int = 10000
+    ) -> List[Tuple[tuple, datetime]]:
+        """
+        (변경 시각 updated_at, id) 키셋 페이지: 워터마크 이후 ~ until 이전에 추가/재수집/집계·점수 갱신된 행
+        :return: [(export_columns 순서 행, 변경 시각), ...]
+        - until: 진행 중인 트랜잭션이 커밋 전 시각으로 끼어들어 누락되지 않도록 현재보다 약간 이전
+        """
+        spec = _SOURCES[source]
+        changed = spec["changed"]
+        filters = [f"{changed} < :until"]
+        params = {"until": until, "limit": limit}
+        if after_at is not None:
+            filters.append(f"({changed}, {spec['id']}) > (:after_at, :after_id)")
+            params.update(after_at=after_at, after_id=after_id)
+        if countries:
+            filters.append(f"{spec['country']} = ANY(CAST(:countries AS VARCHAR[]))")
+            params["countries"] = countries
+        select = ", ".join(f"{expr} AS {name}" for name, expr, _ in spec["columns"])
+        rows = await fetch_all(
+            f"""
+            SELECT {select}, {changed} AS _changed_at FROM {spec['from']}
+            WHERE {' AND '.join(filters)}
+            ORDER BY {changed}, {spec['id']}
+            LIMIT :limit
+            """,
+            params
+        )
+        return [(tuple(values[:-1]), values[-1]) for values in (tuple(row.values()) for row in rows)]
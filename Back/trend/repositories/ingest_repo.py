@@ -0,0 +1,197 @@
+from typing import Dict, List, Optional, Sequence
+from ...core import metrics
+from ...core.database import fetch_one, execute, raw_connection
+from ...core.tracing import trace_methods
+
+# 종류별 스테이징 테이블 / COPY 컬럼 순서 (bulk_ingest의 레코드 튜플 순서와 동일)
+STAGES = {
+    "keywords": ("ingest_stage_keywords", ("keyword", "country", "trend_volume", "rank", "keyword_collected_at")),
+    "youtube": ("ingest_stage_youtube", (
+        "keyword", "country", "keyword_collected_at", "video_id", "title", "channel",
+        "views", "likes", "published_at", "url", "collected_at",
+    )),
+    "news": ("ingest_stage_news", (
+        "keyword", "country", "keyword_collected_at", "title", "source", "description",
+        "published_at", "url", "collected_at",
+    )),
+}
+
+# 동시에 여러 파일을 적재해도 같은 키워드가 두 번 생기지 않도록 키워드 병합 구간 직렬화 (트랜잭션 종료 시 해제)
+_KEYWORD_LOCK = "SELECT pg_advisory_xact_lock(hashtext('bulk_ingest:keywords'))"
+
+_KEY_MATCH = "k.keyword = s.keyword AND k.country = s.country AND k.keyword_collected_at = s.keyword_collected_at"
+
+_UPDATE_KEYWORDS = f"""
+UPDATE keywords k SET trend_volume = s.trend_volume, rank = s.rank, updated_at = NOW()
+FROM (
+    SELECT DISTINCT ON (keyword, country, keyword_collected_at) keyword, country, keyword_collected_at,
+           COALESCE(trend_volume, 0) AS trend_volume, COALESCE(rank, 0) AS rank
+    FROM ingest_stage_keywords
+    ORDER BY keyword, country, keyword_collected_at, rank
+) s
+WHERE {_KEY_MATCH}
+"""
+
+# 스테이징에만 있는 (keyword, country, keyword_collected_at) -> keywords 신규 행
+_INSERT_MISSING_KEYWORDS = """
+INSERT INTO keywords
+    (keyword, country, trend_volume, rank, keyword_collected_at, instagram_posts, youtube_videos, news_count, score)
+SELECT DISTINCT ON (s.keyword, s.country, s.keyword_collected_at)
+       s.keyword, s.country, {volume}, {rank}, s.keyword_collected_at, 0, 0, 0, 0
+FROM {stage} s
+WHERE NOT EXISTS (SELECT 1 FROM keywords k WHERE {match})
+ORDER BY s.keyword, s.country, s.keyword_collected_at{order}
+"""
+
+# 배치 내 중복은 최신 수집분 1건만, 기존 행은 더 최신 수집분일 때만 갱신 (과거 덤프가 최신 값을 덮지 않음)
+# 결과: (keyword_id, n) = 키워드별 upsert 행 수 + 다른 키워드로 옮겨진 행의 이전 keyword_id (n = 0)
+#   -> 옮겨 간 키워드와 빠져나온 키워드 모두 콘텐츠 수 재계산 대상
+#   (CTE는 같은 스냅샷을 보므로 src의 old_keyword_id는 upsert 이전 값)
+_UPSERT_YOUTUBE = f"""
+WITH src AS (
+    SELECT DISTINCT ON (s.video_id) s.*, k.id AS keyword_id, e.keyword_id AS old_keyword_id
+    FROM ingest_stage_youtube s
+    JOIN keywords k ON {_KEY_MATCH}
+    LEFT JOIN youtube_contents e ON e.video_id = s.video_id
+    ORDER BY s.video_id, s.collected_at DESC, k.id DESC
+), upserted AS (
+    INSERT INTO youtube_contents
+        (keyword_id, keyword_country, video_id, title, channel, views, likes, published_at, url, collected_at)
+    SELECT keyword_id, country, video_id, title, channel, COALESCE(views, 0), COALESCE(likes, 0), published_at, url, collected_at
+    FROM src
+    ON CONFLICT (video_id) DO UPDATE
+    SET keyword_id = EXCLUDED.keyword_id, keyword_country = EXCLUDED.keyword_country,
+        views = EXCLUDED.views, likes = EXCLUDED.likes, collected_at = EXCLUDED.collected_at, updated_at = NOW()
+    WHERE youtube_contents.collected_at IS NULL OR youtube_contents.collected_at <= EXCLUDED.collected_at
+    RETURNING video_id, keyword_id
+)
+SELECT keyword_id, COUNT(*) AS n FROM upserted GROUP BY keyword_id
+UNION ALL
+SELECT DISTINCT src.old_keyword_id, 0 FROM src JOIN upserted u ON u.video_id = src.video_id
+WHERE src.old_keyword_id IS DISTINCT FROM u.keyword_id AND src.old_keyword_id IS NOT NULL
+"""
+
+_UPSERT_NEWS = f"""
+WITH src AS (
+    SELECT DISTINCT ON (s.url) s.*, k.id AS keyword_id, e.keyword_id AS old_keyword_id
+    FROM ingest_stage_news s
+    JOIN keywords k ON {_KEY_MATCH}
+    LEFT JOIN news_contents e ON e.url = s.url
+    ORDER BY s.url, s.collected_at DESC, k.id DESC
+), upserted AS (
+    INSERT INTO news_contents
+        (keyword_id, keyword_country, title, source, description, published_at, url, collected_at)
+    SELECT keyword_id, country, title, source, description, published_at, url, collected_at
+    FROM src
+    ON CONFLICT (url) DO UPDATE
+    SET keyword_id = EXCLUDED.keyword_id, keyword_country = EXCLUDED.keyword_country, collected_at = EXCLUDED.collected_at,
+        updated_at = NOW()
+    WHERE news_contents.collected_at IS NULL OR news_contents.collected_at <= EXCLUDED.collected_at
+    RETURNING url, keyword_id
+)
+SELECT keyword_id, COUNT(*) AS n FROM upserted GROUP BY keyword_id
+UNION ALL
+SELECT DISTINCT src.old_keyword_id, 0 FROM src JOIN upserted u ON u.url = src.url
+WHERE src.old_keyword_id IS DISTINCT FROM u.keyword_id AND src.old_keyword_id IS NOT NULL
+"""
+
+# 이번 배치가 건드린 키워드의 콘텐츠 수 재계산 (KeywordRepository.update_keyword_stats와 같은 의미)
+# - 콘텐츠가 모두 빠져나간 키워드도 0으로 갱신되도록 대상 id 기준 LEFT JOIN
+_RECOUNT = """
+UPDATE keywords k SET {column} = COALESCE(c.n, 0), updated_at = NOW()
+FROM unnest($1::int[]) AS t(id)
+LEFT JOIN (SELECT keyword_id, COUNT(*) AS n FROM {table} WHERE keyword_id = ANY($1::int[]) GROUP BY keyword_id) c
+    ON c.keyword_id = t.id
+WHERE k.id = t.id AND k.{column} IS DISTINCT FROM COALESCE(c.n, 0)
+"""
+
+_CONTENTS = {
+    "youtube": (_UPSERT_YOUTUBE, "youtube_contents", "youtube_videos"),
+    "news": (_UPSERT_NEWS, "news_contents", "news_count"),
+}
+
+_SAVE_CHECKPOINT = """
+INSERT INTO ingest_checkpoints (source_key, kind, rows_done, merged_rows, finished, updated_at)
+VALUES ($1, $2, $3, $4, false, NOW())
+ON CONFLICT (source_key) DO UPDATE
+SET rows_done = EXCLUDED.rows_done, merged_rows = ingest_checkpoints.merged_rows + EXCLUDED.merged_rows,
+    finished = false, updated_at = NOW()
+"""
+
+
+def _status_count(status: str) -> int:
+    """asyncpg 명령 상태 문자열 ('INSERT 0 120', 'UPDATE 7') -> 행 수"""
+    try:
+        return int(status.rsplit(" ", 1)[-1])
+    except (AttributeError, ValueError):
+        return 0
+
+
+@trace_methods("db.ingest")
+class IngestRepository:
+    def __init__(self):
+        pass
+
+    async def get_checkpoint(self, source_key: str) -> Optional[dict]:
+        return await fetch_one(
+            "SELECT source_key, kind, rows_done, merged_rows, finished FROM ingest_checkpoints WHERE source_key = :source_key",
+            {"source_key": source_key}
+        )
+
+    async def reset_checkpoint(self, source_key: str):
+        await execute("DELETE FROM ingest_checkpoints WHERE source_key = :source_key", {"source_key": source_key})
+
+    async def finish_checkpoint(self, source_key: str, kind: str, rows_done: int):
+        await execute(
+            """
+            INSERT INTO ingest_checkpoints (source_key, kind, rows_done, merged_rows, finished, updated_at)
+            VALUES (:source_key, :kind, :rows_done, 0, true, NOW())
+            ON CONFLICT (source_key) DO UPDATE
+            SET rows_done = EXCLUDED.rows_done, finished = true, updated_at = NOW()
+            """,
+            {"source_key": source_key, "kind": kind, "rows_done": rows_done}
+        )
+
+    async def merge_batch(self, kind: str, records: Sequence[tuple], source_key: str, rows_done: int) -> Dict[str, int]:
+        """
+        배치 1개 적재 (단일 트랜잭션)
+        1. 스테이징 TRUNCATE -> binary COPY
+        2. 키워드 병합 (키워드 파일: 값 갱신 + 신규 / 콘텐츠 파일: 없는 키워드만 생성)
+        3. 콘텐츠 upsert + 키워드별 콘텐츠 수 재계산
+        4. 체크포인트 갱신 -> 실패 시 배치 전체가 롤백되어 재실행해도 같은 위치부터 다시 적재
+        """
+        stage, columns = STAGES[kind]
+        counts = {"keywords_updated": 0, "keywords_inserted": 0, "contents": 0}
+
+        async with raw_connection() as conn:
+            async with conn.transaction():
+                await conn.execute(f"TRUNCATE {stage}")
+                await conn.copy_records_to_table(stage, records=records, columns=columns)
+                await conn.execute(_KEYWORD_LOCK)
+
+                if kind == "keywords":
+                    counts["keywords_updated"] = _status_count(await conn.execute(_UPDATE_KEYWORDS))
+                    missing = _INSERT_MISSING_KEYWORDS.format(
+                        stage=stage, match=_KEY_MATCH,
+                        volume="COALESCE(s.trend_volume, 0)", rank="COALESCE(s.rank, 0)", order=", s.rank"
+                    )
+                else:
+                    missing = _INSERT_MISSING_KEYWORDS.format(stage=stage, match=_KEY_MATCH, volume="0", rank="0", order="")
+                counts["keywords_inserted"] = _status_count(await conn.execute(missing))
+
+                if kind in _CONTENTS:
+                    upsert, table, column = _CONTENTS[kind]
+                    rows = await conn.fetch(upsert)
+                    counts["contents"] = sum(row["n"] for row in rows)
+                    touched: List[int] = sorted({row["keyword_id"] for row in rows})
+                    if touched:
+                        await conn.execute(_RECOUNT.format(column=column, table=table), touched)
+
+                merged = counts["keywords_updated"] + counts["keywords_inserted"] + counts["contents"]
+                await conn.execute(_SAVE_CHECKPOINT, source_key, kind, rows_done, merged)
+
+        metrics.db_rows_written.inc("keywords", "update", amount=counts["keywords_updated"])
+        metrics.db_rows_written.inc("keywords", "insert", amount=counts["keywords_inserted"])
+        if kind in _CONTENTS:
+            metrics.db_rows_written.inc(_CONTENTS[kind][1], "upsert", amount=counts["contents"])
+        return counts
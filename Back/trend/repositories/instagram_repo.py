@@ -0,0 +1,60 @@
+from typing import List
+from ...core.database import execute_return
+from ...core.tracing import trace_methods
+from ..records import InstagramPost, columns, unique_by
+
+@trace_methods("db.instagram")
+class InstagramRepository:
+    def __init__(self):
+        pass
+
+    async def save_posts(self, keyword_id: int, country: str, posts: List[InstagramPost]) -> int:
+        """
+        인스타그램 게시물 일괄 저장 (post_id 기준 Upsert, 왕복 1회)
+        - 같은 문장(=같은 트랜잭션)에서 keywords.instagram_posts 갱신
+        - 문장 내에서는 방금 upsert한 행이 보이지 않으므로: 이번 배치 외 기존 행 수 + upsert 행 수
+        """
+        posts = unique_by(posts, "post_id")
+        if not posts:
+            return 0
+        post_ids, usernames, captions, likes, comments, timestamps, urls = columns(
+            posts, "post_id", "username", "caption", "likes", "comments", "timestamp", "url"
+        )
+
+        row = await execute_return(
+            """
+            WITH upserted AS (
+                INSERT INTO instagram_contents
+                    (keyword_id, keyword_country, post_id, username, caption, likes, comments, "timestamp", url, collected_at)
+                SELECT :keyword_id, :country, p.post_id, p.username, p.caption, p.likes, p.comments, p.ts, p.url, NOW()
+                FROM unnest(
+                    CAST(:post_ids AS VARCHAR[]), CAST(:usernames AS VARCHAR[]), CAST(:captions AS TEXT[]),
+                    CAST(:likes AS INTEGER[]), CAST(:comments AS INTEGER[]), CAST(:timestamps AS VARCHAR[]),
+                    CAST(:urls AS VARCHAR[])
+                ) AS p(post_id, username, caption, likes, comments, ts, url)
+                ON CONFLICT (post_id) DO UPDATE
+                SET keyword_id = EXCLUDED.keyword_id, keyword_country = EXCLUDED.keyword_country,
+                    likes = EXCLUDED.likes, comments = EXCLUDED.comments, collected_at = NOW()
+                RETURNING 1
+            )
+            UPDATE keywords
+            SET instagram_posts = (SELECT COUNT(*) FROM upserted) + (
+                SELECT COUNT(*) FROM instagram_contents
+                WHERE keyword_id = :keyword_id AND post_id <> ALL(CAST(:post_ids AS VARCHAR[]))
+            ), updated_at = NOW()
+            WHERE id = :keyword_id
+            RETURNING (SELECT COUNT(*) FROM upserted) AS saved
+            """,
+            {
+                "keyword_id": keyword_id,
+                "country": country,
+                "post_ids": post_ids,
+                "usernames": usernames,
+                "captions": captions,
+                "likes": likes,
+                "comments": comments,
+                "timestamps": timestamps,
+                "urls": urls,
+            }
+        )
+        return row["saved"] if row else 0
@@ -1,6 +1,9 @@
 from datetime import datetime
-from ...core.database import fetch_one, execute_return, execute
+from typing import List
+from ...core.database import fetch_one, fetch_all, execute_return, execute
+from ...core.tracing import trace_methods
 
+@trace_methods("db.keyword")
 class KeywordRepository:
     def __init__(self):
         pass # Raw SQL 방식은 db 세션을 멤버로 가질 필요 없음 (Pool 사용)
@@ -34,7 +37,7 @@ class KeywordRepository:
         return keyword_obj
 
     async def update_statistics(self, keyword_id: int):
-        """Youtube/News 카운트 집계 및 점수 갱신"""
+        """Youtube/News 카운트 집계 (점수는 HotIssueScorer가 갱신)"""
         # 유튜브 카운트
         res_yt = await fetch_one(
             "SELECT COUNT(*) as count FROM youtube_contents WHERE keyword_id = :keyword_id",
@@ -49,19 +52,37 @@ class KeywordRepository:
         )
         news_count = res_news['count'] if res_news else 0
         
-        score = (youtube_count * 1.5) + (news_count * 1)
-        
         # 업데이트
         await execute(
             """
             UPDATE keywords 
-            SET youtube_videos = :yt_count, news_count = :news_count, score = :score
+            SET youtube_videos = :yt_count, news_count = :news_count, updated_at = NOW()
             WHERE id = :keyword_id
             """,
             {
                 "yt_count": youtube_count,
                 "news_count": news_count,
-                "score": score,
                 "keyword_id": keyword_id
             }
         )
+
+    async def get_for_scoring(self, country: str, since: datetime) -> List[dict]:
+        """점수 계산용 국가별 키워드 행 조회"""
+        return await fetch_all(
+            """
+            SELECT id, keyword, keyword_collected_at FROM keywords
+            WHERE country = :country AND keyword_collected_at >= :since
+            """,
+            {"country": country, "since": since}
+        )
+
+    async def update_scores(self, ids: List[int], scores: List[float]):
+        """키워드 점수 일괄 갱신"""
+        await execute(
+            """
+            UPDATE keywords AS k SET score = s.score, updated_at = NOW()
+            FROM unnest(CAST(:ids AS INTEGER[]), CAST(:scores AS DOUBLE PRECISION[])) AS s(id, score)
+            WHERE k.id = s.id AND k.score IS DISTINCT FROM s.score
+            """,
+            {"ids": ids, "scores": scores}
+        )
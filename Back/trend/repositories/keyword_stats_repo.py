@@ -0,0 +1,64 @@
+from datetime import datetime
+from typing import List, Dict, Any
+from ...core.database import fetch_all, execute
+from ...core.tracing import trace_methods
+
+@trace_methods("db.keyword_stats")
+class KeywordStatsRepository:
+    def __init__(self):
+        pass
+
+    async def get_states(self, country: str, keywords: List[str]) -> Dict[str, dict]:
+        """키워드별 EWMA 상태 조회 -> {keyword: row}"""
+        if not keywords:
+            return {}
+        rows = await fetch_all(
+            """
+            SELECT keyword, rank_mean, rank_var, freq_mean, freq_var, observations
+            FROM keyword_stats
+            WHERE country = :country AND keyword = ANY(CAST(:keywords AS VARCHAR[]))
+            """,
+            {"country": country, "keywords": keywords}
+        )
+        return {row["keyword"]: row for row in rows}
+
+    async def save_states(self, rows: List[Dict[str, Any]]):
+        """EWMA 상태 일괄 Upsert (이벤트가 없는 행은 기존 이벤트 기록 유지)"""
+        if not rows:
+            return
+        await execute(
+            """
+            INSERT INTO keyword_stats (
+                country, keyword, rank_mean, rank_var, freq_mean, freq_var, observations, last_seen_at,
+                last_event, last_event_z, last_event_rank, last_event_freq, last_event_at
+            )
+            VALUES (
+                :country, :keyword, :rank_mean, :rank_var, :freq_mean, :freq_var, :observations, NOW(),
+                :event, :z, :rank, :freq, CASE WHEN CAST(:event AS VARCHAR) IS NULL THEN NULL ELSE NOW() END
+            )
+            ON CONFLICT (country, keyword) DO UPDATE
+            SET rank_mean = EXCLUDED.rank_mean, rank_var = EXCLUDED.rank_var,
+                freq_mean = EXCLUDED.freq_mean, freq_var = EXCLUDED.freq_var,
+                observations = EXCLUDED.observations, last_seen_at = NOW(),
+                last_event = COALESCE(EXCLUDED.last_event, keyword_stats.last_event),
+                last_event_z = COALESCE(EXCLUDED.last_event_z, keyword_stats.last_event_z),
+                last_event_rank = COALESCE(EXCLUDED.last_event_rank, keyword_stats.last_event_rank),
+                last_event_freq = COALESCE(EXCLUDED.last_event_freq, keyword_stats.last_event_freq),
+                last_event_at = COALESCE(EXCLUDED.last_event_at, keyword_stats.last_event_at)
+            """,
+            rows
+        )
+
+    async def get_recent_events(self, country: str, since: datetime, limit: int = 50) -> List[dict]:
+        """최근 감지된 급상승/신규 키워드"""
+        return await fetch_all(
+            """
+            SELECT keyword, last_event AS event, last_event_z AS z, last_event_rank AS rank,
+                   last_event_freq AS frequency, observations, last_event_at AS detected_at
+            FROM keyword_stats
+            WHERE country = :country AND last_event_at >= :since
+            ORDER BY last_event_at DESC, last_event_z DESC NULLS LAST
+            LIMIT :limit
+            """,
+            {"country": country, "since": since, "limit": limit}
+        )
@@ -1,48 +1,119 @@
-from typing import List, Dict, Any
-from ...core.database import fetch_one, execute, fetch_all
+import json
+from datetime import datetime
+from typing import List, Dict
+from ...core.database import execute, execute_return, fetch_all
+from ...core.tracing import trace_methods
+from ..records import NewsRecord, columns, unique_by
 
+@trace_methods("db.news")
 class NewsRepository:
     def __init__(self):
         pass
 
-    async def save_articles(self, keyword_id: int, country: str, articles: List[Dict[str, Any]]):
-        """뉴스 기사 저장 (Upsert)"""
-        for article in articles:
-            url = article.get('url', '')
-            if not url:
-                continue
+    async def save_articles(self, keyword_id: int, country: str, articles: List[NewsRecord]) -> List[str]:
+        """
+        뉴스 기사 일괄 저장 (url 기준 Upsert, 왕복 1회)
+        - 기존 행: 소속 키워드/매칭 키워드/수집 시각만 갱신 (duplicate_count는 add_duplicates로만 가산)
+        :return: 신규 저장된 url 목록 (재수집 행 제외)
+        """
+        articles = unique_by(articles, "url")
+        if not articles:
+            return []
+        titles, sources, descriptions, published_ats, urls = columns(
+            articles, "title", "source", "description", "published_at", "url"
+        )
+        # 행마다 길이가 다른 배열은 unnest 배열 파라미터로 넘길 수 없어 JSON 배열 문자열로 전달
+        matched = [article.matched_keywords for article in articles]
 
-            # 중복 체크
-            existing = await fetch_one(
-                "SELECT id FROM news_contents WHERE url = :url",
-                {"url": url}
+        row = await execute_return(
+            """
+            WITH upserted AS (
+                INSERT INTO news_contents
+                    (keyword_id, keyword_country, title, source, description, published_at, url,
+                     matched_keywords, keyword_match_count, collected_at)
+                SELECT :keyword_id, :country, LEFT(a.title, 300), LEFT(a.source, 100), a.description, LEFT(a.published_at, 50),
+                       a.url,
+                       CAST(ARRAY(SELECT jsonb_array_elements_text(CAST(a.matched AS JSONB))) AS VARCHAR(200)[]),
+                       a.match_count, NOW()
+                FROM unnest(
+                    CAST(:titles AS TEXT[]), CAST(:sources AS TEXT[]), CAST(:descriptions AS TEXT[]),
+                    CAST(:published_ats AS TEXT[]), CAST(:urls AS TEXT[]),
+                    CAST(:matched AS TEXT[]), CAST(:match_counts AS INTEGER[])
+                ) AS a(title, source, description, published_at, url, matched, match_count)
+                ON CONFLICT (url) DO UPDATE
+                SET keyword_id = EXCLUDED.keyword_id, collected_at = NOW(), updated_at = NOW(),
+                    matched_keywords = EXCLUDED.matched_keywords, keyword_match_count = EXCLUDED.keyword_match_count
+                RETURNING url, (xmax = 0) AS inserted
             )
-            
-            if existing:
-                # 업데이트 (소속 키워드 갱신)
-                await execute(
-                    "UPDATE news_contents SET keyword_id = :keyword_id, collected_at = NOW() WHERE id = :id",
-                    {"keyword_id": keyword_id, "id": existing['id']}
-                )
-            else:
-                # 신규
-                await execute(
-                    """
-                    INSERT INTO news_contents 
-                    (keyword_id, keyword_country, title, source, description, published_at, url, collected_at)
-                    VALUES (:keyword_id, :country, :title, :source, :description, :published_at, :url, NOW())
-                    """,
-                    {
-                        "keyword_id": keyword_id,
-                        "country": country,
-                        "title": article.get('title'),
-                        "source": article.get('source'),
-                        "description": article.get('description', ''),
-                        "published_at": article.get('published_at'),
-                        "url": url
-                    }
-                )
+            SELECT COALESCE(array_agg(url) FILTER (WHERE inserted), '{}') AS inserted_urls FROM upserted
+            """,
+            {
+                "keyword_id": keyword_id,
+                "country": country,
+                "titles": titles,
+                "sources": sources,
+                "descriptions": descriptions,
+                "published_ats": published_ats,
+                "urls": urls,
+                "matched": [json.dumps(list(keywords), ensure_ascii=False) for keywords in matched],
+                "match_counts": [len(keywords) for keywords in matched],
+            }
+        )
+        return list(row["inserted_urls"]) if row else []
+
+    async def add_duplicates(self, country: str, duplicates: Dict[str, str]):
+        """
+        유사 중복 병합 기록 + 대표 기사(url)에 중복 수 가산 (왕복 1회)
+        - 병합된 url은 content_duplicates에 1회만 기록 -> 같은 기사를 다시 수집해도 가산되지 않음
+        """
+        if not duplicates:
+            return
+        await execute(
+            """
+            WITH absorbed AS (
+                INSERT INTO content_duplicates (country, kind, content_key, canonical_key, created_at)
+                SELECT :country, 'news', d.url, d.canonical, NOW()
+                FROM unnest(CAST(:urls AS TEXT[]), CAST(:canonicals AS TEXT[])) AS d(url, canonical)
+                ON CONFLICT (kind, content_key) DO NOTHING
+                RETURNING canonical_key
+            )
+            UPDATE news_contents AS n SET duplicate_count = COALESCE(n.duplicate_count, 0) + a.cnt, updated_at = NOW()
+            FROM (SELECT canonical_key, COUNT(*) AS cnt FROM absorbed GROUP BY canonical_key) AS a
+            WHERE n.url = a.canonical_key
+            """,
+            {"country": country, "urls": list(duplicates.keys()), "canonicals": list(duplicates.values())}
+        )
 
     async def get_by_keyword(self, keyword_id: int, limit: int = 50) -> List[dict]:
-        sql = "SELECT * FROM news_contents WHERE keyword_id = :keyword_id LIMIT :limit"
+        """키워드별 뉴스 조회 (핫이슈 점수 내림차순, 응답 필드만 조회)"""
+        sql = """
+            SELECT title, url, source, published_at, score,
+                   COALESCE(duplicate_count, 0) AS duplicate_count,
+                   COALESCE(matched_keywords, '{}') AS matched_keywords,
+                   'news' AS type
+            FROM news_contents WHERE keyword_id = :keyword_id
+            ORDER BY score DESC NULLS LAST, id DESC
+            LIMIT :limit
+        """
         return await fetch_all(sql, {"keyword_id": keyword_id, "limit": limit})
+
+    async def get_for_scoring(self, country: str, since: datetime) -> List[dict]:
+        """점수 계산용 최소 컬럼 조회"""
+        sql = """
+            SELECT id, keyword_id, source, published_at, collected_at,
+                   1 + COALESCE(duplicate_count, 0) + COALESCE(keyword_match_count, 0) AS mentions
+            FROM news_contents
+            WHERE keyword_country = :country AND collected_at >= :since
+        """
+        return await fetch_all(sql, {"country": country, "since": since})
+
+    async def update_scores(self, ids: List[int], scores: List[float]):
+        """점수 일괄 갱신 (단일 UPDATE ... FROM unnest)"""
+        await execute(
+            """
+            UPDATE news_contents AS n SET score = s.score, updated_at = NOW()
+            FROM unnest(CAST(:ids AS INTEGER[]), CAST(:scores AS DOUBLE PRECISION[])) AS s(id, score)
+            WHERE n.id = s.id AND n.score IS DISTINCT FROM s.score
+            """,
+            {"ids": ids, "scores": scores}
+        )
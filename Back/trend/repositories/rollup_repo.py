@@ -0,0 +1,141 @@
+from datetime import date, datetime
+from typing import List, Optional
+from ...core.database import fetch_all, execute
+from ...core.tracing import trace_methods
+
+# 소스별 원본 테이블 / 상위 집계 차원 (차원명, 값 컬럼 SQL)
+_SOURCES = {
+    "youtube": {
+        "table": "youtube_contents",
+        "views": "COALESCE(views, 0)",
+        "likes": "COALESCE(likes, 0)",
+        "duplicates": "0",
+        "dimensions": [("channel", "channel")],
+    },
+    "news": {
+        "table": "news_contents",
+        "views": "0",
+        "likes": "0",
+        "duplicates": "COALESCE(duplicate_count, 0)",
+        "dimensions": [("source", "source"), ("keyword", "unnest(matched_keywords)")],
+    },
+}
+
+
+@trace_methods("db.rollup")
+class RollupRepository:
+    def __init__(self):
+        pass
+
+    async def get_collected_days(self, country: str, video_ids: List[str], urls: List[str]) -> List[date]:
+        """저장 직전 기존 행들의 수집일 (재수집 시 collected_at이 오늘로 이동하므로 이전 일자도 재집계 필요)"""
+        if not video_ids and not urls:
+            return []
+        rows = await fetch_all(
+            """
+            SELECT DISTINCT (collected_at AT TIME ZONE 'UTC')::date AS day FROM youtube_contents
+            WHERE video_id = ANY(CAST(:video_ids AS VARCHAR[])) AND keyword_country = :country
+            UNION
+            SELECT DISTINCT (collected_at AT TIME ZONE 'UTC')::date AS day FROM news_contents
+            WHERE url = ANY(CAST(:urls AS TEXT[])) AND keyword_country = :country
+            """,
+            {"country": country, "video_ids": video_ids, "urls": urls}
+        )
+        return [row["day"] for row in rows if row["day"]]
+
+    async def get_days_with_contents(self, since: datetime, country: Optional[str] = None) -> List[dict]:
+        """백필 대상 (국가, 일자) 목록"""
+        country_filter = "AND keyword_country = :country" if country else ""
+        return await fetch_all(
+            f"""
+            SELECT keyword_country AS country, (collected_at AT TIME ZONE 'UTC')::date AS day
+            FROM youtube_contents WHERE collected_at >= :since AND keyword_country IS NOT NULL {country_filter}
+            UNION
+            SELECT keyword_country AS country, (collected_at AT TIME ZONE 'UTC')::date AS day
+            FROM news_contents WHERE collected_at >= :since AND keyword_country IS NOT NULL {country_filter}
+            ORDER BY day, country
+            """,
+            {"since": since, "country": country}
+        )
+
+    async def refresh_day(self, country: str, day: date, start: datetime, end: datetime, refreshed_at: datetime, top_n: int = 50):
+        """
+        (국가, 일자) 요약 재계산
+        - 해당 일자 범위만 인덱스(keyword_country, collected_at)로 조회하므로 실행 비용은 하루치 행 수에 비례
+        - 이번 갱신에 포함되지 않은 상위 항목(순위 밖으로 밀려난 값)은 삭제
+        """
+        params = {"country": country, "day": day, "start": start, "end": end, "refreshed_at": refreshed_at, "top_n": top_n}
+        where = "keyword_country = :country AND collected_at >= :start AND collected_at < :end"
+
+        for source, spec in _SOURCES.items():
+            await execute(
+                f"""
+                INSERT INTO daily_rollups
+                    (country, day, source, content_count, total_views, total_likes, duplicate_count, avg_score, updated_at)
+                SELECT :country, :day, '{source}', COUNT(*), COALESCE(SUM({spec['views']}), 0),
+                       COALESCE(SUM({spec['likes']}), 0), COALESCE(SUM({spec['duplicates']}), 0), AVG(score), :refreshed_at
+                FROM {spec['table']} WHERE {where}
+                ON CONFLICT (country, day, source) DO UPDATE
+                SET content_count = EXCLUDED.content_count, total_views = EXCLUDED.total_views,
+                    total_likes = EXCLUDED.total_likes, duplicate_count = EXCLUDED.duplicate_count,
+                    avg_score = EXCLUDED.avg_score, updated_at = EXCLUDED.updated_at
+                """,
+                params
+            )
+            for dimension, value_sql in spec["dimensions"]:
+                await execute(
+                    f"""
+                    INSERT INTO daily_top_rollups
+                        (country, day, source, dimension, value, content_count, total_views, updated_at)
+                    SELECT :country, :day, '{source}', '{dimension}', LEFT(value, 200), COUNT(*), SUM(views), :refreshed_at
+                    FROM (
+                        SELECT {value_sql} AS value, {spec['views']} AS views
+                        FROM {spec['table']} WHERE {where}
+                    ) t
+                    WHERE value IS NOT NULL AND value <> ''
+                    GROUP BY LEFT(value, 200)
+                    ORDER BY COUNT(*) DESC, SUM(views) DESC
+                    LIMIT :top_n
+                    ON CONFLICT (country, day, source, dimension, value) DO UPDATE
+                    SET content_count = EXCLUDED.content_count, total_views = EXCLUDED.total_views,
+                        updated_at = EXCLUDED.updated_at
+                    """,
+                    params
+                )
+
+        await execute(
+            """
+            DELETE FROM daily_top_rollups
+            WHERE country = :country AND day = :day AND updated_at < :refreshed_at
+            """,
+            params
+        )
+
+    async def get_daily(self, country: str, since: date, source: Optional[str] = None) -> List[dict]:
+        source_filter = "AND source = :source" if source else ""
+        return await fetch_all(
+            f"""
+            SELECT day, source, content_count, total_views, total_likes, duplicate_count,
+                   CASE WHEN content_count > 0 THEN total_views::float / content_count ELSE 0 END AS avg_views,
+                   avg_score
+            FROM daily_rollups
+            WHERE country = :country AND day >= :since {source_filter}
+            ORDER BY day, source
+            """,
+            {"country": country, "since": since, "source": source}
+        )
+
+    async def get_top(self, country: str, dimension: str, since: date, limit: int = 10) -> List[dict]:
+        """기간 내 일자별 상위 항목 합산 (일자당 상위 N개 기준 근사)"""
+        return await fetch_all(
+            """
+            SELECT value, SUM(content_count) AS content_count, SUM(total_views) AS total_views,
+                   COUNT(*) AS active_days
+            FROM daily_top_rollups
+            WHERE country = :country AND dimension = :dimension AND day >= :since
+            GROUP BY value
+            ORDER BY SUM(content_count) DESC, SUM(total_views) DESC
+            LIMIT :limit
+            """,
+            {"country": country, "dimension": dimension, "since": since, "limit": limit}
+        )
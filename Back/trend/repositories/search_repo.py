@@ -0,0 +1,82 @@
+from datetime import datetime
+from typing import List, Optional
+from ...core.config import settings
+from ...core.database import fetch_all
+from ...core.tracing import trace_methods
+
+# 소스별 검색 대상 (테이블, 출처 표시 컬럼)
+_SOURCES = {
+    "youtube": ("youtube_contents", "channel"),
+    "news": ("news_contents", "source"),
+}
+
+
+def _like_pattern(query: str) -> str:
+    """부분 일치 패턴 (입력의 LIKE 와일드카드/이스케이프 문자는 글자 그대로 매칭)"""
+    escaped = query.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+    return f"%{escaped}%"
+
+
+@trace_methods("db.search")
+class SearchRepository:
+    def __init__(self):
+        pass
+
+    async def search_titles(
+        self,
+        query: str,
+        countries: Optional[List[str]] = None,
+        date_from: Optional[datetime] = None,
+        date_to: Optional[datetime] = None,
+        source: str = "all",
+        limit: int = 20,
+        offset: int = 0
+    ) -> List[dict]:
+        """
+        제목 검색 (관련도순)
+        - tsvector(GIN) 전문 검색: english/simple 질의를 OR 결합
+        - pg_trgm(GIN) 부분 일치(CJK) + 유사 일치(오타): 검색어와 제목 내 구간의 word_similarity가
+          SEARCH_FUZZY_THRESHOLD 이상 (이 조회 트랜잭션에만 SET LOCAL)
+        - 관련도 = max(ts_rank, trigram word_similarity)
+        """
+        filters = ["(title_tsv @@ q.tsq OR title ILIKE :like OR :q <% title)"]
+        params = {
+            "q": query,
+            "like": _like_pattern(query),
+            "limit": limit,
+            "offset": offset,
+        }
+        if countries:
+            filters.append("keyword_country = ANY(CAST(:countries AS VARCHAR[]))")
+            params["countries"] = countries
+        if date_from:
+            filters.append("collected_at >= :date_from")
+            params["date_from"] = date_from
+        if date_to:
+            filters.append("collected_at < :date_to")
+            params["date_to"] = date_to
+        where = " AND ".join(filters)
+
+        targets = _SOURCES if source == "all" else {source: _SOURCES[source]}
+        selects = [
+            f"""
+            SELECT '{kind}' AS type, id, title, url, {origin} AS source, keyword_country AS country,
+                   published_at, collected_at, score,
+                   GREATEST(ts_rank(title_tsv, q.tsq), word_similarity(:q, title)) AS rank
+            FROM {table}, q
+            WHERE {where}
+            """
+            for kind, (table, origin) in targets.items()
+        ]
+
+        sql = f"""
+            WITH q AS (
+                SELECT websearch_to_tsquery('english', :q) || websearch_to_tsquery('simple', :q) AS tsq
+            )
+            {" UNION ALL ".join(selects)}
+            ORDER BY rank DESC, collected_at DESC
+            LIMIT :limit OFFSET :offset
+        """
+        return await fetch_all(
+            sql, params, local_settings={"pg_trgm.word_similarity_threshold": settings.SEARCH_FUZZY_THRESHOLD}
+        )
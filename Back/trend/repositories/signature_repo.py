@@ -0,0 +1,36 @@
+from typing import List, Dict, Any
+from ...core.database import fetch_all, execute
+from ...core.tracing import trace_methods
+
+@trace_methods("db.signature")
+class SignatureRepository:
+    def __init__(self):
+        pass
+
+    async def find_candidates(self, country: str, kind: str, band_keys: List[int], days: int = 7) -> List[dict]:
+        """밴드 키가 하나라도 겹치는 최근 시그니처 조회 (GIN 인덱스 && 연산)"""
+        if not band_keys:
+            return []
+        return await fetch_all(
+            """
+            SELECT content_key, signature FROM content_signatures
+            WHERE country = :country AND kind = :kind
+              AND created_at >= NOW() - make_interval(days => :days)
+              AND bands && CAST(:band_keys AS BIGINT[])
+            """,
+            {"country": country, "kind": kind, "days": days, "band_keys": band_keys}
+        )
+
+    async def save_signatures(self, rows: List[Dict[str, Any]]):
+        """시그니처 일괄 저장 (executemany, 같은 키는 갱신)"""
+        if not rows:
+            return
+        await execute(
+            """
+            INSERT INTO content_signatures (country, kind, content_key, signature, bands, created_at)
+            VALUES (:country, :kind, :content_key, :signature, CAST(:bands AS BIGINT[]), NOW())
+            ON CONFLICT (kind, content_key) DO UPDATE
+            SET signature = EXCLUDED.signature, bands = EXCLUDED.bands, created_at = NOW()
+            """,
+            rows
+        )
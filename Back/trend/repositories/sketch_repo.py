@@ -0,0 +1,39 @@
+from datetime import datetime
+from typing import AsyncIterator, List, Optional
+from ...core.database import fetch_one, execute, stream_all
+from ...core.tracing import trace_methods
+
+@trace_methods("db.sketch")
+class SketchRepository:
+    def __init__(self):
+        pass
+
+    async def get_bucket(self, country: str, bucket_start: datetime) -> dict | None:
+        return await fetch_one(
+            "SELECT data, total FROM term_sketches WHERE country = :country AND bucket_start = :bucket_start",
+            {"country": country, "bucket_start": bucket_start}
+        )
+
+    async def save_bucket(self, country: str, bucket_start: datetime, data: bytes, total: int):
+        await execute(
+            """
+            INSERT INTO term_sketches (country, bucket_start, data, total, updated_at)
+            VALUES (:country, :bucket_start, :data, :total, NOW())
+            ON CONFLICT (country, bucket_start) DO UPDATE
+            SET data = EXCLUDED.data, total = EXCLUDED.total, updated_at = NOW()
+            """,
+            {"country": country, "bucket_start": bucket_start, "data": data, "total": total}
+        )
+
+    async def iter_buckets(self, countries: Optional[List[str]], since: datetime) -> AsyncIterator[bytes]:
+        """기간 내 버킷 스케치를 1개씩 순회 (국가 미지정 시 전체)"""
+        country_filter = "AND country = ANY(CAST(:countries AS VARCHAR[]))" if countries else ""
+        async for row in stream_all(
+            f"""
+            SELECT data FROM term_sketches
+            WHERE bucket_start >= :since {country_filter}
+            ORDER BY bucket_start
+            """,
+            {"since": since, "countries": countries}
+        ):
+            yield row["data"]
@@ -0,0 +1,37 @@
+from datetime import datetime
+from typing import Optional
+from ...core.database import fetch_one, execute
+from ...core.tracing import trace_methods
+
+@trace_methods("db.sync")
+class SyncStateRepository:
+    def __init__(self):
+        pass
+
+    async def get_state(self, sink: str, source: str) -> Optional[dict]:
+        return await fetch_one(
+            """
+            SELECT watermark_at, watermark_id, rows_appended, rows_updated
+            FROM sync_states WHERE sink = :sink AND source = :source
+            """,
+            {"sink": sink, "source": source}
+        )
+
+    async def advance(self, sink: str, source: str, watermark_at: datetime, watermark_id: int, appended: int, updated: int):
+        """청크 기록 성공 후 워터마크 전진 (누적 건수 가산)"""
+        await execute(
+            """
+            INSERT INTO sync_states (sink, source, watermark_at, watermark_id, rows_appended, rows_updated, updated_at)
+            VALUES (:sink, :source, :watermark_at, :watermark_id, :appended, :updated, NOW())
+            ON CONFLICT (sink, source) DO UPDATE
+            SET watermark_at = EXCLUDED.watermark_at, watermark_id = EXCLUDED.watermark_id,
+                rows_appended = sync_states.rows_appended + EXCLUDED.rows_appended,
+                rows_updated = sync_states.rows_updated + EXCLUDED.rows_updated,
+                updated_at = NOW()
+            """,
+            {"sink": sink, "source": source, "watermark_at": watermark_at, "watermark_id": watermark_id,
+             "appended": appended, "updated": updated}
+        )
+
+    async def reset(self, sink: str, source: str):
+        await execute("DELETE FROM sync_states WHERE sink = :sink AND source = :source", {"sink": sink, "source": source})
@@ -1,69 +1,112 @@
+from datetime import datetime
 from typing import List, Dict, Any
 from loguru import logger
-from ...core.database import fetch_one, execute, fetch_all
+from ...core.database import execute, execute_return, fetch_all
+from ...core.tracing import trace_methods
+from ..records import VideoRecord, columns, unique_by
 
+@trace_methods("db.youtube")
 class YouTubeRepository:
     def __init__(self):
         pass
 
-    async def save_videos(self, keyword_id: int, country: str, videos: List[Dict[str, Any]]) -> Dict[str, int]:
-        """유튜브 비디오 리스트 저장 (Upsert)"""
-        saved_count = 0
-        skipped_count = 0
-        
+    async def save_videos(self, keyword_id: int, country: str, videos: List[VideoRecord]) -> Dict[str, Any]:
+        """
+        유튜브 비디오 일괄 저장 (video_id 기준 Upsert, 왕복 1회)
+        - 기존 행: 소속 키워드/조회수/좋아요/수집 시각만 갱신
+        - 문자열은 컬럼 길이로 자름 (한 행 때문에 배치 전체가 실패하지 않도록)
+        - 그래도 배치가 실패하면 행 단위로 재시도 (실패 행만 로그 후 제외, 수집은 계속)
+        :return: {"saved": 신규 수, "skipped": 갱신 수, "inserted": 신규 video_id 목록}
+        """
+        videos = unique_by(videos, "video_id")
+        if not videos:
+            return {"saved": 0, "skipped": 0, "inserted": []}
+        try:
+            return await self._upsert(keyword_id, country, videos)
+        except Exception as e:
+            logger.warning(f"⚠️ YouTube 일괄 저장 실패 -> 행 단위 재시도 ({len(videos)}개): {e}")
+
+        result = {"saved": 0, "skipped": 0, "inserted": []}
         for video in videos:
             try:
-                video_id = video.get("video_id")
-                
-                # 중복 체크
-                sql_check = "SELECT id FROM youtube_contents WHERE video_id = :video_id"
-                existing = await fetch_one(sql_check, {"video_id": video_id})
-                
-                if existing:
-                    # 업데이트
-                    await execute(
-                        """
-                        UPDATE youtube_contents 
-                        SET keyword_id = :keyword_id, collected_at = NOW(), views = :views, likes = :likes
-                        WHERE id = :id
-                        """,
-                        {
-                            "keyword_id": keyword_id,
-                            "views": video.get("views", 0),
-                            "likes": video.get("likes", 0),
-                            "id": existing['id']
-                        }
-                    )
-                    skipped_count += 1
-                else:
-                    # 신규 저장
-                    await execute(
-                        """
-                        INSERT INTO youtube_contents 
-                        (keyword_id, keyword_country, video_id, title, channel, views, likes, published_at, url, collected_at)
-                        VALUES (:keyword_id, :country, :video_id, :title, :channel, :views, :likes, :published_at, :url, NOW())
-                        """,
-                        {
-                            "keyword_id": keyword_id,
-                            "country": country,
-                            "video_id": video_id,
-                            "title": video.get("title"),
-                            "channel": video.get("channel"),
-                            "views": video.get("views", 0),
-                            "likes": video.get("likes", 0),
-                            "published_at": video.get("published_at"),
-                            "url": video.get("url")
-                        }
-                    )
-                    saved_count += 1
-                    
+                row = await self._upsert(keyword_id, country, [video])
             except Exception as e:
-                logger.error(f"YouTube Repo 저장 실패: {video.get('title')} - {e}")
+                logger.error(f"❌ YouTube 저장 실패 ({video.video_id}): {e}")
                 continue
-        
-        return {"saved": saved_count, "skipped": skipped_count}
+            result["saved"] += row["saved"]
+            result["skipped"] += row["skipped"]
+            result["inserted"].extend(row["inserted"])
+        return result
+
+    async def _upsert(self, keyword_id: int, country: str, videos: List[VideoRecord]) -> Dict[str, Any]:
+        """unnest 일괄 Upsert 1회 (save_videos 참고)"""
+        video_ids, titles, channels, views, likes, published_ats, urls = columns(
+            videos, "video_id", "title", "channel", "views", "likes", "published_at", "url"
+        )
+
+        row = await execute_return(
+            """
+            WITH upserted AS (
+                INSERT INTO youtube_contents
+                    (keyword_id, keyword_country, video_id, title, channel, views, likes, published_at, url, collected_at)
+                SELECT :keyword_id, :country, LEFT(v.video_id, 50), LEFT(v.title, 300), LEFT(v.channel, 200),
+                       v.views, v.likes, LEFT(v.published_at, 50), LEFT(v.url, 300), NOW()
+                FROM unnest(
+                    CAST(:video_ids AS TEXT[]), CAST(:titles AS TEXT[]), CAST(:channels AS TEXT[]),
+                    CAST(:views AS BIGINT[]), CAST(:likes AS BIGINT[]), CAST(:published_ats AS TEXT[]),
+                    CAST(:urls AS TEXT[])
+                ) AS v(video_id, title, channel, views, likes, published_at, url)
+                ON CONFLICT (video_id) DO UPDATE
+                SET keyword_id = EXCLUDED.keyword_id, collected_at = NOW(), updated_at = NOW(),
+                    views = EXCLUDED.views, likes = EXCLUDED.likes
+                RETURNING video_id, (xmax = 0) AS inserted
+            )
+            SELECT COUNT(*) FILTER (WHERE inserted) AS saved, COUNT(*) FILTER (WHERE NOT inserted) AS skipped,
+                   COALESCE(array_agg(video_id) FILTER (WHERE inserted), '{}') AS inserted_ids
+            FROM upserted
+            """,
+            {
+                "keyword_id": keyword_id,
+                "country": country,
+                "video_ids": video_ids,
+                "titles": titles,
+                "channels": channels,
+                "views": views,
+                "likes": likes,
+                "published_ats": published_ats,
+                "urls": urls,
+            }
+        )
+        if not row:
+            return {"saved": 0, "skipped": 0, "inserted": []}
+        return {"saved": row["saved"], "skipped": row["skipped"], "inserted": list(row["inserted_ids"])}
 
     async def get_by_keyword(self, keyword_id: int, limit: int = 10) -> List[dict]:
-        """키워드별 유튜브 콘텐츠 조회"""
-        sql = "SELECT * FROM youtube_contents WHERE keyword_id = :keyword_id LIMIT :limit"
+        """키워드별 유튜브 콘텐츠 조회 (핫이슈 점수 내림차순, 응답 필드만 조회)"""
+        sql = """
+            SELECT title, url, channel, views, likes, score, 'video' AS type
+            FROM youtube_contents WHERE keyword_id = :keyword_id
+            ORDER BY score DESC NULLS LAST, id DESC
+            LIMIT :limit
+        """
         return await fetch_all(sql, {"keyword_id": keyword_id, "limit": limit})
+
+    async def get_for_scoring(self, country: str, since: datetime) -> List[dict]:
+        """점수 계산용 최소 컬럼 조회"""
+        sql = """
+            SELECT id, keyword_id, views, likes, published_at, collected_at
+            FROM youtube_contents
+            WHERE keyword_country = :country AND collected_at >= :since
+        """
+        return await fetch_all(sql, {"country": country, "since": since})
+
+    async def update_scores(self, ids: List[int], scores: List[float]):
+        """점수 일괄 갱신 (단일 UPDATE ... FROM unnest)"""
+        await execute(
+            """
+            UPDATE youtube_contents AS y SET score = s.score, updated_at = NOW()
+            FROM unnest(CAST(:ids AS INTEGER[]), CAST(:scores AS DOUBLE PRECISION[])) AS s(id, score)
+            WHERE y.id = s.id AND y.score IS DISTINCT FROM s.score
+            """,
+            {"ids": ids, "scores": scores}
+        )
@@ -0,0 +1,82 @@
+"""
+일자별 사전 집계 (Rollup)
+- 수집 종료 시 이번 회차가 건드린 (국가, 일자)만 재집계 -> daily_rollups / daily_top_rollups
+- 대시보드 차트는 원본 콘텐츠 테이블 대신 수백 행 규모의 집계 테이블만 조회
+- 과거 데이터 백필: python -m Back.trend.rollups --days 90 [--country KR]
+"""
+import argparse
+import asyncio
+from datetime import date, datetime, time, timedelta, timezone
+from typing import Iterable, List, Optional
+
+from loguru import logger
+
+from .records import NewsRecord, VideoRecord
+from .repositories.rollup_repo import RollupRepository
+
+
+def _utc_today() -> date:
+    return datetime.now(timezone.utc).date()
+
+
+def _day_range(day: date):
+    start = datetime.combine(day, time.min, tzinfo=timezone.utc)
+    return start, start + timedelta(days=1)
+
+
+class RollupService:
+    """일자별 집계 갱신/조회"""
+
+    def __init__(self):
+        self.repo = RollupRepository()
+
+    async def affected_days(self, country: str, videos: List[VideoRecord], articles: List[NewsRecord]) -> List[date]:
+        """저장 전 호출: 이번 수집분 중 기존 행이 속해 있던 일자"""
+        return await self.repo.get_collected_days(
+            country,
+            [v.video_id for v in videos if v.video_id],
+            [a.url for a in articles if a.url]
+        )
+
+    async def refresh(self, country: str, days: Optional[Iterable[date]] = None):
+        """지정 일자(기본: 오늘) 재집계"""
+        targets = sorted(set(days or []) | {_utc_today()})
+        refreshed_at = datetime.now(timezone.utc)
+        for day in targets:
+            start, end = _day_range(day)
+            await self.repo.refresh_day(country, day, start, end, refreshed_at)
+        logger.info(f"🧮 일자별 집계 갱신 ({country}): {', '.join(str(d) for d in targets)}")
+
+    async def backfill(self, days: int = 90, country: Optional[str] = None) -> int:
+        """최근 days일 원본 데이터 전체 재집계"""
+        since = datetime.combine(_utc_today() - timedelta(days=days - 1), time.min, tzinfo=timezone.utc)
+        targets = await self.repo.get_days_with_contents(since, country)
+        refreshed_at = datetime.now(timezone.utc)
+        for row in targets:
+            start, end = _day_range(row["day"])
+            await self.repo.refresh_day(row["country"], row["day"], start, end, refreshed_at)
+        logger.info(f"🧮 집계 백필 완료: {len(targets)}개 (국가, 일자)")
+        return len(targets)
+
+    async def daily(self, country: str, days: int = 90, source: Optional[str] = None) -> List[dict]:
+        return await self.repo.get_daily(country, _utc_today() - timedelta(days=days - 1), source)
+
+    async def top(self, country: str, dimension: str, days: int = 30, limit: int = 10) -> List[dict]:
+        return await self.repo.get_top(country, dimension, _utc_today() - timedelta(days=days - 1), limit)
+
+
+async def _main():
+    parser = argparse.ArgumentParser(description="일자별 집계 테이블 백필")
+    parser.add_argument("--days", type=int, default=90)
+    parser.add_argument("--country", default=None)
+    args = parser.parse_args()
+
+    from ..core.database import close_pool
+    try:
+        await RollupService().backfill(args.days, args.country)
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
@@ -1,14 +1,75 @@
 """
 트렌드 수집 API 엔드포인트
 """
-from fastapi import APIRouter, Query
+import json
+import time
+from datetime import date, datetime, timedelta
+from typing import Any, Awaitable, Callable, Dict, Optional, Tuple
+
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from loguru import logger
 # from fastapi import Depends, ... (get_db 사용 안 함)
 
 from .service import TrendService
+from ..core.cache import CachedResponse, response_cache, etag_matches
+from ..core.config import settings
+from ..core.llm_cache import llm_cache
+from ..core.responses import FastJSONResponse
+from ..core.tracing import current_span, span
+from ..utils.singleflight import SingleFlight
 # from .schemas import TrendCollectionResponse
 
 router = APIRouter(prefix="/trend", tags=["Trend Collection"])
 
+# 백그라운드 AI 키워드 보강 (키: 보강 결과 캐시 키 -> 같은 보강은 동시에 1회만)
+_enrich_flight = SingleFlight()
+
+# 플랫폼 검색어(Nate/Yahoo 스크래핑) 마지막 결과: country -> (조회 시각 monotonic, 응답 dict)
+# - 수집 세대와 무관한 외부 데이터라 응답 캐시 대신 별도 보관, 갱신은 국가별 1회만 (키: country)
+_platform_keywords: Dict[str, Tuple[float, dict]] = {}
+_platform_flight = SingleFlight()
+
+
+async def _cached_response(
+    request: Request,
+    endpoint: str,
+    country: str,
+    params: Dict[str, Any],
+    builder: Callable[[], Awaitable[Any]],
+    cacheable: Optional[Callable[[Any], bool]] = None
+) -> Response:
+    """
+    응답 캐시 조회 -> 없으면 builder 실행 후 저장
+    - 국가별 데이터 세대가 키에 포함되어 수집 완료 시 자동 무효화
+    - If-None-Match 일치 시 304 Not Modified
+    - cacheable(payload)가 False면 저장하지 않음 (일시적 실패 결과 캐싱 방지)
+    """
+    key = await _cache_key(endpoint, country, params)
+    entry = response_cache.get(key)
+    current_span().set(**{"cache.endpoint": endpoint, "cache.hit": entry is not None})
+    if entry is None:
+        with span(f"build.{endpoint}", country=country):
+            payload = await builder()
+        store = cacheable(payload) if cacheable else True
+        entry = response_cache.put(key, payload, store=store)
+    return _entry_response(request, entry)
+
+
+async def _cache_key(endpoint: str, country: str, params: Dict[str, Any]) -> tuple:
+    """응답 캐시 키 (다른 워커의 세대 증가 반영 후 생성)"""
+    # 날짜가 바뀌면 조회 대상 키워드(Trending_{country}_{YYYYMMDD})도 바뀜
+    today = datetime.now().strftime("%Y%m%d")
+    await response_cache.refresh_generations()
+    return response_cache.make_key(endpoint, country, {**params, "date": today})
+
+
+def _entry_response(request: Request, entry: CachedResponse) -> Response:
+    """캐시 항목 -> 응답 (If-None-Match 일치 시 304)"""
+    headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+    if etag_matches(request.headers.get("if-none-match"), entry.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=entry.body, media_type="application/json", headers=headers)
+
 
 @router.post("/collect-trending")
 async def collect_trending_contents(
@@ -20,37 +81,132 @@ async def collect_trending_contents(
     
     # 1. 수집 수행 (여기서 키워드 리스트 확보)
     collection_res = await service.collect_trending_contents(country, source)
+    if not collection_res.success:
+        # 다른 프로세스의 같은 수집이 대기 상한 내에 끝나지 않음
+        raise HTTPException(status_code=409, detail=collection_res.message)
     
     # 2. 수집된 콘텐츠 조회
-    contents_res = await get_trending_contents(country=country, limit=50)
+    contents_res = await _load_trending_contents(country=country, limit=50)
     
     # 3. 결과 병합 (UI 배너를 위해 top_keywords + ai_keywords 포함)
-    return {
+    return FastJSONResponse({
         **contents_res, # youtube, news 리스트
         "top_keywords": collection_res.top_keywords,
         "ai_keywords": collection_res.ai_keywords,
+        "keyword_coverage": collection_res.keyword_coverage,
+        "spikes": collection_res.spikes,
         "message": collection_res.message
-    }
+    })
+
+
+@router.get("/cache/stats")
+async def get_cache_stats():
+    """응답 캐시 / LLM 결과 캐시 통계 (적중률, 절약 지연시간/토큰)"""
+    return FastJSONResponse({
+        "response_cache": response_cache.stats(),
+        "llm_cache": llm_cache.stats()
+    })
 
 
 @router.get("/platform-keywords")
 async def get_platform_keywords(
     country: str = Query(..., description="국가 코드 (KR, JP)")
 ):
-    """플랫폼별 실시간 검색어 수집 (Nate, Yahoo Japan 등)"""
-    service = TrendService()
-    result = await service.get_platform_keywords(country)
+    """플랫폼별 실시간 검색어 수집 (Nate, Yahoo Japan 등, 결과는 대시보드에도 반영)"""
+    result = await _platform_flight.do(country, _fetch_platform_keywords, country)
+    if result is None:
+        raise HTTPException(status_code=502, detail=f"{country} 플랫폼 검색어 수집 실패")
+    return FastJSONResponse(result)
+
+
+async def _fetch_platform_keywords(country: str) -> Optional[dict]:
+    """
+    플랫폼 검색어 수집 -> 마지막 결과 갱신 (엔드포인트/대시보드 백그라운드 갱신 공용, 키: country)
+    - 실패 결과는 이전 성공 결과를 덮어쓰지 않음, 예외는 로그 후 None (다음 주기에 재시도)
+    """
+    try:
+        with span("build.platform-keywords", country=country):
+            result = (await TrendService().get_platform_keywords(country)).model_dump()
+    except Exception as e:
+        logger.error(f"❌ 플랫폼 검색어 수집 실패 ({country}): {e}")
+        return None
+    if result["success"] or country not in _platform_keywords:
+        _platform_keywords[country] = (time.monotonic(), result)
     return result
 
 
+def _cached_platform_keywords(country: str) -> Optional[Tuple[float, dict]]:
+    """마지막 플랫폼 검색어 결과 (없거나 PLATFORM_KEYWORDS_TTL_SECONDS 경과 시 백그라운드 갱신 시작)"""
+    cached = _platform_keywords.get(country)
+    if cached is None or time.monotonic() - cached[0] > settings.PLATFORM_KEYWORDS_TTL_SECONDS:
+        _platform_flight.start(country, _fetch_platform_keywords, country)
+    return cached
+
+
+@router.get("/dashboard")
+async def get_dashboard(
+    request: Request,
+    country: str = "KR",
+    limit: int = Query(50, ge=1, le=100, description="콘텐츠 표시 개수"),
+    top_n: int = Query(6, ge=1, le=50, description="분석 키워드 개수"),
+    enrich: bool = Query(False, description="AI 보강 결과가 준비되어 있으면 사용 (없으면 백그라운드 보강 시작)")
+):
+    """
+    대시보드 1회 호출 (콘텐츠 + 분석 키워드 + 플랫폼 검색어)
+    - 콘텐츠는 한 번만 조회하여 키워드 분석과 공유, 결과는 국가/날짜별 응답 캐시 경유
+    - 플랫폼 검색어는 마지막 수집 결과를 포함 (Nate/Yahoo 스크래핑은 백그라운드 갱신, 첫 갱신 전에는 null)
+    """
+    enriched = await _enriched_keywords(country, top_n) if enrich else None
+    platform = _cached_platform_keywords(country)
+    # 플랫폼 검색어 조회 시각이 키에 포함 -> 백그라운드 갱신 후 다음 요청부터 새 결과
+    params = {"limit": limit, "top_n": top_n, "ai": enriched is not None, "platform": platform and platform[0]}
+    return await _cached_response(
+        request, "dashboard", country, params,
+        lambda: _load_dashboard(country, limit, top_n, enriched, platform and platform[1])
+    )
+
+
+async def _load_dashboard(
+    country: str,
+    limit: int,
+    top_n: int,
+    enriched: Optional[CachedResponse] = None,
+    platform: Optional[dict] = None
+) -> dict:
+    """대시보드 응답 원본 (캐시 미적용, enriched가 있으면 AI 보강 키워드 사용)"""
+    # 키워드 분석은 100건 기준 -> 한 번 조회 후 표시용은 limit만큼 자름
+    contents = await _load_trending_contents(country, max(limit, 100))
+    if enriched is not None:
+        keywords = json.loads(enriched.body)
+    else:
+        keywords = await _load_trending_keywords(country, top_n, contents=contents)
+
+    return {
+        "country": country,
+        "contents": {source: items[:limit] for source, items in contents.items()},
+        "keywords": keywords["keywords"],
+        "total_contents": keywords["total_contents"],
+        "platform_keywords": platform
+    }
+
+
 @router.get("/trending/contents")
 async def get_trending_contents(
+    request: Request,
     country: str = "KR",
     limit: int = 50
 ):
     """
     오늘 수집된 인기 콘텐츠 조회 (YouTube + News)
     """
+    return await _cached_response(
+        request, "trending/contents", country, {"limit": limit},
+        lambda: _load_trending_contents(country, limit)
+    )
+
+
+async def _load_trending_contents(country: str, limit: int) -> dict:
+    """오늘자 콘텐츠 DB 조회 (캐시 미적용 원본)"""
     from .repositories.keyword_repo import KeywordRepository
     from .repositories.youtube_repo import YouTubeRepository
     from .repositories.news_repo import NewsRepository
@@ -67,45 +223,265 @@ async def get_trending_contents(
     
     keyword_id = keyword_obj['id']
     
-    # 2. 콘텐츠 조회 (Repo 사용 -> 결과는 Dict 리스트)
-    yt_list = await youtube_repo.get_by_keyword(keyword_id, limit=limit)
-    news_list = await news_repo.get_by_keyword(keyword_id, limit=limit)
-    
+    # 2. 콘텐츠 조회 (Repo가 응답 필드만 조회 -> 추가 변환 없이 그대로 반환)
     return {
-        "youtube": [
+        "youtube": await youtube_repo.get_by_keyword(keyword_id, limit=limit),
+        "news": await news_repo.get_by_keyword(keyword_id, limit=limit)
+    }
+
+
+@router.get("/search")
+async def search_contents(
+    q: str = Query(..., min_length=1, max_length=200, description="검색어"),
+    country: Optional[str] = Query(None, description="국가 코드 (쉼표 구분, 예: KR,JP). 미지정 시 전체"),
+    date_from: Optional[date] = Query(None, description="수집일 시작 (포함)"),
+    date_to: Optional[date] = Query(None, description="수집일 끝 (포함)"),
+    source: str = Query("all", pattern="^(all|youtube|news)$", description="검색 대상 (all, youtube, news)"),
+    page: int = Query(1, ge=1),
+    size: int = Query(20, ge=1, le=100)
+):
+    """수집된 YouTube/News 제목 검색 (전문 검색 + Trigram, 관련도순 페이지네이션)"""
+    from .repositories.search_repo import SearchRepository
+    
+    countries = [c.strip().upper() for c in country.split(",") if c.strip()] if country else None
+    
+    # 다음 페이지 존재 여부 확인을 위해 1건 더 조회 (COUNT(*) 생략)
+    rows = await SearchRepository().search_titles(
+        q.strip(),
+        countries=countries,
+        date_from=datetime.combine(date_from, datetime.min.time()) if date_from else None,
+        date_to=datetime.combine(date_to + timedelta(days=1), datetime.min.time()) if date_to else None,
+        source=source,
+        limit=size + 1,
+        offset=(page - 1) * size
+    )
+    
+    return FastJSONResponse({
+        "query": q,
+        "page": page,
+        "size": size,
+        "has_more": len(rows) > size,
+        "results": [
             {
-                "title": y['title'],
-                "url": y['url'],
-                "channel": y['channel'],
-                "views": y['views'],
-                "likes": y['likes'],
-                "type": "video"
-            } for y in yt_list
-        ],
-        "news": [
+                "type": r['type'],
+                "title": r['title'],
+                "url": r['url'],
+                "source": r['source'],
+                "country": r['country'],
+                "published_at": r['published_at'],
+                "collected_at": str(r['collected_at']),
+                "score": r['score'],
+                "rank": round(float(r['rank'] or 0), 4)
+            } for r in rows[:size]
+        ]
+    })
+
+
+@router.get("/related")
+async def get_related_contents(
+    url: str = Query(..., description="기준 콘텐츠 URL (수집된 YouTube/News)"),
+    country: Optional[str] = Query(None, description="결과 국가 제한"),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """의미상 가까운 콘텐츠 (pgvector HNSW 근사 최근접)"""
+    from .embeddings import embedding_index
+    
+    rows = await embedding_index.related_contents(url, limit=limit, country=country)
+    if rows is None:
+        raise HTTPException(status_code=404, detail="임베딩이 저장된 콘텐츠가 아닙니다.")
+    return FastJSONResponse({
+        "url": url,
+        "results": [
             {
-                "title": n['title'],
-                "url": n['url'],
-                "source": n['source'],
-                "published_at": str(n['published_at']),
-                "type": "news"
-            } for n in news_list
+                "type": r['kind'],
+                "title": r['title'],
+                "url": r['content_key'],
+                "country": r['country'],
+                "similarity": round(float(r['similarity']), 4)
+            } for r in rows
         ]
-    }
+    })
+
+
+@router.get("/keywords/similar")
+async def get_similar_keywords(
+    keyword: str = Query(..., min_length=1, max_length=200),
+    country: Optional[str] = Query(None, description="국가 제한 (미지정 시 전체)"),
+    limit: int = Query(10, ge=1, le=50)
+):
+    """과거 트렌드 키워드 중 유사한 키워드 (pgvector HNSW 근사 최근접)"""
+    from .embeddings import embedding_index
+    
+    rows = await embedding_index.similar_keywords(keyword, country=country, limit=limit)
+    return FastJSONResponse({
+        "keyword": keyword,
+        "results": [
+            {
+                "keyword": r['title'],
+                "country": r['country'],
+                "similarity": round(float(r['similarity']), 4)
+            } for r in rows
+        ]
+    })
+
+
+@router.get("/terms/top")
+async def get_top_terms(
+    country: str = Query("ALL", description="국가 코드 (쉼표 구분) 또는 ALL"),
+    days: int = Query(7, ge=1, le=90, description="조회 기간 (일, 오늘 포함)"),
+    k: int = Query(20, ge=1, le=200)
+):
+    """기간 내 가장 많이 등장한 용어 Top-K (일자 버킷 스케치 병합, 콘텐츠 테이블 미조회)"""
+    from .sketches import term_tracker
+    
+    countries = None if country.upper() == "ALL" else [c.strip().upper() for c in country.split(",") if c.strip()]
+    result = await term_tracker.top_terms(countries, days=days, k=k)
+    return FastJSONResponse({"country": country.upper(), "days": days, **result})
+
+
+@router.get("/spikes")
+async def get_keyword_spikes(
+    country: str = Query("KR", description="국가 코드"),
+    hours: int = Query(24, ge=1, le=24 * 30, description="조회 기간 (시간)"),
+    limit: int = Query(50, ge=1, le=200)
+):
+    """최근 감지된 급상승(rank_spike, freq_spike) / 신규 진입(new) 키워드"""
+    from .spikes import SpikeDetector
+    
+    events = await SpikeDetector().recent(country, hours=hours, limit=limit)
+    return FastJSONResponse({
+        "country": country,
+        "hours": hours,
+        "events": [
+            {**e, "detected_at": str(e['detected_at'])} for e in events
+        ]
+    })
+
+
+@router.get("/rollups/daily")
+async def get_daily_rollups(
+    request: Request,
+    country: str = "KR",
+    days: int = Query(90, ge=1, le=365),
+    source: Optional[str] = Query(None, pattern="^(youtube|news)$")
+):
+    """일자별 수집 요약 (콘텐츠 수, 조회수 합계/평균, 중복 병합 수, 평균 점수)"""
+    from .rollups import RollupService
+    
+    async def build():
+        return {"country": country, "days": days, "series": await RollupService().daily(country, days, source)}
+    
+    return await _cached_response(request, "rollups/daily", country, {"days": days, "source": source}, build)
+
+
+@router.get("/rollups/top")
+async def get_top_rollups(
+    request: Request,
+    country: str = "KR",
+    dimension: str = Query("channel", pattern="^(channel|source|keyword)$", description="channel(YouTube 채널), source(언론사), keyword(트렌드 키워드)"),
+    days: int = Query(30, ge=1, le=365),
+    limit: int = Query(10, ge=1, le=100)
+):
+    """기간 내 상위 채널/언론사/트렌드 키워드"""
+    from .rollups import RollupService
+    
+    async def build():
+        return {
+            "country": country,
+            "dimension": dimension,
+            "days": days,
+            "items": await RollupService().top(country, dimension, days, limit)
+        }
+    
+    return await _cached_response(
+        request, "rollups/top", country, {"dimension": dimension, "days": days, "limit": limit}, build
+    )
+
+
+@router.get("/export")
+async def export_history(
+    source: str = Query("youtube", pattern="^(keywords|youtube|news)$", description="내보낼 데이터 (keywords, youtube, news)"),
+    fmt: str = Query("csv", alias="format", pattern="^(csv|jsonl|parquet)$", description="파일 형식 (csv, jsonl, parquet)"),
+    country: Optional[str] = Query(None, description="국가 코드 (쉼표 구분, 예: KR,JP). 미지정 시 전체"),
+    date_from: Optional[date] = Query(None, description="수집일 시작 (포함, UTC)"),
+    date_to: Optional[date] = Query(None, description="수집일 끝 (포함, UTC)")
+):
+    """수집 이력 파일 다운로드 (limit 없음, 서버 사이드 커서로 청크 스트리밍)"""
+    from fastapi.responses import StreamingResponse
+    from .export import EXPORT_FORMATS, ExportService, export_filename, parquet_available
+    
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(status_code=400, detail="date_from이 date_to보다 늦습니다.")
+    if fmt == "parquet" and not parquet_available():
+        raise HTTPException(status_code=501, detail="Parquet 내보내기에는 pyarrow가 필요합니다.")
+    
+    countries = [c.strip().upper() for c in country.split(",") if c.strip()] if country else None
+    filename = export_filename(source, fmt, date_from, date_to)
+    return StreamingResponse(
+        ExportService().stream(source, fmt, countries, date_from, date_to),
+        media_type=EXPORT_FORMATS[fmt][0],
+        headers={"Content-Disposition": f'attachment; filename="{filename}"', "Cache-Control": "no-store"}
+    )
 
 
 @router.get("/trending/keywords")
 async def get_trending_keywords(
+    request: Request,
     country: str = "KR",
-    top_n: int = 20
+    top_n: int = 20,
+    enrich: bool = Query(False, description="AI 보강 결과 요청 (준비 전이면 로컬 결과 반환 후 백그라운드 보강)")
 ):
     """
-    오늘 수집된 콘텐츠에서 핵심 키워드 추출 (NLP 분석)
+    오늘 수집된 콘텐츠에서 핵심 키워드 추출 (로컬 TF-IDF, AI 보강 결과는 준비된 경우에만)
+    - AI 보강은 요청을 기다리게 하지 않음: 백그라운드 실행 후 별도 키로 캐싱, 이후 enrich 요청부터 제공
+    """
+    if enrich:
+        entry = await _enriched_keywords(country, top_n)
+        if entry is not None:
+            return _entry_response(request, entry)
+    return await _cached_response(
+        request, "trending/keywords", country, {"top_n": top_n},
+        lambda: _load_trending_keywords(country, top_n)
+    )
+
+
+async def _enriched_keywords(country: str, top_n: int) -> Optional[CachedResponse]:
+    """캐싱된 AI 보강 결과 (없으면 백그라운드 보강을 시작하고 None)"""
+    key = await _cache_key("trending/keywords/ai", country, {"top_n": top_n})
+    entry = response_cache.get(key)
+    if entry is None:
+        _enrich_flight.start(key, _enrich_trending_keywords, key, country, top_n)
+    return entry
+
+
+async def _enrich_trending_keywords(key: tuple, country: str, top_n: int):
+    """AI 키워드 분석 -> 성공 시 보강 결과 캐시에 저장 (실패하면 다음 enrich 요청에서 재시도)"""
+    from .analyzer import KeywordAnalyzer
+    
+    try:
+        with span("build.trending/keywords/ai", country=country):
+            contents = await _load_trending_contents(country=country, limit=100)
+            keywords = await KeywordAnalyzer().enrich_keywords(contents, country=country, top_n=top_n)
+        if keywords:
+            response_cache.put(key, {
+                "country": country,
+                "keywords": keywords,
+                "total_contents": len(contents.get('youtube', [])) + len(contents.get('news', []))
+            })
+    except Exception as e:
+        logger.error(f"❌ 백그라운드 AI 키워드 보강 실패 ({country}): {e}")
+
+
+async def _load_trending_keywords(country: str, top_n: int, contents: Optional[dict] = None) -> dict:
+    """
+    콘텐츠 조회 + 로컬 키워드 추출 (캐시 미적용 원본)
+    :param contents: 이미 조회한 콘텐츠가 있으면 재사용 (대시보드)
     """
     from .analyzer import KeywordAnalyzer
     
     # 먼저 콘텐츠 조회
-    contents = await get_trending_contents(country=country, limit=100)
+    if contents is None:
+        contents = await _load_trending_contents(country=country, limit=100)
     
     # 키워드 분석
     analyzer = KeywordAnalyzer()
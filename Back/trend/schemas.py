@@ -2,7 +2,7 @@
 트렌드 도메인 Pydantic 스키마
 """
 from pydantic import BaseModel, Field, HttpUrl
-from typing import Optional, List
+from typing import Optional, List, Dict
 from datetime import datetime
 
 
@@ -95,6 +95,7 @@ class NewsContentBase(BaseModel):
     description: Optional[str] = None
     published_at: Optional[str] = None
     url: Optional[str] = None
+    matched_keywords: List[str] = []
 
 
 class NewsContentCreate(NewsContentBase):
@@ -136,7 +137,10 @@ class TrendCollectionResponse(BaseModel):
     keywords_count: int
     top_keywords: List[str] = []
     ai_keywords: List[str] = []  # GenAI 추출 마케팅 키워드
-    instagram_count: int = 0
+    keyword_coverage: Dict[str, int] = {}  # 트렌드 키워드별 매칭 뉴스 수
+    spikes: List[Dict] = []  # 급상승/신규 진입 키워드 (EWMA z-score)
+    instagram_count: Optional[int] = 0  # None: Instagram 백그라운드 수집 진행 중 (instagram_pending)
+    instagram_pending: bool = False
     youtube_count: int = 0
     news_count: int = 0
 
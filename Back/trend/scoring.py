@@ -0,0 +1,223 @@
+"""
+핫이슈 점수 산정 엔진 (Project_Docs/Trash/EnterPrise_Plan/03_점수_산정_알고리즘.md)
+핫이슈 점수 = 인기도(40) + 상승세(30) + 최근성(20) + 다출처(10)
+
+- 국가의 전체 콘텐츠를 한 번의 NumPy/pandas 연산으로 점수화 (10만 건 < 1초)
+- 콘텐츠(item) 점수: 인기도/상승세는 소스(youtube/news)별 Min-Max 정규화
+- 키워드 점수: 일자별 키워드 단위로 집계 + 같은 키워드의 전일/7일 대비 증가율로 상승세 산정 (달력 일자 기준)
+- pandas는 점수 계산 시점에 로딩 (API cold start에서 제외)
+"""
+from __future__ import annotations
+
+from datetime import datetime, timedelta, timezone
+from typing import TYPE_CHECKING, Dict, Optional
+
+import numpy as np
+from loguru import logger
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+from .repositories.keyword_repo import KeywordRepository
+from .repositories.youtube_repo import YouTubeRepository
+from .repositories.news_repo import NewsRepository
+
+# 최근성 단계 (경과 시간 상한, 점수)
+_RECENCY_STEPS = [(3, 20.0), (12, 18.0), (24, 15.0), (48, 10.0), (72, 5.0)]
+
+# 수집 일별 키워드 행 이름 (KeywordRepository.get_or_create_daily_keyword) -> 날짜를 뗀 이름이 같은 시계열
+_DAILY_KEYWORD = r"^(Trending_\w+?)_\d{8}$"
+
+
+def parse_published(published: pd.Series, fallback: pd.Series) -> pd.Series:
+    """
+    published_at 문자열(ISO8601 / RFC822) -> UTC datetime
+    - 빠른 ISO 파싱 후 실패분만 RFC822 포맷으로 재시도, 그래도 실패하면 collected_at 사용
+    """
+    import pandas as pd
+
+    published = published.fillna("").astype(str)
+    parsed = pd.to_datetime(published, utc=True, errors="coerce", format="ISO8601")
+    missing = parsed.isna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(
+            published[missing].str.replace(r"\s+(GMT|UTC)$", " +0000", regex=True),
+            utc=True, errors="coerce", format="%a, %d %b %Y %H:%M:%S %z"
+        )
+        missing = parsed.isna()
+    if missing.any():
+        parsed[missing] = pd.to_datetime(fallback[missing], utc=True, errors="coerce")
+    return parsed
+
+
+def _minmax(values: pd.Series, groups: pd.Series) -> pd.Series:
+    """그룹별 Min-Max 정규화 (0~10). 값이 모두 같으면 0"""
+    grouped = values.groupby(groups)
+    lo = grouped.transform("min")
+    span = (grouped.transform("max") - lo).replace(0, np.nan)
+    return ((values - lo) / span * 10.0).fillna(0.0)
+
+
+def _recency_points(hours: np.ndarray) -> np.ndarray:
+    conditions = [hours < limit for limit, _ in _RECENCY_STEPS]
+    return np.select(conditions, [points for _, points in _RECENCY_STEPS], default=0.0)
+
+
+def score_items(items: pd.DataFrame, now: Optional[datetime] = None) -> pd.DataFrame:
+    """
+    콘텐츠 단위 점수 계산 (벡터화)
+    :param items: 컬럼 id, kind('youtube'/'news'), keyword_id, views, likes, comments, mentions,
+                  source, published_at, collected_at
+    :return: items + popularity, velocity, recency, multi_source, score, published_dt, age_hours
+    """
+    import pandas as pd
+
+    now = now or datetime.now(timezone.utc)
+    df = items.copy()
+    for col, default in (("views", 0), ("likes", 0), ("comments", 0), ("mentions", 1)):
+        if col not in df:
+            df[col] = default
+        df[col] = pd.to_numeric(df[col], errors="coerce").fillna(default).clip(lower=default)
+
+    df["published_dt"] = parse_published(df["published_at"], df["collected_at"])
+    age = (pd.Timestamp(now) - df["published_dt"]).dt.total_seconds() / 3600.0
+    df["age_hours"] = age.fillna(72.0).clip(lower=0.0)
+
+    # 1. 인기도 (0~40): log 스케일 -> 소스별 정규화 -> 가중 평균
+    views_score = np.log10(df["views"] + 1)
+    engagement_score = np.log10(df["likes"] + df["comments"] * 2 + 1)
+    mentions_score = np.log10(df["mentions"] + 1)
+    df["popularity"] = (
+        _minmax(views_score, df["kind"]) * 0.4
+        + _minmax(engagement_score, df["kind"]) * 0.4
+        + _minmax(mentions_score, df["kind"]) * 0.2
+    ) * 4
+
+    # 2. 상승세 (0~30): 게시 후 시간당 반응 속도 (뉴스는 언급량 기준)
+    reach = np.where(df["kind"] == "youtube", df["views"] + df["likes"] * 2, df["mentions"])
+    per_hour = np.log10(reach / np.maximum(df["age_hours"], 1.0) + 1)
+    df["velocity"] = _minmax(pd.Series(per_hour, index=df.index), df["kind"]) * 3
+
+    # 3. 최근성 (0~20)
+    df["recency"] = _recency_points(df["age_hours"].to_numpy())
+
+    # 4. 다출처 (0~10): 같은 키워드에 묶인 플랫폼/매체 다양성
+    platforms = df.groupby("keyword_id")["kind"].nunique()
+    news_sources = (
+        df[df["kind"] == "news"].groupby("keyword_id")["source"].nunique()
+        .reindex(platforms.index, fill_value=0)
+    )
+    source_diversity = np.select([news_sources >= 5, news_sources >= 3], [3, 2], default=1)
+    diversity = np.minimum(platforms * 2 + source_diversity, 10)
+    df["multi_source"] = df["keyword_id"].map(diversity).fillna(0).astype(float)
+
+    df["score"] = (df["popularity"] + df["velocity"] + df["recency"] + df["multi_source"]).round(4)
+    return df
+
+
+def _momentum_points(growth_24h: np.ndarray, acceleration: np.ndarray) -> np.ndarray:
+    return np.select(
+        [acceleration > 200, acceleration > 100, acceleration > 50, growth_24h > 50, growth_24h > 0],
+        [30.0, 25.0, 20.0, 15.0, 10.0],
+        default=0.0,
+    )
+
+
+def score_keywords(scored_items: pd.DataFrame, keywords: pd.DataFrame) -> pd.DataFrame:
+    """
+    키워드 단위 점수 계산 (score_items 결과를 keyword_id로 집계)
+    :param keywords: 컬럼 id, keyword, keyword_collected_at (같은 국가의 일자별 키워드 행)
+    """
+    import pandas as pd
+
+    kw = keywords[["id", "keyword", "keyword_collected_at"]].copy()
+    kw["day"] = pd.to_datetime(kw["keyword_collected_at"], utc=True).dt.floor("D")
+    kw = kw.sort_values("day").reset_index(drop=True)
+
+    items = scored_items.assign(
+        in_6h=scored_items["age_hours"] < 6,
+        in_12h=scored_items["age_hours"] < 12,
+        # 키워드별 인기도 상위 20개만 평균에 반영
+        pop_rank=scored_items.groupby("keyword_id")["popularity"].rank(method="first", ascending=False),
+    )
+    grouped = items.groupby("keyword_id")
+    stats = pd.DataFrame({
+        "count": grouped.size(),
+        "popularity": items[items["pop_rank"] <= 20].groupby("keyword_id")["popularity"].mean(),
+        "multi_source": grouped["multi_source"].max(),
+        "latest_age": grouped["age_hours"].min(),
+        "last_6h": grouped["in_6h"].sum(),
+        "last_12h": grouped["in_12h"].sum(),
+    })
+    kw = kw.join(stats, on="id")
+    kw[["count", "popularity", "multi_source", "last_6h", "last_12h"]] = (
+        kw[["count", "popularity", "multi_source", "last_6h", "last_12h"]].fillna(0)
+    )
+    kw["latest_age"] = kw["latest_age"].fillna(np.inf)
+
+    # 상승세: 같은 키워드의 전일 대비 / 직전 7일 평균 대비 콘텐츠 수 증가율
+    # - 키워드 x 달력 일자 표로 재색인: 행이 없는 날은 0건 (빠진 날을 인접일로 취급하지 않음)
+    kw["series"] = kw["keyword"].astype(str).str.replace(_DAILY_KEYWORD, r"\1", regex=True)
+    daily = kw.pivot_table(index="day", columns="series", values="count", aggfunc="sum", fill_value=0)
+    daily = daily.reindex(pd.date_range(daily.index.min(), daily.index.max(), freq="D"), fill_value=0)
+    previous = daily.shift(1, fill_value=0)
+    rows = pd.MultiIndex.from_arrays([kw["day"], kw["series"]])
+    prev_24h = pd.Series(previous.stack().reindex(rows).to_numpy(), index=kw.index).fillna(0)
+    prev_7d = pd.Series(previous.rolling(7, min_periods=1).mean().stack().reindex(rows).to_numpy(), index=kw.index).fillna(0)
+    growth_24h = (kw["count"] - prev_24h) / (prev_24h + 1) * 100
+    growth_7d = (kw["count"] - prev_7d) / (prev_7d + 1) * 100
+    kw["momentum"] = _momentum_points(growth_24h.to_numpy(), (growth_24h - growth_7d).to_numpy())
+
+    # 최근성 + 게시 빈도 보너스
+    kw["recency"] = (
+        _recency_points(kw["latest_age"].to_numpy())
+        + np.where(kw["last_6h"] > 10, 2.0, 0.0)
+        + np.where(kw["last_12h"] > 20, 3.0, 0.0)
+    )
+
+    kw["score"] = (kw["popularity"] + kw["momentum"] + kw["recency"] + kw["multi_source"]).round(4)
+    return kw
+
+
+class HotIssueScorer:
+    """국가 단위 점수 재계산 + 저장"""
+
+    def __init__(self, window_days: int = 30):
+        self.window_days = window_days
+        self.keyword_repo = KeywordRepository()
+        self.youtube_repo = YouTubeRepository()
+        self.news_repo = NewsRepository()
+
+    async def rescore_country(self, country: str) -> Dict[str, int]:
+        """국가의 최근 window_days 콘텐츠 전체 점수 갱신"""
+        since = datetime.now(timezone.utc) - timedelta(days=self.window_days)
+
+        videos = await self.youtube_repo.get_for_scoring(country, since)
+        articles = await self.news_repo.get_for_scoring(country, since)
+        keywords = await self.keyword_repo.get_for_scoring(country, since)
+        if not videos and not articles:
+            return {"items": 0, "keywords": 0}
+
+        import pandas as pd
+
+        frames = []
+        if videos:
+            frames.append(pd.DataFrame(videos).assign(kind="youtube", source="YouTube"))
+        if articles:
+            frames.append(pd.DataFrame(articles).assign(kind="news"))
+        items = pd.concat(frames, ignore_index=True)
+
+        scored = score_items(items)
+        for kind, repo in (("youtube", self.youtube_repo), ("news", self.news_repo)):
+            part = scored[scored["kind"] == kind]
+            if not part.empty:
+                await repo.update_scores(part["id"].astype(int).tolist(), part["score"].astype(float).tolist())
+
+        keyword_count = 0
+        if keywords:
+            kw_scored = score_keywords(scored, pd.DataFrame(keywords))
+            await self.keyword_repo.update_scores(kw_scored["id"].astype(int).tolist(), kw_scored["score"].astype(float).tolist())
+            keyword_count = len(kw_scored)
+
+        logger.info(f"📈 핫이슈 점수 갱신 ({country}): 콘텐츠 {len(scored)}개, 키워드 {keyword_count}개")
+        return {"items": len(scored), "keywords": keyword_count}
@@ -1,10 +1,16 @@
 """
 트렌드 수집 비즈니스 로직
 """
+from datetime import datetime, timezone
+from typing import List
 from loguru import logger
-from datetime import datetime
 
 from .schemas import TrendCollectionResponse, PlatformKeywordsResponse
+from ..core.cache import response_cache
+from ..core.config import settings
+from .keyword_engine import keyword_engine
+from ..core.database import advisory_lock
+from ..utils.singleflight import SingleFlight
 
 # API Clients
 from ..clients.youtube_client import YouTubeClient
@@ -13,11 +19,27 @@ from ..clients.nate_client import NateClient
 from ..clients.reddit_client import RedditClient
 from ..clients.yahoo_japan_client import YahooJapanClient
 from ..clients.ai_keyword_extractor import AIKeywordExtractor
+from ..clients.instagram_client import create_instagram_client
 
 # Repositories
 from .repositories.keyword_repo import KeywordRepository
 from .repositories.youtube_repo import YouTubeRepository
 from .repositories.news_repo import NewsRepository
+from .repositories.instagram_repo import InstagramRepository
+from .records import VideoRecord, unique_by
+from .scoring import HotIssueScorer
+from .dedupe import NearDuplicateDetector
+from .keyword_matcher import KeywordMatcher
+from .embeddings import embedding_index
+from .sketches import term_tracker
+from .spikes import SpikeDetector
+from .rollups import RollupService
+from ..core.tracing import span
+
+# 프로세스 전역 수집 병합기 (키: (country, source), 소스별 분산 잠금 키와 동일)
+_collect_flight = SingleFlight()
+# Instagram 백그라운드 수집 (키: country, 진행 중이면 새로 시작하지 않음 -> Apify 실행 누적 방지)
+_instagram_flight = SingleFlight()
 
 class TrendService:
     """트렌드 수집 및 분석 서비스"""
@@ -30,49 +52,109 @@ class TrendService:
         self.reddit_client = RedditClient()
         self.yahoo_japan_client = YahooJapanClient()
         self.ai_extractor = AIKeywordExtractor()
+        self.instagram_client = create_instagram_client()  # INSTAGRAM_BACKEND=off면 None
         
         # Repositories
         self.keyword_repo = KeywordRepository()
         self.youtube_repo = YouTubeRepository()
         self.news_repo = NewsRepository()
+        self.instagram_repo = InstagramRepository()
+        self.scorer = HotIssueScorer()
+        self.deduper = NearDuplicateDetector()
+        self.spike_detector = SpikeDetector()
+        self.rollups = RollupService()
 
     async def collect_trending_contents(self, country: str, source: str = "auto") -> TrendCollectionResponse:
+        """
+        실시간 인기 콘텐츠 수집 (동시 요청 병합)
+        - 같은 (국가, 소스) 요청만 병합: 같은 프로세스는 진행 중인 수집에 합류, 다른 워커/호스트는 소스별 Advisory Lock
+        - 소스가 다른 수집은 합류하지 않고 국가 잠금을 기다린 뒤 직접 실행
+          (용어 스케치/급상승/배경 코퍼스의 국가별 read-modify-write가 국가 단위 직렬화에 의존)
+        """
+        return await _collect_flight.do((country, source), self._collect_exclusive, country, source)
+
+    async def _collect_exclusive(self, country: str, source: str) -> TrendCollectionResponse:
+        """
+        분산 잠금 하에서 수집 실행 (잠금 순서: 소스 -> 국가, 항상 같은 순서라 교착 없음)
+        - 소스 잠금: 같은 (국가, 소스) 수집을 다른 프로세스가 끝냈으면 저장 결과 재사용
+        - 국가 잠금: 다른 소스 수집이 끝날 때까지 기다렸다가 획득 후 실행
+        """
+        waited_since = datetime.now(timezone.utc)
+        lock_options = {"poll_seconds": settings.COLLECT_LOCK_POLL_SECONDS, "timeout": settings.COLLECT_LOCK_WAIT_SECONDS}
+        try:
+            async with advisory_lock(f"collect-trending:{country}:{source}", **lock_options) as acquired:
+                if acquired:
+                    async with advisory_lock(f"collect-trending:{country}", hold_after_wait=True, **lock_options):
+                        return await self._collect_trending_contents(country, source)
+        except TimeoutError:
+            logger.warning(f"⏳ 다른 프로세스의 {country} 수집 대기 시간 초과 (source={source})")
+            return TrendCollectionResponse(
+                success=False,
+                message=f"{country} 수집이 다른 프로세스에서 진행 중입니다. 잠시 후 다시 시도하세요.",
+                keywords_count=0
+            )
+
+        # 다른 프로세스가 방금 같은 소스의 수집을 끝냄 -> 중복 수집 대신 저장된 결과를 DB에서 다시 읽음
+        logger.info(f"🔗 다른 프로세스의 {country} 수집(source={source}) 완료 대기 후 저장 결과 재사용")
+        return await self._load_collected(country, waited_since)
+
+    async def _load_collected(self, country: str, since: datetime) -> TrendCollectionResponse:
+        """다른 프로세스가 같은 소스로 저장한 오늘 수집 결과 (일별 키워드 행 집계 + 대기 시작 이후 감지된 급상승 이벤트)"""
+        keyword_obj = await self.keyword_repo.get_or_create_daily_keyword(country)
+        youtube_count = keyword_obj.get("youtube_videos") or 0
+        news_count = keyword_obj.get("news_count") or 0
+        instagram_count = keyword_obj.get("instagram_posts") or 0
+        total = youtube_count + news_count + instagram_count
+        spikes = await self.spike_detector.recent(country, since=since)
+        return TrendCollectionResponse(
+            success=True,
+            message=f"{country} 수집이 다른 프로세스에서 완료되어 저장된 콘텐츠 {total}개를 사용합니다.",
+            keywords_count=total,
+            spikes=spikes,
+            instagram_count=instagram_count,
+            youtube_count=youtube_count,
+            news_count=news_count
+        )
+
+    async def _collect_trending_contents(self, country: str, source: str = "auto") -> TrendCollectionResponse:
         """
         실시간 인기 콘텐츠 수집 로직 (Keyword Driven)
         :param source: 'auto', 'nate', 'reddit'
         """
         logger.info(f"🔥 실시간 인기 콘텐츠 수집 시작 ({country}, source={source})")
         
-        # 1. 키워드 ID 확보
-        keyword_obj = await self.keyword_repo.get_or_create_daily_keyword(country)
-        keyword_id = keyword_obj['id']
-        trend_keywords = []
+        with span("collect.keywords", country=country, source=source) as stage:
+            # 1. 키워드 ID 확보
+            keyword_obj = await self.keyword_repo.get_or_create_daily_keyword(country)
+            keyword_id = keyword_obj['id']
+            trend_keywords = []
 
-        # 2. 트렌드 키워드 수집
-        if source == "nate":
-            if country == 'KR':
-                trend_keywords = await self.nate_client.get_realtime_trends()
-            else:
-                logger.warning("⚠️ Nate는 한국(KR)만 지원합니다.")
+            # 2. 트렌드 키워드 수집
+            if source == "nate":
+                if country == 'KR':
+                    trend_keywords = await self.nate_client.get_realtime_trends()
+                else:
+                    logger.warning("⚠️ Nate는 한국(KR)만 지원합니다.")
                 
-        elif source == "reddit":
-            trend_keywords = await self.reddit_client.get_global_trends()
-
-        else: # source == "auto" or others
-            if country == 'KR':
-                # KR -> Nate 우선
-                trend_keywords = await self.nate_client.get_realtime_trends()
-                if not trend_keywords:
-                    logger.warning("⚠️ Nate 수집 실패 -> Reddit(Global) 대체 시도")
-                    trend_keywords = await self.reddit_client.get_global_trends()
-            else:
-                # KR 외 -> Reddit (Global)
-                # Pytrends/Signal 제거로 인해 글로벌 소스는 Reddit이 유일함
+            elif source == "reddit":
                 trend_keywords = await self.reddit_client.get_global_trends()
 
+            else: # source == "auto" or others
+                if country == 'KR':
+                    # KR -> Nate 우선
+                    trend_keywords = await self.nate_client.get_realtime_trends()
+                    if not trend_keywords:
+                        logger.warning("⚠️ Nate 수집 실패 -> Reddit(Global) 대체 시도")
+                        trend_keywords = await self.reddit_client.get_global_trends()
+                else:
+                    # KR 외 -> Reddit (Global)
+                    # Pytrends/Signal 제거로 인해 글로벌 소스는 Reddit이 유일함
+                    trend_keywords = await self.reddit_client.get_global_trends()
+
 
-        # 수집 대상 키워드 선정 (Top 20)
-        target_keywords = trend_keywords[:20] if trend_keywords else []
+            # 수집 대상 키워드 선정 (유사 표현 병합 후 Top 20 -> 중복 YouTube 검색 방지)
+            target_keywords = self.deduper.dedupe_keywords(trend_keywords)[:20] if trend_keywords else []
+            stage.set(keywords=len(target_keywords))
         
         if not target_keywords:
              logger.warning(f"⚠️ 수집된 키워드가 없습니다. (Source: {source}, Country: {country})")
@@ -80,60 +162,157 @@ class TrendService:
         else:
              logger.info(f"🎯 최종 수집 대상 키워드: {target_keywords}")
 
-        total_videos = []
-        total_news = []
+        # 3-0. Instagram은 백그라운드 실행 (수집 응답/통계 갱신이 기다리지 않음)
+        # - 게시물 저장 문장이 keywords.instagram_posts를 직접 갱신하고, 끝나면 점수 재계산 + 캐시 무효화
+        instagram_pending = bool(self.instagram_client and target_keywords)
+        if instagram_pending:
+            if _instagram_flight.is_inflight(country):
+                logger.info(f"🔗 {country} Instagram 수집이 이미 진행 중 -> 이번 회차는 건너뜀")
+            else:
+                _instagram_flight.start(country, self._collect_instagram, keyword_id, country, target_keywords)
+
+        total_videos: List[VideoRecord] = []
         
-        # 3. 키워드 기반 콘텐츠 수집
-        if target_keywords:
-            for keyword in target_keywords:
-                # 3-1. YouTube 검색
-                found_videos = await self.youtube_client.search_videos(keyword, max_results=3)
-                total_videos.extend(found_videos)
+        with span("collect.youtube", country=country, keywords=len(target_keywords)):
+            # 3. 키워드 기반 콘텐츠 수집
+            if target_keywords:
+                for keyword in target_keywords:
+                    # 3-1. YouTube 검색
+                    found_videos = await self.youtube_client.search_videos(keyword, max_results=3)
+                    total_videos.extend(found_videos)
                 
-                # 3-2. News 검색 (생략. 전체 뉴스에서 매칭하거나, 향후 검색 기능 추가)
-        
-        # [보완] 콘텐츠 부족 시 YouTube 인급동(Trending) 추가
-        if len(total_videos) < 10:
-             trending_videos = await self.youtube_client.get_trending_videos(country, max_results=10)
-             total_videos.extend(trending_videos)
-
-        # 4. 일반 뉴스(RSS) 수집 - 키워드 무관
-        headlines = await self.rss_client.fetch_google_news(country)
-        for hl in headlines:
-            total_news.append({
-                'title': hl['keyword'], 
-                'source': 'Google News',
-                'description': '',
-                'url': hl.get('url', ''),
-                'published_at': hl.get('published_at') or datetime.now().isoformat()
-            })
+                    # 3-2. News는 키워드별 검색 대신 아래 RSS 헤드라인 전체를 한 번에 매칭 (5-2)
+        
+            # [보완] 콘텐츠 부족 시 YouTube 인급동(Trending) 추가
+            if len(total_videos) < 10:
+                 trending_videos = await self.youtube_client.get_trending_videos(country, max_results=10)
+                 total_videos.extend(trending_videos)
+
+        with span("collect.rss", country=country):
+            # 4. 일반 뉴스(RSS) 수집 - 키워드 무관
+            total_news = await self.rss_client.fetch_google_news(country)
             
-        # 5. DB 저장
-        unique_videos = {v['video_id']: v for v in total_videos}.values()
-        unique_news = {n['url']: n for n in total_news if n.get('url')}.values()
+        with span("collect.dedupe", country=country, videos=len(total_videos), news=len(total_news)):
+            # 5. DB 저장 (레코드는 복사 없이 이후 단계에서 그대로 사용)
+            unique_videos = unique_by(total_videos, "video_id")
+            unique_news = unique_by(total_news, "url")
+        
+            # 5-1. 유사 중복 헤드라인 병합 (수집분 내부 -> 과거 이력 순)
+            unique_news = self.deduper.dedupe_items(unique_news)
+            unique_news, news_duplicates = await self.deduper.filter_against_history(country, "news", unique_news)
+        
+            # 5-2. 헤드라인 <-> 트렌드 키워드 매칭 (Aho-Corasick 1회 스캔)
+            keyword_coverage = KeywordMatcher(target_keywords).annotate(unique_news) if target_keywords else {}
+        
+        with span("collect.save", country=country, videos=len(unique_videos), news=len(unique_news)):
+            # 재수집 행은 collected_at이 오늘로 이동 -> 이전 수집일 집계도 갱신 대상
+            try:
+                rollup_days = await self.rollups.affected_days(country, unique_videos, unique_news)
+            except Exception as e:
+                logger.error(f"❌ 집계 대상 일자 조회 실패: {e}")
+                rollup_days = []
+        
+            video_result = await self.youtube_repo.save_videos(keyword_id, country, unique_videos)
+            inserted_urls = await self.news_repo.save_articles(keyword_id, country, unique_news)
+            await self.news_repo.add_duplicates(country, news_duplicates)
+            await self.deduper.remember(country, "news", unique_news)
         
-        youtube_res = await self.youtube_repo.save_videos(keyword_id, country, list(unique_videos))
-        await self.news_repo.save_articles(keyword_id, country, list(unique_news))
+            logger.info(f"✅ 저장 완료: YouTube {len(unique_videos)}개, News {len(unique_news)}개")
         
-        logger.info(f"✅ 저장 완료: YouTube {len(unique_videos)}개, News {len(unique_news)}개")
+        with span("collect.embeddings", country=country):
+            # 5-3. 제목/키워드 임베딩 배치 계산 (실패해도 수집 결과는 유지)
+            try:
+                await embedding_index.index(country, "youtube", unique_videos)
+                await embedding_index.index(country, "news", unique_news)
+                await embedding_index.index_keywords(country, target_keywords)
+            except Exception as e:
+                logger.error(f"❌ 임베딩 저장 실패: {e}")
 
-        # 6. 통계 업데이트
-        await self.keyword_repo.update_statistics(keyword_id)
+        with span("collect.statistics", country=country):
+            # 6. 통계 업데이트 (instagram_posts는 백그라운드 게시물 저장 문장에서 따로 갱신됨)
+            await self.keyword_repo.update_statistics(keyword_id)
+            await self.scorer.rescore_country(country)
+        
+        with span("collect.rollups_spikes", country=country, days=len(rollup_days)):
+            # 6-1. 일자별 집계 갱신 (이번 회차가 건드린 일자만)
+            try:
+                await self.rollups.refresh(country, rollup_days)
+            except Exception as e:
+                logger.error(f"❌ 일자별 집계 갱신 실패: {e}")
+        
+            # 6-2. 급상승/신규 키워드 탐지 (순위 + 매칭 뉴스 수 EWMA)
+            try:
+                spikes = await self.spike_detector.observe(country, target_keywords, keyword_coverage)
+            except Exception as e:
+                logger.error(f"❌ 급상승 탐지 실패: {e}")
+                spikes = []
+        
+        # 데이터 세대 증가 -> 해당 국가 응답 캐시 즉시 무효화
+        await response_cache.bump_generation(country)
+        
+        with span("collect.sketches", country=country):
+            # 로컬 키워드 엔진 배경 코퍼스 갱신 (오늘 수집분은 날짜가 바뀐 뒤 배경에 편입 -> 오늘 점수에 이중 집계 없음)
+            all_titles = [v.title for v in unique_videos] + [n.title for n in unique_news]
+            try:
+                await keyword_engine.observe(all_titles, country)
+            except Exception as e:
+                logger.error(f"❌ 키워드 배경 코퍼스 갱신 실패: {e}")
+        
+            # Heavy-Hitter 용어 스케치 갱신 (기간별 급상승 용어 조회용)
+            # - 신규 저장분만 반영: 재수집된 같은 영상/기사가 수집할 때마다 다시 집계되지 않도록
+            inserted_videos = set(video_result["inserted"])
+            inserted_news = set(inserted_urls)
+            new_titles = [v.title for v in unique_videos if v.video_id in inserted_videos]
+            new_titles += [n.title for n in unique_news if n.url in inserted_news]
+            try:
+                await term_tracker.observe(country, new_titles, target_keywords)
+            except Exception as e:
+                logger.error(f"❌ 용어 스케치 갱신 실패: {e}")
         
         total = len(unique_videos) + len(unique_news)
         
         # 7. GenAI 마케팅 키워드 추출
-        all_contents = list(unique_videos) + list(unique_news)
-        ai_keywords = await self.ai_extractor.extract_marketing_keywords(all_contents)
+        with span("collect.ai_keywords", country=country):
+            all_contents = unique_videos + unique_news
+            ai_keywords = await self.ai_extractor.extract_marketing_keywords(all_contents)
         
         return TrendCollectionResponse(
             success=True,
             message=f"콘텐츠 {total}개 수집 완료 (키워드: {', '.join(target_keywords[:5])}...)",
             keywords_count=total,
             top_keywords=target_keywords,
-            ai_keywords=ai_keywords
+            ai_keywords=ai_keywords,
+            keyword_coverage=keyword_coverage,
+            spikes=spikes,
+            instagram_count=None if instagram_pending else 0,  # 백그라운드 저장 전이라 이번 회차 수는 아직 모름
+            instagram_pending=instagram_pending,
+            youtube_count=len(unique_videos),
+            news_count=len(unique_news)
         )
 
+    async def _collect_instagram(self, keyword_id: int, country: str, keywords: list) -> int:
+        """
+        해시태그 동시 수집 -> post_id 기준 일괄 Upsert (백그라운드, 실패해도 다른 소스 수집은 유지)
+        - 저장 문장이 keywords.instagram_posts 갱신 -> 점수 재계산 + 응답 캐시 무효화
+        """
+        with span("collect.instagram", country=country, keywords=len(keywords)) as stage:
+            try:
+                posts = await self.instagram_client.fetch_for_keywords(keywords)
+                saved = await self.instagram_repo.save_posts(keyword_id, country, posts)
+            except Exception as e:
+                logger.error(f"❌ Instagram 수집/저장 실패: {e}")
+                return 0
+            stage.set(posts=saved)
+            logger.info(f"✅ Instagram 저장 완료: {saved}개")
+
+        if saved:
+            try:
+                await self.scorer.rescore_country(country)
+                await response_cache.bump_generation(country)
+            except Exception as e:
+                logger.error(f"❌ Instagram 저장 후 점수/캐시 갱신 실패: {e}")
+        return saved
+
     async def get_platform_keywords(self, country: str) -> PlatformKeywordsResponse:
         """
         플랫폼별 실시간 검색어 수집
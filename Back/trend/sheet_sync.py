@@ -0,0 +1,189 @@
+"""
+표 형식 싱크 동기화 (Google Sheets 호환, 행 단위 diff)
+- 소스별 워터마크(변경 시각 updated_at, id) 이후 바뀐 행만 조회 -> 시트의 키 컬럼과 비교해 신규는 append, 기존은 행 덮어쓰기
+- 실행 1회 호출 수: 탭별 키 컬럼 읽기 1회 + 청크 수만큼 append/batchUpdate (행마다 호출하던 n8n 방식 대체)
+- 청크: SYNC_CHUNK_ROWS행 / SYNC_CHUNK_BYTES 이하, 쓰기 호출 간격 60/SYNC_WRITE_CALLS_PER_MINUTE초
+- 429/5xx: 지수 백오프 후 같은 청크 재시도
+- 재개: 청크가 성공할 때마다 워터마크 저장, 중단 후 재실행 시 이미 시트에 들어간 행은 키 비교로 update 처리 (중복 append 없음)
+- diff 기준 updated_at은 수집/재수집뿐 아니라 키워드 집계(콘텐츠 수)/점수/중복 수 갱신 시에도 바뀜
+  -> 수집 후 점수만 다시 계산된 행도 다음 실행에서 반영
+
+실행 (저장소 루트):
+  python -m Back.trend.sheet_sync [--sink gsheets|file] [--dir sheet_sync] [--source youtube --source news] [--country KR] [--reset]
+"""
+import argparse
+import asyncio
+import time
+from datetime import date, datetime, timedelta, timezone
+from typing import Dict, List, Optional, Sequence, Tuple
+
+from loguru import logger
+
+from ..clients.sheets_client import TabularSink, create_sink
+from ..core.config import settings
+from .repositories.export_repo import ExportRepository, export_columns
+from .repositories.sync_repo import SyncStateRepository
+
+# 소스 -> (탭 이름, 키 컬럼) / 워터마크는 각 테이블의 updated_at (ExportRepository.fetch_changed)
+SYNC_SOURCES = {
+    "keywords": ("trend_keywords", "id"),
+    "youtube": ("trend_youtube", "video_id"),
+    "news": ("trend_news", "url"),
+}
+
+_MAX_RETRIES = 5
+
+
+def _cell(value) -> str:
+    """시트 셀 값 (RAW 입력: 문자열로 통일)"""
+    if value is None:
+        return ""
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    if isinstance(value, (list, tuple)):
+        return "|".join(str(v) for v in value)
+    return str(value)
+
+
+def chunk_rows(rows: List[list], max_rows: int, max_bytes: int) -> List[List[list]]:
+    """행 수/대략적 요청 크기 상한으로 분할 (행 1개가 상한을 넘어도 단독 청크로 보냄)"""
+    chunks: List[List[list]] = []
+    current: List[list] = []
+    size = 0
+    for row in rows:
+        row_bytes = sum(len(cell) for cell in row) + 4 * len(row)
+        if current and (len(current) >= max_rows or size + row_bytes > max_bytes):
+            chunks.append(current)
+            current, size = [], 0
+        current.append(row)
+        size += row_bytes
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+class _WritePacer:
+    """쓰기 호출 최소 간격 유지 (분당 호출 한도)"""
+
+    def __init__(self, calls_per_minute: int):
+        self.interval = 60.0 / calls_per_minute if calls_per_minute > 0 else 0.0
+        self.next_at = 0.0
+
+    async def wait(self):
+        delay = self.next_at - time.monotonic()
+        if delay > 0:
+            await asyncio.sleep(delay)
+        self.next_at = time.monotonic() + self.interval
+
+
+class SheetSyncService:
+    """DB -> 표 형식 싱크 diff 동기화"""
+
+    def __init__(self, sink: TabularSink):
+        self.sink = sink
+        self.export_repo = ExportRepository()
+        self.state_repo = SyncStateRepository()
+        self.pacer = _WritePacer(settings.SYNC_WRITE_CALLS_PER_MINUTE)
+        self.calls = 0
+
+    async def _call(self, func, *args):
+        """싱크 쓰기 호출 (속도 제한 + 일시 오류 재시도)"""
+        for attempt in range(_MAX_RETRIES + 1):
+            await self.pacer.wait()
+            self.calls += 1
+            try:
+                return await func(*args)
+            except Exception as e:
+                if attempt == _MAX_RETRIES or not self.sink.is_retryable(e):
+                    raise
+                backoff = min(2 ** attempt, 60)
+                logger.warning(f"⏳ 싱크 호출 제한/일시 오류, {backoff}s 후 재시도 ({attempt + 1}/{_MAX_RETRIES}): {e}")
+                await asyncio.sleep(backoff)
+
+    async def _write(self, tab: str, keys: Dict[str, int], key_pos: int, rows: List[List[str]]) -> Tuple[int, int]:
+        """한 페이지 반영 -> (append 수, update 수). 페이지 내 같은 키는 마지막 행만"""
+        latest: Dict[str, List[str]] = {}
+        for row in rows:
+            latest[row[key_pos]] = row
+
+        updates = [(keys[key], row) for key, row in latest.items() if key in keys]
+        appends = [row for key, row in latest.items() if key not in keys]
+
+        # chunk_rows는 순서를 유지하므로 updates를 같은 길이로 잘라 (행 번호, 값) 청크로 사용
+        position = 0
+        for chunk in chunk_rows([row for _, row in updates], settings.SYNC_CHUNK_ROWS, settings.SYNC_CHUNK_BYTES):
+            await self._call(self.sink.update_rows, tab, updates[position:position + len(chunk)])
+            position += len(chunk)
+
+        next_row = max(keys.values(), default=1) + 1
+        for chunk in chunk_rows(appends, settings.SYNC_CHUNK_ROWS, settings.SYNC_CHUNK_BYTES):
+            start = await self._call(self.sink.append_rows, tab, chunk) or next_row
+            for offset, row in enumerate(chunk):
+                keys[row[key_pos]] = start + offset
+            next_row = start + len(chunk)
+
+        return len(appends), len(latest) - len(appends)
+
+    async def sync_source(self, source: str, countries: Optional[List[str]] = None, reset: bool = False) -> Dict[str, int]:
+        tab, key_name = SYNC_SOURCES[source]
+        columns = [name for name, _ in export_columns(source)]
+        key_pos, id_pos = columns.index(key_name), columns.index("id")
+
+        # 국가 필터가 다르면 diff 대상도 다르므로 워터마크를 따로 관리
+        state_key = f"{self.sink.name}|{','.join(sorted(countries))}" if countries else self.sink.name
+        if reset:
+            await self.state_repo.reset(state_key, source)
+        state = await self.state_repo.get_state(state_key, source) or {}
+        watermark_at, watermark_id = state.get("watermark_at"), state.get("watermark_id") or 0
+
+        self.calls += 1
+        keys = await self.sink.prepare(tab, columns, key_pos)
+        until = datetime.now(timezone.utc) - timedelta(seconds=settings.SYNC_LAG_SECONDS)
+        totals = {"appended": 0, "updated": 0}
+
+        while True:
+            page = await self.export_repo.fetch_changed(
+                source, watermark_at, watermark_id, until, countries, settings.SYNC_SCAN_ROWS
+            )
+            if not page:
+                break
+            appended, updated = await self._write(tab, keys, key_pos, [[_cell(v) for v in row] for row, _ in page])
+            last_row, watermark_at = page[-1]
+            watermark_id = last_row[id_pos]
+            await self.state_repo.advance(state_key, source, watermark_at, watermark_id, appended, updated)
+            totals["appended"] += appended
+            totals["updated"] += updated
+            if len(page) < settings.SYNC_SCAN_ROWS:
+                break
+
+        logger.info(f"🔁 {source} -> {self.sink.name}/{tab}: 추가 {totals['appended']}행, 갱신 {totals['updated']}행")
+        return totals
+
+    async def sync(self, sources: Sequence[str] = tuple(SYNC_SOURCES), countries: Optional[List[str]] = None, reset: bool = False) -> Dict[str, Dict[str, int]]:
+        started = time.perf_counter()
+        result = {source: await self.sync_source(source, countries, reset) for source in sources}
+        logger.info(f"✅ 싱크 동기화 완료: 호출 {self.calls}회 ({time.perf_counter() - started:.1f}s)")
+        return result
+
+
+async def _main():
+    parser = argparse.ArgumentParser(description="DB -> Google Sheets(호환) diff 동기화")
+    parser.add_argument("--sink", choices=["gsheets", "file"], default=None, help="기본: SYNC_SINK")
+    parser.add_argument("--dir", default=None, help="file 싱크 디렉터리 (기본: SYNC_FILE_DIR)")
+    parser.add_argument("--source", action="append", choices=sorted(SYNC_SOURCES), default=None)
+    parser.add_argument("--country", default=None, help="쉼표 구분 (미지정 시 전체)")
+    parser.add_argument("--reset", action="store_true", help="워터마크를 지우고 전체 재비교")
+    args = parser.parse_args()
+
+    countries = [c.strip().upper() for c in args.country.split(",") if c.strip()] if args.country else None
+
+    from ..core.database import close_pool
+    try:
+        service = SheetSyncService(create_sink(args.sink, args.dir))
+        await service.sync(args.source or tuple(SYNC_SOURCES), countries, args.reset)
+    finally:
+        await close_pool()
+
+
+if __name__ == "__main__":
+    asyncio.run(_main())
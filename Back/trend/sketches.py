@@ -0,0 +1,238 @@
+"""
+스트리밍 Heavy-Hitter 용어 추적 (Count-Min Sketch + Space-Saving)
+- 수집 시 제목/트렌드 키워드의 용어를 국가 x 일자(UTC) 버킷 스케치에 증분 반영
+- 스케치는 고정 크기 + 병합 가능 -> 임의 기간/국가 Top-K를 콘텐츠 테이블 스캔 없이 상수 메모리로 계산
+- 버킷은 압축 바이트로 Postgres(term_sketches)에 저장
+"""
+import hashlib
+import heapq
+import json
+import struct
+import zlib
+from datetime import datetime, timedelta, timezone
+from typing import Dict, Iterable, List, Optional, Tuple
+
+import numpy as np
+from loguru import logger
+
+from ..core.config import settings
+from .keyword_engine import title_terms
+from .repositories.sketch_repo import SketchRepository
+
+_MAGIC = b"TSK1"
+_HEADER = struct.Struct("<4sIIIQ")  # magic, width, depth, capacity, total
+
+
+def _term_hashes(term: str) -> Tuple[int, int]:
+    digest = hashlib.blake2b(term.encode("utf-8"), digest_size=16).digest()
+    return int.from_bytes(digest[:8], "little"), int.from_bytes(digest[8:], "little") | 1
+
+
+class CountMinSketch:
+    """Count-Min Sketch (과대 추정만 발생, 같은 크기끼리 원소별 합으로 병합)"""
+
+    def __init__(self, width: int, depth: int, table: Optional[np.ndarray] = None):
+        self.width = width
+        self.depth = depth
+        self.table = table if table is not None else np.zeros((depth, width), dtype=np.uint32)
+
+    def _columns(self, term: str) -> np.ndarray:
+        h1, h2 = _term_hashes(term)
+        return np.array([(h1 + i * h2) % self.width for i in range(self.depth)], dtype=np.int64)
+
+    def add(self, term: str, count: int = 1):
+        self.table[np.arange(self.depth), self._columns(term)] += np.uint32(count)
+
+    def estimate(self, term: str) -> int:
+        return int(self.table[np.arange(self.depth), self._columns(term)].min())
+
+    def merge(self, other: "CountMinSketch"):
+        if (self.width, self.depth) != (other.width, other.depth):
+            raise ValueError("크기가 다른 Count-Min Sketch는 병합할 수 없습니다.")
+        self.table += other.table
+
+
+class SpaceSaving:
+    """
+    Space-Saving Top-K 요약 (capacity개 카운터)
+    - 카운터가 가득 차면 최솟값 카운터를 새 용어로 교체 (error = 교체 전 최솟값)
+    """
+
+    def __init__(self, capacity: int):
+        self.capacity = capacity
+        self.counts: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._heap: List[Tuple[int, str]] = []
+
+    def _push(self, term: str):
+        heapq.heappush(self._heap, (self.counts[term], term))
+        # 갱신으로 무효화된 항목이 쌓이면 재구성
+        if len(self._heap) > self.capacity * 4:
+            self._heap = [(c, t) for t, c in self.counts.items()]
+            heapq.heapify(self._heap)
+
+    def _pop_min(self) -> Tuple[str, int]:
+        while True:
+            count, term = heapq.heappop(self._heap)
+            if self.counts.get(term) == count:
+                return term, count
+
+    def min_count(self) -> int:
+        if len(self.counts) < self.capacity or not self.counts:
+            return 0
+        return min(self.counts.values())
+
+    def add(self, term: str, count: int = 1):
+        if term in self.counts:
+            self.counts[term] += count
+        elif len(self.counts) < self.capacity:
+            self.counts[term] = count
+            self.errors[term] = 0
+        else:
+            evicted, floor = self._pop_min()
+            del self.counts[evicted]
+            del self.errors[evicted]
+            self.counts[term] = floor + count
+            self.errors[term] = floor
+        self._push(term)
+
+    def merge(self, other: "SpaceSaving"):
+        """병합 요약: 한쪽에 없는 용어는 그쪽 최솟값을 상한으로 가산 후 상위 capacity개 유지"""
+        floor_a, floor_b = self.min_count(), other.min_count()
+        counts: Dict[str, int] = {}
+        errors: Dict[str, int] = {}
+        for term in set(self.counts) | set(other.counts):
+            count_a = self.counts.get(term, floor_a)
+            count_b = other.counts.get(term, floor_b)
+            counts[term] = count_a + count_b
+            errors[term] = (
+                (self.errors.get(term, floor_a)) + (other.errors.get(term, floor_b))
+            )
+        top = heapq.nlargest(self.capacity, counts.items(), key=lambda x: x[1])
+        self.counts = dict(top)
+        self.errors = {t: errors[t] for t in self.counts}
+        self._heap = [(c, t) for t, c in self.counts.items()]
+        heapq.heapify(self._heap)
+
+    def top(self, k: int) -> List[Tuple[str, int, int]]:
+        return [(t, c, self.errors[t]) for t, c in heapq.nlargest(k, self.counts.items(), key=lambda x: x[1])]
+
+
+class TermSketch:
+    """버킷 1개의 스케치 (CMS + Space-Saving)"""
+
+    def __init__(self, width: int, depth: int, capacity: int):
+        self.cms = CountMinSketch(width, depth)
+        self.heavy = SpaceSaving(capacity)
+        self.total = 0
+
+    @classmethod
+    def empty(cls) -> "TermSketch":
+        return cls(settings.SKETCH_WIDTH, settings.SKETCH_DEPTH, settings.SKETCH_CAPACITY)
+
+    def add_counts(self, counts: Dict[str, int]):
+        # 큰 값부터 넣어야 Space-Saving 교체 오차가 작아짐
+        for term, count in sorted(counts.items(), key=lambda x: -x[1]):
+            self.cms.add(term, count)
+            self.heavy.add(term, count)
+            self.total += count
+
+    def merge(self, other: "TermSketch"):
+        self.cms.merge(other.cms)
+        self.heavy.merge(other.heavy)
+        self.total += other.total
+
+    def top(self, k: int) -> List[dict]:
+        """상위 k개 (count는 Space-Saving/CMS 상한 중 작은 값)"""
+        results = []
+        for term, count, error in self.heavy.top(k):
+            estimate = min(count, self.cms.estimate(term))
+            results.append({"term": term, "count": estimate, "error": min(error, estimate)})
+        return sorted(results, key=lambda x: x["count"], reverse=True)
+
+    def to_bytes(self) -> bytes:
+        header = _HEADER.pack(_MAGIC, self.cms.width, self.cms.depth, self.heavy.capacity, self.total)
+        heavy = json.dumps(
+            [[t, c, self.heavy.errors[t]] for t, c in self.heavy.counts.items()],
+            ensure_ascii=False, separators=(",", ":")
+        ).encode("utf-8")
+        return zlib.compress(header + struct.pack("<I", len(heavy)) + heavy + self.cms.table.tobytes())
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "TermSketch":
+        raw = zlib.decompress(data)
+        magic, width, depth, capacity, total = _HEADER.unpack_from(raw)
+        if magic != _MAGIC:
+            raise ValueError("알 수 없는 스케치 포맷")
+        offset = _HEADER.size
+        (heavy_len,) = struct.unpack_from("<I", raw, offset)
+        offset += 4
+        sketch = cls(width, depth, capacity)
+        for term, count, error in json.loads(raw[offset:offset + heavy_len].decode("utf-8")):
+            sketch.heavy.counts[term] = count
+            sketch.heavy.errors[term] = error
+        sketch.heavy._heap = [(c, t) for t, c in sketch.heavy.counts.items()]
+        heapq.heapify(sketch.heavy._heap)
+        offset += heavy_len
+        sketch.cms.table = np.frombuffer(raw, dtype=np.uint32, count=width * depth, offset=offset).reshape(depth, width).copy()
+        sketch.total = total
+        return sketch
+
+
+def bucket_start(at: Optional[datetime] = None) -> datetime:
+    """UTC 일자 버킷 시작 시각"""
+    at = at or datetime.now(timezone.utc)
+    return at.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+
+
+class TermTracker:
+    """국가 x 일자 버킷 스케치 증분 갱신 + 기간 Top-K 조회"""
+
+    def __init__(self):
+        self.repo = SketchRepository()
+
+    async def observe(self, country: str, titles: Iterable[str], keywords: Iterable[str] = (), at: Optional[datetime] = None):
+        """
+        수집분 반영 (신규 저장된 제목당 용어 1회 = 문서 빈도, 트렌드 키워드는 구문 그대로 1회)
+        - 같은 국가 수집은 advisory lock으로 직렬화되므로 버킷 read-modify-write가 안전
+        """
+        counts: Dict[str, int] = {}
+        for title in titles:
+            for term in title_terms(title or "", country):
+                counts[term] = counts.get(term, 0) + 1
+        for keyword in keywords:
+            term = " ".join(str(keyword).lower().split())
+            if term:
+                counts[term] = counts.get(term, 0) + 1
+        if not counts:
+            return
+
+        bucket = bucket_start(at)
+        row = await self.repo.get_bucket(country, bucket)
+        sketch = TermSketch.from_bytes(row["data"]) if row else TermSketch.empty()
+        sketch.add_counts(counts)
+        await self.repo.save_bucket(country, bucket, sketch.to_bytes(), sketch.total)
+        logger.info(f"📊 용어 스케치 갱신 ({country} {bucket.date()}): 용어 {len(counts)}개")
+
+    async def top_terms(self, countries: Optional[List[str]] = None, days: int = 7, k: int = 20) -> Dict:
+        """최근 days일 버킷을 병합한 Top-K (버킷 수와 무관하게 스케치 1개 크기의 메모리)"""
+        since = bucket_start() - timedelta(days=days - 1)
+        merged: Optional[TermSketch] = None
+        buckets = 0
+        async for data in self.repo.iter_buckets(countries, since):
+            sketch = TermSketch.from_bytes(data)
+            if merged is None:
+                merged = sketch
+            else:
+                merged.merge(sketch)
+            buckets += 1
+
+        return {
+            "buckets": buckets,
+            "total_terms": merged.total if merged else 0,
+            "terms": merged.top(k) if merged else [],
+        }
+
+
+# 프로세스 전역 트래커
+term_tracker = TermTracker()
@@ -0,0 +1,108 @@
+"""
+키워드 급상승 탐지 (EWMA z-score)
+- (국가, 정규화 키워드)별로 순위 / 언급 빈도의 지수가중 평균·분산을 유지
+- 관측 1회당 O(1) 갱신, 키워드당 실수 4개만 저장 -> 수백만 키워드도 감당
+- 과거 평균 대비 z-score가 임계값을 넘으면 rank_spike / freq_spike, 처음 보는 키워드는 new
+"""
+import math
+from datetime import datetime, timedelta, timezone
+from typing import Dict, List, Optional, Tuple
+
+from loguru import logger
+
+from ..core.config import settings
+from .keyword_matcher import normalize
+from .repositories.keyword_stats_repo import KeywordStatsRepository
+
+# 분산이 0에 가까울 때 z-score 폭주 방지용 최소 표준편차
+_MIN_STD = 1.0
+
+
+def ewma_update(mean: float, var: float, value: float, alpha: float) -> Tuple[float, float]:
+    """지수가중 평균/분산 증분 갱신"""
+    diff = value - mean
+    increment = alpha * diff
+    return mean + increment, (1 - alpha) * (var + diff * increment)
+
+
+def z_score(value: float, mean: float, var: float) -> float:
+    return (value - mean) / max(math.sqrt(max(var, 0.0)), _MIN_STD)
+
+
+class SpikeDetector:
+    """수집 회차별 키워드 관측 -> EWMA 상태 갱신 + 급상승 판정"""
+
+    def __init__(self, alpha: Optional[float] = None, threshold: Optional[float] = None):
+        self.alpha = alpha or settings.SPIKE_EWMA_ALPHA
+        self.threshold = threshold or settings.SPIKE_Z_THRESHOLD
+        self.min_observations = settings.SPIKE_MIN_OBSERVATIONS
+        self.repo = KeywordStatsRepository()
+
+    def evaluate(self, state: Optional[dict], rank: int, freq: int) -> Tuple[dict, Optional[dict]]:
+        """
+        관측 1건 평가 (갱신 전 상태 기준 z-score)
+        :return: (갱신된 상태, 이벤트 또는 None)
+        """
+        if state is None:
+            new_state = {"rank_mean": float(rank), "rank_var": 0.0, "freq_mean": float(freq), "freq_var": 0.0, "observations": 1}
+            return new_state, {"event": "new", "z": None}
+
+        # 순위는 숫자가 작을수록 상위 -> 평균보다 올라간 정도를 양수로
+        z_rank = -z_score(rank, state["rank_mean"], state["rank_var"])
+        z_freq = z_score(freq, state["freq_mean"], state["freq_var"])
+
+        rank_mean, rank_var = ewma_update(state["rank_mean"], state["rank_var"], rank, self.alpha)
+        freq_mean, freq_var = ewma_update(state["freq_mean"], state["freq_var"], freq, self.alpha)
+        new_state = {
+            "rank_mean": rank_mean, "rank_var": rank_var,
+            "freq_mean": freq_mean, "freq_var": freq_var,
+            "observations": state["observations"] + 1,
+        }
+
+        event = None
+        if state["observations"] >= self.min_observations:
+            if z_rank >= self.threshold and z_rank >= z_freq:
+                event = {"event": "rank_spike", "z": round(z_rank, 3)}
+            elif z_freq >= self.threshold:
+                event = {"event": "freq_spike", "z": round(z_freq, 3)}
+        return new_state, event
+
+    async def observe(self, country: str, keywords: List[str], frequencies: Optional[Dict[str, int]] = None) -> List[dict]:
+        """
+        수집 회차 관측 반영
+        :param keywords: 순위순 트렌드 키워드
+        :param frequencies: 키워드별 언급 빈도 (매칭 뉴스 수 등)
+        :return: 이번 회차에 감지된 이벤트 리스트
+        """
+        frequencies = frequencies or {}
+        observations: Dict[str, Tuple[str, int, int]] = {}
+        for rank, keyword in enumerate(keywords, start=1):
+            key = normalize(keyword)[:200]
+            if key and key not in observations:
+                observations[key] = (keyword, rank, int(frequencies.get(keyword, 0)))
+        if not observations:
+            return []
+
+        states = await self.repo.get_states(country, list(observations))
+        rows, events = [], []
+        for key, (keyword, rank, freq) in observations.items():
+            state, event = self.evaluate(states.get(key), rank, freq)
+            rows.append({
+                "country": country, "keyword": key, **state,
+                "event": event["event"] if event else None,
+                "z": event["z"] if event else None,
+                "rank": rank if event else None,
+                "freq": freq if event else None,
+            })
+            if event:
+                events.append({"keyword": keyword, **event, "rank": rank, "frequency": freq})
+
+        await self.repo.save_states(rows)
+        spikes = [e for e in events if e["event"] != "new"]
+        if spikes:
+            logger.info(f"🚀 급상승 키워드 ({country}): {[e['keyword'] for e in spikes]}")
+        return events
+
+    async def recent(self, country: str, hours: int = 24, limit: int = 50, since: Optional[datetime] = None) -> List[dict]:
+        since = since or datetime.now(timezone.utc) - timedelta(hours=hours)
+        return await self.repo.get_recent_events(country, since, limit)
@@ -0,0 +1,330 @@
+"""
+HTTP 기록/재생(Record/Replay) 트랜스포트
+- 스크래퍼(requests), RSS(requests -> feedparser), YouTube(googleapiclient/httplib2), LLM(openai/httpx)이
+  같은 카세트 저장소를 공유
+- 모든 모드에서 소스별 외부 호출 지연/오류 메트릭 기록 (Back/core/metrics.py)
+- settings.HTTP_MODE
+  live  : 그대로 네트워크 호출 (기본)
+  record: 네트워크 호출 + 요청/응답 쌍을 카세트(gzip JSONL)에 추가 기록
+  replay: 네트워크 없이 카세트에서 응답 (HTTP_REPLAY_SPEED 배속 지연, HTTP_REPLAY_CONCURRENCY 동시성 제한)
+- 매칭 규칙(HTTP_MATCH_ON): method, host, path, query(정렬 + HTTP_IGNORE_PARAMS 제외), body(sha1)
+  같은 키의 기록이 여러 개면 순환 재생, body 불일치 시 body를 뺀 규칙으로 한 번 더 조회
+"""
+import asyncio
+import base64
+import gzip
+import hashlib
+import json
+import threading
+import time
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+from loguru import logger
+
+from ..core import metrics
+from ..core.config import settings
+
+
+class CassetteMiss(Exception):
+    """재생 모드에서 일치하는 기록이 없음"""
+
+
+def _encode_body(content: bytes) -> dict:
+    """텍스트 응답은 그대로(gzip 압축 효율), 바이너리만 base64"""
+    try:
+        return {"text": content.decode("utf-8")}
+    except UnicodeDecodeError:
+        return {"body": base64.b64encode(content).decode("ascii")}
+
+
+class Cassette:
+    """요청/응답 기록 저장소 (프로세스 전역, 스레드 안전)"""
+
+    def __init__(self, path: Path, match_on: List[str], ignore_params: List[str]):
+        self.path = path
+        self.match_on = match_on
+        self.ignore_params = set(ignore_params)
+        self._lock = threading.Lock()
+        self._entries: Dict[str, List[dict]] = {}
+        self._loose: Dict[str, List[dict]] = {}
+        self._loose_rules = [m for m in match_on if m != "body"]
+        self._cursor: Dict[str, int] = {}
+        if path.exists():
+            self._load()
+
+    def _load(self):
+        count = 0
+        with gzip.open(self.path, "rt", encoding="utf-8") as f:
+            for line in f:
+                if line.strip():
+                    self._index(json.loads(line))
+                    count += 1
+        logger.info(f"📼 카세트 로드: {self.path.name} ({count}건)")
+
+    def _normalize_url(self, url: str) -> str:
+        parts = urlsplit(url)
+        query = sorted((k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True) if k not in self.ignore_params)
+        return urlunsplit((parts.scheme, parts.netloc, parts.path, urlencode(query), ""))
+
+    def make_key(self, method: str, url: str, body: Optional[bytes], match_on: Optional[List[str]] = None) -> str:
+        match_on = match_on or self.match_on
+        parts = urlsplit(self._normalize_url(url))
+        fields = []
+        if "method" in match_on:
+            fields.append(method.upper())
+        if "host" in match_on:
+            fields.append(parts.netloc)
+        if "path" in match_on:
+            fields.append(parts.path)
+        if "query" in match_on:
+            fields.append(parts.query)
+        if "body" in match_on:
+            fields.append(hashlib.sha1(body or b"").hexdigest())
+        return " ".join(fields)
+
+    def _index(self, entry: dict):
+        self._entries.setdefault(entry["key"], []).append(entry)
+        if "body" in self.match_on:
+            loose = self.make_key(entry["method"], entry["url"], None, self._loose_rules)
+            self._loose.setdefault(loose, []).append(entry)
+
+    def record(self, method: str, url: str, body: Optional[bytes], status: int, headers: Dict[str, str], content: bytes, elapsed: float):
+        # 인증 정보가 카세트에 남지 않도록 무시 대상 파라미터는 제거한 URL로 저장
+        entry = {
+            "key": self.make_key(method, url, body),
+            "method": method.upper(),
+            "url": self._normalize_url(url),
+            "status": status,
+            "headers": {k: v for k, v in headers.items() if k.lower() in ("content-type", "content-encoding")},
+            **_encode_body(content),
+            "elapsed": round(elapsed, 4),
+        }
+        with self._lock:
+            self._index(entry)
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            with gzip.open(self.path, "at", encoding="utf-8") as f:
+                f.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+    def lookup(self, method: str, url: str, body: Optional[bytes]) -> Tuple[int, Dict[str, str], bytes, float]:
+        key = self.make_key(method, url, body)
+        with self._lock:
+            entries = self._entries.get(key)
+            if not entries and "body" in self.match_on:
+                # 요청 본문만 다른 경우 (프롬프트 순서 등) 본문을 뺀 규칙으로 대체 응답
+                key = "~" + self.make_key(method, url, None, self._loose_rules)
+                entries = self._loose.get(key[1:])
+            if not entries:
+                raise CassetteMiss(f"카세트에 없는 요청: {key}")
+            index = self._cursor.get(key, 0)
+            self._cursor[key] = index + 1
+            entry = entries[index % len(entries)]
+        content = entry["text"].encode("utf-8") if "text" in entry else base64.b64decode(entry["body"])
+        return entry["status"], entry["headers"], content, entry["elapsed"]
+
+
+_cassette: Optional[Cassette] = None
+_cassette_lock = threading.Lock()
+_sync_slots: Optional[threading.BoundedSemaphore] = None
+_async_slots: Dict[int, asyncio.Semaphore] = {}
+
+
+def mode() -> str:
+    return settings.HTTP_MODE
+
+
+def get_cassette() -> Cassette:
+    global _cassette, _sync_slots
+    with _cassette_lock:
+        if _cassette is None:
+            path = Path(settings.HTTP_CASSETTE_DIR) / f"{settings.HTTP_CASSETTE}.jsonl.gz"
+            _cassette = Cassette(
+                path,
+                [m.strip() for m in settings.HTTP_MATCH_ON.split(",") if m.strip()],
+                [p.strip() for p in settings.HTTP_IGNORE_PARAMS.split(",") if p.strip()],
+            )
+            if settings.HTTP_REPLAY_CONCURRENCY > 0:
+                _sync_slots = threading.BoundedSemaphore(settings.HTTP_REPLAY_CONCURRENCY)
+        return _cassette
+
+
+def _replay_delay(elapsed: float) -> float:
+    return elapsed / settings.HTTP_REPLAY_SPEED if settings.HTTP_REPLAY_SPEED > 0 else 0.0
+
+
+def replay_sync(method: str, url: str, body: Optional[bytes]) -> Tuple[int, Dict[str, str], bytes]:
+    """동기 클라이언트용 재생 (동시성 슬롯 + 배속 지연)"""
+    cassette = get_cassette()
+    if _sync_slots is not None:
+        _sync_slots.acquire()
+    try:
+        status, headers, content, elapsed = cassette.lookup(method, url, body)
+        delay = _replay_delay(elapsed)
+        if delay:
+            time.sleep(delay)
+        return status, headers, content
+    finally:
+        if _sync_slots is not None:
+            _sync_slots.release()
+
+
+async def replay_async(method: str, url: str, body: Optional[bytes]) -> Tuple[int, Dict[str, str], bytes]:
+    """비동기 클라이언트용 재생 (이벤트 루프별 세마포어)"""
+    cassette = get_cassette()
+    slots = None
+    if settings.HTTP_REPLAY_CONCURRENCY > 0:
+        loop_id = id(asyncio.get_running_loop())
+        slots = _async_slots.setdefault(loop_id, asyncio.Semaphore(settings.HTTP_REPLAY_CONCURRENCY))
+        await slots.acquire()
+    try:
+        status, headers, content, elapsed = cassette.lookup(method, url, body)
+        delay = _replay_delay(elapsed)
+        if delay:
+            await asyncio.sleep(delay)
+        return status, headers, content
+    finally:
+        if slots is not None:
+            slots.release()
+
+
+def _observe(source: str, status: Optional[int], elapsed: float, error: Optional[BaseException] = None):
+    """외부 호출 메트릭 (모든 모드 공통, 재생 시에는 재생 지연 기준)"""
+    metrics.outbound_request_seconds.observe(elapsed, source, str(status) if status else "error")
+    if error is not None:
+        metrics.outbound_errors.inc(source, type(error).__name__)
+    elif status and status >= 400:
+        metrics.outbound_errors.inc(source, str(status))
+
+
+# ===== requests =====
+
+def http_session(source: str):
+    """
+    스크래퍼/RSS용 requests.Session
+    - 모든 모드에서 소스별 호출 메트릭 기록, record/replay 모드면 카세트 경유
+    """
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    class CassetteAdapter(HTTPAdapter):
+        def _replay(self, request):
+            status, headers, content = replay_sync(request.method, request.url, _body(request.body))
+            response = requests.Response()
+            response.status_code = status
+            response.headers.update(headers)
+            response._content = content
+            response.url = request.url
+            response.request = request
+            response.encoding = requests.utils.get_encoding_from_headers(response.headers)
+            return response
+
+        def send(self, request, **kwargs):
+            start = time.perf_counter()
+            try:
+                if mode() == "replay":
+                    response = self._replay(request)
+                else:
+                    response = super().send(request, **kwargs)
+                    if mode() == "record":
+                        get_cassette().record(
+                            request.method, request.url, _body(request.body), response.status_code,
+                            dict(response.headers), response.content, time.perf_counter() - start
+                        )
+            except Exception as e:
+                _observe(source, None, time.perf_counter() - start, e)
+                raise
+            _observe(source, response.status_code, time.perf_counter() - start)
+            return response
+
+    session = requests.Session()
+    adapter = CassetteAdapter()
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _body(body) -> Optional[bytes]:
+    return body.encode("utf-8") if isinstance(body, str) else body
+
+
+# ===== httpx (openai) =====
+
+def httpx_async_client(source: str):
+    """openai AsyncOpenAI(http_client=...)용 httpx 클라이언트 (호출 메트릭 + record/replay)"""
+    import httpx
+
+    class CassetteTransport(httpx.AsyncBaseTransport):
+        def __init__(self):
+            self._live = httpx.AsyncHTTPTransport()
+
+        async def _send(self, request: httpx.Request) -> httpx.Response:
+            if mode() == "live":
+                return await self._live.handle_async_request(request)
+
+            body = await request.aread()
+            if mode() == "replay":
+                status, headers, content = await replay_async(request.method, str(request.url), body)
+                headers = {k: v for k, v in headers.items() if k.lower() != "content-encoding"}
+                return httpx.Response(status, headers=headers, content=content, request=request)
+
+            start = time.perf_counter()
+            response = await self._live.handle_async_request(request)
+            content = await response.aread()
+            get_cassette().record(
+                request.method, str(request.url), body, response.status_code,
+                {k: v for k, v in response.headers.items() if k.lower() != "content-encoding"},
+                content, time.perf_counter() - start
+            )
+            headers = [(k, v) for k, v in response.headers.items() if k.lower() not in ("content-encoding", "content-length")]
+            return httpx.Response(response.status_code, headers=headers, content=content, request=request)
+
+        async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+            start = time.perf_counter()
+            try:
+                response = await self._send(request)
+            except Exception as e:
+                _observe(source, None, time.perf_counter() - start, e)
+                raise
+            _observe(source, response.status_code, time.perf_counter() - start)
+            return response
+
+        async def aclose(self):
+            await self._live.aclose()
+
+    return httpx.AsyncClient(transport=CassetteTransport(), timeout=httpx.Timeout(60.0, connect=5.0))
+
+
+# ===== httplib2 (googleapiclient) =====
+
+def googleapi_http(source: str):
+    """googleapiclient build(http=...)용 httplib2.Http (호출 메트릭 + record/replay)"""
+    import httplib2
+
+    class CassetteHttp(httplib2.Http):
+        def _send(self, uri, method, body, headers, *args, **kwargs):
+            if mode() == "replay":
+                status, resp_headers, content = replay_sync(method, uri, _body(body))
+                return httplib2.Response({"status": str(status), **resp_headers}), content
+
+            start = time.perf_counter()
+            response, content = super().request(uri, method, body, headers, *args, **kwargs)
+            if mode() == "record":
+                get_cassette().record(
+                    method, uri, _body(body), response.status,
+                    {k: v for k, v in response.items() if k.lower() == "content-type"},
+                    content, time.perf_counter() - start
+                )
+            return response, content
+
+        def request(self, uri, method="GET", body=None, headers=None, *args, **kwargs):
+            start = time.perf_counter()
+            try:
+                response, content = self._send(uri, method, body, headers, *args, **kwargs)
+            except Exception as e:
+                _observe(source, None, time.perf_counter() - start, e)
+                raise
+            _observe(source, response.status, time.perf_counter() - start)
+            return response, content
+
+    return CassetteHttp(timeout=30)
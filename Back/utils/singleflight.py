@@ -0,0 +1,35 @@
+"""
+Single-Flight 요청 병합 유틸리티
+- 같은 키로 동시에 들어온 요청은 진행 중인 1회 실행에 합류하여 결과를 공유
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+from loguru import logger
+
+
+class SingleFlight:
+    """키별 진행 중 작업(Task) 공유"""
+
+    def __init__(self):
+        self._inflight: Dict[Hashable, asyncio.Task] = {}
+
+    def is_inflight(self, key: Hashable) -> bool:
+        return key in self._inflight
+
+    async def do(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """
+        key로 진행 중인 작업이 있으면 합류, 없으면 새로 실행
+        - 호출자 한 명이 취소(연결 끊김)되어도 공유 작업은 계속 진행 (shield)
+        """
+        if key in self._inflight:
+            logger.info(f"🔗 진행 중인 작업에 합류: {key}")
+        return await asyncio.shield(self.start(key, func, *args, **kwargs))
+
+    def start(self, key: Hashable, func: Callable[..., Awaitable[Any]], *args, **kwargs) -> asyncio.Task:
+        """기다리지 않고 실행만 (백그라운드 작업, 진행 중이면 기존 Task 반환)"""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(func(*args, **kwargs))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _: self._inflight.pop(key, None))
+        return task
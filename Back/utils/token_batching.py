@@ -0,0 +1,159 @@
+"""
+토큰 예산 기반 배치 분할 + Map-Reduce 유틸리티
+- 제목 리스트를 프롬프트 토큰 예산에 맞춰 청크로 분할
+- 청크별 LLM 분석을 동시성 제한 하에 병렬 실행 (지연 목표 초과 시 남은 청크 포기)
+- 청크 결과를 count 가중 합산으로 병합
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, TypeVar
+from loguru import logger
+
+T = TypeVar("T")
+
+_encoding = None
+
+
+def _get_encoding():
+    """tiktoken 인코더 지연 로딩 (미설치 시 None)"""
+    global _encoding
+    if _encoding is None:
+        try:
+            import tiktoken
+            _encoding = tiktoken.get_encoding("cl100k_base")
+        except Exception as e:
+            logger.warning(f"⚠️ tiktoken 로딩 실패, 근사 토큰 계산 사용: {e}")
+            _encoding = False
+    return _encoding or None
+
+
+def count_tokens(text: str) -> int:
+    """텍스트 토큰 수 (tiktoken 없으면 글자 수 기반 근사)"""
+    encoding = _get_encoding()
+    if encoding is not None:
+        return len(encoding.encode(text))
+    # CJK는 글자당 1토큰 이상, 영문은 4글자당 1토큰 정도 -> 보수적으로 2글자당 1토큰
+    return max(1, len(text) // 2)
+
+
+def split_by_token_budget(titles: List[str], budget: int) -> List[List[str]]:
+    """
+    순서를 유지하며 토큰 예산 이내의 청크로 분할
+    - 단일 제목이 예산을 넘으면 해당 제목 하나로 청크 구성
+    """
+    chunks: List[List[str]] = []
+    current: List[str] = []
+    used = 0
+
+    for title in titles:
+        tokens = count_tokens(title) + 1  # 줄바꿈 구분자
+        if current and used + tokens > budget:
+            chunks.append(current)
+            current, used = [], 0
+        current.append(title)
+        used += tokens
+
+    if current:
+        chunks.append(current)
+    return chunks
+
+
+async def map_chunks(
+    chunks: List[List[str]],
+    mapper: Callable[[List[str]], Awaitable[T]],
+    concurrency: int = 4,
+    timeout: Optional[float] = None
+) -> List[T]:
+    """
+    청크별 mapper를 동시성 제한(Semaphore) 하에 병렬 실행
+    - timeout(초) 내 끝나지 않은 청크는 취소하고 완료된 결과만 반환
+    - 실패한 청크는 로그 후 제외
+    """
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def _run(chunk: List[str]) -> T:
+        async with semaphore:
+            return await mapper(chunk)
+
+    tasks = [asyncio.ensure_future(_run(chunk)) for chunk in chunks]
+    done, pending = await asyncio.wait(tasks, timeout=timeout)
+
+    for task in pending:
+        task.cancel()
+    if pending:
+        logger.warning(f"⏱️ 지연 목표 초과: {len(pending)}/{len(tasks)}개 청크 분석 생략")
+
+    results = []
+    for task in tasks:
+        if task not in done:
+            continue
+        if task.exception() is not None:
+            logger.error(f"❌ 청크 분석 실패: {task.exception()}")
+            continue
+        results.append(task.result())
+    return results
+
+
+def _norm(keyword: str) -> str:
+    return " ".join(keyword.split()).lower()
+
+
+def merge_keyword_dicts(chunk_results: List[List[Dict[str, Any]]], top_n: Optional[int] = None) -> List[Dict[str, Any]]:
+    """
+    청크별 [{keyword, keyword_kr, count, reason}, ...] 결과를 count 가중 병합
+    - 같은 키워드(정규화 기준)는 count 합산
+    - reason/keyword_kr은 가장 큰 count를 준 청크의 값을 사용
+    """
+    merged: Dict[str, Dict[str, Any]] = {}
+    best_count: Dict[str, float] = {}
+
+    for result in chunk_results:
+        for item in result or []:
+            keyword = str(item.get("keyword", "")).strip()
+            if not keyword:
+                continue
+            key = _norm(keyword)
+            try:
+                count = float(item.get("count", 1) or 1)
+            except (TypeError, ValueError):
+                count = 1.0
+
+            if key not in merged:
+                merged[key] = {**item, "keyword": keyword, "count": 0}
+                best_count[key] = -1.0
+            merged[key]["count"] += count
+            if count > best_count[key]:
+                best_count[key] = count
+                for field in ("keyword_kr", "reason"):
+                    if item.get(field):
+                        merged[key][field] = item[field]
+
+    for item in merged.values():
+        if float(item["count"]).is_integer():
+            item["count"] = int(item["count"])
+
+    ranked = sorted(merged.values(), key=lambda x: x["count"], reverse=True)
+    return ranked[:top_n] if top_n else ranked
+
+
+def merge_keyword_lists(chunk_results: List[Tuple[List[str], float]], top_n: Optional[int] = None) -> List[str]:
+    """
+    청크별 (키워드 문자열 리스트, 가중치) 결과를 가중 병합
+    - 가중치: 청크 크기(제목 수). 여러 청크에 등장할수록, 큰 청크일수록 상위
+    - 청크 내 순위가 높을수록 가중치 소폭 가산
+    """
+    scores: Dict[str, float] = {}
+    display: Dict[str, str] = {}
+
+    for result, weight in chunk_results:
+        size = len(result) or 1
+        for rank, keyword in enumerate(result):
+            key = _norm(keyword)
+            if not key:
+                continue
+            display.setdefault(key, keyword.strip())
+            scores[key] = scores.get(key, 0.0) + weight * (1.0 + (size - rank) / size)
+
+    ranked = sorted(scores, key=lambda k: scores[k], reverse=True)
+    if top_n:
+        ranked = ranked[:top_n]
+    return [display[k] for k in ranked]
@@ -1,6 +1,14 @@
 import apiClient from './client';
 
 export const trendApi = {
+  // 대시보드 1회 조회 (콘텐츠 + 분석 키워드 + 마지막 플랫폼 검색어, 서버 캐시 경유 / AI 보강은 별도 요청)
+  getDashboard: async (country = 'KR', limit = 50, top_n = 6, enrich = false) => {
+    const response = await apiClient.get('/trend/dashboard', {
+      params: { country, limit, top_n, enrich }
+    });
+    return response.data;
+  },
+
   // 실시간 인기 콘텐츠 수집 (YouTube + News)
   collectTrending: async (country = 'KR', source = 'auto') => {
     const response = await apiClient.post(`/trend/collect-trending?country=${country}&source=${source}`);
@@ -15,10 +23,10 @@ export const trendApi = {
     return response.data;
   },
 
-  // 트렌드 키워드 분석 (AI)
-  getTrendingKeywords: async (country = 'KR', top_n = 10) => {
+  // 트렌드 키워드 분석 (enrich: AI 보강 결과 요청, 준비 전이면 로컬 결과)
+  getTrendingKeywords: async (country = 'KR', top_n = 10, enrich = false) => {
     const response = await apiClient.get('/trend/trending/keywords', {
-      params: { country, top_n }
+      params: { country, top_n, enrich }
     });
     return response.data;
   },
@@ -20,14 +20,19 @@ const TrendCollector = () => {
     setKeywords([]); // 국가 변경 시 분석 결과 초기화
     setTopKeywords([]); // 키워드 배너 초기화
     setTranslateMode(false); // 번역 모드도 초기화
+    setPlatformKeywords([]); // 대시보드 응답의 마지막 플랫폼 검색어로 채움 (버튼은 즉시 재수집)
     fetchContents();
   }, [country]);
 
   const fetchContents = async () => {
     try {
-      const res = await trendApi.getTrendingContents(country, 50);
-      if (res && res.youtube) {
-        setContents(res);
+      // 페이지 로딩은 대시보드 1회 호출 (캐시된 콘텐츠 + 로컬 분석 키워드 + 마지막 플랫폼 검색어, AI/외부 스크래핑 없음)
+      const res = await trendApi.getDashboard(country, 50, 6, false);
+      if (res && res.contents) {
+        setContents(res.contents);
+        setKeywords(res.keywords || []);
+        const platform = res.platform_keywords;
+        setPlatformKeywords(platform && platform.success ? platform.keywords : []);
       }
     } catch (err) {
       console.error('조회 실패', err);
@@ -92,7 +97,7 @@ const TrendCollector = () => {
     setAnalyzing(true);
     try {
       // AI 분석 API 호출 (top_n=6 정도로 카드 UI에 알맞게)
-      const res = await trendApi.getTrendingKeywords(country, 6);
+      const res = await trendApi.getTrendingKeywords(country, 6, true);
       if (res && res.keywords) {
         setKeywords(res.keywords);
       }
@@ -106,9 +111,10 @@ const TrendCollector = () => {
 
   const [filter, setFilter] = useState('All'); // 필터 상태 추가
 
+  // 서버 핫이슈 점수(score) 사용, 점수 미계산 항목만 기존 방식으로 대체
   const allItems = [
-    ...contents.youtube.map(item => ({ ...item, type: 'video', score: Math.floor(item.views / 1000), source: 'YouTube' })),
-    ...contents.news.map((item, idx) => ({ ...item, type: item.source === '실시간 검색어' ? 'keyword' : 'news', score: item.source === '실시간 검색어' ? 100 : 99 - idx }))
+    ...contents.youtube.map(item => ({ ...item, type: 'video', score: item.score ?? Math.floor(item.views / 1000), source: 'YouTube' })),
+    ...contents.news.map((item, idx) => ({ ...item, type: item.source === '실시간 검색어' ? 'keyword' : 'news', score: item.score ?? (item.source === '실시간 검색어' ? 100 : 99 - idx) }))
   ].sort((a, b) => b.score - a.score);
 
   // 필터링 적용
@@ -440,7 +446,7 @@ const TrendCollector = () => {
                     {item.type === 'video' ? 'YouTube' : item.source || 'News'}
                   </td>
                   <td style={{ padding: '1rem', textAlign: 'center', fontWeight: 'bold', color: 'var(--primary)' }}>
-                    {item.type === 'video' ? `${(item.views / 1000).toFixed(0)}K` : item.score}
+                    {item.type === 'video' ? `${(item.views / 1000).toFixed(0)}K` : Math.round(item.score)}
                   </td>
                   <td style={{ padding: '1rem', textAlign: 'center' }}>
                     <span style={{ padding: '0.3rem 0.8rem', borderRadius: '12px', background: item.type === 'video' ? 'rgba(255,0,0,0.2)' : 'rgba(0,150,255,0.2)', fontSize: '0.8rem' }}>
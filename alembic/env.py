@@ -15,7 +15,7 @@ sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 # 프로젝트 설정 및 모델 임포트
 from Back.core.config import settings
-from Back.core.database import Base
+from Back.core.base import Base
 # 모델들이 Base에 등록되도록 반드시 import 해야 함
 from Back.trend import models
 
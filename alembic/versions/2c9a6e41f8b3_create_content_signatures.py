@@ -0,0 +1,47 @@
+"""create content signatures
+
+Revision ID: 2c9a6e41f8b3
+Revises: 8d4f0c6b2e17
+Create Date: 2026-10-19 12:10:31.552087
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2c9a6e41f8b3'
+down_revision: Union[str, Sequence[str], None] = '8d4f0c6b2e17'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('content_signatures',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('content_key', sa.Text(), nullable=False),
+    sa.Column('signature', sa.LargeBinary(), nullable=False),
+    sa.Column('bands', postgresql.ARRAY(sa.BigInteger()), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('kind', 'content_key', name='uq_content_signatures_kind_key')
+    )
+    op.create_index(op.f('ix_content_signatures_id'), 'content_signatures', ['id'], unique=False)
+    op.create_index('ix_content_signatures_bands', 'content_signatures', ['bands'], unique=False, postgresql_using='gin')
+    op.create_index('ix_content_signatures_scope', 'content_signatures', ['country', 'kind', 'created_at'], unique=False)
+    op.add_column('news_contents', sa.Column('duplicate_count', sa.Integer(), server_default='0', nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('news_contents', 'duplicate_count')
+    op.drop_index('ix_content_signatures_scope', table_name='content_signatures')
+    op.drop_index('ix_content_signatures_bands', table_name='content_signatures')
+    op.drop_index(op.f('ix_content_signatures_id'), table_name='content_signatures')
+    op.drop_table('content_signatures')
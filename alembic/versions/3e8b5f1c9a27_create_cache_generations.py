@@ -0,0 +1,33 @@
+"""create cache generations
+
+Revision ID: 3e8b5f1c9a27
+Revises: a4c1e8f27b90
+Create Date: 2026-10-19 21:05:41.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3e8b5f1c9a27'
+down_revision: Union[str, Sequence[str], None] = 'a4c1e8f27b90'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('cache_generations',
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('generation', sa.BigInteger(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=False),
+    sa.PrimaryKeyConstraint('country')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('cache_generations')
@@ -0,0 +1,53 @@
+"""create content embeddings
+
+Revision ID: 4f1d8b6c3e92
+Revises: 9a7c1f35d604
+Create Date: 2026-10-19 15:02:47.318204
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from pgvector.sqlalchemy import Vector
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4f1d8b6c3e92'
+down_revision: Union[str, Sequence[str], None] = '9a7c1f35d604'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute('CREATE EXTENSION IF NOT EXISTS vector')
+    op.create_table('content_embeddings',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('content_key', sa.Text(), nullable=False),
+    sa.Column('title', sa.Text(), nullable=False),
+    sa.Column('text_hash', sa.String(length=64), nullable=False),
+    sa.Column('model', sa.String(length=100), nullable=False),
+    sa.Column('embedding', Vector(384), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('kind', 'country', 'content_key', name='uq_content_embeddings_kind_key')
+    )
+    op.create_index(op.f('ix_content_embeddings_id'), 'content_embeddings', ['id'], unique=False)
+    op.create_index('ix_content_embeddings_hash', 'content_embeddings', ['text_hash', 'model'], unique=False)
+    op.create_index(
+        'ix_content_embeddings_hnsw', 'content_embeddings', ['embedding'], unique=False,
+        postgresql_using='hnsw',
+        postgresql_with={'m': 16, 'ef_construction': 64},
+        postgresql_ops={'embedding': 'vector_cosine_ops'}
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_content_embeddings_hnsw', table_name='content_embeddings')
+    op.drop_index('ix_content_embeddings_hash', table_name='content_embeddings')
+    op.drop_index(op.f('ix_content_embeddings_id'), table_name='content_embeddings')
+    op.drop_table('content_embeddings')
@@ -0,0 +1,31 @@
+"""widen youtube counts
+
+Revision ID: 5f8a3c1e6d42
+Revises: 9c4e2a7d1f58
+Create Date: 2026-10-19 23:58:12.640915
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f8a3c1e6d42'
+down_revision: Union[str, Sequence[str], None] = '9c4e2a7d1f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.alter_column('youtube_contents', 'views', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=True)
+    op.alter_column('youtube_contents', 'likes', existing_type=sa.Integer(), type_=sa.BigInteger(), existing_nullable=True)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    # INTEGER 범위를 넘는 값이 있으면 실패 (데이터 손실 대신 중단)
+    op.alter_column('youtube_contents', 'likes', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=True)
+    op.alter_column('youtube_contents', 'views', existing_type=sa.BigInteger(), type_=sa.Integer(), existing_nullable=True)
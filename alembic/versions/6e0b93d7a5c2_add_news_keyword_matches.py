@@ -0,0 +1,31 @@
+"""add news keyword matches
+
+Revision ID: 6e0b93d7a5c2
+Revises: 2c9a6e41f8b3
+Create Date: 2026-10-19 12:41:08.117630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6e0b93d7a5c2'
+down_revision: Union[str, Sequence[str], None] = '2c9a6e41f8b3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('news_contents', sa.Column('matched_keywords', postgresql.ARRAY(sa.String(length=200)), nullable=True))
+    op.add_column('news_contents', sa.Column('keyword_match_count', sa.Integer(), server_default='0', nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_column('news_contents', 'keyword_match_count')
+    op.drop_column('news_contents', 'matched_keywords')
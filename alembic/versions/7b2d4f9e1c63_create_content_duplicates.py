@@ -0,0 +1,35 @@
+"""create content duplicates
+
+Revision ID: 7b2d4f9e1c63
+Revises: 3e8b5f1c9a27
+Create Date: 2026-10-19 22:14:09.527316
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7b2d4f9e1c63'
+down_revision: Union[str, Sequence[str], None] = '3e8b5f1c9a27'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('content_duplicates',
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('content_key', sa.Text(), nullable=False),
+    sa.Column('canonical_key', sa.Text(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('created_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('kind', 'content_key')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('content_duplicates')
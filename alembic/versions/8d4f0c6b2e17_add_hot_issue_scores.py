@@ -0,0 +1,38 @@
+"""add hot issue scores
+
+Revision ID: 8d4f0c6b2e17
+Revises: 5b1e7d2a9c40
+Create Date: 2026-10-19 11:40:52.901344
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8d4f0c6b2e17'
+down_revision: Union[str, Sequence[str], None] = '5b1e7d2a9c40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.add_column('youtube_contents', sa.Column('score', sa.Float(), nullable=True))
+    op.add_column('news_contents', sa.Column('score', sa.Float(), nullable=True))
+    op.create_index('ix_youtube_contents_keyword_score', 'youtube_contents', ['keyword_id', 'score'], unique=False)
+    op.create_index('ix_youtube_contents_country_collected', 'youtube_contents', ['keyword_country', 'collected_at'], unique=False)
+    op.create_index('ix_news_contents_keyword_score', 'news_contents', ['keyword_id', 'score'], unique=False)
+    op.create_index('ix_news_contents_country_collected', 'news_contents', ['keyword_country', 'collected_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_news_contents_country_collected', table_name='news_contents')
+    op.drop_index('ix_news_contents_keyword_score', table_name='news_contents')
+    op.drop_index('ix_youtube_contents_country_collected', table_name='youtube_contents')
+    op.drop_index('ix_youtube_contents_keyword_score', table_name='youtube_contents')
+    op.drop_column('news_contents', 'score')
+    op.drop_column('youtube_contents', 'score')
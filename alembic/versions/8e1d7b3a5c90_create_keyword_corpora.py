@@ -0,0 +1,35 @@
+"""create keyword corpora
+
+Revision ID: 8e1d7b3a5c90
+Revises: 5f8a3c1e6d42
+Create Date: 2026-10-20 00:21:45.183027
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e1d7b3a5c90'
+down_revision: Union[str, Sequence[str], None] = '5f8a3c1e6d42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('keyword_corpora',
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('day', sa.String(length=8), nullable=False),
+    sa.Column('n_docs', sa.Float(), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('country')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('keyword_corpora')
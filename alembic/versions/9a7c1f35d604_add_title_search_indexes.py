@@ -0,0 +1,49 @@
+"""add title search indexes
+
+Revision ID: 9a7c1f35d604
+Revises: 6e0b93d7a5c2
+Create Date: 2026-10-19 13:05:44.380215
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9a7c1f35d604'
+down_revision: Union[str, Sequence[str], None] = '6e0b93d7a5c2'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Back/trend/models/search.py 의 TITLE_TSV_EXPR 와 동일하게 유지
+TITLE_TSV_EXPR = (
+    "to_tsvector("
+    "CASE WHEN keyword_country = 'US' THEN 'english'::regconfig ELSE 'simple'::regconfig END, "
+    "coalesce(title, ''))"
+)
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for table in ('youtube_contents', 'news_contents'):
+        op.add_column(table, sa.Column(
+            'title_tsv', postgresql.TSVECTOR(),
+            sa.Computed(TITLE_TSV_EXPR, persisted=True), nullable=True
+        ))
+        op.create_index(f'ix_{table}_title_tsv', table, ['title_tsv'], unique=False, postgresql_using='gin')
+        op.create_index(
+            f'ix_{table}_title_trgm', table, ['title'], unique=False,
+            postgresql_using='gin', postgresql_ops={'title': 'gin_trgm_ops'}
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in ('news_contents', 'youtube_contents'):
+        op.drop_index(f'ix_{table}_title_trgm', table_name=table)
+        op.drop_index(f'ix_{table}_title_tsv', table_name=table)
+        op.drop_column(table, 'title_tsv')
@@ -0,0 +1,34 @@
+"""add updated_at columns
+
+Revision ID: 9c4e2a7d1f58
+Revises: 7b2d4f9e1c63
+Create Date: 2026-10-19 23:41:27.308154
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e2a7d1f58'
+down_revision: Union[str, Sequence[str], None] = '7b2d4f9e1c63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+_TABLES = ('keywords', 'youtube_contents', 'news_contents')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    for table in _TABLES:
+        op.add_column(table, sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True))
+        op.create_index(f'ix_{table}_updated', table, ['updated_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    for table in _TABLES:
+        op.drop_index(f'ix_{table}_updated', table_name=table)
+        op.drop_column(table, 'updated_at')
@@ -0,0 +1,37 @@
+"""create sync states
+
+Revision ID: a4c1e8f27b90
+Revises: d2b6f9a4c7e1
+Create Date: 2026-10-19 19:20:08.472615
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a4c1e8f27b90'
+down_revision: Union[str, Sequence[str], None] = 'd2b6f9a4c7e1'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('sync_states',
+    sa.Column('sink', sa.String(length=200), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('watermark_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('watermark_id', sa.Integer(), nullable=True),
+    sa.Column('rows_appended', sa.BigInteger(), nullable=True),
+    sa.Column('rows_updated', sa.BigInteger(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('sink', 'source')
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_table('sync_states')
@@ -0,0 +1,39 @@
+"""create term sketches
+
+Revision ID: b7e2c4a91f05
+Revises: 4f1d8b6c3e92
+Create Date: 2026-10-19 15:41:09.728113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b7e2c4a91f05'
+down_revision: Union[str, Sequence[str], None] = '4f1d8b6c3e92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('term_sketches',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('bucket_start', sa.DateTime(timezone=True), nullable=False),
+    sa.Column('data', sa.LargeBinary(), nullable=False),
+    sa.Column('total', sa.BigInteger(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('country', 'bucket_start', name='uq_term_sketches_country_bucket')
+    )
+    op.create_index(op.f('ix_term_sketches_id'), 'term_sketches', ['id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index(op.f('ix_term_sketches_id'), table_name='term_sketches')
+    op.drop_table('term_sketches')
@@ -0,0 +1,76 @@
+"""create ingest staging
+
+Revision ID: d2b6f9a4c7e1
+Revises: f83c6a0d5e21
+Create Date: 2026-10-19 18:42:37.115208
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2b6f9a4c7e1'
+down_revision: Union[str, Sequence[str], None] = 'f83c6a0d5e21'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('ingest_checkpoints',
+    sa.Column('source_key', sa.String(length=500), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('rows_done', sa.BigInteger(), nullable=False),
+    sa.Column('merged_rows', sa.BigInteger(), nullable=False),
+    sa.Column('finished', sa.Boolean(), nullable=False),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('source_key')
+    )
+    op.create_table('ingest_stage_keywords',
+    sa.Column('keyword', sa.Text(), nullable=True),
+    sa.Column('country', sa.Text(), nullable=True),
+    sa.Column('trend_volume', sa.BigInteger(), nullable=True),
+    sa.Column('rank', sa.Integer(), nullable=True),
+    sa.Column('keyword_collected_at', sa.DateTime(timezone=True), nullable=True),
+    prefixes=['UNLOGGED']
+    )
+    op.create_table('ingest_stage_youtube',
+    sa.Column('keyword', sa.Text(), nullable=True),
+    sa.Column('country', sa.Text(), nullable=True),
+    sa.Column('keyword_collected_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('video_id', sa.Text(), nullable=True),
+    sa.Column('title', sa.Text(), nullable=True),
+    sa.Column('channel', sa.Text(), nullable=True),
+    sa.Column('views', sa.BigInteger(), nullable=True),
+    sa.Column('likes', sa.BigInteger(), nullable=True),
+    sa.Column('published_at', sa.Text(), nullable=True),
+    sa.Column('url', sa.Text(), nullable=True),
+    sa.Column('collected_at', sa.DateTime(timezone=True), nullable=True),
+    prefixes=['UNLOGGED']
+    )
+    op.create_table('ingest_stage_news',
+    sa.Column('keyword', sa.Text(), nullable=True),
+    sa.Column('country', sa.Text(), nullable=True),
+    sa.Column('keyword_collected_at', sa.DateTime(timezone=True), nullable=True),
+    sa.Column('title', sa.Text(), nullable=True),
+    sa.Column('source', sa.Text(), nullable=True),
+    sa.Column('description', sa.Text(), nullable=True),
+    sa.Column('published_at', sa.Text(), nullable=True),
+    sa.Column('url', sa.Text(), nullable=True),
+    sa.Column('collected_at', sa.DateTime(timezone=True), nullable=True),
+    prefixes=['UNLOGGED']
+    )
+    # 콘텐츠 -> 키워드 연결 조회 (keyword, country, keyword_collected_at)
+    op.create_index('ix_keywords_lookup', 'keywords', ['keyword', 'country', 'keyword_collected_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_keywords_lookup', table_name='keywords')
+    op.drop_table('ingest_stage_news')
+    op.drop_table('ingest_stage_youtube')
+    op.drop_table('ingest_stage_keywords')
+    op.drop_table('ingest_checkpoints')
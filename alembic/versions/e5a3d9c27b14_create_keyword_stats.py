@@ -0,0 +1,47 @@
+"""create keyword stats
+
+Revision ID: e5a3d9c27b14
+Revises: b7e2c4a91f05
+Create Date: 2026-10-19 16:20:54.103862
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5a3d9c27b14'
+down_revision: Union[str, Sequence[str], None] = 'b7e2c4a91f05'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('keyword_stats',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('keyword', sa.String(length=200), nullable=False),
+    sa.Column('rank_mean', sa.REAL(), nullable=False),
+    sa.Column('rank_var', sa.REAL(), nullable=False),
+    sa.Column('freq_mean', sa.REAL(), nullable=False),
+    sa.Column('freq_var', sa.REAL(), nullable=False),
+    sa.Column('observations', sa.Integer(), nullable=False),
+    sa.Column('last_seen_at', sa.DateTime(timezone=True), server_default=sa.text('now()'), nullable=True),
+    sa.Column('last_event', sa.String(length=20), nullable=True),
+    sa.Column('last_event_z', sa.REAL(), nullable=True),
+    sa.Column('last_event_rank', sa.Integer(), nullable=True),
+    sa.Column('last_event_freq', sa.Integer(), nullable=True),
+    sa.Column('last_event_at', sa.DateTime(timezone=True), nullable=True),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('country', 'keyword', name='uq_keyword_stats_country_keyword')
+    )
+    op.create_index('ix_keyword_stats_country_event', 'keyword_stats', ['country', 'last_event_at'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_keyword_stats_country_event', table_name='keyword_stats')
+    op.drop_table('keyword_stats')
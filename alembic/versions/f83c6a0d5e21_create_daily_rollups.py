@@ -0,0 +1,57 @@
+"""create daily rollups
+
+Revision ID: f83c6a0d5e21
+Revises: e5a3d9c27b14
+Create Date: 2026-10-19 17:05:12.640391
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f83c6a0d5e21'
+down_revision: Union[str, Sequence[str], None] = 'e5a3d9c27b14'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('daily_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('content_count', sa.Integer(), nullable=True),
+    sa.Column('total_views', sa.BigInteger(), nullable=True),
+    sa.Column('total_likes', sa.BigInteger(), nullable=True),
+    sa.Column('duplicate_count', sa.Integer(), nullable=True),
+    sa.Column('avg_score', sa.Float(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('country', 'day', 'source', name='uq_daily_rollups_country_day_source')
+    )
+    op.create_table('daily_top_rollups',
+    sa.Column('id', sa.Integer(), nullable=False),
+    sa.Column('country', sa.String(length=10), nullable=False),
+    sa.Column('day', sa.Date(), nullable=False),
+    sa.Column('source', sa.String(length=20), nullable=False),
+    sa.Column('dimension', sa.String(length=20), nullable=False),
+    sa.Column('value', sa.String(length=200), nullable=False),
+    sa.Column('content_count', sa.Integer(), nullable=True),
+    sa.Column('total_views', sa.BigInteger(), nullable=True),
+    sa.Column('updated_at', sa.DateTime(timezone=True), nullable=False),
+    sa.PrimaryKeyConstraint('id'),
+    sa.UniqueConstraint('country', 'day', 'source', 'dimension', 'value', name='uq_daily_top_rollups_key')
+    )
+    op.create_index('ix_daily_top_rollups_lookup', 'daily_top_rollups', ['country', 'dimension', 'day'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_daily_top_rollups_lookup', table_name='daily_top_rollups')
+    op.drop_table('daily_top_rollups')
+    op.drop_table('daily_rollups')
@@ -0,0 +1,104 @@
+"""
+대량 적재(Back.trend.bulk_ingest) 처리량 벤치마크
+- n8n 시트 형식(Sheet YouTube / Sheet News) 합성 CSV를 생성해 적재
+- 파싱 단계(CSV -> COPY 레코드)는 DB 없이 측정, --db 지정 시 COPY + 병합까지 포함한 행/초 측정
+- --db: 로컬 Postgres 필요 (DB_* 환경 변수 + alembic upgrade head), 합성 키워드(__bench__ 접두사)는 종료 후 삭제
+
+실행 (저장소 루트): python -m benchmarks.bench_bulk_ingest [--rows 500000] [--kind youtube] [--batch-rows 50000] [--db]
+"""
+import argparse
+import asyncio
+import csv
+import os
+import random
+import tempfile
+import time
+
+from Back.trend.bulk_ingest import DEFAULT_BATCH_ROWS, NO_DATA, _BatchReader
+
+_COLUMNS = {
+    "youtube": ["collected_at", "keyword", "keyword_country", "keyword_collected_at", "video_id", "title",
+                "channel", "views", "likes", "published_at", "url"],
+    "news": ["collected_at", "keyword", "keyword_country", "keyword_collected_at", "title", "source",
+             "description", "published_at", "url"],
+}
+
+
+def write_sheet(path: str, kind: str, rows: int, keywords: int = 2000, seed: int = 7):
+    """키워드 keywords개 x 회차별 콘텐츠, 1% NO_DATA 행 + 5% 중복(재수집) 행 포함"""
+    rng = random.Random(seed)
+    with open(path, "w", encoding="utf-8", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(_COLUMNS[kind])
+        for i in range(rows):
+            kw = rng.randrange(keywords)
+            day = 1 + kw % 28
+            run_at = f"2025-01-{day:02d}T09:00:00.000Z"
+            collected = f"2025-01-{day:02d}T09:0{rng.randrange(10)}:00.000Z"
+            item = rng.randrange(rows) if rng.random() < 0.05 else i
+            keyword = f"__bench__키워드 {kw}"
+            country = ("KR", "US", "JP", "TW", "ID")[kw % 5]
+            if kind == "youtube":
+                video_id = NO_DATA if rng.random() < 0.01 else f"bench{item:011d}"
+                writer.writerow([collected, keyword, country, run_at, video_id, f"영상 제목 {item} {keyword}",
+                                 f"채널 {item % 500}", rng.randrange(10_000_000), rng.randrange(100_000),
+                                 "2025-01-01T00:00:00Z", f"https://www.youtube.com/watch?v=bench{item:011d}"])
+            else:
+                title = NO_DATA if rng.random() < 0.01 else f"뉴스 헤드라인 {item} {keyword}"
+                writer.writerow([collected, keyword, country, run_at, title, f"언론사 {item % 300}",
+                                 "기사 요약 " * 8, "Wed, 01 Jan 2025 00:00:00 GMT", f"https://news.example.com/bench/{item}"])
+
+
+def bench_parse(kind: str, path: str, batch_rows: int) -> float:
+    reader = _BatchReader(kind, path, "csv", 0, batch_rows)
+    started = time.perf_counter()
+    total = 0
+    while True:
+        records, consumed = reader.next_batch()
+        if not consumed:
+            break
+        total += consumed
+    return total / (time.perf_counter() - started)
+
+
+async def bench_db(kind: str, path: str, batch_rows: int) -> float:
+    from Back.core.database import close_pool, execute
+    from Back.trend.bulk_ingest import BulkIngestService
+
+    try:
+        started = time.perf_counter()
+        totals = await BulkIngestService(batch_rows).ingest_file(kind, path, "csv", restart=True)
+        elapsed = time.perf_counter() - started
+        return totals["rows"] / elapsed
+    finally:
+        await execute("DELETE FROM keywords WHERE keyword LIKE '\\_\\_bench\\_\\_%'")
+        await execute("DELETE FROM ingest_checkpoints WHERE source_key LIKE :key", {"key": f"%{os.path.basename(path)}"})
+        await close_pool()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="대량 적재 처리량 벤치마크")
+    parser.add_argument("--rows", type=int, default=500_000)
+    parser.add_argument("--kind", choices=sorted(_COLUMNS), default="youtube")
+    parser.add_argument("--batch-rows", type=int, default=DEFAULT_BATCH_ROWS)
+    parser.add_argument("--db", action="store_true", help="COPY + 병합까지 측정 (로컬 Postgres 필요)")
+    parser.add_argument("--target", type=float, default=100_000.0, help="목표 처리량 (행/초)")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, f"bench_{args.kind}.csv")
+        write_sheet(path, args.kind, args.rows)
+        size_mb = os.path.getsize(path) / 1024 / 1024
+        print(f"합성 {args.kind} 시트: {args.rows:,}행, {size_mb:.1f}MB")
+
+        parse_rate = bench_parse(args.kind, path, args.batch_rows)
+        print(f"파싱 (CSV -> COPY 레코드)   {parse_rate:12,.0f} 행/s")
+
+        if args.db:
+            rate = asyncio.run(bench_db(args.kind, path, args.batch_rows))
+            verdict = "✅" if rate >= args.target else "❌"
+            print(f"전체 (COPY + 병합)          {rate:12,.0f} 행/s  {verdict} 목표 {args.target:,.0f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,153 @@
+"""
+/trend/trending/contents 응답 생성 경로 벤치마크 (DB 제외, 프로세스 내)
+
+before: SELECT * 행(dict) -> 라우터에서 dict 재구성 -> jsonable_encoder -> json.dumps
+after : 응답 필드만 조회한 행 -> orjson 직렬화
+
+--asgi: 같은 payload를 FastAPI 앱(TestClient)으로 왕복 측정 (미들웨어/라우팅 포함)
+  json   : dict 반환 + 기본 JSONResponse (jsonable_encoder -> json.dumps)
+  dict   : dict 반환 + default_response_class=FastJSONResponse (jsonable_encoder는 그대로 실행됨)
+  direct : FastJSONResponse(payload) 직접 반환 (jsonable_encoder 생략)
+
+실행 (저장소 루트): python -m benchmarks.bench_json_response [--items 100] [--requests 2000] [--asgi]
+"""
+import argparse
+import json
+import statistics
+import time
+from datetime import datetime, timedelta, timezone
+
+from fastapi.encoders import jsonable_encoder
+
+from Back.core.responses import FastJSONResponse, dumps
+
+
+def _full_rows(n: int):
+    now = datetime.now(timezone.utc)
+    youtube = [
+        {
+            "id": i, "keyword_id": 1, "video_id": f"vid{i:06d}", "title": f"인기 영상 제목 {i} - 오늘의 핫이슈 Official MV",
+            "channel": f"채널 {i % 17}", "views": 1_000_000 + i * 37, "likes": 10_000 + i, "published_at": now.isoformat(),
+            "url": f"https://www.youtube.com/watch?v=vid{i:06d}", "score": 71.5 - i * 0.1,
+            "collected_at": now - timedelta(minutes=i), "keyword_country": "KR",
+            "title_tsv": f"'인기':1 '영상':2 '제목':3 '{i}':4",
+        }
+        for i in range(n)
+    ]
+    news = [
+        {
+            "id": i, "keyword_id": 1, "title": f"속보: 주요 뉴스 헤드라인 {i} - 언론사", "source": "Google News",
+            "description": "", "url": f"https://news.example.com/article/{i}", "published_at": now.isoformat(),
+            "score": 55.0 - i * 0.1, "collected_at": now - timedelta(minutes=i), "keyword_country": "KR",
+            "duplicate_count": i % 3, "matched_keywords": ["핫이슈", "속보"], "keyword_match_count": 2,
+            "title_tsv": f"'속보':1 '주요':2 '뉴스':3 '{i}':5",
+        }
+        for i in range(n)
+    ]
+    return youtube, news
+
+
+def _projected_rows(youtube, news):
+    return (
+        [{k: y[k] for k in ("title", "url", "channel", "views", "likes", "score")} | {"type": "video"} for y in youtube],
+        [
+            {k: n[k] for k in ("title", "url", "source", "published_at", "score", "duplicate_count", "matched_keywords")} | {"type": "news"}
+            for n in news
+        ],
+    )
+
+
+def before(youtube, news) -> bytes:
+    payload = {
+        "youtube": [
+            {"title": y['title'], "url": y['url'], "channel": y['channel'], "views": y['views'],
+             "likes": y['likes'], "score": y['score'], "type": "video"}
+            for y in [dict(r) for r in youtube]
+        ],
+        "news": [
+            {"title": n['title'], "url": n['url'], "source": n['source'], "published_at": str(n['published_at']),
+             "score": n['score'], "duplicate_count": n.get('duplicate_count') or 0,
+             "matched_keywords": n.get('matched_keywords') or [], "type": "news"}
+            for n in [dict(r) for r in news]
+        ],
+    }
+    return json.dumps(jsonable_encoder(payload), ensure_ascii=False, default=str, separators=(",", ":")).encode("utf-8")
+
+
+def after(youtube, news) -> bytes:
+    return dumps({"youtube": youtube, "news": news})
+
+
+def _measure(func, args, requests: int):
+    latencies = []
+    cpu_start = time.process_time()
+    for _ in range(requests):
+        start = time.perf_counter()
+        func(*args)
+        latencies.append((time.perf_counter() - start) * 1000)
+    cpu_ms = (time.process_time() - cpu_start) * 1000 / requests
+    latencies.sort()
+    return {
+        "p50_ms": statistics.median(latencies),
+        "p99_ms": latencies[int(len(latencies) * 0.99) - 1],
+        "cpu_ms_per_req": cpu_ms,
+    }
+
+
+def _asgi_client(payload):
+    from fastapi import FastAPI
+    from fastapi.responses import JSONResponse
+    from fastapi.testclient import TestClient
+
+    app = FastAPI(default_response_class=FastJSONResponse)
+
+    @app.get("/json", response_class=JSONResponse)
+    async def as_json():
+        return payload
+
+    @app.get("/dict")
+    async def as_dict():
+        return payload
+
+    @app.get("/direct")
+    async def as_direct():
+        return FastJSONResponse(payload)
+
+    return TestClient(app)
+
+
+def run_asgi(projected, requests: int):
+    youtube, news = projected
+    client = _asgi_client({"youtube": youtube, "news": news})
+    bodies = {path: client.get(f"/{path}").json() for path in ("json", "dict", "direct")}
+    assert bodies["json"] == bodies["dict"] == bodies["direct"]
+
+    for path in ("json", "dict", "direct"):
+        result = _measure(lambda: client.get(f"/{path}"), (), requests)
+        print(f"{path:>6}: p50 {result['p50_ms']:.3f}ms | p99 {result['p99_ms']:.3f}ms | cpu {result['cpu_ms_per_req']:.3f}ms/req")
+
+
+def main():
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--items", type=int, default=100)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--asgi", action="store_true", help="FastAPI 앱 경유 측정")
+    args = parser.parse_args()
+
+    youtube, news = _full_rows(args.items)
+    projected = _projected_rows(youtube, news)
+    assert json.loads(before(youtube, news)) == json.loads(after(*projected))
+
+    if args.asgi:
+        print(f"[ASGI] items={args.items} (youtube+news 각각), requests={args.requests}")
+        run_asgi(projected, args.requests)
+        return
+
+    print(f"items={args.items} (youtube+news 각각), requests={args.requests}")
+    for name, func, func_args in (("before", before, (youtube, news)), ("after", after, projected)):
+        result = _measure(func, func_args, args.requests)
+        print(f"{name:>6}: p50 {result['p50_ms']:.3f}ms | p99 {result['p99_ms']:.3f}ms | cpu {result['cpu_ms_per_req']:.3f}ms/req")
+
+
+if __name__ == "__main__":
+    main()
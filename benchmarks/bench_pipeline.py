@@ -0,0 +1,287 @@
+"""
+수집 파이프라인(collect_trending_contents) 오프라인 E2E 벤치마크
+- 외부 API 대신 benchmarks.fake_upstream 가짜 서버 사용 (지연/오류율 주입)
+- 로컬 Postgres 필요: DB_HOST/DB_PORT/DB_USER/DB_PASSWORD/DB_NAME 환경 변수 + alembic upgrade head
+- 측정: 단계별(클라이언트/Repository/서비스 구성요소 메서드) 소요 시간, 국가 N개 처리량, DB 왕복 수
+- 결과는 benchmarks/results/<시각>-<커밋>.json 으로 저장하고 직전(또는 --baseline) 결과와 비교
+- 수집 1회라도 트렌드 키워드가 --min-keywords개 미만이면 실패 처리 (픽스처 파싱 오류로 빈 파이프라인을 측정하지 않도록)
+
+실행 (저장소 루트):
+    python -m benchmarks.bench_pipeline --countries KR,US,JP --rounds 3 --latency-ms 30 --error-rate 0.02
+
+카세트 기록/재생 (Back/utils/http_cassette.py):
+    python -m benchmarks.bench_pipeline --record bench --rounds 1        # 가짜 서버 응답을 카세트로 기록
+    python -m benchmarks.bench_pipeline --replay bench --rounds 20 --replay-concurrency 8   # 네트워크/서버 없이 재생
+"""
+import argparse
+import asyncio
+import functools
+import inspect
+import json
+import os
+import subprocess
+import time
+from datetime import datetime
+from pathlib import Path
+from typing import Dict, List, Optional
+
+from .fake_upstream import FakeUpstream, FaultProfile
+
+RESULTS_DIR = Path(__file__).parent / "results"
+
+
+class StageTimer:
+    """메서드 단위 호출 수 / 누적 시간"""
+
+    def __init__(self):
+        self.stages: Dict[str, List[float]] = {}
+
+    def record(self, name: str, elapsed: float):
+        stage = self.stages.setdefault(name, [0, 0.0])
+        stage[0] += 1
+        stage[1] += elapsed
+
+    def wrap(self, name: str, func):
+        if inspect.iscoroutinefunction(func):
+            @functools.wraps(func)
+            async def async_wrapper(*args, **kwargs):
+                start = time.perf_counter()
+                try:
+                    return await func(*args, **kwargs)
+                finally:
+                    self.record(name, time.perf_counter() - start)
+            return async_wrapper
+
+        @functools.wraps(func)
+        def sync_wrapper(*args, **kwargs):
+            start = time.perf_counter()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                self.record(name, time.perf_counter() - start)
+        return sync_wrapper
+
+    def instrument(self, cls, prefix: str):
+        """클래스에 정의된 공개 메서드를 계측 래퍼로 교체"""
+        for attr, value in list(vars(cls).items()):
+            if attr.startswith("_") or not callable(value) or isinstance(value, (staticmethod, classmethod, type)):
+                continue
+            setattr(cls, attr, self.wrap(f"{prefix}.{attr}", value))
+
+    def report(self) -> List[dict]:
+        rows = [
+            {"stage": name, "calls": int(calls), "total_ms": round(total * 1000, 2), "mean_ms": round(total * 1000 / calls, 3)}
+            for name, (calls, total) in self.stages.items()
+        ]
+        return sorted(rows, key=lambda r: r["total_ms"], reverse=True)
+
+
+def _git_revision() -> str:
+    try:
+        return subprocess.check_output(["git", "rev-parse", "--short", "HEAD"], text=True).strip()
+    except Exception:
+        return "unknown"
+
+
+def _instrument_pipeline(timer: StageTimer):
+    """파이프라인 구성요소 계측 (import는 환경 변수 설정 이후)"""
+    from Back.clients.nate_client import NateClient
+    from Back.clients.reddit_client import RedditClient
+    from Back.clients.rss_client import RSSClient
+    from Back.clients.youtube_client import YouTubeClient
+    from Back.clients.ai_keyword_extractor import AIKeywordExtractor
+    from Back.trend.repositories.keyword_repo import KeywordRepository
+    from Back.trend.repositories.youtube_repo import YouTubeRepository
+    from Back.trend.repositories.news_repo import NewsRepository
+    from Back.trend.scoring import HotIssueScorer
+    from Back.trend.dedupe import NearDuplicateDetector
+    from Back.trend.embeddings import EmbeddingIndex
+    from Back.trend.sketches import TermTracker
+    from Back.trend.spikes import SpikeDetector
+    from Back.trend.rollups import RollupService
+    from Back.trend.keyword_engine import LocalKeywordEngine
+
+    targets = [
+        (NateClient, "nate"), (RedditClient, "reddit"), (RSSClient, "rss"), (YouTubeClient, "youtube"),
+        (AIKeywordExtractor, "openai"), (KeywordRepository, "db.keyword"), (YouTubeRepository, "db.youtube"),
+        (NewsRepository, "db.news"), (HotIssueScorer, "scoring"), (NearDuplicateDetector, "dedupe"),
+        (EmbeddingIndex, "embedding"), (TermTracker, "sketch"), (SpikeDetector, "spikes"), (RollupService, "rollup"),
+        (LocalKeywordEngine, "keyword_engine"),
+    ]
+    for cls, prefix in targets:
+        timer.instrument(cls, prefix)
+
+
+def _count_db_roundtrips() -> Dict[str, int]:
+    """SQLAlchemy 커서 실행 이벤트로 DB 왕복 수 집계"""
+    from sqlalchemy import event
+    from Back.core.database import get_engine
+
+    counts = {"statements": 0, "executemany": 0}
+
+    @event.listens_for(get_engine().sync_engine, "before_cursor_execute")
+    def _on_execute(conn, cursor, statement, parameters, context, executemany):
+        counts["statements"] += 1
+        if executemany:
+            counts["executemany"] += 1
+
+    return counts
+
+
+async def _run(countries: List[str], rounds: int, concurrent: bool, source: str) -> dict:
+    from Back.trend.service import TrendService
+    from Back.core.database import close_pool
+
+    service = TrendService()
+    per_collection: List[float] = []
+    keyword_counts: List[int] = []
+    items = 0
+
+    async def collect(country: str):
+        nonlocal items
+        start = time.perf_counter()
+        result = await service.collect_trending_contents(country, source)
+        per_collection.append(time.perf_counter() - start)
+        keyword_counts.append(len(result.top_keywords))
+        items += result.keywords_count
+
+    start = time.perf_counter()
+    try:
+        for _ in range(rounds):
+            if concurrent:
+                await asyncio.gather(*(collect(c) for c in countries))
+            else:
+                for country in countries:
+                    await collect(country)
+    finally:
+        await close_pool()
+    wall = time.perf_counter() - start
+
+    per_collection.sort()
+    return {
+        "wall_s": round(wall, 3),
+        "collections": len(per_collection),
+        "collections_per_s": round(len(per_collection) / wall, 3) if wall else 0.0,
+        "items": items,
+        "items_per_s": round(items / wall, 2) if wall else 0.0,
+        "collection_p50_s": round(per_collection[len(per_collection) // 2], 3) if per_collection else 0.0,
+        "collection_max_s": round(per_collection[-1], 3) if per_collection else 0.0,
+        "keywords_min": min(keyword_counts) if keyword_counts else 0,
+    }
+
+
+def _load_baseline(path: Optional[str]) -> Optional[dict]:
+    if path:
+        return json.loads(Path(path).read_text(encoding="utf-8"))
+    previous = sorted(RESULTS_DIR.glob("*.json"))
+    return json.loads(previous[-1].read_text(encoding="utf-8")) if previous else None
+
+
+def _print_report(result: dict, baseline: Optional[dict]):
+    def delta(current: float, before: Optional[float]) -> str:
+        if not before:
+            return ""
+        return f" ({(current - before) / before * 100:+.1f}%)"
+
+    summary, base_summary = result["summary"], (baseline or {}).get("summary", {})
+    print(f"\n== 수집 파이프라인 벤치마크 ({result['revision']}) ==")
+    config = result["config"]
+    mode = f"replay={config['replay']} speed={config['replay_speed']}" if config.get("replay") else \
+        f"latency={config['latency_ms']}ms error_rate={config['error_rate']}"
+    print(f"countries={','.join(config['countries'])} rounds={config['rounds']} {mode}")
+    if baseline:
+        print(f"비교 대상: {baseline['revision']} ({baseline['timestamp']})")
+    for key in ("wall_s", "collections_per_s", "items_per_s", "collection_p50_s", "collection_max_s", "keywords_min"):
+        print(f"  {key:<20} {summary[key]:>10}{delta(summary[key], base_summary.get(key))}")
+    base_db = (baseline or {}).get("db", {})
+    print(f"  {'db_statements':<20} {result['db']['statements']:>10}{delta(result['db']['statements'], base_db.get('statements'))}")
+    print(f"  {'db_executemany':<20} {result['db']['executemany']:>10}")
+    print(f"  {'upstream_requests':<20} {sum(result['upstream']['requests'].values()):>10} "
+          f"(errors {sum(result['upstream']['errors'].values())})")
+
+    base_stages = {s["stage"]: s for s in (baseline or {}).get("stages", [])}
+    print("\n  stage                                   calls   total_ms    mean_ms")
+    for stage in result["stages"]:
+        before = base_stages.get(stage["stage"], {}).get("total_ms")
+        print(f"  {stage['stage']:<38} {stage['calls']:>6} {stage['total_ms']:>10} {stage['mean_ms']:>10}{delta(stage['total_ms'], before)}")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 파이프라인 오프라인 벤치마크")
+    parser.add_argument("--countries", default="KR,US,JP")
+    parser.add_argument("--rounds", type=int, default=3)
+    parser.add_argument("--source", default="auto")
+    parser.add_argument("--sequential", action="store_true", help="국가별 순차 실행 (기본: 라운드마다 국가 동시 실행)")
+    parser.add_argument("--latency-ms", type=float, default=30.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--record", metavar="CASSETTE", default=None, help="업스트림 응답을 카세트로 기록")
+    parser.add_argument("--replay", metavar="CASSETTE", default=None, help="가짜 서버 없이 카세트에서 재생")
+    parser.add_argument("--replay-speed", type=float, default=0.0, help="0: 지연 없음, 1: 기록된 응답 시간 그대로")
+    parser.add_argument("--replay-concurrency", type=int, default=0)
+    parser.add_argument("--baseline", default=None, help="비교할 결과 JSON (기본: results/ 최신 파일)")
+    parser.add_argument("--no-save", action="store_true")
+    parser.add_argument("--min-keywords", type=int, default=5, help="수집 1회당 최소 트렌드 키워드 수 (미달 시 결과 저장 없이 실패)")
+    args = parser.parse_args()
+    countries = [c.strip().upper() for c in args.countries.split(",") if c.strip()]
+
+    upstream = None
+    if args.replay:
+        # 기록 시 주소(가짜 서버 포트)와 무관하게 재생되도록 host는 매칭에서 제외
+        os.environ.update(FakeUpstream.env_for("http://replay.invalid"))
+        os.environ.update({
+            "HTTP_MODE": "replay", "HTTP_CASSETTE": args.replay, "HTTP_MATCH_ON": "method,path,query,body",
+            "HTTP_REPLAY_SPEED": str(args.replay_speed), "HTTP_REPLAY_CONCURRENCY": str(args.replay_concurrency),
+        })
+    else:
+        upstream = FakeUpstream(profile=FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate)).start()
+        os.environ.update(upstream.env())
+        if args.record:
+            os.environ.update({"HTTP_MODE": "record", "HTTP_CASSETTE": args.record})
+    os.environ.setdefault("HTTP_CASSETTE_DIR", str(Path(__file__).parent / "cassettes"))
+    for key in ("APIFY_TOKEN", "YOUTUBE_API_KEY", "OPENAI_API_KEY", "GEMINI_API_KEY"):
+        os.environ.setdefault(key, "offline-benchmark")
+
+    timer = StageTimer()
+    _instrument_pipeline(timer)
+    db_counts = _count_db_roundtrips()
+
+    try:
+        summary = asyncio.run(_run(countries, args.rounds, not args.sequential, args.source))
+    finally:
+        if upstream:
+            upstream.stop()
+
+    if summary["keywords_min"] < args.min_keywords:
+        raise SystemExit(
+            f"❌ 트렌드 키워드 단계 이상: 수집 1회 최소 {summary['keywords_min']}개 < {args.min_keywords}개 "
+            "(픽스처/클라이언트 파싱 확인, 결과 저장 안 함)"
+        )
+
+    result = {
+        "revision": _git_revision(),
+        "timestamp": datetime.now().isoformat(timespec="seconds"),
+        "config": {
+            "countries": countries, "rounds": args.rounds, "source": args.source, "concurrent": not args.sequential,
+            "latency_ms": args.latency_ms, "jitter_ms": args.jitter_ms, "error_rate": args.error_rate,
+            "record": args.record, "replay": args.replay, "replay_speed": args.replay_speed,
+            "replay_concurrency": args.replay_concurrency,
+        },
+        "summary": summary,
+        "db": db_counts,
+        "upstream": {"requests": upstream.requests if upstream else {}, "errors": upstream.errors if upstream else {}},
+        "stages": timer.report(),
+    }
+
+    baseline = _load_baseline(args.baseline)
+    _print_report(result, baseline)
+
+    if not args.no_save:
+        RESULTS_DIR.mkdir(exist_ok=True)
+        path = RESULTS_DIR / f"{datetime.now().strftime('%Y%m%d-%H%M%S')}-{result['revision']}.json"
+        path.write_text(json.dumps(result, ensure_ascii=False, indent=2), encoding="utf-8")
+        print(f"\n결과 저장: {path}")
+
+
+if __name__ == "__main__":
+    main()
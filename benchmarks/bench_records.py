@@ -0,0 +1,207 @@
+"""
+수집 레코드(Back.trend.records) vs dict 파이프라인 메모리/CPU 벤치마크
+- 소스별 합성 원본(API 응답 item / RSS entry / Apify item) N건을 같은 단계로 처리
+  파싱 -> 키 중복 제거 -> 중복 병합/매칭 결과 기록 -> 일괄 Upsert 파라미터 생성
+- dict: 이전 방식 (행마다 dict 생성, 단계마다 dict/list 복사, 저장 시 .get()으로 행별 파라미터 dict)
+- records: slots dataclass 1회 생성(위치 인자) 후 제자리 갱신, columns()로 unnest 컬럼 배열
+- 측정: CPU(process_time, --repeat회 중 최솟값), 파싱 결과 보유 메모리, 전체 단계 최대 메모리(tracemalloc)
+- GC 제외 CPU도 함께 표시: 원자 값만 가진 dict는 GC 추적 대상이 아니지만 레코드 인스턴스는 추적 대상이라
+  대량 배치에서는 생성 중 세대 수집(힙 전체 순회)이 더 자주 일어남 (수집 1회분 수십~수백 행에서는 무시 가능)
+- MinHash/매칭 계산 자체는 두 방식이 같으므로 제외 (결과를 기록하는 비용만 포함)
+
+실행 (저장소 루트): python -m benchmarks.bench_records [--rows 100000] [--repeat 5]
+"""
+import argparse
+import gc
+import random
+import time
+import tracemalloc
+from typing import Callable, Dict, List, Tuple
+
+from Back.trend.records import InstagramPost, NewsRecord, VideoRecord, columns, unique_by
+
+
+def synth(kind: str, rows: int, seed: int = 7) -> List[dict]:
+    """클라이언트가 받는 원본 형태, 5%는 같은 키 재등장"""
+    rng = random.Random(seed)
+    items = []
+    for i in range(rows):
+        n = rng.randrange(rows) if rng.random() < 0.05 else i
+        if kind == "youtube":
+            items.append({
+                "id": f"vid{n:08d}",
+                "snippet": {"title": f"영상 제목 {n}", "channelTitle": f"채널 {n % 500}", "publishedAt": "2025-01-01T00:00:00Z"},
+                "statistics": {"viewCount": str(rng.randrange(10_000_000)), "likeCount": str(rng.randrange(100_000))},
+            })
+        elif kind == "news":
+            items.append({"title": f"뉴스 헤드라인 {n} - 언론사", "link": f"https://news.example.com/{n}",
+                          "published": "Wed, 01 Jan 2025 00:00:00 GMT"})
+        else:
+            items.append({"id": f"{n:019d}", "shortCode": f"C{n:010d}", "ownerUsername": f"user_{n % 997}",
+                          "caption": f"#해시태그 게시물 {n}", "likesCount": rng.randrange(50_000),
+                          "commentsCount": rng.randrange(900), "timestamp": "2025-01-01T12:00:00.000Z",
+                          "url": f"https://www.instagram.com/p/C{n:010d}/"})
+    return items
+
+
+# ===== dict 파이프라인 (이전 방식) =====
+
+def dict_parse(kind: str, raw: List[dict]) -> List[dict]:
+    if kind == "youtube":
+        return [{
+            "video_id": item["id"], "title": item["snippet"]["title"], "channel": item["snippet"]["channelTitle"],
+            "url": f"https://youtube.com/watch?v={item['id']}", "views": int(item["statistics"].get("viewCount", 0)),
+            "likes": int(item["statistics"].get("likeCount", 0)), "published_at": item["snippet"]["publishedAt"],
+        } for item in raw]
+    if kind == "news":
+        # RSS 클라이언트 키워드 dict -> 서비스에서 뉴스 dict로 한 번 더 변환
+        headlines = [{
+            "keyword": item["title"].rsplit(" - ", 1)[0], "country": "KR", "trend_volume": 0, "rank": i + 1,
+            "url": item["link"], "published_at": item.get("published", ""),
+        } for i, item in enumerate(raw)]
+        return [{
+            "title": hl["keyword"], "source": "Google News", "description": "",
+            "url": hl.get("url", ""), "published_at": hl.get("published_at"),
+        } for hl in headlines]
+    return [{
+        "post_id": item["id"], "username": item["ownerUsername"], "caption": item["caption"],
+        "likes": int(item["likesCount"]), "comments": int(item["commentsCount"]),
+        "timestamp": item["timestamp"], "url": item["url"],
+    } for item in raw]
+
+
+def dict_pipeline(kind: str, items: List[dict]):
+    if kind == "youtube":
+        unique = list({v["video_id"]: v for v in items}.values())
+        return [{
+            "keyword_id": 1, "country": "KR", "video_id": v.get("video_id"), "title": v.get("title"),
+            "channel": v.get("channel"), "views": v.get("views", 0), "likes": v.get("likes", 0),
+            "published_at": v.get("published_at"), "url": v.get("url"),
+        } for v in unique]
+    if kind == "news":
+        unique = list({n["url"]: n for n in items if n.get("url")}.values())
+        canonical = []
+        for item in unique:
+            item = dict(item)
+            item["duplicate_urls"] = item.get("duplicate_urls", [])
+            item["_signature"] = None
+            canonical.append(item)
+        for item in canonical:
+            item["matched_keywords"] = []
+        return [{
+            "keyword_id": 1, "country": "KR", "title": a.get("title"), "source": a.get("source"),
+            "description": a.get("description", ""), "published_at": a.get("published_at"), "url": a["url"],
+            "matched_keywords": a.get("matched_keywords", []),
+            "keyword_match_count": len(a.get("matched_keywords", [])),
+        } for a in canonical]
+    unique = list({p["post_id"]: p for p in items if p.get("post_id")}.values())
+    return (
+        [p["post_id"] for p in unique], [p.get("username") for p in unique], [p.get("caption") for p in unique],
+        [p.get("likes", 0) for p in unique], [p.get("comments", 0) for p in unique],
+        [p.get("timestamp") for p in unique], [p.get("url") for p in unique],
+    )
+
+
+# ===== 레코드 파이프라인 =====
+
+def record_parse(kind: str, raw: List[dict]) -> list:
+    if kind == "youtube":
+        return [VideoRecord(
+            item["id"], item["snippet"]["title"], item["snippet"]["channelTitle"], item["snippet"]["publishedAt"],
+            f"https://youtube.com/watch?v={item['id']}",
+            int(item["statistics"].get("viewCount", 0)), int(item["statistics"].get("likeCount", 0)),
+        ) for item in raw]
+    if kind == "news":
+        return [NewsRecord(
+            item["title"].rsplit(" - ", 1)[0], "Google News", item["link"], item.get("published", ""),
+        ) for item in raw]
+    return [InstagramPost(
+        item["id"], item["ownerUsername"], item["caption"], int(item["likesCount"]), int(item["commentsCount"]),
+        item["timestamp"], item["url"],
+    ) for item in raw]
+
+
+def record_pipeline(kind: str, items: list):
+    if kind == "youtube":
+        return columns(unique_by(items, "video_id"), "video_id", "title", "channel", "views", "likes", "published_at", "url")
+    if kind == "news":
+        unique = unique_by(items, "url")
+        for item in unique:
+            item.duplicate_urls = []
+            item.signature = None
+        for item in unique:
+            item.matched_keywords = []
+        return columns(unique, "title", "source", "description", "published_at", "url", "matched_keywords")
+    return columns(unique_by(items, "post_id"), "post_id", "username", "caption", "likes", "comments", "timestamp", "url")
+
+
+# ===== 측정 =====
+
+def _cpu(fn: Callable[[], object], repeat: int, collect: bool = True) -> float:
+    best = float("inf")
+    for _ in range(repeat):
+        gc.collect()
+        if not collect:
+            gc.disable()
+        try:
+            started = time.process_time()
+            fn()
+            best = min(best, time.process_time() - started)
+        finally:
+            gc.enable()
+    return best
+
+
+def measure(kind: str, raw: List[dict], parse, pipeline, repeat: int) -> Dict[str, float]:
+    parse_cpu = _cpu(lambda: parse(kind, raw), repeat)
+    total_cpu = _cpu(lambda: pipeline(kind, parse(kind, raw)), repeat)
+    total_cpu_nogc = _cpu(lambda: pipeline(kind, parse(kind, raw)), repeat, collect=False)
+
+    gc.collect()
+    tracemalloc.start()
+    parsed = parse(kind, raw)
+    retained = tracemalloc.get_traced_memory()[0]
+    tracemalloc.reset_peak()
+    params = pipeline(kind, parsed)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    del parsed, params
+    return {
+        "parse_ms": parse_cpu * 1000, "total_ms": total_cpu * 1000, "nogc_ms": total_cpu_nogc * 1000,
+        "retained_mb": retained / 2**20, "peak_mb": peak / 2**20,
+    }
+
+
+_METRICS = [
+    ("parse_ms", "파싱 ms"), ("total_ms", "전체 ms"), ("nogc_ms", "GC 제외 ms"),
+    ("retained_mb", "보유 MB"), ("peak_mb", "최대 MB"),
+]
+
+
+def main():
+    parser = argparse.ArgumentParser(description="수집 레코드 vs dict 메모리/CPU 벤치마크")
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--kind", action="append", choices=["youtube", "news", "instagram"], default=None)
+    args = parser.parse_args()
+
+    print(f"합성 배치 {args.rows:,}행 (CPU는 {args.repeat}회 중 최솟값)")
+    print(f"{'소스':<10} {'방식':<8}" + "".join(f"{label:>12}" for _, label in _METRICS))
+    for kind in args.kind or ["youtube", "news", "instagram"]:
+        raw = synth(kind, args.rows)
+        results: List[Tuple[str, Dict[str, float]]] = [
+            ("dict", measure(kind, raw, dict_parse, dict_pipeline, args.repeat)),
+            ("records", measure(kind, raw, record_parse, record_pipeline, args.repeat)),
+        ]
+        for name, r in results:
+            print(f"{kind:<10} {name:<8}" + "".join(f"{r[key]:12.1f}" for key, _ in _METRICS))
+        base, new = results[0][1], results[1][1]
+        print(f"{'':<10} {'변화':<8}" + "".join(f"{_delta(base[key], new[key]):>12}" for key, _ in _METRICS))
+
+
+def _delta(before: float, after: float) -> str:
+    return f"{(after - before) / before * 100:+.0f}%" if before else "-"
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,59 @@
+"""
+트레이싱 오버헤드 벤치마크 (프로세스 내, 네트워크/DB 제외)
+
+- 미샘플링: @traced 래퍼 호출 1회당 추가 비용(ns) -> 1회 수집의 계측 호출 수 기준 비율 환산
+- 샘플링: Span 생성/속성 기록 비용 (Server-Timing/OTLP 내보내기 제외)
+
+실행 (저장소 루트): python -m benchmarks.bench_tracing [--calls 200000] [--spans-per-collection 120]
+"""
+import argparse
+import asyncio
+import time
+
+from Back.core.tracing import Trace, _trace, traced
+
+
+async def _work(keyword: str, country: str = "KR"):
+    return [keyword]
+
+
+_traced_work = traced("bench.work")(_work)
+
+
+async def _loop(func, calls: int) -> float:
+    start = time.perf_counter_ns()
+    for _ in range(calls):
+        await func("키워드", country="KR")
+    return (time.perf_counter_ns() - start) / calls
+
+
+def main():
+    parser = argparse.ArgumentParser(description="트레이싱 오버헤드 벤치마크")
+    parser.add_argument("--calls", type=int, default=200_000)
+    parser.add_argument("--spans-per-collection", type=int, default=120, help="1회 수집의 계측 호출 수 (클라이언트+Repository+단계)")
+    parser.add_argument("--collection-ms", type=float, default=500.0, help="비교 기준 1회 수집 소요 시간 (네트워크 재생 기준)")
+    args = parser.parse_args()
+
+    raw = asyncio.run(_loop(_work, args.calls))
+    unsampled = asyncio.run(_loop(_traced_work, args.calls))
+
+    async def sampled_loop():
+        token = _trace.set(Trace())
+        try:
+            return await _loop(_traced_work, args.calls)
+        finally:
+            _trace.reset(token)
+
+    sampled = asyncio.run(sampled_loop())
+
+    budget_ns = args.collection_ms * 1e6
+    print(f"raw        {raw:8.0f} ns/call")
+    print(f"unsampled  {unsampled:8.0f} ns/call  (+{unsampled - raw:.0f} ns)")
+    print(f"sampled    {sampled:8.0f} ns/call  (+{sampled - raw:.0f} ns)")
+    for label, cost in (("unsampled", unsampled - raw), ("sampled", sampled - raw)):
+        share = cost * args.spans_per_collection / budget_ns * 100
+        print(f"{label:<10} 수집 1회({args.collection_ms:.0f}ms, Span {args.spans_per_collection}개) 대비 {share:.4f}%")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Cold start import 예산 검사 (python -X importtime 기반, CI용 종료 코드)
+
+- API: `import Back.main` 시 무거운 SDK/드라이버(FORBIDDEN_API)가 로딩되지 않아야 함 (첫 사용 시 지연 로딩)
+- Alembic: `import Back.core.base, Back.trend.models` 가 DB 엔진 모듈/드라이버를 로딩하지 않아야 함
+- 시간 예산: Back.main 누적 import 시간(여러 번 실행 중 최솟값)과 Back.* 자체 시간 합계
+- 위반 시 종료 코드 1, 느린 모듈 상위 목록 출력
+
+실행 (저장소 루트): python -m benchmarks.check_import_time [--budget-ms 2000] [--own-budget-ms 150] [--runs 3]
+"""
+import argparse
+import os
+import re
+import subprocess
+import sys
+from typing import Dict, List, Tuple
+
+_LINE = re.compile(r"^import time:\s+(\d+)\s+\|\s+(\d+)\s+\|(\s*)(\S+)$")
+
+# 요청 처리 중 실제로 필요할 때만 로딩해야 하는 모듈 (최상위 패키지 또는 전체 이름)
+FORBIDDEN_API = (
+    "googleapiclient", "httplib2", "google.generativeai", "openai", "feedparser", "bs4",
+    "requests", "pandas", "pyarrow", "tiktoken", "sentence_transformers", "asyncpg", "sqlalchemy.ext.asyncio",
+)
+FORBIDDEN_ALEMBIC = ("Back.core.database", "asyncpg", "Back.trend.router", "Back.clients")
+
+_OFFLINE_ENV = {key: "import-check" for key in ("APIFY_TOKEN", "YOUTUBE_API_KEY", "OPENAI_API_KEY", "GEMINI_API_KEY")}
+
+
+def import_profile(statement: str) -> Dict[str, Tuple[int, int, int]]:
+    """새 인터프리터에서 statement 실행 -> {모듈: (self_us, cumulative_us, 깊이)}"""
+    env = {**_OFFLINE_ENV, **os.environ}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, env=env,
+    )
+    if proc.returncode != 0:
+        raise RuntimeError(f"import 실패: {statement}\n{proc.stderr[-2000:]}")
+
+    modules: Dict[str, Tuple[int, int, int]] = {}
+    for line in proc.stderr.splitlines():
+        match = _LINE.match(line)
+        if match:
+            modules[match.group(4)] = (int(match.group(1)), int(match.group(2)), len(match.group(3)) // 2)
+    return modules
+
+
+def loaded(modules: Dict[str, Tuple[int, int, int]], forbidden: Tuple[str, ...]) -> List[str]:
+    return sorted(name for name in modules if any(name == f or name.startswith(f + ".") for f in forbidden))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="cold start import 예산 검사")
+    parser.add_argument("--budget-ms", type=float, default=2000.0, help="import Back.main 누적 시간 상한")
+    parser.add_argument("--own-budget-ms", type=float, default=150.0, help="Back.* 모듈 자체 시간 합계 상한")
+    parser.add_argument("--runs", type=int, default=3)
+    parser.add_argument("--top", type=int, default=10)
+    args = parser.parse_args()
+
+    failures: List[str] = []
+
+    runs = [import_profile("import Back.main") for _ in range(max(1, args.runs))]
+    best = min(runs, key=lambda m: m["Back.main"][1])
+    total_ms = best["Back.main"][1] / 1000
+    own_ms = sum(values[0] for name, values in best.items() if name.startswith("Back.")) / 1000
+
+    print(f"import Back.main: {total_ms:.1f}ms (Back.* 자체 {own_ms:.1f}ms, {len(best)}개 모듈, {len(runs)}회 중 최솟값)")
+    print("  Back.main 직접 import 누적 시간 상위:")
+    child_depth = best["Back.main"][2] + 1
+    children = [(name, cum) for name, (_, cum, depth) in best.items() if depth == child_depth]
+    for name, cum in sorted(children, key=lambda x: x[1], reverse=True)[:args.top]:
+        print(f"    {cum / 1000:8.1f}ms  {name}")
+    print("  Back.* 자체 시간 상위:")
+    own = [(name, values[0]) for name, values in best.items() if name.startswith("Back.")]
+    for name, self_us in sorted(own, key=lambda x: x[1], reverse=True)[:args.top]:
+        print(f"    {self_us / 1000:8.1f}ms  {name}")
+
+    if total_ms > args.budget_ms:
+        failures.append(f"import Back.main {total_ms:.1f}ms > 예산 {args.budget_ms:.0f}ms")
+    if own_ms > args.own_budget_ms:
+        failures.append(f"Back.* 자체 import {own_ms:.1f}ms > 예산 {args.own_budget_ms:.0f}ms")
+    eager = loaded(best, FORBIDDEN_API)
+    if eager:
+        failures.append(f"API import 시 지연 로딩 대상이 로딩됨: {', '.join(eager)}")
+
+    alembic = import_profile("import Back.core.base, Back.trend.models")
+    eager = loaded(alembic, FORBIDDEN_ALEMBIC)
+    if eager:
+        failures.append(f"모델 등록 시 엔진/라우터 모듈이 로딩됨: {', '.join(eager)}")
+    else:
+        alembic_ms = sum(alembic[name][1] for name in ("Back.core.base", "Back.trend.models") if name in alembic) / 1000
+        print(f"import Back.core.base + Back.trend.models (Alembic): {alembic_ms:.1f}ms")
+
+    if failures:
+        print("\n❌ import 예산 위반")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ import 예산 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""
+LLM 캐시 DB 계층 LRU 검사 (로컬 Postgres 필요, CI용 종료 코드)
+
+- DB 적중(_db_get)이 hit_count/last_hit_at을 실제로 갱신(커밋)하는지 확인
+- prune()이 최근 적중한 행을 남기고 오래 안 쓰인 행을 삭제하는지 확인 (삽입 순서 FIFO가 아닌 LRU)
+- DB_* 환경 변수 + alembic upgrade head 필요, 검사용 행(provider=__check__)은 종료 시 삭제
+
+실행 (저장소 루트): python -m benchmarks.check_llm_cache
+"""
+import asyncio
+import sys
+import time
+from typing import List
+
+from Back.core.database import close_pool, execute, fetch_all
+from Back.core.llm_cache import LLMCache, _Entry
+
+_PROVIDER = "__check__"
+
+
+async def _rows(keys: List[str]) -> dict:
+    rows = await fetch_all(
+        "SELECT cache_key, hit_count, last_hit_at FROM llm_cache WHERE cache_key = ANY(:keys)",
+        {"keys": keys}
+    )
+    return {row["cache_key"]: row for row in rows}
+
+
+async def run() -> List[str]:
+    failures: List[str] = []
+    cache = LLMCache(ttl_seconds=600, memory_entries=0, max_rows=10**9)
+    keys = [f"__check__{time.time_ns()}_{i}" for i in range(2)]
+    for key in keys:
+        await cache._db_put(key, _PROVIDER, "check", "v0", "", _Entry(["키워드"], 1, 1.0, 0.0))
+
+    before = await _rows(keys)
+    await asyncio.sleep(0.05)
+    entry = await cache._db_get(keys[0])
+    after = await _rows(keys)
+
+    if entry is None:
+        failures.append("DB 적중 실패: 저장한 행을 조회하지 못함")
+    elif after[keys[0]]["hit_count"] != before[keys[0]]["hit_count"] + 1:
+        failures.append(f"hit_count 미갱신: {before[keys[0]]['hit_count']} -> {after[keys[0]]['hit_count']}")
+    elif not after[keys[0]]["last_hit_at"] > before[keys[0]]["last_hit_at"]:
+        failures.append(f"last_hit_at 미갱신: {before[keys[0]]['last_hit_at']} -> {after[keys[0]]['last_hit_at']}")
+    else:
+        print(f"DB 적중 기록: hit_count {after[keys[0]]['hit_count']}, last_hit_at {after[keys[0]]['last_hit_at']}")
+
+    # 먼저 넣은 keys[0]이 방금 적중 -> 최근 사용 순서는 keys[0], keys[1]
+    recent = await fetch_all(
+        "SELECT cache_key FROM llm_cache WHERE cache_key = ANY(:keys) ORDER BY last_hit_at DESC",
+        {"keys": keys}
+    )
+    if [row["cache_key"] for row in recent] != keys:
+        failures.append("LRU 순서 불일치: 최근 적중 행이 먼저 오지 않음 (prune이 삽입 순서로 삭제)")
+    return failures
+
+
+async def main_async() -> List[str]:
+    try:
+        return await run()
+    finally:
+        await execute("DELETE FROM llm_cache WHERE provider = :provider", {"provider": _PROVIDER})
+        await close_pool()
+
+
+def main():
+    failures = asyncio.run(main_async())
+    if failures:
+        print("\n❌ LLM 캐시 LRU 검사 실패")
+        for failure in failures:
+            print(f"  - {failure}")
+        sys.exit(1)
+    print("\n✅ LLM 캐시 LRU 검사 통과")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,177 @@
+"""
+오프라인 벤치마크용 가짜 업스트림 서버 (Nate / Reddit / Yahoo Japan / Google News RSS / YouTube / OpenAI)
+- benchmarks/fixtures 의 기록된 응답을 템플릿 치환 후 반환
+  {{COUNTRY}}: RSS gl / YouTube regionCode, {{Q}}: YouTube 검색어, {{SEED}}: 검색어 해시, {{RUN}}: 서버 실행 ID
+- 지연(latency_ms ± jitter_ms)과 오류율(error_rate, 503 응답)을 경로별로 주입 가능
+- 단독 실행: python -m benchmarks.fake_upstream --port 8765 --latency-ms 50 --error-rate 0.05
+"""
+import argparse
+import hashlib
+import json
+import random
+import threading
+import time
+from dataclasses import dataclass, field
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+from typing import Dict, Optional
+from urllib.parse import parse_qs, urlparse
+
+FIXTURES = Path(__file__).parent / "fixtures"
+
+# 경로 접두어 -> (fixture 파일, Content-Type)
+ROUTES = {
+    "/nate/": ("nate.html", "text/html; charset=utf-8"),
+    "/reddit/r/popular/top.json": ("reddit_popular.json", "application/json"),
+    "/yahoo/realtime/search": ("yahoo_realtime.html", "text/html; charset=utf-8"),
+    "/rss": ("google_news.xml", "application/rss+xml; charset=utf-8"),
+    "/youtube/v3/search": ("youtube_search.json", "application/json"),
+    "/youtube/v3/videos": ("youtube_videos.json", "application/json"),
+    "/v1/chat/completions": ("openai_chat.json", "application/json"),
+}
+
+
+@dataclass
+class FaultProfile:
+    """주입할 지연/오류 설정 (경로 접두어별 덮어쓰기 가능)"""
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    overrides: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+    def for_path(self, path: str) -> Dict[str, float]:
+        base = {"latency_ms": self.latency_ms, "jitter_ms": self.jitter_ms, "error_rate": self.error_rate}
+        for prefix, values in self.overrides.items():
+            if path.startswith(prefix):
+                base.update(values)
+        return base
+
+
+class FakeUpstream:
+    """백그라운드 스레드에서 동작하는 가짜 업스트림"""
+
+    def __init__(self, port: int = 0, profile: Optional[FaultProfile] = None, seed: int = 7):
+        self.profile = profile or FaultProfile()
+        self.run_id = hashlib.sha1(str(time.time()).encode()).hexdigest()[:6]
+        self.requests: Dict[str, int] = {}
+        self.errors: Dict[str, int] = {}
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self._templates = {name: (FIXTURES / name).read_text(encoding="utf-8") for name, _ in ROUTES.values()}
+        self._server = ThreadingHTTPServer(("127.0.0.1", port), self._handler_class())
+        self._server.daemon_threads = True
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self._server.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @staticmethod
+    def env_for(base_url: str) -> Dict[str, str]:
+        """Back.core.config 설정을 base_url(가짜 서버)로 향하게 하는 환경 변수"""
+        return {
+            "NATE_URL": f"{base_url}/nate/",
+            "REDDIT_POPULAR_URL": f"{base_url}/reddit/r/popular/top.json?limit=25&t=day",
+            "YAHOO_JAPAN_REALTIME_URL": f"{base_url}/yahoo/realtime/search",
+            "GOOGLE_NEWS_RSS_URL": f"{base_url}/rss",
+            "YOUTUBE_API_ENDPOINT": f"{base_url}/",
+            "OPENAI_BASE_URL": f"{base_url}/v1",
+            "INSTAGRAM_BACKEND": "fake",  # Apify는 가짜 서버 대신 결정적 가짜 게시물
+        }
+
+    def env(self) -> Dict[str, str]:
+        return self.env_for(self.base_url)
+
+    def start(self) -> "FakeUpstream":
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._server.shutdown()
+        self._server.server_close()
+
+    def render(self, path: str, query: Dict[str, list]) -> Optional[tuple]:
+        for prefix, (name, content_type) in ROUTES.items():
+            if path.startswith(prefix):
+                q = (query.get("q") or [""])[0]
+                country = (query.get("gl") or query.get("regionCode") or ["KR"])[0]
+                body = (
+                    self._templates[name]
+                    .replace("{{COUNTRY}}", country)
+                    .replace("{{RUN}}", self.run_id)
+                    .replace("{{SEED}}", hashlib.md5(q.encode("utf-8")).hexdigest()[:8])
+                )
+                if "{{Q}}" in body:
+                    body = body.replace("{{Q}}", json.dumps(q, ensure_ascii=False)[1:-1])
+                return body.encode("utf-8"), content_type
+        return None
+
+    def _handler_class(self):
+        upstream = self
+
+        class Handler(BaseHTTPRequestHandler):
+            protocol_version = "HTTP/1.1"
+
+            def log_message(self, *args):
+                pass
+
+            def _respond(self):
+                parsed = urlparse(self.path)
+                length = int(self.headers.get("Content-Length") or 0)
+                if length:
+                    self.rfile.read(length)
+
+                fault = upstream.profile.for_path(parsed.path)
+                with upstream._lock:
+                    upstream.requests[parsed.path] = upstream.requests.get(parsed.path, 0) + 1
+                    delay = max(0.0, fault["latency_ms"] + upstream._rng.uniform(-fault["jitter_ms"], fault["jitter_ms"]))
+                    failed = upstream._rng.random() < fault["error_rate"]
+                if delay:
+                    time.sleep(delay / 1000)
+
+                rendered = None if failed else upstream.render(parsed.path, parse_qs(parsed.query))
+                if rendered is None:
+                    status = 503 if failed else 404
+                    if failed:
+                        with upstream._lock:
+                            upstream.errors[parsed.path] = upstream.errors.get(parsed.path, 0) + 1
+                    body, content_type = json.dumps({"error": "fake upstream"}).encode(), "application/json"
+                else:
+                    status = 200
+                    body, content_type = rendered
+
+                self.send_response(status)
+                self.send_header("Content-Type", content_type)
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            do_GET = _respond
+            do_POST = _respond
+
+        return Handler
+
+
+def main():
+    parser = argparse.ArgumentParser(description="가짜 업스트림 서버")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    args = parser.parse_args()
+
+    server = FakeUpstream(args.port, FaultProfile(args.latency_ms, args.jitter_ms, args.error_rate)).start()
+    print(f"fake upstream: {server.base_url}")
+    for key, value in server.env().items():
+        print(f"  {key}={value}")
+    try:
+        while True:
+            time.sleep(3600)
+    except KeyboardInterrupt:
+        server.stop()
+
+
+if __name__ == "__main__":
+    main()